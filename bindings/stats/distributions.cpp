@@ -1,6 +1,8 @@
 #include "distributions.h"
 
+#include <algorithm>
 #include <cmath>
+#include <vector>
 
 #include <core/corelib.h>
 #include <core/stats/distributions.h>
@@ -11,42 +13,173 @@
 using namespace core::stats;
 
 
+namespace
+{
+	constexpr double LOG_SQRT_2PI = 0.918938533204672741780329736406;
+
+
+	//p or log(p)
+	inline double Prob(double p, bool log_p)
+	{
+		return log_p ? std::log(p) : p;
+	}
+
+
+	//tail requested from lower_tail/log_p when the upper tail is exp(lq), lq<=0
+	inline double TailExp(double lq, bool lower_tail, bool log_p)
+	{
+		if (lower_tail)
+			return log_p ? std::log(-std::expm1(lq)) : -std::expm1(lq);
+
+		return log_p ? lq : std::exp(lq);
+	}
+
+
+	//log(d), falls back to the closed-form log density logd() when d underflowed to 0
+	template <typename FUNC>
+	inline double LogDensity(double d, FUNC logd)
+	{
+		return (d > 0.0 || std::isnan(d)) ? std::log(d) : logd();
+	}
+
+
+	inline bool IsNonNegInt(double x)
+	{
+		return x >= 0.0 && x == std::floor(x);
+	}
+
+
+	inline double lbeta(double a, double b)
+	{
+		return std::lgamma(a) + std::lgamma(b) - std::lgamma(a + b);
+	}
 
 
-PyObject* c_stat_dbeta(PyObject* X, double shape1, double shape2)
+	inline double lchoose(double n, double k)
+	{
+		return std::lgamma(n + 1) - std::lgamma(k + 1) - std::lgamma(n - k + 1);
+	}
+
+
+	inline double LogGammaDensity(double x, double shape, double scale)
+	{
+		if (x <= 0.0)
+			return -INFINITY;
+
+		return (shape - 1)*std::log(x) - x/scale - std::lgamma(shape) - shape*std::log(scale);
+	}
+
+
+	/*
+		log of the regularized upper incomplete gamma function Q(a, x)
+		continued fraction with modified Lentz's method for x>=a+1 (Numerical Recipes 3rd Ed, 6.2)
+	*/
+	double LogUpperGamma(double x, double shape, double scale)
+	{
+		x /= scale;
+
+		if (x <= 0.0)
+			return 0.0;
+
+		if (std::isinf(x))
+			return -INFINITY;
+
+		if (x < shape + 1)
+			return std::log1p(-dist::pgamma(x, shape, 1.0));
+
+		constexpr double FPMIN = 1E-300;
+		constexpr double EPS = 2.220446049250313e-16;
+
+		double b = x + 1 - shape, c = 1/FPMIN, d = 1/b, h = d;
+		for (int i = 1; i < 10000; ++i)
+		{
+			double an = -i*(i - shape);
+			b += 2;
+
+			d = an*d + b;
+			if (std::abs(d) < FPMIN)
+				d = FPMIN;
+
+			c = b + an/c;
+			if (std::abs(c) < FPMIN)
+				c = FPMIN;
+
+			d = 1/d;
+			double delta = d*c;
+			h *= delta;
+
+			if (std::abs(delta - 1) <= EPS)
+				break;
+		}
+
+		return std::log(h) + shape*std::log(x) - x - std::lgamma(shape);
+	}
+
+
+	/*
+		log P(D_n >= d), twice the one-sided Birnbaum-Tingey tail
+		used when 1 - psmirnov would lose all precision
+	*/
+	double LogSmirnovUpper(double d, int n)
+	{
+		if (d >= 1.0)
+			return -INFINITY;
+
+		int J = static_cast<int>(std::floor(n*(1.0 - d)));
+		double lnfact = std::lgamma(n + 1.0), Max = -INFINITY;
+
+		std::vector<double> terms(J + 1);
+		for (int j = 0; j <= J; ++j)
+		{
+			double u = 1.0 - d - static_cast<double>(j)/n;
+			double t = lnfact - std::lgamma(j + 1.0) - std::lgamma(n - j + 1.0) + (j - 1)*std::log(d + static_cast<double>(j)/n);
+			t += (n - j) == 0 ? 0.0 : (n - j)*std::log(std::max(u, 0.0));
+
+			terms[j] = t;
+			Max = std::max(Max, t);
+		}
+
+		double sum = 0.0;
+		for (double t : terms)
+			sum += std::exp(t - Max);
+
+		return std::log(2*d) + Max + std::log(sum);
+	}
+}
+
+
+
+/*  -----------        beta distribution -------------------*/
+PyObject* c_stat_dbeta(PyObject* xvalObj, PyObject* Out, double shape1, double shape2, int log_d)
 {
 	TRYBLOCK();
 
-	if (IsRealNum(X))
+	return EvaluateFunction(xvalObj, Out, [=](double x)
 	{
-		double dval = dist::dbeta(*GetAsRealNumber(X), shape1, shape2);
-		return Py_BuildValue("d", dval);
-	}
+		double d = dist::dbeta(x, shape1, shape2);
+		if (!log_d)
+			return d;
 
-	auto Vec = Iterable_As1DVector(X);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::dbeta(x, shape1, shape2);});
+		return LogDensity(d, [&]{return x <= 0.0 || x >= 1.0 ? -INFINITY : (shape1 - 1)*std::log(x) + (shape2 - 1)*std::log1p(-x) - lbeta(shape1, shape2);});
+	});
 
-	return List_FromVector(Vec);
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_pbeta(PyObject* qvalObj, double shape1, double shape2)
+PyObject* c_stat_pbeta(PyObject* qvalObj, PyObject* Out, double shape1, double shape2, int lower_tail, int log_p)
 {
 	TRYBLOCK();
 
-	if (IsRealNum(qvalObj))
+	return EvaluateFunction(qvalObj, Out, [=](double x)
 	{
-		double dval = dist::pbeta(*GetAsRealNumber(qvalObj), shape1, shape2);
-		return Py_BuildValue("d", dval);
-	}
+		if (lower_tail)
+			return Prob(dist::pbeta(x, shape1, shape2), log_p);
 
-	auto Vec = Iterable_As1DVector(qvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::pbeta(x, shape1, shape2);});
-	return List_FromVector(Vec);
+		return Prob(dist::pbeta(1.0 - x, shape2, shape1), log_p);
+	});
 
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
@@ -54,20 +187,12 @@ PyObject* c_stat_pbeta(PyObject* qvalObj, double shape1, double shape2)
 }
 
 
-PyObject* c_stat_qbeta(PyObject* pvalObj, double shape1, double shape2)
+PyObject* c_stat_qbeta(PyObject* pvalObj, PyObject* Out, double shape1, double shape2)
 {
 	TRYBLOCK();
 
-	if (IsRealNum(pvalObj))
-	{
-		double dval = dist::qbeta(*GetAsRealNumber(pvalObj), shape1, shape2);
-		return Py_BuildValue("d", dval);
-	}
+	return EvaluateFunction(pvalObj, Out, [=](double x){return dist::qbeta(x, shape1, shape2);});
 
-	auto Vec = Iterable_As1DVector(pvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::qbeta(x, shape1, shape2);});
-	return List_FromVector(Vec);
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
@@ -75,61 +200,51 @@ PyObject* c_stat_qbeta(PyObject* pvalObj, double shape1, double shape2)
 
 
 
+
 /*  -----------        binomial distribution -------------------*/
-PyObject* c_stat_dbinom(PyObject* X, int size_, double prob)
+PyObject* c_stat_dbinom(PyObject* xvalObj, PyObject* Out, int size_, double prob, int log_d)
 {
 	TRYBLOCK();
 
-	if (IsRealNum(X))
+	return EvaluateFunction(xvalObj, Out, [=](double x)
 	{
-		double dval = dist::dbinom(*GetAsRealNumber(X), size_, prob);
-		return Py_BuildValue("d", dval);
-	}
-		
-	auto Vec = Iterable_As1DVector(X);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::dbinom(x, size_, prob);});
-	return List_FromVector(Vec);
-	
+		double d = dist::dbinom(x, size_, prob);
+		if (!log_d)
+			return d;
+
+		return LogDensity(d, [&]{return !IsNonNegInt(x) || x > size_ ? -INFINITY : lchoose(size_, x) + x*std::log(prob) + (size_ - x)*std::log1p(-prob);});
+	});
+
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_pbinom(PyObject* qvalObj, int size_, double prob)
+PyObject* c_stat_pbinom(PyObject* qvalObj, PyObject* Out, int size_, double prob, int lower_tail, int log_p)
 {
 	TRYBLOCK();
 
-	if (IsRealNum(qvalObj))
+	return EvaluateFunction(qvalObj, Out, [=](double x)
 	{
-		double qval = *GetAsRealNumber(qvalObj);
-		return Py_BuildValue("d", dist::pbinom(qval, size_, prob));
-	}
-		
-	auto Vec = Iterable_As1DVector(qvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::pbinom(x, size_, prob);});
-	return List_FromVector(Vec);
-	
+		if (lower_tail)
+			return Prob(dist::pbinom(x, size_, prob), log_p);
+
+		return Prob(dist::pbinom(size_ - std::floor(x) - 1, size_, 1.0 - prob), log_p);
+	});
+
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_qbinom(PyObject* pvalObj, int size_, double prob)
+PyObject* c_stat_qbinom(PyObject* pvalObj, PyObject* Out, int size_, double prob)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(pvalObj))
-	{
-		double pval = *GetAsRealNumber(pvalObj);
-		return Py_BuildValue("d", dist::qbinom(pval, size_, prob));
-	}
-		
-	auto Vec = Iterable_As1DVector(pvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::qbinom(x, size_, prob);});
-	return List_FromVector(Vec);
-	
+
+	return EvaluateFunction(pvalObj, Out, [=](double x){return dist::qbinom(x, size_, prob);});
+
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
@@ -137,61 +252,51 @@ PyObject* c_stat_qbinom(PyObject* pvalObj, int size_, double prob)
 
 
 
+
 /*  -----------     negative binomial distribution -------------------*/
-PyObject* c_stat_dnbinom(PyObject* X, int size_, double prob)
+PyObject* c_stat_dnbinom(PyObject* xvalObj, PyObject* Out, int size_, double prob, int log_d)
 {
 	TRYBLOCK();
 
-	if (IsRealNum(X))
+	return EvaluateFunction(xvalObj, Out, [=](double x)
 	{
-		double dval = dist::dnbinom(*GetAsRealNumber(X), size_, prob);
-		return Py_BuildValue("d", dval);
-	}
+		double d = dist::dnbinom(x, size_, prob);
+		if (!log_d)
+			return d;
+
+		return LogDensity(d, [&]{return !IsNonNegInt(x) ? -INFINITY : std::lgamma(x + size_) - std::lgamma(size_) - std::lgamma(x + 1) + size_*std::log(prob) + x*std::log1p(-prob);});
+	});
 
-	auto Vec = Iterable_As1DVector(X);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::dnbinom(x, size_, prob);});
-	return List_FromVector(Vec);
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_pnbinom(PyObject* qvalObj, int size_, double prob)
+PyObject* c_stat_pnbinom(PyObject* qvalObj, PyObject* Out, int size_, double prob, int lower_tail, int log_p)
 {
 	TRYBLOCK();
 
-	if (IsRealNum(qvalObj))
+	return EvaluateFunction(qvalObj, Out, [=](double x)
 	{
-		double qval = *GetAsRealNumber(qvalObj);
-		return Py_BuildValue("d", dist::pnbinom(qval, size_, prob));
-	}
+		if (lower_tail)
+			return Prob(dist::pnbinom(x, size_, prob), log_p);
+
+		return Prob(x < 0.0 ? 1.0 : dist::pbeta(1.0 - prob, std::floor(x) + 1, size_), log_p);
+	});
 
-	auto Vec = Iterable_As1DVector(qvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::pnbinom(x, size_, prob);});
-	return List_FromVector(Vec);
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_qnbinom(PyObject* pvalObj, int size_, double prob)
+PyObject* c_stat_qnbinom(PyObject* pvalObj, PyObject* Out, int size_, double prob)
 {
 	TRYBLOCK();
 
-	if (IsRealNum(pvalObj))
-	{
-		double pval = *GetAsRealNumber(pvalObj);
-		return Py_BuildValue("d", dist::qnbinom(pval, size_, prob));
-	}
+	return EvaluateFunction(pvalObj, Out, [=](double x){return dist::qnbinom(x, size_, prob);});
 
-	auto Vec = Iterable_As1DVector(pvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::qnbinom(x, size_, prob);});
-	return List_FromVector(Vec);
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
@@ -200,8 +305,6 @@ PyObject* c_stat_qnbinom(PyObject* pvalObj, int size_, double prob)
 
 
 
-
-
 /* --------------- multinomial distribution ---------------- */
 
 PyObject* c_stat_dmultinom(PyObject* X, int size_, PyObject* probs)
@@ -219,125 +322,100 @@ PyObject* c_stat_dmultinom(PyObject* X, int size_, PyObject* probs)
 
 
 
-
-
 /*  -----------        chisq distribution -------------------*/
-PyObject* c_stat_dchisq(PyObject* xvalObj, int df)
+PyObject* c_stat_dchisq(PyObject* xvalObj, PyObject* Out, int df, int log_d)
 {
 	TRYBLOCK();
 
-	if (IsRealNum(xvalObj))
+	return EvaluateFunction(xvalObj, Out, [=](double x)
 	{
-		double xval = GetAsRealNumber(xvalObj).value();
-		return Py_BuildValue("d", dist::dchisq(xval, df));
-	}
+		double d = dist::dchisq(x, df);
+		if (!log_d)
+			return d;
+
+		return LogDensity(d, [&]{return LogGammaDensity(x, df/2.0, 2.0);});
+	});
 
-	auto Vec = Iterable_As1DVector(xvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::dchisq(x, df);});
-	return List_FromVector(Vec);
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_pchisq(PyObject* qvalObj, int df)
+PyObject* c_stat_pchisq(PyObject* qvalObj, PyObject* Out, int df, int lower_tail, int log_p)
 {
 	TRYBLOCK();
-	if (IsRealNum(qvalObj))
+
+	return EvaluateFunction(qvalObj, Out, [=](double x)
 	{
-		double qval = *GetAsRealNumber(qvalObj);
-		return Py_BuildValue("d", dist::pchisq(qval, df));
-	}
-	
-	auto Vec = Iterable_As1DVector(qvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::pchisq(x, df);});
-	return List_FromVector(Vec);
-	
+		if (lower_tail)
+			return Prob(dist::pchisq(x, df), log_p);
+
+		double lq = LogUpperGamma(x, df/2.0, 2.0);
+		return log_p ? lq : std::exp(lq);
+	});
+
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_qchisq(PyObject* pvalObj, int df)
+PyObject* c_stat_qchisq(PyObject* pvalObj, PyObject* Out, int df)
 {
 	TRYBLOCK();
-	if (IsRealNum(pvalObj))
-	{
-		double pval = *GetAsRealNumber(pvalObj);
-		return Py_BuildValue("d", dist::qchisq(pval, df));
-	}
-		
-	auto Vec = Iterable_As1DVector(pvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::qchisq(x, df);});
-	return List_FromVector(Vec);
-		
-	
+
+	return EvaluateFunction(pvalObj, Out, [=](double x){return dist::qchisq(x, df);});
+
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-/*  -----------        Exponential distribution -------------------*/
 
-PyObject* c_stat_dexp(PyObject* xvalObj, double rate)
+
+/*  -----------        Exponential distribution -------------------*/
+PyObject* c_stat_dexp(PyObject* xvalObj, PyObject* Out, double rate, int log_d)
 {
 	TRYBLOCK();
 
-	if (IsRealNum(xvalObj))
+	return EvaluateFunction(xvalObj, Out, [=](double x)
 	{
-		double xval = GetAsRealNumber(xvalObj).value();
-		return Py_BuildValue("d", dist::dexp(xval, rate));
-	}
+		double d = dist::dexp(x, rate);
+		if (!log_d)
+			return d;
+
+		return LogDensity(d, [&]{return x < 0.0 ? -INFINITY : std::log(rate) - rate*x;});
+	});
 
-	auto Vec = Iterable_As1DVector(xvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::dexp(x, rate);});
-	return List_FromVector(Vec);
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_pexp(PyObject* qvalObj, double rate)
+PyObject* c_stat_pexp(PyObject* qvalObj, PyObject* Out, double rate, int lower_tail, int log_p)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(qvalObj))
+
+	return EvaluateFunction(qvalObj, Out, [=](double x)
 	{
-		double qval = *GetAsRealNumber(qvalObj);
-		return Py_BuildValue("d", dist::pexp(qval, rate));
-	}
+		return TailExp(x <= 0.0 ? 0.0 : -rate*x, lower_tail, log_p);
+	});
 
-	auto Vec = Iterable_As1DVector(qvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::pexp(x, rate);});
-	return List_FromVector(Vec);
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_qexp(PyObject* pvalObj, double rate)
+PyObject* c_stat_qexp(PyObject* pvalObj, PyObject* Out, double rate)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(pvalObj))
-	{
-		double pval = *GetAsRealNumber(pvalObj);
-		return Py_BuildValue("d", dist::qexp(pval, rate));
-	}
 
-	auto Vec = Iterable_As1DVector(pvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::qexp(x, rate);});
-	return List_FromVector(Vec);
+	return EvaluateFunction(pvalObj, Out, [=](double x){return dist::qexp(x, rate);});
 
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
@@ -347,60 +425,49 @@ PyObject* c_stat_qexp(PyObject* pvalObj, double rate)
 
 
 /*  -----------        F distribution -------------------*/
-PyObject* c_stat_df(PyObject* xvalObj, int df1, int df2)
+PyObject* c_stat_df(PyObject* xvalObj, PyObject* Out, int df1, int df2, int log_d)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(xvalObj))
+
+	return EvaluateFunction(xvalObj, Out, [=](double x)
 	{
-		double xval = GetAsRealNumber(xvalObj).value();
-		return Py_BuildValue("d", dist::df(xval, df1, df2));
-	}
-	
-	auto Vec = Iterable_As1DVector(xvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::df(x, df1, df2);});
-	return List_FromVector(Vec);
-	
+		double d = dist::df(x, df1, df2);
+		if (!log_d)
+			return d;
+
+		return LogDensity(d, [&]{return x <= 0.0 ? -INFINITY : 0.5*(df1*std::log(df1) + df2*std::log(df2)) + (0.5*df1 - 1)*std::log(x) - 0.5*(df1 + df2)*std::log(df2 + df1*x) - lbeta(0.5*df1, 0.5*df2);});
+	});
+
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_pf(PyObject* qvalObj, int df1, int df2)
+PyObject* c_stat_pf(PyObject* qvalObj, PyObject* Out, int df1, int df2, int lower_tail, int log_p)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(qvalObj))
+
+	return EvaluateFunction(qvalObj, Out, [=](double x)
 	{
-		double qval = *GetAsRealNumber(qvalObj);
-		return Py_BuildValue("d", dist::pf(qval, df1, df2));
-	}
-	
-	auto Vec = Iterable_As1DVector(qvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::pf(x, df1, df2);});
-	return List_FromVector(Vec);
-	
+		if (lower_tail)
+			return Prob(dist::pf(x, df1, df2), log_p);
+
+		return Prob(x <= 0.0 ? 1.0 : dist::pbeta(df2/(df2 + df1*x), df2/2.0, df1/2.0), log_p);
+	});
+
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_qf(PyObject* pvalObj, int df1, int df2)
+PyObject* c_stat_qf(PyObject* pvalObj, PyObject* Out, int df1, int df2)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(pvalObj))
-	{
-		double pval = *GetAsRealNumber(pvalObj);
-		return Py_BuildValue("d", dist::qf(pval, df1, df2));
-	}
 
-	auto Vec = Iterable_As1DVector(pvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::qf(x, df1, df2);});
-	return List_FromVector(Vec);
-	
+	return EvaluateFunction(pvalObj, Out, [=](double x){return dist::qf(x, df1, df2);});
+
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
@@ -408,21 +475,20 @@ PyObject* c_stat_qf(PyObject* pvalObj, int df1, int df2)
 
 
 
-/*  -----------        Gamma distribution -------------------*/
 
-PyObject* c_stat_dgamma(PyObject* xvalObj, double shape, double scale)
+/*  -----------        Gamma distribution -------------------*/
+PyObject* c_stat_dgamma(PyObject* xvalObj, PyObject* Out, double shape, double scale, int log_d)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(xvalObj))
+
+	return EvaluateFunction(xvalObj, Out, [=](double x)
 	{
-		double dval = dist::dgamma(GetAsRealNumber(xvalObj).value(), shape, scale);
-		return Py_BuildValue("d", dval);
-	}
+		double d = dist::dgamma(x, shape, scale);
+		if (!log_d)
+			return d;
 
-	auto Vec = Iterable_As1DVector(xvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::dgamma(x, shape, scale);});
-	return List_FromVector(Vec);
+		return LogDensity(d, [&]{return LogGammaDensity(x, shape, scale);});
+	});
 
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
@@ -430,39 +496,30 @@ PyObject* c_stat_dgamma(PyObject* xvalObj, double shape, double scale)
 }
 
 
-PyObject* c_stat_pgamma(PyObject* qvalObj, double shape, double scale)
+PyObject* c_stat_pgamma(PyObject* qvalObj, PyObject* Out, double shape, double scale, int lower_tail, int log_p)
 {
 	TRYBLOCK();
-		
-	if (IsRealNum(qvalObj))
+
+	return EvaluateFunction(qvalObj, Out, [=](double x)
 	{
-		double qval = *GetAsRealNumber(qvalObj);
-		return Py_BuildValue("d", dist::pgamma(qval, shape, scale));
-	}
+		if (lower_tail)
+			return Prob(dist::pgamma(x, shape, scale), log_p);
+
+		double lq = LogUpperGamma(x, shape, scale);
+		return log_p ? lq : std::exp(lq);
+	});
 
-	auto Vec = Iterable_As1DVector(qvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::pgamma(x, shape, scale);});
-	return List_FromVector(Vec);
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_qgamma(PyObject* pvalObj, double shape, double scale)
+PyObject* c_stat_qgamma(PyObject* pvalObj, PyObject* Out, double shape, double scale)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(pvalObj))
-	{
-		double pval = *GetAsRealNumber(pvalObj);
-		return Py_BuildValue("d", dist::qgamma(pval, shape, scale));
-	}
 
-	auto Vec = Iterable_As1DVector(pvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::qgamma(x, shape, scale);});
-	return List_FromVector(Vec);
+	return EvaluateFunction(pvalObj, Out, [=](double x){return dist::qgamma(x, shape, scale);});
 
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
@@ -471,61 +528,48 @@ PyObject* c_stat_qgamma(PyObject* pvalObj, double shape, double scale)
 
 
 
+
 /*  -----------        geometric distribution -------------------*/
-PyObject* c_stat_dgeom(PyObject* X, double prob)
+PyObject* c_stat_dgeom(PyObject* xvalObj, PyObject* Out, double prob, int log_d)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(X))
+
+	return EvaluateFunction(xvalObj, Out, [=](double x)
 	{
-		double dval = dist::dgeom(*GetAsRealNumber(X), prob);
-		return Py_BuildValue("d", dval);
-	}
+		double d = dist::dgeom(x, prob);
+		if (!log_d)
+			return d;
+
+		return LogDensity(d, [&]{return !IsNonNegInt(x) ? -INFINITY : std::log(prob) + x*std::log1p(-prob);});
+	});
 
-	auto Vec = Iterable_As1DVector(X);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::dgeom(x, prob);});
-	return List_FromVector(Vec);
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_pgeom(PyObject* qvalObj, double prob)
+PyObject* c_stat_pgeom(PyObject* qvalObj, PyObject* Out, double prob, int lower_tail, int log_p)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(qvalObj))
+
+	return EvaluateFunction(qvalObj, Out, [=](double x)
 	{
-		double qval = *GetAsRealNumber(qvalObj);
-		return Py_BuildValue("d", dist::pgeom(qval, prob));
-	}
+		return TailExp(x < 0.0 ? 0.0 : (std::floor(x) + 1)*std::log1p(-prob), lower_tail, log_p);
+	});
 
-	auto Vec = Iterable_As1DVector(qvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::pgeom(x, prob);});
-	return List_FromVector(Vec);
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_qgeom(PyObject* pvalObj, double prob)
+PyObject* c_stat_qgeom(PyObject* pvalObj, PyObject* Out, double prob)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(pvalObj))
-	{
-		double pval = *GetAsRealNumber(pvalObj);
-		return Py_BuildValue("d", dist::qgeom(pval, prob));
-	}
 
-	auto Vec = Iterable_As1DVector(pvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::qgeom(x, prob);});
-	return List_FromVector(Vec);
-	
+	return EvaluateFunction(pvalObj, Out, [=](double x){return dist::qgeom(x, prob);});
+
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
@@ -535,40 +579,36 @@ PyObject* c_stat_qgeom(PyObject* pvalObj, double prob)
 
 
 /***************       hypergeometric dist        ******************/
-
-PyObject* c_stat_dhyper(PyObject* X, int m, int n, int k)
+PyObject* c_stat_dhyper(PyObject* xvalObj, PyObject* Out, int m, int n, int k, int log_d)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(X))
+
+	return EvaluateFunction(xvalObj, Out, [=](double x)
 	{
-		double xval = *GetAsRealNumber(X);
-		return Py_BuildValue("d", dist::dhyper(xval, m, n, k));
-	}
+		double d = dist::dhyper(x, m, n, k);
+		if (!log_d)
+			return d;
+
+		return LogDensity(d, [&]{return !IsNonNegInt(x) || x < k - n || x > std::min(k, m) ? -INFINITY : lchoose(m, x) + lchoose(n, k - x) - lchoose(m + n, k);});
+	});
 
-	auto Vec = Iterable_As1DVector(X);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::dhyper(x, m, n, k);});
-	return List_FromVector(Vec);
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_phyper(PyObject* qvalObj, int m, int n, int k)
+PyObject* c_stat_phyper(PyObject* qvalObj, PyObject* Out, int m, int n, int k, int lower_tail, int log_p)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(qvalObj))
+
+	return EvaluateFunction(qvalObj, Out, [=](double x)
 	{
-		double qval = *GetAsRealNumber(qvalObj);
-		return Py_BuildValue("d", dist::phyper(qval, m, n, k));
-	}
+		if (lower_tail)
+			return Prob(dist::phyper(x, m, n, k), log_p);
 
-	auto Vec = Iterable_As1DVector(qvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::phyper(x, m, n, k);});
-	return List_FromVector(Vec);
+		return Prob(dist::phyper(k - std::floor(x) - 1, n, m, k), log_p);
+	});
 
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
@@ -576,20 +616,12 @@ PyObject* c_stat_phyper(PyObject* qvalObj, int m, int n, int k)
 }
 
 
-PyObject* c_stat_qhyper(PyObject* pvalObj, int m, int n, int k)
+PyObject* c_stat_qhyper(PyObject* pvalObj, PyObject* Out, int m, int n, int k)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(pvalObj))
-	{
-		double pval = *GetAsRealNumber(pvalObj);
-		return Py_BuildValue("d", dist::qhyper(pval, m, n, k));
-	}
 
-	auto Vec = Iterable_As1DVector(pvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::qhyper(x, m, n, k);});
-	return List_FromVector(Vec);
-	
+	return EvaluateFunction(pvalObj, Out, [=](double x){return dist::qhyper(x, m, n, k);});
+
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
@@ -597,62 +629,51 @@ PyObject* c_stat_qhyper(PyObject* pvalObj, int m, int n, int k)
 
 
 
-/*  -----------        Normal distribution -------------------*/
 
-PyObject* c_stat_dnorm(PyObject* xvalObj, double mean, double sd)
+/*  -----------        Normal distribution -------------------*/
+PyObject* c_stat_dnorm(PyObject* xvalObj, PyObject* Out, double mean, double sd, int log_d)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(xvalObj))
+
+	return EvaluateFunction(xvalObj, Out, [=](double x)
 	{
-		double xval = GetAsRealNumber(xvalObj).value();
-		return Py_BuildValue("d", dist::dnorm(xval, mean, sd));
-	}
+		double d = dist::dnorm(x, mean, sd);
+		if (!log_d)
+			return d;
+
+		return LogDensity(d, [&]{return -0.5*std::pow((x - mean)/sd, 2) - std::log(sd) - LOG_SQRT_2PI;});
+	});
 
-	auto Vec = Iterable_As1DVector(xvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::dnorm(x, mean, sd);});
-	return List_FromVector(Vec);
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_pnorm(PyObject* qvalObj, double mean, double sd)
+PyObject* c_stat_pnorm(PyObject* qvalObj, PyObject* Out, double mean, double sd, int lower_tail, int log_p)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(qvalObj))
+
+	return EvaluateFunction(qvalObj, Out, [=](double x)
 	{
-		double qval = *GetAsRealNumber(qvalObj);
-		return Py_BuildValue("d", dist::pnorm(qval, mean, sd));
-	}
+		if (lower_tail)
+			return Prob(dist::pnorm(x, mean, sd), log_p);
+
+		return Prob(dist::pnorm(-(x - mean)/sd, 0.0, 1.0), log_p);
+	});
 
-	auto Vec = Iterable_As1DVector(qvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::pnorm(x, mean, sd);});
-	return List_FromVector(Vec);
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_qnorm(PyObject* pvalObj, double mean, double sd)
+PyObject* c_stat_qnorm(PyObject* pvalObj, PyObject* Out, double mean, double sd)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(pvalObj))
-	{
-		double pval = *GetAsRealNumber(pvalObj);
-		return Py_BuildValue("d", dist::qnorm(pval, mean, sd));
-	}
-	
-	auto Vec = Iterable_As1DVector(pvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::qnorm(x, mean, sd);});
-	return List_FromVector(Vec);
-	
+
+	return EvaluateFunction(pvalObj, Out, [=](double x){return dist::qnorm(x, mean, sd);});
+
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
@@ -662,61 +683,49 @@ PyObject* c_stat_qnorm(PyObject* pvalObj, double mean, double sd)
 
 
 /*  -----------        Lognormal distribution -------------------*/
-
-PyObject* c_stat_dlnorm(PyObject* xvalObj, double meanlog, double sdlog)
+PyObject* c_stat_dlnorm(PyObject* xvalObj, PyObject* Out, double meanlog, double sdlog, int log_d)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(xvalObj))
+
+	return EvaluateFunction(xvalObj, Out, [=](double x)
 	{
-		double xval = GetAsRealNumber(xvalObj).value();
-		return Py_BuildValue("d", dist::dlnorm(xval, meanlog, sdlog));
-	}
+		double d = dist::dlnorm(x, meanlog, sdlog);
+		if (!log_d)
+			return d;
+
+		return LogDensity(d, [&]{return x <= 0.0 ? -INFINITY : -0.5*std::pow((std::log(x) - meanlog)/sdlog, 2) - std::log(x*sdlog) - LOG_SQRT_2PI;});
+	});
 
-	auto Vec = Iterable_As1DVector(xvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::dlnorm(x, meanlog, sdlog);});
-	return List_FromVector(Vec);
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_plnorm(PyObject* qvalObj, double meanlog, double sdlog)
+PyObject* c_stat_plnorm(PyObject* qvalObj, PyObject* Out, double meanlog, double sdlog, int lower_tail, int log_p)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(qvalObj))
+
+	return EvaluateFunction(qvalObj, Out, [=](double x)
 	{
-		double qval = *GetAsRealNumber(qvalObj);
-		return Py_BuildValue("d", dist::plnorm(qval, meanlog, sdlog));
-	}
+		if (lower_tail)
+			return Prob(dist::plnorm(x, meanlog, sdlog), log_p);
+
+		return Prob(x <= 0.0 ? 1.0 : dist::pnorm(-(std::log(x) - meanlog)/sdlog, 0.0, 1.0), log_p);
+	});
 
-	auto Vec = Iterable_As1DVector(qvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::plnorm(x, meanlog, sdlog);});
-	return List_FromVector(Vec);
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_qlnorm(PyObject* pvalObj, double meanlog, double sdlog)
+PyObject* c_stat_qlnorm(PyObject* pvalObj, PyObject* Out, double meanlog, double sdlog)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(pvalObj))
-	{
-		double pval = *GetAsRealNumber(pvalObj);
-		return Py_BuildValue("d", dist::qlnorm(pval, meanlog, sdlog));
-	}
 
-	auto Vec = Iterable_As1DVector(pvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::qlnorm(x, meanlog, sdlog);});
-	return List_FromVector(Vec);
-	
+	return EvaluateFunction(pvalObj, Out, [=](double x){return dist::qlnorm(x, meanlog, sdlog);});
+
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
@@ -726,61 +735,46 @@ PyObject* c_stat_qlnorm(PyObject* pvalObj, double meanlog, double sdlog)
 
 
 /*  -----------        Pareto distribution -------------------*/
-
-PyObject* c_stat_dpareto(PyObject* xvalObj, double location, double shape)
+PyObject* c_stat_dpareto(PyObject* xvalObj, PyObject* Out, double location, double shape, int log_d)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(xvalObj))
+
+	return EvaluateFunction(xvalObj, Out, [=](double x)
 	{
-		double xval = GetAsRealNumber(xvalObj).value();
-		return Py_BuildValue("d", dist::dpareto(xval, location, shape));
-	}
+		double d = dist::dpareto(x, location, shape);
+		if (!log_d)
+			return d;
+
+		return LogDensity(d, [&]{return x < location ? -INFINITY : std::log(shape) + shape*std::log(location) - (shape + 1)*std::log(x);});
+	});
 
-	auto Vec = Iterable_As1DVector(xvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::dpareto(x, location, shape);});
-	return List_FromVector(Vec);
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_ppareto(PyObject* qvalObj, double location, double shape)
+PyObject* c_stat_ppareto(PyObject* qvalObj, PyObject* Out, double location, double shape, int lower_tail, int log_p)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(qvalObj))
+
+	return EvaluateFunction(qvalObj, Out, [=](double x)
 	{
-		double qval = *GetAsRealNumber(qvalObj);
-		return Py_BuildValue("d", dist::ppareto(qval, location, shape));
-	}
+		return TailExp(x <= location ? 0.0 : shape*std::log(location/x), lower_tail, log_p);
+	});
 
-	auto Vec = Iterable_As1DVector(qvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::ppareto(x, location, shape);});
-	return List_FromVector(Vec);
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_qpareto(PyObject* pvalObj, double location, double shape)
+PyObject* c_stat_qpareto(PyObject* pvalObj, PyObject* Out, double location, double shape)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(pvalObj))
-	{
-		double pval = *GetAsRealNumber(pvalObj);
-		return Py_BuildValue("d", dist::qpareto(pval, location, shape));
-	}
 
-	auto Vec = Iterable_As1DVector(pvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::qpareto(x, location, shape);});
-	return List_FromVector(Vec);
-	
+	return EvaluateFunction(pvalObj, Out, [=](double x){return dist::qpareto(x, location, shape);});
+
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
@@ -790,60 +784,49 @@ PyObject* c_stat_qpareto(PyObject* pvalObj, double location, double shape)
 
 
 /*  -----------        Poisson distribution -------------------*/
-PyObject* c_stat_dpois(PyObject* xvalObj, double mu)
+PyObject* c_stat_dpois(PyObject* xvalObj, PyObject* Out, double mu, int log_d)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(xvalObj))
+
+	return EvaluateFunction(xvalObj, Out, [=](double x)
 	{
-		double xval = GetAsRealNumber(xvalObj).value();
-		return Py_BuildValue("d", dist::dpois(xval, mu));
-	}
+		double d = dist::dpois(x, mu);
+		if (!log_d)
+			return d;
+
+		return LogDensity(d, [&]{return !IsNonNegInt(x) ? -INFINITY : x*std::log(mu) - mu - std::lgamma(x + 1);});
+	});
 
-	auto Vec = Iterable_As1DVector(xvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::dpois(x, mu);});
-	return List_FromVector(Vec);
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_ppois(PyObject* qvalObj, double mu)
+PyObject* c_stat_ppois(PyObject* qvalObj, PyObject* Out, double mu, int lower_tail, int log_p)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(qvalObj))
+
+	return EvaluateFunction(qvalObj, Out, [=](double x)
 	{
-		double qval = *GetAsRealNumber(qvalObj);
-		return Py_BuildValue("d", dist::ppois(qval, mu));
-	}
+		if (lower_tail)
+			return Prob(dist::ppois(x, mu), log_p);
+
+		return Prob(x < 0.0 ? 1.0 : dist::pgamma(mu, std::floor(x) + 1, 1.0), log_p);
+	});
 
-	auto Vec = Iterable_As1DVector(qvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::ppois(x, mu);});
-	return List_FromVector(Vec);
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_qpois(PyObject* pvalObj, double mu)
+PyObject* c_stat_qpois(PyObject* pvalObj, PyObject* Out, double mu)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(pvalObj))
-	{
-		double pval = *GetAsRealNumber(pvalObj);
-		return Py_BuildValue("d", dist::qpois(pval, mu));
-	}
-	
-	auto Vec = Iterable_As1DVector(pvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::qpois(x, mu);});
-	return List_FromVector(Vec);
-	
+
+	return EvaluateFunction(pvalObj, Out, [=](double x){return dist::qpois(x, mu);});
+
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
@@ -853,61 +836,49 @@ PyObject* c_stat_qpois(PyObject* pvalObj, double mu)
 
 
 /*  -----------        t distribution -------------------*/
-
-PyObject* c_stat_dt(PyObject* xvalObj, int df)
+PyObject* c_stat_dt(PyObject* xvalObj, PyObject* Out, int df, int log_d)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(xvalObj))
+
+	return EvaluateFunction(xvalObj, Out, [=](double x)
 	{
-		double xval = GetAsRealNumber(xvalObj).value();
-		return Py_BuildValue("d", dist::dt(xval, df));
-	}
+		double d = dist::dt(x, df);
+		if (!log_d)
+			return d;
+
+		return LogDensity(d, [&]{return std::lgamma((df + 1)/2.0) - std::lgamma(df/2.0) - 0.5*std::log(df*M_PI) - (df + 1)/2.0*(std::abs(x) > 1E100 ? 2*std::log(std::abs(x)) - std::log(df) : std::log1p(x*x/df));});
+	});
 
-	auto Vec = Iterable_As1DVector(xvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::dt(x, df);});
-	return List_FromVector(Vec);
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_pt(PyObject* qvalObj, int df)
+PyObject* c_stat_pt(PyObject* qvalObj, PyObject* Out, int df, int lower_tail, int log_p)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(qvalObj))
+
+	return EvaluateFunction(qvalObj, Out, [=](double x)
 	{
-		double qval = *GetAsRealNumber(qvalObj);
-		return Py_BuildValue("d", dist::pt(qval, df));
-	}
-	
-	auto Vec = Iterable_As1DVector(qvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::pt(x, df);});
-	return List_FromVector(Vec);
-	
+		if (lower_tail)
+			return Prob(dist::pt(x, df), log_p);
+
+		return Prob(dist::pt(-x, df), log_p);
+	});
+
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_qt(PyObject* pvalObj, int df)
+PyObject* c_stat_qt(PyObject* pvalObj, PyObject* Out, int df)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(pvalObj))
-	{
-		double pval = *GetAsRealNumber(pvalObj);
-		return Py_BuildValue("d", dist::qt(pval, df));
-	}
-	
-	auto Vec = Iterable_As1DVector(pvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::qt(x, df);});
-	return List_FromVector(Vec);
-	
+
+	return EvaluateFunction(pvalObj, Out, [=](double x){return dist::qt(x, df);});
+
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
@@ -915,83 +886,72 @@ PyObject* c_stat_qt(PyObject* pvalObj, int df)
 
 
 
-//Kolmogorov-Smirnov Dist
-PyObject * c_stat_psmirnov(PyObject * qvalObj, int n)
+
+/*  -----------        Kolmogorov-Smirnov distribution -------------------*/
+PyObject* c_stat_psmirnov(PyObject* qvalObj, PyObject* Out, int n, int lower_tail, int log_p)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(qvalObj))
+
+	return EvaluateFunction(qvalObj, Out, [=](double x)
 	{
-		double pval = *GetAsRealNumber(qvalObj);
-		return Py_BuildValue("d", dist::psmirnov(pval, n));
-	}
-	
-	auto Vec = Iterable_As1DVector(qvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::psmirnov(x, n);});
-	return List_FromVector(Vec);
-	
+		double P = dist::psmirnov(x, n);
+		if (lower_tail)
+			return Prob(P, log_p);
+
+		if (P < 1.0 - 1E-3)
+			return Prob(1.0 - P, log_p);
+
+		double lq = LogSmirnovUpper(x, n);
+		return log_p ? lq : std::exp(lq);
+	});
+
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-/*  -----------        uniform distribution -------------------*/
 
-PyObject* c_stat_dunif(PyObject* xvalObj, double min, double max)
+/*  -----------        uniform distribution -------------------*/
+PyObject* c_stat_dunif(PyObject* xvalObj, PyObject* Out, double min, double max, int log_d)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(xvalObj))
+
+	return EvaluateFunction(xvalObj, Out, [=](double x)
 	{
-		double xval = GetAsRealNumber(xvalObj).value();
-		return Py_BuildValue("d", dist::dunif(xval, min, max));
-	}
-	
-	auto Vec = Iterable_As1DVector(xvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::dunif(x, min, max);});
-	return List_FromVector(Vec);
-	
+		return log_d ? std::log(dist::dunif(x, min, max)) : dist::dunif(x, min, max);
+	});
+
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_punif(PyObject* qvalObj, double min, double max)
+PyObject* c_stat_punif(PyObject* qvalObj, PyObject* Out, double min, double max, int lower_tail, int log_p)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(qvalObj))
+
+	return EvaluateFunction(qvalObj, Out, [=](double x)
 	{
-		double qval = *GetAsRealNumber(qvalObj);
-		return Py_BuildValue("d", dist::punif(qval, min, max));
-	}
-	
-	auto Vec = Iterable_As1DVector(qvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::punif(x, min, max);});
-	return List_FromVector(Vec);
-	
+		if (lower_tail)
+			return Prob(dist::punif(x, min, max), log_p);
+
+		return Prob(std::clamp((max - x)/(max - min), 0.0, 1.0), log_p);
+	});
+
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_qunif(PyObject* pvalObj, double min, double max)
+PyObject* c_stat_qunif(PyObject* pvalObj, PyObject* Out, double min, double max)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(pvalObj))
-	{
-		double pval = *GetAsRealNumber(pvalObj);
-		return Py_BuildValue("d", dist::qunif(pval, min, max));
-	}
-	
-	auto Vec = Iterable_As1DVector(pvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::qunif(x, min, max);});
-	return List_FromVector(Vec);
-	
+
+	return EvaluateFunction(pvalObj, Out, [=](double x){return dist::qunif(x, min, max);});
+
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
@@ -999,64 +959,48 @@ PyObject* c_stat_qunif(PyObject* pvalObj, double min, double max)
 
 
 
-//weibull distribution
 
-PyObject* c_stat_dweibull(PyObject* xvalObj, double shape, double scale)
+/*  -----------        weibull distribution -------------------*/
+PyObject* c_stat_dweibull(PyObject* xvalObj, PyObject* Out, double shape, double scale, int log_d)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(xvalObj))
+
+	return EvaluateFunction(xvalObj, Out, [=](double x)
 	{
-		double xval = GetAsRealNumber(xvalObj).value();
-		return Py_BuildValue("d", dist::dweibull(xval, shape, scale));
-	}
+		double d = dist::dweibull(x, shape, scale);
+		if (!log_d)
+			return d;
+
+		return LogDensity(d, [&]{return x < 0.0 ? -INFINITY : std::log(shape/scale) + (shape - 1)*std::log(x/scale) - std::pow(x/scale, shape);});
+	});
 
-	auto Vec = Iterable_As1DVector(xvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::dweibull(x, shape, scale);});
-	return List_FromVector(Vec);
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-
-PyObject* c_stat_pweibull(PyObject* qvalObj, double shape, double scale)
+PyObject* c_stat_pweibull(PyObject* qvalObj, PyObject* Out, double shape, double scale, int lower_tail, int log_p)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(qvalObj))
+
+	return EvaluateFunction(qvalObj, Out, [=](double x)
 	{
-		double qval = *GetAsRealNumber(qvalObj);
-		return Py_BuildValue("d", dist::pweibull(qval, shape, scale));
-	}
+		return TailExp(x <= 0.0 ? 0.0 : -std::pow(x/scale, shape), lower_tail, log_p);
+	});
 
-	auto Vec = Iterable_As1DVector(qvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::pweibull(x, shape, scale);});
-	return List_FromVector(Vec);
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-
-PyObject* c_stat_qweibull(PyObject* pvalObj, double shape, double scale)
+PyObject* c_stat_qweibull(PyObject* pvalObj, PyObject* Out, double shape, double scale)
 {
 	TRYBLOCK();
-	
-	if (IsRealNum(pvalObj))
-	{
-		double pval = *GetAsRealNumber(pvalObj);
-		return Py_BuildValue("d", dist::qweibull(pval, shape, scale));
-	}
 
-	auto Vec = Iterable_As1DVector(pvalObj);
-	std::for_each(Vec.begin(), Vec.end(), [=](double& x){x = dist::qweibull(x, shape, scale);});
-	return List_FromVector(Vec);
-	
+	return EvaluateFunction(pvalObj, Out, [=](double x){return dist::qweibull(x, shape, scale);});
+
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
@@ -1066,85 +1010,96 @@ PyObject* c_stat_qweibull(PyObject* pvalObj, double shape, double scale)
 
 
 /*  -----------        wilcoxon sign rank distribution -------------------*/
-
-PyObject* c_stat_dsignrank(PyObject* xvalObj, int n)
+PyObject* c_stat_dsignrank(PyObject* xvalObj, PyObject* Out, int n, int log_d)
 {
 	IF_PYERR(n<=0, PyExc_ValueError, "n must be >0");
 
 	TRYBLOCK();
-	
-	if (IsRealNum(xvalObj))
-	{
-		int xval = static_cast<int>(std::round(GetAsRealNumber(xvalObj).value()));
-		return Py_BuildValue("d", dist::dsignrank(xval, n));
-	}
 
-	auto Vec = Iterable_As1DVector(xvalObj);
-
-	core::CVector retVec;
-	for (const auto& xv : Vec)
-		retVec.push_back(dist::dsignrank(static_cast<int>(xv), n));
+	return EvaluateFunction(xvalObj, Out, [=](double x)
+	{
+		return log_d ? std::log(dist::dsignrank(static_cast<int>(std::round(x)), n)) : dist::dsignrank(static_cast<int>(std::round(x)), n);
+	});
 
-	return List_FromVector(retVec.data());
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_psignrank(PyObject* qvalObj, int n)
+PyObject* c_stat_psignrank(PyObject* qvalObj, PyObject* Out, int n, int lower_tail, int log_p)
 {
 	IF_PYERR(n<=0, PyExc_ValueError, "n must be >0");
 
 	TRYBLOCK();
-	
-	if (IsRealNum(qvalObj))
-	{
-		double qval = *GetAsRealNumber(qvalObj);
-		return Py_BuildValue("d", dist::psignrank(qval, n));
-	}
 
-	auto Vec = Iterable_As1DVector(qvalObj);
+	return EvaluateFunction(qvalObj, Out, [=](double x)
+	{
+		if (lower_tail)
+			return Prob(dist::psignrank(x, n), log_p);
 
-	core::CVector retVec;
-	for (const auto& qv : Vec)
-		retVec.push_back(dist::psignrank(qv, n));
+		return Prob(dist::psignrank(n*(n + 1)/2.0 - std::floor(x) - 1, n), log_p);
+	});
 
-	return List_FromVector(retVec.data());
-	
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
 
 
-PyObject* c_stat_qsignrank(PyObject* pvalObj, int n)
+PyObject* c_stat_qsignrank(PyObject* pvalObj, PyObject* Out, int n)
 {
 	IF_PYERR(n<=0, PyExc_ValueError, "n must be >0");
 
 	TRYBLOCK();
-	
-	if (IsRealNum(pvalObj))
+
+	return EvaluateFunction(pvalObj, Out, [=](double x)
 	{
-		double pval = *GetAsRealNumber(pvalObj);
-		CHECKRANGE_RET(pval, 0.0, 1.0, "p value must be in the range of (0,1).");
+		if (x < 0.0 || x > 1.0)
+			throw std::exception("p value must be in the range of (0,1).");
 
-		return Py_BuildValue("d", dist::qsignrank(pval, n));
-	}
+		return dist::qsignrank(x, n);
+	});
 
-	auto Vec = Iterable_As1DVector(pvalObj);
+	CATCHRUNTIMEEXCEPTION(nullptr);
 
-	core::CVector retVec;
-	for (const auto& pv : Vec)
+	Py_RETURN_NONE;
+}
+
+
+
+
+/*  -----------        worker pool -------------------*/
+PyObject* c_stat_dist_setpool(int nthreads, int chunksize)
+{
+	IF_PYERR(nthreads<0, PyExc_ValueError, "nthreads>=0 expected");
+	IF_PYERR(chunksize<=0, PyExc_ValueError, "chunksize>0 expected");
+
+	TRYBLOCK();
+
+	size_t NThreads = nthreads > 0 ? nthreads : std::max(1u, std::thread::hardware_concurrency());
+
+	auto& Pool = CThreadPool::Get();
+	if (Pool.GetThreads() != NThreads)
 	{
-		CHECKRANGE_RET(pv, 0.0, 1.0, "p value must be in the range of (0,1).");
-		retVec.push_back(dist::qsignrank(pv, n));
+		//joining the workers must not block other Python threads
+		Py_BEGIN_ALLOW_THREADS
+		Pool.SetThreads(NThreads);
+		Py_END_ALLOW_THREADS
 	}
 
-	return List_FromVector(retVec.data());
-	
+	Pool.SetChunkSize(chunksize);
+
 	CATCHRUNTIMEEXCEPTION(nullptr);
 
 	Py_RETURN_NONE;
 }
+
+
+PyObject* c_stat_dist_getpool()
+{
+	auto& Pool = CThreadPool::Get();
+	return Py_BuildValue("(nn)", 
+		static_cast<Py_ssize_t>(Pool.GetThreads()), 
+		static_cast<Py_ssize_t>(Pool.GetChunkSize()));
+}
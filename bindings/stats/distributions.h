@@ -12,16 +12,22 @@
 //beta distribution
 EXTERN PyObject* c_stat_dbeta(
 	PyObject* X, 
+	PyObject* Out, 
 	double shape1, 
-	double shape2);
+	double shape2, 
+	int log_d = 0);
 
 EXTERN PyObject* c_stat_pbeta(
 	PyObject* qvalObj, 
+	PyObject* Out, 
 	double shape1, 
-	double shape2);
+	double shape2, 
+	int lower_tail = 1, 
+	int log_p = 0);
 
 EXTERN PyObject* c_stat_qbeta(
 	PyObject* pvalObj, 
+	PyObject* Out, 
 	double shape1, 
 	double shape2);
 
@@ -30,16 +36,22 @@ EXTERN PyObject* c_stat_qbeta(
 //binomial distribution
 EXTERN PyObject * c_stat_dbinom(
 	PyObject * X, 
+	PyObject* Out, 
 	int size_, 
-	double prob);
+	double prob, 
+	int log_d = 0);
 
 EXTERN PyObject * c_stat_pbinom(
 	PyObject * qvalObj, 
+	PyObject* Out, 
 	int size_, 
-	double prob);
+	double prob, 
+	int lower_tail = 1, 
+	int log_p = 0);
 
 EXTERN PyObject * c_stat_qbinom(
 	PyObject * pvalObj, 
+	PyObject* Out, 
 	int size_, 
 	double prob);
 
@@ -48,16 +60,22 @@ EXTERN PyObject * c_stat_qbinom(
 //negative-binomial distribution
 EXTERN PyObject* c_stat_dnbinom(
 	PyObject* X, 
+	PyObject* Out, 
 	int size_, 
-	double prob);
+	double prob, 
+	int log_d = 0);
 
 EXTERN PyObject* c_stat_pnbinom(
 	PyObject* qvalObj, 
+	PyObject* Out, 
 	int size_, 
-	double prob);
+	double prob, 
+	int lower_tail = 1, 
+	int log_p = 0);
 
 EXTERN PyObject* c_stat_qnbinom(
 	PyObject* pvalObj, 
+	PyObject* Out, 
 	int size_, 
 	double prob);
 
@@ -74,14 +92,20 @@ EXTERN PyObject* c_stat_dmultinom(
 //chisq distribution
 EXTERN PyObject * c_stat_dchisq(
 	PyObject * xvalObj, 
-	int df);
+	PyObject* Out, 
+	int df, 
+	int log_d = 0);
 
 EXTERN PyObject * c_stat_pchisq(
 	PyObject * qvalObj, 
-	int df);
+	PyObject* Out, 
+	int df, 
+	int lower_tail = 1, 
+	int log_p = 0);
 
 EXTERN PyObject * c_stat_qchisq(
 	PyObject * pvalObj, 
+	PyObject* Out, 
 	int df);
 
 
@@ -89,14 +113,20 @@ EXTERN PyObject * c_stat_qchisq(
 //exponential distribution
 EXTERN PyObject* c_stat_dexp(
 	PyObject* xvalObj, 
-	double rate = 1.0);
+	PyObject* Out, 
+	double rate = 1.0, 
+	int log_d = 0);
 
 EXTERN PyObject* c_stat_pexp(
 	PyObject* qvalObj, 
-	double rate = 1.0);
+	PyObject* Out, 
+	double rate = 1.0, 
+	int lower_tail = 1, 
+	int log_p = 0);
 
 EXTERN PyObject* c_stat_qexp(
 	PyObject* pvalObj, 
+	PyObject* Out, 
 	double rate = 1.0);
 
 
@@ -104,16 +134,22 @@ EXTERN PyObject* c_stat_qexp(
 //F distribution
 EXTERN PyObject * c_stat_df(
 	PyObject * xvalObj, 
+	PyObject* Out, 
 	int df1, 
-	int df2);
+	int df2, 
+	int log_d = 0);
 
 EXTERN PyObject * c_stat_pf(
 	PyObject * qvalObj, 
+	PyObject* Out, 
 	int df1, 
-	int df2);
+	int df2, 
+	int lower_tail = 1, 
+	int log_p = 0);
 
 EXTERN PyObject * c_stat_qf(
 	PyObject * pvalObj, 
+	PyObject* Out, 
 	int df1, 
 	int df2);
 
@@ -122,16 +158,22 @@ EXTERN PyObject * c_stat_qf(
 //Gamma distribution
 EXTERN PyObject* c_stat_dgamma(
 	PyObject* xvalObj, 
+	PyObject* Out, 
 	double shape, 
-	double scale = 1.0);
+	double scale = 1.0, 
+	int log_d = 0);
 
 EXTERN PyObject* c_stat_pgamma(
 	PyObject* qvalObj, 
+	PyObject* Out, 
 	double shape, 
-	double scale = 1.0);
+	double scale = 1.0, 
+	int lower_tail = 1, 
+	int log_p = 0);
 
 EXTERN PyObject* c_stat_qgamma(
 	PyObject* pvalObj, 
+	PyObject* Out, 
 	double shape, 
 	double scale = 1.0);
 
@@ -140,14 +182,20 @@ EXTERN PyObject* c_stat_qgamma(
 //geometric distribution
 EXTERN PyObject* c_stat_dgeom(
 	PyObject* X, 
-	double prob);
+	PyObject* Out, 
+	double prob, 
+	int log_d = 0);
 
 EXTERN PyObject* c_stat_pgeom(
 	PyObject* qvalObj, 
-	double prob);
+	PyObject* Out, 
+	double prob, 
+	int lower_tail = 1, 
+	int log_p = 0);
 
 EXTERN PyObject* c_stat_qgeom(
 	PyObject* pvalObj, 
+	PyObject* Out, 
 	double prob);
 
 
@@ -155,18 +203,24 @@ EXTERN PyObject* c_stat_qgeom(
 //hypergeometric distribution
 EXTERN PyObject* c_stat_dhyper(
 	PyObject* X, 
+	PyObject* Out, 
 	int m, 
 	int n, 
-	int k); 
+	int k, 
+	int log_d = 0); 
 
 EXTERN PyObject* c_stat_phyper(
 	PyObject* qvalObj, 
+	PyObject* Out, 
 	int m, 
 	int n, 
-	int k); 
+	int k, 
+	int lower_tail = 1, 
+	int log_p = 0); 
 
 EXTERN PyObject* c_stat_qhyper(
 	PyObject* pvalObj,
+	PyObject* Out, 
 	int m, 
 	int n, 
 	int k); 
@@ -176,16 +230,22 @@ EXTERN PyObject* c_stat_qhyper(
 //Normal distribution
 EXTERN PyObject * c_stat_dnorm(
 	PyObject * xvalObj, 
+	PyObject* Out, 
 	double mean = 0.0, 
-	double sd = 1.0);
+	double sd = 1.0, 
+	int log_d = 0);
 
 EXTERN PyObject * c_stat_pnorm(
 	PyObject * qvalObj, 
+	PyObject* Out, 
 	double mean = 0.0, 
-	double sd = 1.0);
+	double sd = 1.0, 
+	int lower_tail = 1, 
+	int log_p = 0);
 
 EXTERN PyObject * c_stat_qnorm(
 	PyObject * pvalObj, 
+	PyObject* Out, 
 	double mean = 0.0, 
 	double sd = 1.0);
 
@@ -194,16 +254,22 @@ EXTERN PyObject * c_stat_qnorm(
 //Lognormal distribution
 EXTERN PyObject* c_stat_dlnorm(
 	PyObject* xvalObj, 
+	PyObject* Out, 
 	double meanlog = 0.0, 
-	double sdlog = 1.0);
+	double sdlog = 1.0, 
+	int log_d = 0);
 
 EXTERN PyObject* c_stat_plnorm(
 	PyObject* qvalObj, 
+	PyObject* Out, 
 	double meanlog = 0.0, 
-	double sdlog = 1.0);
+	double sdlog = 1.0, 
+	int lower_tail = 1, 
+	int log_p = 0);
 
 EXTERN PyObject* c_stat_qlnorm(
 	PyObject* pvalObj, 
+	PyObject* Out, 
 	double meanlog = 0.0, 
 	double sdlog = 1.0);
 
@@ -212,16 +278,22 @@ EXTERN PyObject* c_stat_qlnorm(
 //Pareto distribution
 EXTERN PyObject* c_stat_dpareto(
 	PyObject* xvalObj, 
+	PyObject* Out, 
 	double location, 
-	double shape = 1.0);
+	double shape = 1.0, 
+	int log_d = 0);
 
 EXTERN PyObject* c_stat_ppareto(
 	PyObject* qvalObj, 
+	PyObject* Out, 
 	double location, 
-	double shape = 1.0);
+	double shape = 1.0, 
+	int lower_tail = 1, 
+	int log_p = 0);
 
 EXTERN PyObject* c_stat_qpareto(
 	PyObject* pvalObj, 
+	PyObject* Out, 
 	double location, 
 	double shape = 1.0);
 
@@ -230,14 +302,20 @@ EXTERN PyObject* c_stat_qpareto(
 //Poisson distribution
 EXTERN PyObject * c_stat_dpois(
 	PyObject * xvalObj, 
-	double mu);
+	PyObject* Out, 
+	double mu, 
+	int log_d = 0);
 
 EXTERN PyObject * c_stat_ppois(
 	PyObject * qvalObj, 
-	double mu);
+	PyObject* Out, 
+	double mu, 
+	int lower_tail = 1, 
+	int log_p = 0);
 
 EXTERN PyObject * c_stat_qpois(
 	PyObject * pvalObj, 
+	PyObject* Out, 
 	double mu);
 
 
@@ -246,7 +324,10 @@ EXTERN PyObject * c_stat_qpois(
 //Kolmogorov-Smirnov Dist
 EXTERN PyObject * c_stat_psmirnov(
 	PyObject * qvalObj, 
-	int n);
+	PyObject* Out, 
+	int n, 
+	int lower_tail = 1, 
+	int log_p = 0);
 
 
 
@@ -254,14 +335,20 @@ EXTERN PyObject * c_stat_psmirnov(
 //t distribution
 EXTERN PyObject* c_stat_dt(
 	PyObject* xvalObj, 
-	int df);
+	PyObject* Out, 
+	int df, 
+	int log_d = 0);
 
 EXTERN PyObject* c_stat_pt(
 	PyObject* qvalObj, 
-	int df);
+	PyObject* Out, 
+	int df, 
+	int lower_tail = 1, 
+	int log_p = 0);
 
 EXTERN PyObject* c_stat_qt(
 	PyObject* pvalObj, 
+	PyObject* Out, 
 	int df);
 
 
@@ -269,16 +356,22 @@ EXTERN PyObject* c_stat_qt(
 //uniform distribution
 EXTERN PyObject* c_stat_dunif(
 	PyObject* xvalObj, 
+	PyObject* Out, 
 	double min = 0.0, 
-	double max = 0.0);
+	double max = 0.0, 
+	int log_d = 0);
 
 EXTERN PyObject* c_stat_punif(
 	PyObject* qvalObj, 
+	PyObject* Out, 
 	double min = 0.0, 
-	double max = 0.0);
+	double max = 0.0, 
+	int lower_tail = 1, 
+	int log_p = 0);
 
 EXTERN PyObject* c_stat_qunif(
 	PyObject* pvalObj, 
+	PyObject* Out, 
 	double min = 0.0, 
 	double max = 0.0);
 
@@ -287,16 +380,22 @@ EXTERN PyObject* c_stat_qunif(
 //weibull distribution
 EXTERN PyObject* c_stat_dweibull(
 	PyObject* xvalObj, 
+	PyObject* Out, 
 	double shape, 
-	double scale);
+	double scale, 
+	int log_d = 0);
 
 EXTERN PyObject* c_stat_pweibull(
 	PyObject* qvalObj, 
+	PyObject* Out, 
 	double shape, 
-	double scale);
+	double scale, 
+	int lower_tail = 1, 
+	int log_p = 0);
 
 EXTERN PyObject* c_stat_qweibull(
 	PyObject* pvalObj, 
+	PyObject* Out, 
 	double shape, 
 	double scale);
 
@@ -305,15 +404,29 @@ EXTERN PyObject* c_stat_qweibull(
 //wilcoxon sign rank distribution
 EXTERN PyObject* c_stat_dsignrank(
 	PyObject* xvalObj, 
-	int n);
+	PyObject* Out, 
+	int n, 
+	int log_d = 0);
 
 EXTERN PyObject* c_stat_psignrank(
 	PyObject* qvalObj, 
-	int n);
+	PyObject* Out, 
+	int n, 
+	int lower_tail = 1, 
+	int log_p = 0);
 
 EXTERN PyObject* c_stat_qsignrank(
 	PyObject* pvalObj, 
+	PyObject* Out, 
 	int n);
 
 
-#undef EXTERN
\ No newline at end of file
+//worker pool used for buffer (ndarray) input
+EXTERN PyObject* c_stat_dist_setpool(
+	int nthreads, 
+	int chunksize);
+
+EXTERN PyObject* c_stat_dist_getpool();
+
+
+#undef EXTERN
@@ -0,0 +1,200 @@
+#pragma once
+
+#include <algorithm>
+#include <atomic>
+#include <condition_variable>
+#include <exception>
+#include <functional>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+
+
+/*
+	Persistent pool of worker threads for data-parallel loops.
+
+	ParallelFor(N, func) calls func(Begin, End) on chunks of [0, N), the calling thread
+	takes part as well. If the pool is already busy (i.e. called from another Python thread),
+	the loop runs serially on the calling thread.
+
+	func must not touch Python objects, so that the GIL can be released during the loop.
+*/
+class CThreadPool
+{
+public:
+	static CThreadPool& Get()
+	{
+		static CThreadPool Pool;
+		return Pool;
+	}
+
+	~CThreadPool()
+	{
+		Stop();
+	}
+
+	CThreadPool(const CThreadPool&) = delete;
+	CThreadPool& operator=(const CThreadPool&) = delete;
+
+
+	//NThreads=0 uses all hardware threads, NThreads=1 disables the workers
+	void SetThreads(size_t NThreads)
+	{
+		std::lock_guard<std::mutex> RunLock(m_RunMtx);
+		Stop();
+		Start(NThreads);
+	}
+
+	size_t GetThreads() const
+	{
+		return m_Workers.size() + 1;
+	}
+
+	void SetChunkSize(size_t ChunkSize)
+	{
+		m_ChunkSize = std::max<size_t>(ChunkSize, 1);
+	}
+
+	size_t GetChunkSize() const
+	{
+		return m_ChunkSize;
+	}
+
+
+	template <typename FUNC>
+	void ParallelFor(size_t N, FUNC&& func)
+	{
+		size_t Chunk = m_ChunkSize;
+
+		std::unique_lock<std::mutex> RunLock(m_RunMtx, std::try_to_lock);
+		if (!RunLock.owns_lock() || m_Workers.empty() || N <= Chunk)
+		{
+			func(size_t{0}, N);
+			return;
+		}
+
+		{
+			std::lock_guard<std::mutex> Lock(m_Mtx);
+			m_Body = [&func](size_t Begin, size_t End) { func(Begin, End); };
+			m_N = N;
+			m_Chunk = Chunk;
+			m_Next = 0;
+			m_Error = nullptr;
+			m_Busy = m_Workers.size();
+			++m_Generation;
+		}
+		m_StartCV.notify_all();
+
+		Work();
+
+		std::unique_lock<std::mutex> Lock(m_Mtx);
+		m_DoneCV.wait(Lock, [this] { return m_Busy == 0; });
+		m_Body = nullptr;
+
+		if (m_Error)
+			std::rethrow_exception(m_Error);
+	}
+
+
+private:
+	CThreadPool()
+	{
+		Start(0);
+	}
+
+	void Start(size_t NThreads)
+	{
+		if (NThreads == 0)
+			NThreads = std::max(1u, std::thread::hardware_concurrency());
+
+		/*
+			workers start from the generation current at Start, a job issued right after 
+			Start returns is therefore seen even if a worker is scheduled late
+		*/
+		size_t Gen = 0;
+		{
+			std::lock_guard<std::mutex> Lock(m_Mtx);
+			m_Stop = false;
+			Gen = m_Generation;
+		}
+
+		for (size_t i = 1; i < NThreads; ++i)
+			m_Workers.emplace_back([this, Gen] { Loop(Gen); });
+	}
+
+	void Stop()
+	{
+		{
+			std::lock_guard<std::mutex> Lock(m_Mtx);
+			m_Stop = true;
+		}
+		m_StartCV.notify_all();
+
+		for (auto& Worker : m_Workers)
+			Worker.join();
+
+		m_Workers.clear();
+	}
+
+	void Loop(size_t Seen)
+	{
+		while (true)
+		{
+			{
+				std::unique_lock<std::mutex> Lock(m_Mtx);
+				m_StartCV.wait(Lock, [&] { return m_Stop || m_Generation != Seen; });
+				if (m_Stop)
+					return;
+
+				Seen = m_Generation;
+			}
+
+			Work();
+
+			std::lock_guard<std::mutex> Lock(m_Mtx);
+			if (--m_Busy == 0)
+				m_DoneCV.notify_one();
+		}
+	}
+
+	//takes chunks until none is left, the first exception stops the loop
+	void Work()
+	{
+		while (true)
+		{
+			size_t Begin = m_Next.fetch_add(m_Chunk);
+			if (Begin >= m_N)
+				return;
+
+			try
+			{
+				m_Body(Begin, std::min(Begin + m_Chunk, m_N));
+			}
+			catch (...)
+			{
+				std::lock_guard<std::mutex> Lock(m_Mtx);
+				if (!m_Error)
+					m_Error = std::current_exception();
+				m_Next = m_N;
+			}
+		}
+	}
+
+
+private:
+	std::vector<std::thread> m_Workers;
+
+	std::mutex m_RunMtx; //one loop at a time
+	std::mutex m_Mtx;
+	std::condition_variable m_StartCV, m_DoneCV;
+
+	std::function<void(size_t, size_t)> m_Body;
+	size_t m_N = 0, m_Chunk = 0;
+	std::atomic<size_t> m_Next{0};
+	std::atomic<size_t> m_ChunkSize{65536};
+	size_t m_Busy = 0;
+	size_t m_Generation = 0;
+	bool m_Stop = false;
+	std::exception_ptr m_Error;
+};
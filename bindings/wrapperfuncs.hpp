@@ -3,11 +3,14 @@
 
 #include <Python.h>
 
+#include <algorithm>
 #include <vector>
 #include <optional>
 #include <string>
 #include <complex>
 
+#include "threadpool.hpp"
+
 
 
 
@@ -161,9 +164,67 @@ PyObject* List_FromVector(const std::vector<T>& Vec)
 
 
 
+/*
+	RAII wrapper around Py_buffer for contiguous float64 (format "d") buffers
+	Throws if Obj does not expose such a buffer
+*/
+class CDoubleBuffer
+{
+public:
+	CDoubleBuffer(PyObject* Obj, bool Writable = false)
+	{
+		int Flags = PyBUF_C_CONTIGUOUS | PyBUF_FORMAT;
+		if (Writable)
+			Flags |= PyBUF_WRITABLE;
+
+		if (PyObject_GetBuffer(Obj, &m_View, Flags) < 0)
+		{
+			PyErr_Clear();
+			throw std::exception("A C-contiguous buffer expected");
+		}
+
+		std::string Format = m_View.format ? m_View.format : "B";
+		if (m_View.itemsize != sizeof(double) || Format.back() != 'd')
+		{
+			PyBuffer_Release(&m_View);
+			throw std::exception("Buffer must contain float64 values");
+		}
+	}
+
+	~CDoubleBuffer()
+	{
+		PyBuffer_Release(&m_View);
+	}
+
+	CDoubleBuffer(const CDoubleBuffer&) = delete;
+	CDoubleBuffer& operator=(const CDoubleBuffer&) = delete;
+
+	double* data() const { return static_cast<double*>(m_View.buf); }
+	size_t size() const { return static_cast<size_t>(m_View.len / m_View.itemsize); }
+
+private:
+	Py_buffer m_View{};
+};
+
+
+
 template <typename T=double>
 std::vector<T> Iterable_As1DVector(PyObject* Obj)
 {
+    if constexpr (std::is_floating_point_v<T>)
+    {
+        //C-contiguous float64 buffers (i.e. validated ndarrays) are copied without creating Python floats
+        if (PyObject_CheckBuffer(Obj))
+        {
+            try
+            {
+                CDoubleBuffer Buf(Obj);
+                return std::vector<T>(Buf.data(), Buf.data() + Buf.size());
+            }
+            catch (...) {}
+        }
+    }
+
     std::vector<T> Vec;
     PyObject* iterator{nullptr};
     PyObject* ResultObj{nullptr};
@@ -220,6 +281,65 @@ std::vector<T> Iterable_As1DVector(PyObject* Obj)
 
 
 
+/*
+	Evaluates func on every element of X
+
+	- X is a real number: returns a Python float
+	- Out is a writable float64 buffer (i.e. numpy array): X must be a C-contiguous float64 buffer
+	  with the same number of elements, results are written in-place into Out and Out is returned.
+	  The GIL is released and chunks are evaluated on CThreadPool, therefore func must be thread-safe
+	- Otherwise X is iterated and a new list is returned
+*/
+template <typename FUNC>
+PyObject* EvaluateFunction(PyObject* X, PyObject* Out, FUNC func)
+{
+	if (IsRealNum(X))
+		return Py_BuildValue("d", func(*GetAsRealNumber(X)));
+
+	if (Out && Out != Py_None)
+	{
+		CDoubleBuffer In(X);
+		CDoubleBuffer Res(Out, true);
+
+		if (In.size() != Res.size())
+			throw std::exception("x and out must have same number of elements");
+
+		const double* Src = In.data();
+		double* Dst = Res.data();
+
+		//buffers stay valid while In and Res are alive, no Python object is touched below
+		std::exception_ptr Error;
+		Py_BEGIN_ALLOW_THREADS
+		try
+		{
+			CThreadPool::Get().ParallelFor(In.size(), [&](size_t Begin, size_t End)
+			{
+				for (size_t i = Begin; i < End; ++i)
+					Dst[i] = func(Src[i]);
+			});
+		}
+		catch (...)
+		{
+			Error = std::current_exception();
+		}
+		Py_END_ALLOW_THREADS
+
+		if (Error)
+			std::rethrow_exception(Error);
+
+		Py_INCREF(Out);
+		return Out;
+	}
+
+	auto Vec = Iterable_As1DVector(X);
+	std::for_each(Vec.begin(), Vec.end(), [&](double& x){x = func(x);});
+
+	return List_FromVector(Vec);
+}
+
+
+
+
 #ifndef IF_PYERR
 #define IF_PYERR(EXPRESSION, ERROR, ERRMSG)	\
 	if((EXPRESSION)){							\
@@ -6,9 +6,46 @@ from pathlib import Path as _Path
 #Tested with: 3.10.6, 3.11.6, 3.12.0, 3.13
 _DLLname = f"pybind{version_info.major}{version_info.minor}"
 
+
+
+class _MissingFunction:
+	"""
+	Stands for a function of the native library when the library could not be loaded.
+	argtypes and restype can be assigned (so that modules can be imported), calling raises.
+	"""
+	def __init__(self, name:str):
+		self.__name__ = name
+		self.argtypes = None
+		self.restype = None
+
+	def __call__(self, *args, **kwargs):
+		raise RuntimeError(f"{self.__name__} requires the native library ({_DLLname}), which could not be loaded.")
+
+
+
+class _MissingLibrary:
+	def __init__(self):
+		self._funcs = {}
+
+	def __getattr__(self, name:str):
+		if name.startswith("__"):
+			raise AttributeError(name)
+		
+		if name not in self._funcs:
+			self._funcs[name] = _MissingFunction(name)
+		return self._funcs[name]
+
+
+
 #__file__ is guaranteed to be an absolute path in Python 3.9+
 __pt = _Path(__file__)
-pydll = PyDLL(str(__pt.parents[0] / _DLLname))
+
+try:
+	pydll = PyDLL(str(__pt.parents[0] / _DLLname))
+	HAS_NATIVE = True
+except OSError:
+	pydll = _MissingLibrary()
+	HAS_NATIVE = False
 
 
-__all__ = ['pydll']
\ No newline at end of file
+__all__ = ['pydll', 'HAS_NATIVE']
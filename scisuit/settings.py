@@ -13,4 +13,52 @@ Tested on apps built with wxWidgets.
 NDIGITS = 3
 """
 Number of decimal points to be used when rounding a floating number (used during outputs)
-"""
\ No newline at end of file
+"""
+
+
+DIST_BACKEND = "auto"
+"""
+Backend used to evaluate d/p/q functions of probability distributions.
+
+"auto": native library if it is available, otherwise NumPy
+"native": native library (raises if the library could not be loaded)
+"numpy": pure NumPy implementation
+"""
+
+
+
+DIST_CACHE_SIZE = 64
+"""
+Maximum number of exact null-distribution tables (signed rank for a given n, ...)
+kept in memory by the NumPy backend, least recently used tables are dropped first.
+"""
+
+
+
+DIST_QUANTILE_GRID = False
+"""
+If True, qt, qf and qchisq (with scalar parameters) interpolate a grid of exact quantiles 
+which is computed once for each set of parameters and cached (see DIST_CACHE_SIZE).
+
+For 1E-8 <= p <= 1-1E-8 the error is |x - Q(p)| <= 1E-10*max(1, |Q(p)|), 
+other probabilities are computed exactly. Building a grid costs a few hundred exact 
+quantile evaluations, therefore it pays off when the same parameters are used repeatedly.
+
+qnorm is already evaluated in closed form and is not affected.
+"""
+
+
+
+DIST_THREADS = 0
+"""
+Number of threads the native library uses to evaluate d/p/q functions on ndarrays,
+0 uses all hardware threads and 1 evaluates on the calling thread only.
+The GIL is released during the evaluation so other Python threads keep running.
+"""
+
+
+DIST_CHUNKSIZE = 65536
+"""
+Number of elements a thread evaluates at a time (see DIST_THREADS), 
+arrays not larger than this are evaluated on the calling thread.
+"""
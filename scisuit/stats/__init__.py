@@ -1,20 +1,22 @@
-from ._core import kurt, mode, moveavg, rolling, skew
+from ._core import kurt, mode, moveavg, rolling, rolling_linregress, rolling_linregress_Result, skew
+from ._bootstrap import bootstrap, bootstrap_Result
 
 from .anova import aov, aov_results, tukey, fisher, Comparison, ComparisonResults 
 from .anova import aov2, aov2_results
 
 
 
-from .regression import linregress
+from .regression import linregress, linregress_accumulator
 
 
 
-from .basictests import test_f, test_f_Result
-from .basictests import test_t, test_t1_result, test_t2_result, test_tpaired_result
-from .basictests import test_z, test_z1_Result, test_z2_Result
-from .basictests import anderson, ADTestRes, ks_1samp, Ks1SampletestResult, shapiro, ShapiroTestResult
-from .basictests import cor_test, cortest_Result
-from .basictests import test_poisson1sample, test_poisson1sample_Result
+from .basictests import test_f, test_f_from_stats, test_f_Result
+from .basictests import test_t, test_t_from_stats, test_t1_result, test_t2_result, test_tpaired_result
+from .basictests import test_z, test_z_from_stats, test_z1_Result, test_z2_Result
+from .basictests import accumulator
+from .basictests import anderson, ADTestRes, ks_1samp, Ks1SampletestResult, ks_2samp, Ks2SampletestResult, shapiro, ShapiroTestResult
+from .basictests import cor_test, cortest_Result, cor_matrix, cor_matrix_Result
+from .basictests import test_poisson1sample, test_poisson1sample_from_stats, test_poisson1sample_Result
 
 
 
@@ -23,6 +25,7 @@ from .nonparametric import test_wilcox, test_wilcox_Result
 from .nonparametric import test_mannwhitney, test_mannwhitney_Result
 from .nonparametric import test_kruskal, test_kruskal_Result
 from .nonparametric import test_friedman, test_friedman_Result
+from .nonparametric import test_permutation, test_permutation_Result
 
 
 from .tables import tally, tally_Result
@@ -52,8 +55,13 @@ from ._distributions import \
 	psmirnov, \
 	dt, pt, qt, rt, \
 	dunif, punif, qunif, runif, \
-	dweibull, pweibull, qweibull, rweibull
+	dweibull, pweibull, qweibull, rweibull, \
+	spawn_rng, distcache_info, distcache_clear, distcache_Info, \
+	table, table_Result
 
 
 
 
+
+
+from . import dist
\ No newline at end of file
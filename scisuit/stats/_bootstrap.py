@@ -0,0 +1,216 @@
+import inspect as _inspect
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from numbers import Real
+from typing import Callable, Iterable
+
+import numpy as _np
+
+from ._distributions import pnorm, qnorm, spawn_rng
+from ._validate import asarray as _asarray, check_conflevel as _check_conflevel
+
+
+
+
+def _evaluate(statistic:Callable, resampled:list[_np.ndarray], vectorized:bool)->_np.ndarray:
+	"""
+	statistic for each of the B resamples stacked along axis 0 of resampled,
+	returns an array of shape (B, number of values the statistic returns)
+	"""
+	B = len(resampled[0])
+	if vectorized:
+		T = _np.asarray(statistic(*resampled, axis=1), dtype=_np.float64)
+	else:
+		T = _np.array([statistic(*[r[b] for r in resampled]) for b in range(B)], dtype=_np.float64)
+	return T.reshape(B, -1)
+
+
+
+def _boot_block(statistic, samples, paired, vectorized, B, gen):
+	"""
+	statistic for B resamples drawn as one block of indices,
+	the generator is returned with its advanced state
+	"""
+	if paired:
+		idx = gen.integers(0, len(samples[0]), size=(B, len(samples[0])))
+		resampled = [s[idx] for s in samples]
+	else:
+		resampled = [s[gen.integers(0, len(s), size=(B, len(s)))] for s in samples]
+
+	return _evaluate(statistic, resampled, vectorized), gen
+
+
+
+def _jack_block(statistic, samples, group, start, stop, vectorized):
+	"""
+	leave-one-out statistic for observations start..stop-1 of the samples in group,
+	(all samples are in the group when paired)
+	"""
+	n = len(samples[group[0]])
+	i = _np.arange(start, stop)
+	j = _np.arange(n - 1)
+	idx = j[None, :] + (j[None, :] >= i[:, None]) #row r skips observation i[r]
+
+	resampled = []
+	for k, s in enumerate(samples):
+		resampled.append(s[idx] if k in group else _np.broadcast_to(s, (len(i),) + s.shape))
+
+	return _evaluate(statistic, resampled, vectorized)
+
+
+
+
+@dataclass
+class bootstrap_Result:
+	statistic:float|_np.ndarray
+	lower:float|_np.ndarray
+	upper:float|_np.ndarray
+	stderr:float|_np.ndarray #standard deviation of the bootstrap distribution
+	bias:float|_np.ndarray
+	conflevel:float
+	method:str
+	nboot:int
+	distribution:_np.ndarray #nboot x number of values the statistic returns
+
+	def __str__(self):
+		s = f"Bootstrap {self.conflevel*100}% confidence interval ({self.method}) \n"
+		s += f"Statistic = {self.statistic} \n"
+		s += f"Interval = ({self.lower}, {self.upper}) \n"
+		s += f"Std error = {self.stderr}, Bias = {self.bias} \n"
+		s += f"Resamples = {self.nboot}"
+		return s
+
+
+
+def bootstrap(
+		statistic:Callable,
+		data:Iterable|tuple,
+		nboot:int = 9999,
+		method:str = "bca",
+		conflevel:Real = 0.95,
+		paired:bool = False,
+		vectorized:bool|None = None,
+		blocksize:int = 1000,
+		rng = None,
+		workers:int = 1)->bootstrap_Result:
+	"""
+	Bootstrap confidence interval of a statistic.
+
+	statistic: called as statistic(*samples), returns a number or a 1D array.
+	If vectorized, called as statistic(*samples, axis=1) with a block of resamples stacked along axis 0.
+	data: a sample, or a tuple of samples (observations along axis 0)
+	nboot: number of resamples
+	method: "percentile", "basic" or "bca" (bias-corrected and accelerated)
+	conflevel: Confidence level, (0,1)
+	paired: resample rows of all samples together (i.e. x and y of a regression)
+	vectorized: None to decide by whether statistic accepts an axis argument
+	blocksize: resamples drawn and evaluated at once (per worker)
+	rng: None (fresh entropy), int seed or numpy.random.Generator
+	workers: number of processes (statistic must be picklable), each draws from its own stream
+	"""
+	assert callable(statistic), "statistic must be callable"
+	assert method in ["percentile", "basic", "bca"], "method must be 'percentile', 'basic' or 'bca'"
+	_check_conflevel(conflevel)
+	assert isinstance(nboot, int) and nboot > 1, "nboot>1 expected"
+	assert isinstance(blocksize, int) and blocksize > 0, "blocksize>0 expected"
+	assert isinstance(workers, int) and workers > 0, "workers>0 expected"
+
+	Data = data if isinstance(data, tuple) else (data, )
+	samples = [_asarray(v, f"sample {i+1}", minsize=2, ndim=None) for i, v in enumerate(Data)]
+	if paired:
+		assert len(set(len(s) for s in samples)) == 1, "paired samples must have same length"
+
+	if vectorized is None:
+		try:
+			vectorized = "axis" in _inspect.signature(statistic).parameters
+		except (TypeError, ValueError):
+			vectorized = False
+
+	theta = _evaluate(statistic, [s[None, ...] for s in samples], vectorized)[0]
+
+	if isinstance(rng, _np.random.Generator):
+		gens = rng.spawn(workers)
+	else:
+		gens = spawn_rng(workers, seed=rng)
+
+	#leave-one-out blocks for the acceleration
+	groups = [list(range(len(samples)))] if paired else [[k] for k in range(len(samples))]
+	jackblocks = []
+	if method == "bca":
+		for g in groups:
+			n = len(samples[g[0]])
+			jackblocks += [(g, i, min(i + blocksize, n)) for i in range(0, n, blocksize)]
+
+	pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+	Boot, Jack = [], []
+	try:
+		done = 0
+		while done < nboot:
+			sizes = []
+			for _ in gens:
+				sizes.append(min(blocksize, nboot - done - sum(sizes)))
+			sizes = [v for v in sizes if v > 0]
+
+			if pool is None:
+				results = [_boot_block(statistic, samples, paired, vectorized, sizes[0], gens[0])]
+			else:
+				futures = [pool.submit(_boot_block, statistic, samples, paired, vectorized, B, g) for B, g in zip(sizes, gens)]
+				results = [f.result() for f in futures]
+
+			for i, (T, g) in enumerate(results):
+				Boot.append(T)
+				gens[i] = g
+			done += sum(sizes)
+
+		if pool is None:
+			Jack = [_jack_block(statistic, samples, g, i, j, vectorized) for g, i, j in jackblocks]
+		else:
+			futures = [pool.submit(_jack_block, statistic, samples, g, i, j, vectorized) for g, i, j in jackblocks]
+			Jack = [f.result() for f in futures]
+	finally:
+		if pool is not None:
+			pool.shutdown()
+
+	Boot = _np.concatenate(Boot)
+	alpha = (1 - conflevel)/2
+
+	if method == "percentile":
+		lower, upper = _np.quantile(Boot, [alpha, 1 - alpha], axis=0)
+
+	elif method == "basic":
+		qlow, qhigh = _np.quantile(Boot, [alpha, 1 - alpha], axis=0)
+		lower, upper = 2*theta - qhigh, 2*theta - qlow
+
+	else:
+		z0 = qnorm((_np.sum(Boot < theta, axis=0) + 0.5*_np.sum(Boot == theta, axis=0))/nboot)
+
+		#empirical influence values U=(n-1)*(mean-jackknife) of each sample are centered 
+		#on the sample's own mean and scaled by its size (Efron, 1987)
+		num, den = 0.0, 0.0
+		for g in groups:
+			Jg = _np.concatenate([J for J, (grp, _, _) in zip(Jack, jackblocks) if grp is g])
+			n = len(Jg)
+			U = (n - 1)*(Jg.mean(axis=0) - Jg)
+			num, den = num + _np.sum(U**3, axis=0)/n**3, den + _np.sum(U**2, axis=0)/n**2
+		den = 6*den**1.5
+		a = _np.divide(num, den, out=_np.zeros_like(num), where=den > 0)
+
+		za = _np.array([qnorm(alpha), qnorm(1 - alpha)])[:, None]
+		probs = pnorm(z0 + (z0 + za)/(1 - a*(z0 + za)))
+		lower = _np.array([_np.quantile(Boot[:, j], probs[0, j]) for j in range(Boot.shape[1])])
+		upper = _np.array([_np.quantile(Boot[:, j], probs[1, j]) for j in range(Boot.shape[1])])
+
+	def _out(v):
+		v = _np.asarray(v, dtype=_np.float64)
+		return float(v[0]) if v.size == 1 else v
+
+	return bootstrap_Result(
+		statistic=_out(theta),
+		lower=_out(lower),
+		upper=_out(upper),
+		stderr=_out(_np.std(Boot, axis=0, ddof=1)),
+		bias=_out(Boot.mean(axis=0) - theta),
+		conflevel=conflevel,
+		method=method,
+		nboot=nboot,
+		distribution=Boot)
\ No newline at end of file
@@ -1,11 +1,13 @@
 import math as _math
 
 import numpy as _np
+from dataclasses import dataclass
 from typing import Iterable 
 from numbers import Real
 
 from ctypes import py_object, c_int
 from .._ctypeslib import pydll as _pydll
+from ._validate import asarray as _asarray
 
 
 
@@ -131,6 +133,148 @@ def moveavg(x, y, period=2)->tuple[list[Real], list[Real]]:
 
 
 
+def _cholupdate(R:list[list[float]], x:list[float], sign:float)->bool:
+	"""
+	R'R + sign*x'x in place (rank-one update if sign=1, downdate if sign=-1)
+	R: upper triangular with non-negative diagonal (nested lists, which are faster 
+	than ndarrays for the few elements of a row), x is overwritten
+
+	Returns False (R is then invalid) if a diagonal element is zero or a downdate 
+	cancels most of it, the factor must then be recomputed from the rows.
+	"""
+	m = len(x)
+	for k in range(m - 1):
+		Rk = R[k]
+		Rkk, xk = Rk[k], x[k]
+		r2 = Rkk*Rkk + sign*xk*xk
+		if not (Rkk > 0 and r2 > 1E-8*Rkk*Rkk):
+			return False
+
+		r = _math.sqrt(r2)
+		c, s = r/Rkk, xk/Rkk
+		Rk[k] = r
+		for j in range(k + 1, m):
+			Rk[j] = (Rk[j] + sign*s*x[j])/c
+			x[j] = c*x[j] - s*Rk[j]
+
+	#last diagonal element is the square root of the residual sum of squares
+	r2 = R[-1][-1]**2 + sign*x[-1]**2
+	if sign < 0 and not r2 > 1E-8*R[-1][-1]**2:
+		return False
+
+	R[-1][-1] = _math.sqrt(r2)
+	return True
+
+
+
+def _triangular(A:_np.ndarray)->_np.ndarray:
+	"""upper triangular factor of A with non-negative diagonal"""
+	R = _np.linalg.qr(A, mode="r")
+	return R*_np.where(_np.diag(R) < 0, -1.0, 1.0)[:, None]
+
+
+
+@dataclass
+class rolling_linregress_Result:
+	Coefficients:_np.ndarray #a row for each window (intercept first)
+	stderr:_np.ndarray #standard errors of coefficients
+	R2:_np.ndarray
+	index:_np.ndarray #position of the last observation of each window
+
+	def __str__(self):
+		s = f"Rolling regression over {len(self.index)} windows \n"
+		s += f"Coefficients (last window) = {self.Coefficients[-1]} \n"
+		s += f"R2 (last window) = {self.R2[-1]}"
+		return s
+
+
+
+def rolling_linregress(
+		yobs:Iterable, 
+		factor:Iterable | Iterable[Iterable], 
+		period:int|None = None, 
+		intercept=True)->rolling_linregress_Result:
+	"""
+	Linear regression over a sliding window of rows (or an expanding window if period is None)
+
+	The triangular factor of [1 | X | y] is carried from window to window with O(p^2) 
+	rank-one updates (entering row) and downdates (leaving row), and recomputed from 
+	the window once every period steps to bound the accumulated rounding error. 
+	It is also recomputed when a downdate cancels a diagonal element, and windows 
+	that are rank deficient (i.e. a constant predictor) give nan.
+
+	yobs: Dependent data  
+	factor: independent data, same layout as linregress   
+	period: number of rows in a window, None for an expanding window  
+	intercept: True if there is intercept
+	"""
+	from .regression._linear_multiple import _Augmented
+
+	Observed = _asarray(yobs, "yobs")
+	Factor = _asarray(factor, "factor", ndim=None)
+	assert Factor.ndim in [1, 2], "factor must be either Iterable, Iterable[Iterable]"
+	Factor = Factor[:, None] if Factor.ndim == 1 else _np.transpose(Factor)
+	assert Factor.shape[0] == Observed.size, "Rows of factor == size of observed variables expected."
+
+	A = _Augmented(Observed, Factor, intercept)
+	T, m = A.shape
+	p = m - 1 #number of coefficients
+
+	start = m if period is None else period
+	assert period is None or isinstance(period, int), "period must be int or None"
+	assert start > p, f"period must be greater than the number of coefficients ({p})"
+	assert T >= start, "not enough observations for a single window"
+
+	Rows = A.tolist()
+	Rs = _np.empty((T - start + 1, m, m))
+	Rs[0] = _triangular(A[:start])
+	R = Rs[0].tolist()
+
+	for t in range(start, T):
+		if period is not None and (t - start + 1) % period == 0:
+			Rs[t - start + 1] = _triangular(A[t - period + 1:t + 1])
+			R = Rs[t - start + 1].tolist()
+			continue
+
+		ok = _cholupdate(R, Rows[t][:], 1.0)
+		if ok and period is not None:
+			ok = _cholupdate(R, Rows[t - period][:], -1.0)
+
+		if ok:
+			Rs[t - start + 1] = R
+		else:
+			#rank deficient or ill-conditioned window, recompute its factor
+			Rs[t - start + 1] = _triangular(A[0 if period is None else t - period + 1:t + 1])
+			R = Rs[t - start + 1].tolist()
+
+	#all windows at once
+	nobs = _np.arange(start, T + 1) if period is None else _np.full(T - start + 1, period)
+	Rxx = Rs[:, :p, :p].copy()
+
+	#windows where a column is (numerically) a combination of the others give nan
+	diag = _np.abs(_np.diagonal(Rxx, axis1=1, axis2=2))
+	singular = _np.any(diag <= 1E-10*_np.linalg.norm(Rxx, axis=1), axis=1)
+	Rxx[singular] = _np.eye(p)
+
+	Coeffs = _np.linalg.solve(Rxx, Rs[:, :p, p:])[:, :, 0]
+
+	SS_Residual = Rs[:, p, p]**2
+	SS_Total = _np.sum(Rs[:, 1 if intercept else 0:, p]**2, axis=1)
+	MS_Residual = SS_Residual/(nobs - p)
+
+	Rinv = _np.linalg.solve(Rxx, _np.broadcast_to(_np.eye(p), Rxx.shape))
+	stderr = _np.sqrt(_np.sum(Rinv**2, axis=2)*MS_Residual[:, None])
+
+	R2 = 1.0 - SS_Residual/SS_Total
+	Coeffs[singular], stderr[singular], R2[singular] = _np.nan, _np.nan, _np.nan
+
+	return rolling_linregress_Result(
+			Coefficients=Coeffs, 
+			stderr=stderr, 
+			R2=R2, 
+			index=_np.arange(start - 1, T))
+
+
 
 
 def skew(y:Iterable)->float:
@@ -1,43 +1,54 @@
 from ctypes import c_double, c_int, py_object
+from dataclasses import dataclass
 from numbers import Real
 from typing import Iterable
 
 import numpy as _np
 
-from .._ctypeslib import pydll as _pydll
+from .. import settings as _settings
+from .._ctypeslib import pydll as _pydll, HAS_NATIVE as _HAS_NATIVE
+from . import _npdist
 
 
 
 
-_pydll.c_stat_dbeta.argtypes = [py_object,  c_double, c_double]
+_pydll.c_stat_dist_setpool.argtypes = [c_int, c_int]
+_pydll.c_stat_dist_setpool.restype=py_object
+
+_pydll.c_stat_dist_getpool.argtypes = []
+_pydll.c_stat_dist_getpool.restype=py_object
+
+#----
+
+_pydll.c_stat_dbeta.argtypes = [py_object, py_object, c_double, c_double, c_int]
 _pydll.c_stat_dbeta.restype=py_object
 
-_pydll.c_stat_pbeta.argtypes = [py_object,  c_double, c_double]
+_pydll.c_stat_pbeta.argtypes = [py_object, py_object, c_double, c_double, c_int, c_int]
 _pydll.c_stat_pbeta.restype=py_object
 
-_pydll.c_stat_qbeta.argtypes = [py_object,  c_double, c_double]
+_pydll.c_stat_qbeta.argtypes = [py_object, py_object, c_double, c_double]
 _pydll.c_stat_qbeta.restype=py_object
 
 #----
 
-_pydll.c_stat_dbinom.argtypes = [py_object, c_int, c_double]
+_pydll.c_stat_dbinom.argtypes = [py_object, py_object, c_int, c_double, c_int]
 _pydll.c_stat_dbinom.restype=py_object
 
-_pydll.c_stat_pbinom.argtypes = [py_object, c_int, c_double]
+_pydll.c_stat_pbinom.argtypes = [py_object, py_object, c_int, c_double, c_int, c_int]
 _pydll.c_stat_pbinom.restype=py_object
 
-_pydll.c_stat_qbinom.argtypes = [py_object, c_int, c_double]
+_pydll.c_stat_qbinom.argtypes = [py_object, py_object, c_int, c_double]
 _pydll.c_stat_qbinom.restype=py_object
 
 #----
 
-_pydll.c_stat_dnbinom.argtypes = [py_object, c_int, c_double]
+_pydll.c_stat_dnbinom.argtypes = [py_object, py_object, c_int, c_double, c_int]
 _pydll.c_stat_dnbinom.restype=py_object
 
-_pydll.c_stat_pnbinom.argtypes = [py_object, c_int, c_double]
+_pydll.c_stat_pnbinom.argtypes = [py_object, py_object, c_int, c_double, c_int, c_int]
 _pydll.c_stat_pnbinom.restype=py_object
 
-_pydll.c_stat_qnbinom.argtypes = [py_object, c_int, c_double]
+_pydll.c_stat_qnbinom.argtypes = [py_object, py_object, c_int, c_double]
 _pydll.c_stat_qnbinom.restype=py_object
 
 #----
@@ -47,318 +58,580 @@ _pydll.c_stat_dmultinom.restype=py_object
 
 #----
 
-_pydll.c_stat_dchisq.argtypes = [py_object, c_int]
+_pydll.c_stat_dchisq.argtypes = [py_object, py_object, c_int, c_int]
 _pydll.c_stat_dchisq.restype=py_object
 
-_pydll.c_stat_pchisq.argtypes = [py_object, c_int]
+_pydll.c_stat_pchisq.argtypes = [py_object, py_object, c_int, c_int, c_int]
 _pydll.c_stat_pchisq.restype=py_object
 
-_pydll.c_stat_qchisq.argtypes = [py_object, c_int]
+_pydll.c_stat_qchisq.argtypes = [py_object, py_object, c_int]
 _pydll.c_stat_qchisq.restype=py_object
 
 #----
 
-_pydll.c_stat_dexp.argtypes = [py_object, c_double]
+_pydll.c_stat_dexp.argtypes = [py_object, py_object, c_double, c_int]
 _pydll.c_stat_dexp.restype=py_object
 
-_pydll.c_stat_pexp.argtypes = [py_object, c_double]
+_pydll.c_stat_pexp.argtypes = [py_object, py_object, c_double, c_int, c_int]
 _pydll.c_stat_pexp.restype=py_object
 
-_pydll.c_stat_qexp.argtypes = [py_object, c_double]
+_pydll.c_stat_qexp.argtypes = [py_object, py_object, c_double]
 _pydll.c_stat_qexp.restype=py_object
 
 #----
 
-_pydll.c_stat_df.argtypes = [py_object, c_int, c_int]
+_pydll.c_stat_df.argtypes = [py_object, py_object, c_int, c_int, c_int]
 _pydll.c_stat_df.restype=py_object
 
-_pydll.c_stat_pf.argtypes = [py_object, c_int, c_int]
+_pydll.c_stat_pf.argtypes = [py_object, py_object, c_int, c_int, c_int, c_int]
 _pydll.c_stat_pf.restype=py_object
 
-_pydll.c_stat_qf.argtypes = [py_object, c_int, c_int]
+_pydll.c_stat_qf.argtypes = [py_object, py_object, c_int, c_int]
 _pydll.c_stat_qf.restype=py_object
 
 #----
 
-_pydll.c_stat_dgamma.argtypes = [py_object, c_double, c_double]
+_pydll.c_stat_dgamma.argtypes = [py_object, py_object, c_double, c_double, c_int]
 _pydll.c_stat_dgamma.restype=py_object
 
-_pydll.c_stat_pgamma.argtypes = [py_object, c_double, c_double]
+_pydll.c_stat_pgamma.argtypes = [py_object, py_object, c_double, c_double, c_int, c_int]
 _pydll.c_stat_pgamma.restype=py_object
 
-_pydll.c_stat_qgamma.argtypes = [py_object, c_double, c_double]
+_pydll.c_stat_qgamma.argtypes = [py_object, py_object, c_double, c_double]
 _pydll.c_stat_qgamma.restype=py_object
 
 #----
 
-_pydll.c_stat_dgeom.argtypes = [py_object, c_double]
+_pydll.c_stat_dgeom.argtypes = [py_object, py_object, c_double, c_int]
 _pydll.c_stat_dgeom.restype=py_object
 
-_pydll.c_stat_pgeom.argtypes =  [py_object, c_double]
+_pydll.c_stat_pgeom.argtypes =  [py_object, py_object, c_double, c_int, c_int]
 _pydll.c_stat_pgeom.restype=py_object
 
-_pydll.c_stat_qgeom.argtypes =  [py_object, c_double]
+_pydll.c_stat_qgeom.argtypes =  [py_object, py_object, c_double]
 _pydll.c_stat_qgeom.restype=py_object
 
 #----
 
-_pydll.c_stat_dhyper.argtypes = [py_object, c_int, c_int, c_int]
+_pydll.c_stat_dhyper.argtypes = [py_object, py_object, c_int, c_int, c_int, c_int]
 _pydll.c_stat_dhyper.restype=py_object
 
-_pydll.c_stat_phyper.argtypes = [py_object, c_int, c_int, c_int]
+_pydll.c_stat_phyper.argtypes = [py_object, py_object, c_int, c_int, c_int, c_int, c_int]
 _pydll.c_stat_phyper.restype=py_object
 
-_pydll.c_stat_qhyper.argtypes = [py_object, c_int, c_int, c_int]
+_pydll.c_stat_qhyper.argtypes = [py_object, py_object, c_int, c_int, c_int]
 _pydll.c_stat_qhyper.restype=py_object
 
 #----
 
-_pydll.c_stat_dnorm.argtypes = [py_object, c_double, c_double]
+_pydll.c_stat_dnorm.argtypes = [py_object, py_object, c_double, c_double, c_int]
 _pydll.c_stat_dnorm.restype=py_object
 
-_pydll.c_stat_pnorm.argtypes = [py_object, c_double, c_double]
+_pydll.c_stat_pnorm.argtypes = [py_object, py_object, c_double, c_double, c_int, c_int]
 _pydll.c_stat_pnorm.restype=py_object
 
-_pydll.c_stat_qnorm.argtypes = [py_object, c_double, c_double]
+_pydll.c_stat_qnorm.argtypes = [py_object, py_object, c_double, c_double]
 _pydll.c_stat_qnorm.restype=py_object
 
 #----
 
-_pydll.c_stat_dlnorm.argtypes = [py_object, c_double, c_double]
+_pydll.c_stat_dlnorm.argtypes = [py_object, py_object, c_double, c_double, c_int]
 _pydll.c_stat_dlnorm.restype=py_object
 
-_pydll.c_stat_plnorm.argtypes = [py_object, c_double, c_double]
+_pydll.c_stat_plnorm.argtypes = [py_object, py_object, c_double, c_double, c_int, c_int]
 _pydll.c_stat_plnorm.restype=py_object
 
-_pydll.c_stat_qlnorm.argtypes = [py_object, c_double, c_double]
+_pydll.c_stat_qlnorm.argtypes = [py_object, py_object, c_double, c_double]
 _pydll.c_stat_qlnorm.restype=py_object
 
 #----
 
-_pydll.c_stat_dpareto.argtypes = [py_object, c_double, c_double]
+_pydll.c_stat_dpareto.argtypes = [py_object, py_object, c_double, c_double, c_int]
 _pydll.c_stat_dpareto.restype=py_object
 
-_pydll.c_stat_ppareto.argtypes = [py_object, c_double, c_double]
+_pydll.c_stat_ppareto.argtypes = [py_object, py_object, c_double, c_double, c_int, c_int]
 _pydll.c_stat_ppareto.restype=py_object
 
-_pydll.c_stat_qpareto.argtypes = [py_object, c_double, c_double]
+_pydll.c_stat_qpareto.argtypes = [py_object, py_object, c_double, c_double]
 _pydll.c_stat_qpareto.restype=py_object
 
 #----
 
-_pydll.c_stat_dpois.argtypes = [py_object, c_double]
+_pydll.c_stat_dpois.argtypes = [py_object, py_object, c_double, c_int]
 _pydll.c_stat_dpois.restype=py_object
 
-_pydll.c_stat_ppois.argtypes = [py_object, c_double]
+_pydll.c_stat_ppois.argtypes = [py_object, py_object, c_double, c_int, c_int]
 _pydll.c_stat_ppois.restype=py_object
 
-_pydll.c_stat_qpois.argtypes = [py_object, c_double]
+_pydll.c_stat_qpois.argtypes = [py_object, py_object, c_double]
 _pydll.c_stat_qpois.restype=py_object
 
 
 #---
 
-_pydll.c_stat_psmirnov.argtypes = [py_object, c_int]
+_pydll.c_stat_psmirnov.argtypes = [py_object, py_object, c_int, c_int, c_int]
 _pydll.c_stat_psmirnov.restype=py_object
 
 
 #----
 
-_pydll.c_stat_dt.argtypes = [py_object, c_int]
+_pydll.c_stat_dt.argtypes = [py_object, py_object, c_int, c_int]
 _pydll.c_stat_dt.restype=py_object
 
-_pydll.c_stat_pt.argtypes = [py_object, c_int]
+_pydll.c_stat_pt.argtypes = [py_object, py_object, c_int, c_int, c_int]
 _pydll.c_stat_pt.restype=py_object
 
-_pydll.c_stat_qt.argtypes = [py_object, c_int]
+_pydll.c_stat_qt.argtypes = [py_object, py_object, c_int]
 _pydll.c_stat_qt.restype=py_object
 
 #----
 
-_pydll.c_stat_dunif.argtypes = [py_object, c_double, c_double]
+_pydll.c_stat_dunif.argtypes = [py_object, py_object, c_double, c_double, c_int]
 _pydll.c_stat_dunif.restype=py_object
 
-_pydll.c_stat_punif.argtypes = [py_object, c_double, c_double]
+_pydll.c_stat_punif.argtypes = [py_object, py_object, c_double, c_double, c_int, c_int]
 _pydll.c_stat_punif.restype=py_object
 
-_pydll.c_stat_qunif.argtypes = [py_object, c_double, c_double]
+_pydll.c_stat_qunif.argtypes = [py_object, py_object, c_double, c_double]
 _pydll.c_stat_qunif.restype=py_object
 
 #----
 
-_pydll.c_stat_dweibull.argtypes = [py_object, c_double, c_double]
+_pydll.c_stat_dweibull.argtypes = [py_object, py_object, c_double, c_double, c_int]
 _pydll.c_stat_dweibull.restype=py_object
 
-_pydll.c_stat_pweibull.argtypes = [py_object, c_double, c_double]
+_pydll.c_stat_pweibull.argtypes = [py_object, py_object, c_double, c_double, c_int, c_int]
 _pydll.c_stat_pweibull.restype=py_object
 
-_pydll.c_stat_qweibull.argtypes = [py_object, c_double, c_double]
+_pydll.c_stat_qweibull.argtypes = [py_object, py_object, c_double, c_double]
 _pydll.c_stat_qweibull.restype=py_object
 
 #----
 
-_pydll.c_stat_dsignrank.argtypes = [py_object, c_int]
+_pydll.c_stat_dsignrank.argtypes = [py_object, py_object, c_int, c_int]
 _pydll.c_stat_dsignrank.restype=py_object
 
-_pydll.c_stat_psignrank.argtypes = [py_object, c_int]
+_pydll.c_stat_psignrank.argtypes = [py_object, py_object, c_int, c_int, c_int]
 _pydll.c_stat_psignrank.restype=py_object
 
-_pydll.c_stat_qsignrank.argtypes = [py_object, c_int]
+_pydll.c_stat_qsignrank.argtypes = [py_object, py_object, c_int]
 _pydll.c_stat_qsignrank.restype=py_object
 
 
 
 
+def _asbuffer(x, out:_np.ndarray|None):
+	"""
+	Objects supporting the buffer protocol (i.e. ndarray) are converted to a C-contiguous
+	float64 ndarray and an output array of the same shape is allocated (unless out is provided).
+	Real numbers and other Iterables are returned as is, with out being None.
+	"""
+	if isinstance(x, Real): #also numpy scalars, which support the buffer protocol
+		assert out is None, "out requires x to be an ndarray"
+		return x, None
+
+	if not isinstance(x, _np.ndarray):
+		try:
+			memoryview(x)
+		except TypeError:
+			assert out is None, "out requires x to be an ndarray"
+			return x, None
+
+	X = _np.asarray(x, dtype=_np.float64, order="C")
+	if out is None:
+		return X, _np.empty_like(X)
+
+	assert isinstance(out, _np.ndarray), "out must be ndarray"
+	assert out.dtype == _np.float64 and out.flags.c_contiguous, "out must be C-contiguous float64 ndarray"
+	assert out.shape == X.shape, "out must have same shape as x"
+
+	return X, out
+
+
+
+def _broadcast(name:str, x, out:_np.ndarray|None, *args, **kwargs)->list|_np.ndarray:
+	"""
+	Evaluates the NumPy counterpart of `name` where x and parameters are broadcast
+	against each other (NumPy rules) and evaluated in a single vectorized pass.
+
+	Returns ndarray (or out) if any of the arguments is an ndarray, otherwise list.
+	"""
+	Args = [x, *args]
+	IsArray = any(isinstance(v, _np.ndarray) for v in Args)
+
+	#generators and other one-pass Iterables
+	Args = [v if isinstance(v, (Real, list, tuple, _np.ndarray)) else list(v) for v in Args]
+	Res = getattr(_npdist, name)(*[_np.asarray(v, dtype=_np.float64) for v in Args], **kwargs)
+
+	if out is not None:
+		assert isinstance(out, _np.ndarray), "out must be ndarray"
+		assert out.shape == Res.shape, f"out must have the broadcast shape {Res.shape}"
+		_np.copyto(out, Res)
+		return out
+
+	return Res if IsArray else Res.tolist()
+
+
+
+def _generator(rng):
+	"""
+	rng: None, int seed, SeedSequence or numpy.random.Generator
+
+	None returns the legacy global state (numpy.random) so that numpy.random.seed keeps working.
+	"""
+	if rng is None:
+		return _np.random
+	if isinstance(rng, _np.random.Generator):
+		return rng
+	return _np.random.default_rng(rng)
+
+
+def _draw(method:str, n:int, rng, asarray:bool, **kwargs)->list|_np.ndarray:
+	"""draws n variates using the method of the generator"""
+	retVal = getattr(_generator(rng), method)(size=n, **kwargs)
+	return retVal if asarray else retVal.tolist()
+
+
+def spawn_rng(n:int, seed:int|None = None)->list[_np.random.Generator]:
+	"""
+	Creates n statistically independent generators from a single seed (SeedSequence.spawn).
+	Each generator can be passed as `rng` to a different worker (thread or process).
+
+	n: number of streams
+	seed: entropy of the root SeedSequence, None for fresh entropy
+	"""
+	assert isinstance(n, int) and n>0, "n>0 expected"
+	return [_np.random.Generator(_np.random.PCG64(s)) for s in _np.random.SeedSequence(seed).spawn(n)]
+
+
+
+@dataclass
+class distcache_Info:
+	hits:int
+	misses:int
+	maxsize:int
+	currsize:int
+
+	def __str__(self):
+		s = "Distribution table cache \n"
+		s += f"hits={self.hits}, misses={self.misses}, size={self.currsize}/{self.maxsize}"
+		return s
+
+
+def distcache_info()->distcache_Info:
+	"""
+	Statistics of the cache of exact null-distribution tables 
+	(signed rank and Smirnov), discrete probability tables and quantile grids used by the NumPy backend.
+
+	The size of the cache is set by settings.DIST_CACHE_SIZE
+	"""
+	hits, misses, currsize = _npdist._CACHE.info()
+	return distcache_Info(hits=hits, misses=misses, maxsize=_settings.DIST_CACHE_SIZE, currsize=currsize)
+
+
+def distcache_clear():
+	"""Removes all tables from the cache and resets its statistics"""
+	_npdist._CACHE.clear()
+
+
+
+@dataclass
+class table_Result:
+	x:_np.ndarray
+	pmf:_np.ndarray
+	cdf:_np.ndarray
+	sf:_np.ndarray
+
+	def __str__(self):
+		s = f"Probability table over {len(self.x)} points \n"
+		s += f"x in [{self.x[0]:.0f}, {self.x[-1]:.0f}], total mass={_np.sum(self.pmf)}"
+		return s
+
+
+def table(dist:str, tol:float = 1E-16, **params)->table_Result:
+	"""
+	PMF, CDF and upper tail (P(X>x)) over the whole support of a discrete distribution, 
+	tables are cached (see distcache_info) and returned arrays are read-only.
+
+	dist: "binom" (size, prob), "hyper" (m, n, k), "nbinom" (size, prob) or "pois" (mu)
+	tol: supports of nbinom and pois end where P(X>x) <= tol
+	"""
+	assert tol>0 and tol<1, "tol in (0, 1) expected"
+
+	if dist in ["binom", "nbinom"]:
+		assert params.keys() == {"size", "prob"}, "size and prob expected"
+		assert params["size"] % 1 == 0, "size must be integer"
+		assert params["size"]>0, "size>0 expected"
+		assert 0<=params["prob"]<=1, "prob in [0, 1] expected"
+		if dist == "nbinom":
+			assert params["prob"]>0, "prob>0 expected"
+		args = (params["size"], params["prob"])
+
+	elif dist == "hyper":
+		assert params.keys() == {"m", "n", "k"}, "m, n and k expected"
+		assert all(params[v] % 1 == 0 for v in ("m", "n", "k")), "m, n and k must be integers"
+		assert params["m"]>=0 and params["n"]>=0, "m>=0 and n>=0 expected"
+		assert 0<=params["k"]<=params["m"]+params["n"], "k in [0, m+n] expected"
+		args = (params["m"], params["n"], params["k"])
+
+	elif dist == "pois":
+		assert params.keys() == {"mu"}, "mu expected"
+		assert params["mu"]>=0, "mu>=0 expected"
+		args = (params["mu"], )
+
+	else:
+		raise ValueError("dist must be 'binom', 'hyper', 'nbinom' or 'pois'")
+
+	x, pmf, cdf, sf = _npdist.pmf_table(dist, args, tol)
+	return table_Result(x=x, pmf=pmf, cdf=cdf, sf=sf)
+
+
+
+_POOL = None #(threads, chunksize) last passed to the native library
+
+
+def _sync_pool():
+	"""passes settings.DIST_THREADS and DIST_CHUNKSIZE to the native worker pool when they change"""
+	global _POOL
+	pool = (_settings.DIST_THREADS, _settings.DIST_CHUNKSIZE)
+	if pool == _POOL:
+		return
+
+	assert isinstance(pool[0], int) and pool[0]>=0, "DIST_THREADS>=0 expected"
+	assert isinstance(pool[1], int) and pool[1]>0, "DIST_CHUNKSIZE>0 expected"
+	_pydll.c_stat_dist_setpool(c_int(pool[0]), c_int(pool[1]))
+	_POOL = pool
+
+
+
+def _use_native()->bool:
+	"""Whether d/p/q functions are evaluated by the native library, see settings.DIST_BACKEND"""
+	backend = _settings.DIST_BACKEND
+	assert backend in ("auto", "native", "numpy"), "DIST_BACKEND must be 'auto', 'native' or 'numpy'"
+
+	if backend == "native" and not _HAS_NATIVE:
+		raise RuntimeError("DIST_BACKEND is 'native' but the native library could not be loaded.")
+
+	return backend == "native" or (backend == "auto" and _HAS_NATIVE)
+
+
+
+def _evaluate(name:str, x, out:_np.ndarray|None, *args, lower_tail:bool = True, log:bool = False)->list|Real|_np.ndarray:
+	"""
+	Evaluates the distribution function `name` (e.g. "dbeta") on x,
+	either by the native library or by its NumPy counterpart in _npdist.
+
+	ndarray input is passed as a buffer and results are written into out (returned),
+	Real returns Real and other Iterables return list.
+
+	If any of the parameters is not a Real number, see _broadcast.
+
+	lower_tail and log are passed on to the native d- and p-functions as trailing int flags.
+	"""
+	kwargs = {}
+	if not lower_tail:
+		kwargs["lower_tail"] = False
+	if log:
+		kwargs["log"] = True
+
+	if not all(isinstance(v, Real) for v in args):
+		return _broadcast(name, x, out, *args, **kwargs)
+
+	#opt-in interpolated quantiles, see settings.DIST_QUANTILE_GRID
+	UseGrid = _settings.DIST_QUANTILE_GRID and name in _npdist._QGRID
+
+	X, Out = _asbuffer(x, out)
+	if _use_native() and not UseGrid:
+		if Out is not None:
+			_sync_pool()
+		func = getattr(_pydll, "c_stat_" + name)
+		#ctypes only accepts int for c_int (not numpy integers or integral floats, i.e. floor(df))
+		args = [int(v) if t is c_int else v for v, t in zip(args, func.argtypes[2:])]
+		flags = {"d": (int(log), ), "p": (int(lower_tail), int(log))}.get(name[0], ())
+		return func(py_object(X), py_object(Out), *args, *flags)
+
+	func = _npdist.qgrid(name) if UseGrid else getattr(_npdist, name)
+	if Out is not None:
+		_np.copyto(Out, func(X, *args, **kwargs))
+		return Out
+
+	if isinstance(X, Real):
+		return float(func(X, *args, **kwargs))
+
+	return func(_np.fromiter(X, dtype=_np.float64), *args, **kwargs).tolist()
+
+
+
+
 
 
 
 # ----- Standard Beta Distribution  -------
 
-def dbeta(x:Iterable|Real, shape1:Real, shape2:Real)->list|Real:
+def dbeta(x:Iterable|Real, shape1:Real, shape2:Real, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	shape1, shape2: similar to alpha and beta
+	log: returns log of the density
 	"""
-	assert shape1>0, "shape1>0 expected"
-	assert shape2>0, "shape2>0 expected"
-	return _pydll.c_stat_dbeta(py_object(x), c_double(shape1), c_double(shape2))
+	assert _np.all(_np.asarray(shape1)>0), "shape1>0 expected"
+	assert _np.all(_np.asarray(shape2)>0), "shape2>0 expected"
+	return _evaluate("dbeta", x, out, shape1, shape2, log=log)
 
 
-def pbeta(q:Iterable|Real, shape1:Real, shape2:Real)->list|Real:
+def pbeta(q:Iterable|Real, shape1:Real, shape2:Real, lower_tail:bool = True, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	shape1, shape2: similar to alpha and beta
+	lower_tail: if True P(X<=q), otherwise P(X>q)
+	log: probabilities are returned as log(p)
 	"""
-	assert shape1>0, "shape1>0 expected"
-	assert shape2>0, "shape2>0 expected"
+	assert _np.all(_np.asarray(shape1)>0), "shape1>0 expected"
+	assert _np.all(_np.asarray(shape2)>0), "shape2>0 expected"
 
-	return _pydll.c_stat_pbeta(py_object(q), c_double(shape1), c_double(shape2))
+	return _evaluate("pbeta", q, out, shape1, shape2, lower_tail=lower_tail, log=log)
 
 
-def qbeta(p:Iterable|Real, shape1:Real, shape2:Real)->list|Real:
+def qbeta(p:Iterable|Real, shape1:Real, shape2:Real, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	shape1, shape2: similar to alpha and beta
 	"""
-	assert shape1>0, "shape1>0 expected"
-	assert shape2>0, "shape2>0 expected"
+	assert _np.all(_np.asarray(shape1)>0), "shape1>0 expected"
+	assert _np.all(_np.asarray(shape2)>0), "shape2>0 expected"
 
-	return _pydll.c_stat_qbeta(py_object(p), c_double(shape1), c_double(shape2))
+	return _evaluate("qbeta", p, out, shape1, shape2)
 	
 
-def rbeta(n:int, shape1:Real, shape2:Real)->list:
+def rbeta(n:int, shape1:Real, shape2:Real, rng=None, asarray:bool=False)->list|_np.ndarray:
 	"""
 	shape1, shape2: similar to alpha and beta
+
+	rng: int seed or numpy.random.Generator (see spawn_rng)
+	asarray: returns ndarray instead of list
 	"""
 	assert n>0 ,"n>0 expected"
 	assert shape1>0, "shape1>0 expected"
 	assert shape2>0, "shape2>0 expected"
 
-	return _np.random.beta(size=n, a=shape1, b=shape2).tolist()
+	return _draw("beta", n, rng, asarray, a=shape1, b=shape2)
 
 
 
 # ----- Binomial Distribution  -------
 
-def dbinom(x:Iterable|Real, size:int, prob:Real)->list|Real:
+def dbinom(x:Iterable|Real, size:int, prob:Real, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	size: number of trials
 	prob: probability of success in each trial
+	log: returns log of the density
 	"""
-	return _pydll.c_stat_dbinom(py_object(x), c_int(size), c_double(prob))
+	return _evaluate("dbinom", x, out, size, prob, log=log)
 
 
-def pbinom(q:Iterable|Real, size:int, prob:Real)->list|Real:
+def pbinom(q:Iterable|Real, size:int, prob:Real, lower_tail:bool = True, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	size: number of trials
 	prob: probability of success in each trial
+	lower_tail: if True P(X<=q), otherwise P(X>q)
+	log: probabilities are returned as log(p)
 	"""
-	assert size>0, "size>0 expected"
-	assert prob>=0 and prob<=1, "prob in [0, 1] expected"
+	assert _np.all(_np.asarray(size)>0), "size>0 expected"
+	assert _np.all((_np.asarray(prob)>=0) & (_np.asarray(prob)<=1)), "prob in [0, 1] expected"
 
-	return _pydll.c_stat_pbinom(py_object(q), c_int(size), c_double(prob))
+	return _evaluate("pbinom", q, out, size, prob, lower_tail=lower_tail, log=log)
 
 
-def qbinom(p:Iterable|Real, size:int, prob:Real)->list|Real:
+def qbinom(p:Iterable|Real, size:int, prob:Real, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	size: number of trials
 	prob: probability of success in each trial
 	"""
-	assert size>0, "size>0 expected"
-	assert prob>=0 and prob<=1, "prob in [0, 1] expected"
+	assert _np.all(_np.asarray(size)>0), "size>0 expected"
+	assert _np.all((_np.asarray(prob)>=0) & (_np.asarray(prob)<=1)), "prob in [0, 1] expected"
 
-	return _pydll.c_stat_qbinom(py_object(p), c_int(size), c_double(prob))
+	return _evaluate("qbinom", p, out, size, prob)
 	
 
-def rbinom(n:int, size:int, prob:Real)->list:
+def rbinom(n:int, size:int, prob:Real, rng=None, asarray:bool=False)->list|_np.ndarray:
 	"""
 	size: number of trials
 	prob: probability of success in each trial
+
+	rng: int seed or numpy.random.Generator (see spawn_rng)
+	asarray: returns ndarray instead of list
 	"""
 	assert n>0 ,"n>0 expected"
 	assert size>0, "size>0 expected"
 	assert prob>=0 and prob<=1, "prob in [0, 1] expected"
 
-	return _np.random.binomial(size=n, n=size, p=prob).tolist()
+	return _draw("binomial", n, rng, asarray, n=size, p=prob)
 
 
 
 
 # ----- Negative-Binomial Distribution  -------
 
-def dnbinom(x:Iterable|Real, size:int, prob:Real)->list|Real:
+def dnbinom(x:Iterable|Real, size:int, prob:Real, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	x: quantiles representing number of failures
 	size: target for number of successful trials
 	prob: probability of success in each trial
+	log: returns log of the density
 	"""
-	assert size>0, "size>0 expected"
-	assert prob>=0 and prob<=1, "prob in [0, 1] expected"
+	assert _np.all(_np.asarray(size)>0), "size>0 expected"
+	assert _np.all((_np.asarray(prob)>=0) & (_np.asarray(prob)<=1)), "prob in [0, 1] expected"
 
-	return _pydll.c_stat_dnbinom(py_object(x), c_int(size), c_double(prob))
+	return _evaluate("dnbinom", x, out, size, prob, log=log)
 
 
-def pnbinom(q:Iterable|Real, size:int, prob:Real)->list|Real:
+def pnbinom(q:Iterable|Real, size:int, prob:Real, lower_tail:bool = True, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	q: quantiles representing number of failures
 	size: target for number of successful trials
 	prob: probability of success in each trial
+	lower_tail: if True P(X<=q), otherwise P(X>q)
+	log: probabilities are returned as log(p)
 	"""
-	assert size>0, "size>0 expected"
-	assert prob>=0 and prob<=1, "prob in [0, 1] expected"
+	assert _np.all(_np.asarray(size)>0), "size>0 expected"
+	assert _np.all((_np.asarray(prob)>=0) & (_np.asarray(prob)<=1)), "prob in [0, 1] expected"
 
-	return _pydll.c_stat_pnbinom(py_object(q), c_int(size), c_double(prob))
+	return _evaluate("pnbinom", q, out, size, prob, lower_tail=lower_tail, log=log)
 
 
-def qnbinom(p:Iterable|Real, size:int, prob:Real)->list|Real:
+def qnbinom(p:Iterable|Real, size:int, prob:Real, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	p: probabilities
 	size: target for number of successful trials
 	prob: probability of success in each trial
 	"""
-	assert size>0, "size>0 expected"
-	assert prob>=0 and prob<=1, "prob in [0, 1] expected"
+	assert _np.all(_np.asarray(size)>0), "size>0 expected"
+	assert _np.all((_np.asarray(prob)>=0) & (_np.asarray(prob)<=1)), "prob in [0, 1] expected"
 
-	return _pydll.c_stat_qnbinom(py_object(p), c_int(size), c_double(prob))
+	return _evaluate("qnbinom", p, out, size, prob)
 
 
-def rnbinom(n:int, size:int, prob:Real)->list:
+def rnbinom(n:int, size:int, prob:Real, rng=None, asarray:bool=False)->list|_np.ndarray:
 	"""
 	size: target for number of successful trials
 	prob: probability of success in each trial
+
+	rng: int seed or numpy.random.Generator (see spawn_rng)
+	asarray: returns ndarray instead of list
 	"""
 	assert n>0 ,"n>0 expected"
 	assert size>0, "size>0 expected"
 	assert prob>=0 and prob<=1, "prob in [0, 1] expected"
 
-	return _np.random.negative_binomial(size=n, n=size, p=prob).tolist()
+	return _draw("negative_binomial", n, rng, asarray, n=size, p=prob)
 
 
 
 # ----- Multinomial Distribution  -------
 
-def dmultinom(x:Iterable, size:int, prob:Iterable)->Real:
+def dmultinom(x:Iterable, size:int, prob:Iterable, log:bool = False)->Real:
 	"""
 	x: quantiles 
 	size: number of trials
 	prob: probabilities of success in each trial
+	log: returns log of the probability
 
 	## Note:
 	Internally sum of probabilities is normalized to 1.0
@@ -367,15 +640,21 @@ def dmultinom(x:Iterable, size:int, prob:Iterable)->Real:
 	assert sum(x) == size, "sum(x) == size expected."
 	assert size>0, "size>0 expected"
 
+	if log or not _use_native():
+		return _npdist.dmultinom(x, size, prob, log)
+
 	return _pydll.c_stat_dmultinom(py_object(x), c_int(size), prob)
 
 
-def rmultinom(n:int, size:int, prob:Iterable)->list:
+def rmultinom(n:int, size:int, prob:Iterable, rng=None, asarray:bool=False)->list|_np.ndarray:
 	"""
 	size: number of trials
 	prob: probabilities of success in each trial
 
-	returns 2D list, where list[i] corresponds to prob[i]
+	rng: int seed or numpy.random.Generator (see spawn_rng)
+	asarray: returns ndarray instead of list
+
+	returns 2D list (len(prob) x n), where list[i] corresponds to prob[i]
 
 	## Note:
 	Sum of probabilities is normalized to 1.0
@@ -386,559 +665,664 @@ def rmultinom(n:int, size:int, prob:Iterable)->list:
 	Sum = sum(prob) 
 	assert Sum>0, "sum of probabilities must be >0"
 
-	return [rbinom(n, size, p/Sum) for p in prob]
+	P = _np.asarray(prob, dtype=_np.float64)/Sum
+
+	#each column is a draw whose counts sum to size
+	retVal = _generator(rng).multinomial(size, pvals=P, size=n).T
+	return retVal if asarray else retVal.tolist()
 
 
 
 
 # ----- Chi-Square Distribution  -------
 
-def dchisq(x:Iterable|Real, df:int)->list|Real:
+def dchisq(x:Iterable|Real, df:int, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	df: degrees of freedom
+	log: returns log of the density
 	"""
-	assert df>0, "df>0 expected"
-	return _pydll.c_stat_dchisq(py_object(x), c_int(df))
+	assert _np.all(_np.asarray(df)>0), "df>0 expected"
+	return _evaluate("dchisq", x, out, df, log=log)
 
 
-def pchisq(q:Iterable|Real, df:int)->list|Real:
+def pchisq(q:Iterable|Real, df:int, lower_tail:bool = True, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	df: degrees of freedom
+	lower_tail: if True P(X<=q), otherwise P(X>q)
+	log: probabilities are returned as log(p)
 	"""
-	assert df>0, "df>0 expected"	
-	return _pydll.c_stat_pchisq(py_object(q), c_int(df))
+	assert _np.all(_np.asarray(df)>0), "df>0 expected"
+	return _evaluate("pchisq", q, out, df, lower_tail=lower_tail, log=log)
 
 
-def qchisq(p:Iterable|Real, df:int)->list|Real:
+def qchisq(p:Iterable|Real, df:int, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	df: degrees of freedom
 	"""
-	assert df>0, "df>0 expected"
-	return _pydll.c_stat_qchisq(py_object(p), c_int(df))
+	assert _np.all(_np.asarray(df)>0), "df>0 expected"
+	return _evaluate("qchisq", p, out, df)
 
 
-def rchisq(n:int, df)->list:
+def rchisq(n:int, df, rng=None, asarray:bool=False)->list|_np.ndarray:
 	"""
 	df: degrees of freedom
+
+	rng: int seed or numpy.random.Generator (see spawn_rng)
+	asarray: returns ndarray instead of list
 	"""
 	assert n>0 ,"n>0 expected"
 	assert df>0, "df>0 expected"
 
-	return _np.random.chisquare(size=n, df = df).tolist()
+	return _draw("chisquare", n, rng, asarray, df = df)
 
 
 
 # ----- Exponential Distribution  -------
 
-def dexp(x:Iterable|Real, rate = 1.0)->list|Real:
+def dexp(x:Iterable|Real, rate = 1.0, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	x: quantiles
 	rate: 1/mean, where mean is the waiting time for the next event recurrence
+	log: returns log of the density
 	"""
-	return _pydll.c_stat_dexp(py_object(x), c_double(rate))
+	return _evaluate("dexp", x, out, rate, log=log)
 
 
-def pexp(q:Iterable|Real, rate = 1.0)->list|Real:
+def pexp(q:Iterable|Real, rate = 1.0, lower_tail:bool = True, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	q: quantiles
 	rate: 1/mean, where mean is the waiting time for the next event recurrence
+	lower_tail: if True P(X<=q), otherwise P(X>q)
+	log: probabilities are returned as log(p)
 	"""
-	return _pydll.c_stat_pexp(py_object(q),  c_double(rate))
+	return _evaluate("pexp", q, out, rate, lower_tail=lower_tail, log=log)
 
 
-def qexp(p:Iterable|Real, rate = 1.0)->list|Real:
+def qexp(p:Iterable|Real, rate = 1.0, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	p: probabilities
 	rate: 1/mean, where mean is the waiting time for the next event recurrence
 	"""
-	return _pydll.c_stat_qexp(py_object(p), c_double(rate))
+	return _evaluate("qexp", p, out, rate)
 
 
-def rexp(n:int, rate=1.0)->list:
+def rexp(n:int, rate=1.0, rng=None, asarray:bool=False)->list|_np.ndarray:
 	"""
 	rate: 1/mean, where mean is the waiting time for the next event recurrence
+
+	rng: int seed or numpy.random.Generator (see spawn_rng)
+	asarray: returns ndarray instead of list
 	"""
 	assert n>0 ,"n>0 expected"
 	assert rate>0, "rate>0 expected"
 
-	return _np.random.exponential(size=n, scale=1/rate).tolist()
+	return _draw("exponential", n, rng, asarray, scale=1/rate)
 
 
 
 # ----- F Distribution  -------
 
-def df(x:Iterable|Real, df1:int, df2:int)->list|Real:
+def df(x:Iterable|Real, df1:int, df2:int, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	df1: degrees of freedom, numerator
 	df2: degrees of freedom, denominator
+	log: returns log of the density
 	"""
-	assert df1>0, "df1>0 expected"
-	assert df2>0, "df2>0 expected"
+	assert _np.all(_np.asarray(df1)>0), "df1>0 expected"
+	assert _np.all(_np.asarray(df2)>0), "df2>0 expected"
 
-	return _pydll.c_stat_df(py_object(x), c_int(df1), c_int(df2))
+	return _evaluate("df", x, out, df1, df2, log=log)
 
 
-def pf(q:Iterable|Real, df1:int, df2:int)->list|Real:
+def pf(q:Iterable|Real, df1:int, df2:int, lower_tail:bool = True, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	df1: degrees of freedom, numerator
 	df2: degrees of freedom, denominator
+	lower_tail: if True P(X<=q), otherwise P(X>q)
+	log: probabilities are returned as log(p)
 	"""
-	assert df1>0, "df1>0 expected"
-	assert df2>0, "df2>0 expected"
+	assert _np.all(_np.asarray(df1)>0), "df1>0 expected"
+	assert _np.all(_np.asarray(df2)>0), "df2>0 expected"
 
-	return _pydll.c_stat_pf(py_object(q), c_int(df1), c_int(df2))
+	return _evaluate("pf", q, out, df1, df2, lower_tail=lower_tail, log=log)
 
-def qf(p:Iterable|Real, df1:int, df2:int)->list|Real:
+def qf(p:Iterable|Real, df1:int, df2:int, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	df1: degrees of freedom, numerator
 	df2: degrees of freedom, denominator
 	"""
-	assert df1>0, "df1>0 expected"
-	assert df2>0, "df2>0 expected"
+	assert _np.all(_np.asarray(df1)>0), "df1>0 expected"
+	assert _np.all(_np.asarray(df2)>0), "df2>0 expected"
 
-	return _pydll.c_stat_qf(py_object(p), c_int(df1), c_int(df2))
+	return _evaluate("qf", p, out, df1, df2)
 
 
-def rf(n:int, df1, df2)->list:
+def rf(n:int, df1, df2, rng=None, asarray:bool=False)->list|_np.ndarray:
 	"""
 	df1: degrees of freedom, numerator
 	df2: degrees of freedom, denominator
+
+	rng: int seed or numpy.random.Generator (see spawn_rng)
+	asarray: returns ndarray instead of list
 	"""
 	assert n>0 ,"n>0 expected"
 	assert df1>0, "df1>0 expected"
 	assert df2>0, "df2>0 expected"
 
-	return _np.random.f(size=n, dfnum=df1, dfden=df2).tolist()
+	return _draw("f", n, rng, asarray, dfnum=df1, dfden=df2)
 
 
 
 
 # ----- Gamma Distribution  -------
 
-def dgamma(x:Iterable|Real, shape:Real, scale = 1.0)->list|Real:
+def dgamma(x:Iterable|Real, shape:Real, scale = 1.0, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	x: quantile	
 	shape: waiting time for the rth event to occur
 	scale: average waiting time for the next event recurrence
+	log: returns log of the density
 	"""
-	return _pydll.c_stat_dgamma(py_object(x), c_double(shape), c_double(scale))
+	return _evaluate("dgamma", x, out, shape, scale, log=log)
 
 
-def pgamma(q:Iterable|Real, shape:Real, scale = 1.0)->list|Real:
+def pgamma(q:Iterable|Real, shape:Real, scale = 1.0, lower_tail:bool = True, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	q: quantile
 	shape: waiting time for the rth event to occur
 	scale: average waiting time for the next event recurrence
+	lower_tail: if True P(X<=q), otherwise P(X>q)
+	log: probabilities are returned as log(p)
 	"""
-	return _pydll.c_stat_pgamma(py_object(q), c_double(shape), c_double(scale))
+	return _evaluate("pgamma", q, out, shape, scale, lower_tail=lower_tail, log=log)
 
 
-def qgamma(p:Iterable|Real, shape:Real, scale = 1.0)->list|Real:
+def qgamma(p:Iterable|Real, shape:Real, scale = 1.0, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	p: probabilities
 	shape: waiting time for the rth event to occur
 	scale: average waiting time for the next event recurrence
 	"""
-	return _pydll.c_stat_qgamma(py_object(p), c_double(shape), c_double(scale))
+	return _evaluate("qgamma", p, out, shape, scale)
 
 
-def rgamma(n:int, shape:Real, scale=1.0)->list:
+def rgamma(n:int, shape:Real, scale=1.0, rng=None, asarray:bool=False)->list|_np.ndarray:
 	"""
 	Draw samples from gamma distribution
+
+	rng: int seed or numpy.random.Generator (see spawn_rng)
+	asarray: returns ndarray instead of list
 	"""
 	assert n>0 ,"n>0 expected"
 	assert shape>0, "shape>0 expected"
 	assert scale>0, "scale>0 expected"
 
-	return _np.random.gamma(size=n, scale=scale, shape=shape).tolist()
+	return _draw("gamma", n, rng, asarray, scale=scale, shape=shape)
 
 
 
 
 # ----- Geometric Distribution  -------
 
-def dgeom(x:Iterable|Real, prob:Real)->list|Real:
+def dgeom(x:Iterable|Real, prob:Real, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	x: Number of failures before success occurs.
 	prob: probability of success in each trial.
+	log: returns log of the density
 	"""
-	return _pydll.c_stat_dgeom(py_object(x), c_double(prob))
+	return _evaluate("dgeom", x, out, prob, log=log)
 
 
-def pgeom(q:Iterable|Real, prob:Real)->list|Real:
+def pgeom(q:Iterable|Real, prob:Real, lower_tail:bool = True, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	q: Number of failures before success occurs.
 	prob: probability of success in each trial.
+	lower_tail: if True P(X<=q), otherwise P(X>q)
+	log: probabilities are returned as log(p)
 	"""
-	return _pydll.c_stat_pgeom(py_object(q), c_double(prob))
+	return _evaluate("pgeom", q, out, prob, lower_tail=lower_tail, log=log)
 
 
-def qgeom(p:Iterable|Real, prob:Real)->list|Real:
+def qgeom(p:Iterable|Real, prob:Real, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	p: probabilities
 	prob: probability of success in each trial.
 	"""
-	return _pydll.c_stat_qgeom(py_object(p), c_double(prob))
+	return _evaluate("qgeom", p, out, prob)
 
 
-def rgeom(n:int, prob:Real)->list:
+def rgeom(n:int, prob:Real, rng=None, asarray:bool=False)->list|_np.ndarray:
 	"""
-	Draw samples from geometric distribution
+	Draw samples from geometric distribution, the number of failures before
+	the first success (support 0, 1, 2, ... as in dgeom)
+
+	rng: int seed or numpy.random.Generator (see spawn_rng)
+	asarray: returns ndarray instead of list
 	"""
 	assert n>0 ,"n>0 expected"
 	assert prob>=0 and prob<=1, "prob in [0, 1] expected"
 
-	return _np.random.geometric(size=n, p=prob).tolist()
+	#numpy counts the trials including the success
+	retVal = _generator(rng).geometric(size=n, p=prob) - 1
+	return retVal if asarray else retVal.tolist()
 
 
 
 
 # ----- Hypergeometric Distribution  -------
 
-def dhyper(x:Iterable|Real, m:int, n:int, k:int)->list|Real:
+def dhyper(x:Iterable|Real, m:int, n:int, k:int, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	m: number of good samples in the urn
 	n: number of bad samples in the urn
 	k: samples drawn from the urn
+	log: returns log of the density
 	"""
-	return _pydll.c_stat_dhyper(py_object(x), c_int(m), c_int(n), c_int(k))
+	return _evaluate("dhyper", x, out, m, n, k, log=log)
 
 
-def phyper(q:Iterable|Real, m:int, n:int, k:int)->list|Real:
+def phyper(q:Iterable|Real, m:int, n:int, k:int, lower_tail:bool = True, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	m: number of good samples in the urn
 	n: number of bad samples in the urn
 	k: samples drawn from the urn
+	lower_tail: if True P(X<=q), otherwise P(X>q)
+	log: probabilities are returned as log(p)
 	"""
-	return _pydll.c_stat_phyper(py_object(q), c_int(m), c_int(n), c_int(k))
+	return _evaluate("phyper", q, out, m, n, k, lower_tail=lower_tail, log=log)
 
 
-def qhyper(p:Iterable|Real, m:int, n:int, k:int)->list|Real:
+def qhyper(p:Iterable|Real, m:int, n:int, k:int, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	m: number of good samples in the urn
 	n: number of bad samples in the urn
 	k: samples drawn from the urn
 	"""
-	return _pydll.c_stat_qhyper(py_object(p), c_int(m), c_int(n), c_int(k))
+	return _evaluate("qhyper", p, out, m, n, k)
 
 
-def rhyper(nn:int, m:int, n:int, k:int)->list:
+def rhyper(nn:int, m:int, n:int, k:int, rng=None, asarray:bool=False)->list|_np.ndarray:
 	"""
 	m: number of good samples in the urn
 	n: number of bad samples in the urn
 	k: samples drawn from the urn
+
+	rng: int seed or numpy.random.Generator (see spawn_rng)
+	asarray: returns ndarray instead of list
 	"""
 	assert nn>0 ,"nn>0 expected"
 	assert m>0, "m>0 expected"
 	assert n>0, "n>0 expected"
 	assert k>0, "k>0 expected"
 
-	return _np.random.hypergeometric(size=nn, ngood=m, nbad=n, nsample=k)
+	return _draw("hypergeometric", nn, rng, asarray, ngood=m, nbad=n, nsample=k)
 
 
 
 
 # ----- Normal Distribution  -------
 
-def dnorm(x:Iterable|Real, mean=0.0, sd=1.0)->list|Real:
+def dnorm(x:Iterable|Real, mean=0.0, sd=1.0, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	mean: mean value of the distribution
 	sd: standard deviation of the distribution
+	log: returns log of the density
 	"""
-	return _pydll.c_stat_dnorm(py_object(x), c_double(mean), c_double(sd))
+	return _evaluate("dnorm", x, out, mean, sd, log=log)
 
 
-def pnorm(q:Iterable|Real, mean=0.0, sd=1.0)->list|Real:
+def pnorm(q:Iterable|Real, mean=0.0, sd=1.0, lower_tail:bool = True, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	mean: mean value of the distribution
 	sd: standard deviation of the distribution
+	lower_tail: if True P(X<=q), otherwise P(X>q)
+	log: probabilities are returned as log(p)
 	"""
-	return _pydll.c_stat_pnorm(py_object(q), c_double(mean), c_double(sd))
+	return _evaluate("pnorm", q, out, mean, sd, lower_tail=lower_tail, log=log)
 
 
-def qnorm(p:Iterable|Real, mean=0.0, sd=1.0)->list|Real:
+def qnorm(p:Iterable|Real, mean=0.0, sd=1.0, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	mean: mean value of the distribution
 	sd: standard deviation of the distribution
 	"""
-	return _pydll.c_stat_qnorm(py_object(p), c_double(mean), c_double(sd))
+	return _evaluate("qnorm", p, out, mean, sd)
 
 
-def rnorm(n:int, mean=0.0, sd=1.0)->list:
+def rnorm(n:int, mean=0.0, sd=1.0, rng=None, asarray:bool=False)->list|_np.ndarray:
 	"""
 	mean: mean value of the distribution
 	sd: standard deviation of the distribution
+
+	rng: int seed or numpy.random.Generator (see spawn_rng)
+	asarray: returns ndarray instead of list
 	"""
 	assert n>0 ,"n>0 expected"
 	assert sd>0, "sd>0 expected"
 
-	return _np.random.normal(size=n, loc=mean, scale=sd).tolist()
+	return _draw("normal", n, rng, asarray, loc=mean, scale=sd)
 
 
 
 
 # ----- Log Normal Distribution  -------
 
-def dlnorm(x:Iterable|Real, meanlog=0.0, sdlog=1.0)->list|Real:
+def dlnorm(x:Iterable|Real, meanlog=0.0, sdlog=1.0, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	meanlog: mean value of the distribution
 	sdlog: standard deviation of the distribution
+	log: returns log of the density
 	"""
-	return _pydll.c_stat_dlnorm(py_object(x), c_double(meanlog), c_double(sdlog))
+	return _evaluate("dlnorm", x, out, meanlog, sdlog, log=log)
 
 
-def plnorm(q:Iterable|Real, meanlog=0.0, sdlog=1.0)->list|Real:
+def plnorm(q:Iterable|Real, meanlog=0.0, sdlog=1.0, lower_tail:bool = True, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	mean: mean value of the distribution
 	sd: standard deviation of the distribution
+	lower_tail: if True P(X<=q), otherwise P(X>q)
+	log: probabilities are returned as log(p)
 	"""
-	return _pydll.c_stat_plnorm(py_object(q), c_double(meanlog), c_double(sdlog))
+	return _evaluate("plnorm", q, out, meanlog, sdlog, lower_tail=lower_tail, log=log)
 
 
-def qlnorm(p:Iterable|Real, meanlog=0.0, sdlog=1.0)->list|Real:
+def qlnorm(p:Iterable|Real, meanlog=0.0, sdlog=1.0, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	mean: mean value of the distribution
 	sd: standard deviation of the distribution
 	"""
-	return _pydll.c_stat_qlnorm(py_object(p), c_double(meanlog), c_double(sdlog))
+	return _evaluate("qlnorm", p, out, meanlog, sdlog)
 
 
-def rlnorm(n:int, meanlog=0.0, sdlog=1.0)->list:
+def rlnorm(n:int, meanlog=0.0, sdlog=1.0, rng=None, asarray:bool=False)->list|_np.ndarray:
 	"""
 	mean: mean value of the distribution
 	sd: standard deviation of the distribution
+
+	rng: int seed or numpy.random.Generator (see spawn_rng)
+	asarray: returns ndarray instead of list
 	"""
 	assert n>0 ,"n>0 expected"
 	assert sdlog>0, "sd>0 expected"
 
-	return _np.random.lognormal(size=n, mean=meanlog, sigma=sdlog).tolist()
+	return _draw("lognormal", n, rng, asarray, mean=meanlog, sigma=sdlog)
 
 
 
 
 # ----- Pareto Distribution  -------
 
-def dpareto(x:Iterable|Real, location:Real, shape=1.0)->list|Real:
+def dpareto(x:Iterable|Real, location:Real, shape=1.0, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	location: location parameter
 	shape: shape parameter
+	log: returns log of the density
 	"""
-	assert location>0 and shape>0, "'location' and 'shape' must be positive"
-	return _pydll.c_stat_dpareto(py_object(x), c_double(location), c_double(shape))
+	assert _np.all((_np.asarray(location)>0) & (_np.asarray(shape)>0)), "'location' and 'shape' must be positive"
+	return _evaluate("dpareto", x, out, location, shape, log=log)
 
 
-def ppareto(q:Iterable|Real, location:Real, shape=1.0)->list|Real:
+def ppareto(q:Iterable|Real, location:Real, shape=1.0, lower_tail:bool = True, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	location: location parameter
 	shape: shape parameter
+	lower_tail: if True P(X<=q), otherwise P(X>q)
+	log: probabilities are returned as log(p)
 	"""
-	assert location>0 and shape>0, "'location' and 'shape' must be positive"
-	return _pydll.c_stat_ppareto(py_object(q), c_double(location), c_double(shape))
+	assert _np.all((_np.asarray(location)>0) & (_np.asarray(shape)>0)), "'location' and 'shape' must be positive"
+	return _evaluate("ppareto", q, out, location, shape, lower_tail=lower_tail, log=log)
 
 
-def qpareto(p:Iterable|Real, location:Real, shape=1.0)->list|Real:
+def qpareto(p:Iterable|Real, location:Real, shape=1.0, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	location: location parameter
 	shape: shape parameter
 	"""
-	assert location>0 and shape>0, "'location' and 'shape' must be positive"
-	return _pydll.c_stat_qpareto(py_object(p), c_double(location), c_double(shape))
+	assert _np.all((_np.asarray(location)>0) & (_np.asarray(shape)>0)), "'location' and 'shape' must be positive"
+	return _evaluate("qpareto", p, out, location, shape)
 
 
-def rpareto(n:int, location:Real, shape=1.0)->list:
+def rpareto(n:int, location:Real, shape=1.0, rng=None, asarray:bool=False)->list|_np.ndarray:
 	"""
+	Draw samples from Pareto I distribution (support x >= location as in dpareto)
+
 	location: location parameter
 	shape: shape parameter
+
+	rng: int seed or numpy.random.Generator (see spawn_rng)
+	asarray: returns ndarray instead of list
 	"""
 	assert location>0 and shape>0, "'location' and 'shape' must be positive"
 	assert n>0 ,"n>0 expected"
 	
-	return (_np.random.pareto(size=n, a=shape)*location).tolist()
+	#numpy draws from Lomax (Pareto II), shifting by 1 gives Pareto I with location 1
+	retVal = location*(_generator(rng).pareto(size=n, a=shape) + 1.0)
+	return retVal if asarray else retVal.tolist()
 
 
 
 
 # ----- Poisson Distribution  -------
 
-def dpois(x:Iterable|Real, mu:Real)->list|Real:
-	return _pydll.c_stat_dpois(py_object(x), c_double(mu))
+def dpois(x:Iterable|Real, mu:Real, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
+	"""
+	log: returns log of the density
+	"""
+	return _evaluate("dpois", x, out, mu, log=log)
 
 
-def ppois(q:Iterable|Real, mu:Real)->list|Real:
-	return _pydll.c_stat_ppois(py_object(q), c_double(mu))
+def ppois(q:Iterable|Real, mu:Real, lower_tail:bool = True, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
+	"""
+	lower_tail: if True P(X<=q), otherwise P(X>q)
+	log: probabilities are returned as log(p)
+	"""
+	return _evaluate("ppois", q, out, mu, lower_tail=lower_tail, log=log)
 
 
-def qpois(p:Iterable|Real, mu:Real)->list|Real:
-	return _pydll.c_stat_qpois(py_object(p), c_double(mu))
+def qpois(p:Iterable|Real, mu:Real, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
+	return _evaluate("qpois", p, out, mu)
 
 
-def rpois(n:int, mu = 1)->list:
+def rpois(n:int, mu = 1, rng=None, asarray:bool=False)->list|_np.ndarray:
 	"""
 	Draw samples from Poisson distribution
+
+	rng: int seed or numpy.random.Generator (see spawn_rng)
+	asarray: returns ndarray instead of list
 	"""
 	assert n>0 ,"n>0 expected"
 	assert mu>0, "mu>0 expected"
 
-	return _np.random.poisson(size=n, lam=mu).tolist()
+	return _draw("poisson", n, rng, asarray, lam=mu)
 
 
 
 #---- Kolmogorov-Smirnov Dist --------
 
-def psmirnov(q:Iterable|Real, n:int)->list|Real:
+def psmirnov(q:Iterable|Real, n:int, lower_tail:bool = True, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	n: size of the sample
+	lower_tail: if True P(X<=q), otherwise P(X>q)
+	log: probabilities are returned as log(p)
 	"""
-	assert isinstance(n, int), "n must be int"
-	assert n>0, "n>0 expected"
+	assert _np.all(_np.mod(n, 1) == 0), "n must be integer"
+	assert _np.all(_np.asarray(n)>0), "n>0 expected"
 
-	return _pydll.c_stat_psmirnov(py_object(q), c_int(n))
+	return _evaluate("psmirnov", q, out, n, lower_tail=lower_tail, log=log)
 
 
 # ----- t Distribution  -------
 
-def dt(x:Iterable|Real, df:int)->list|Real:
+def dt(x:Iterable|Real, df:int, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	df: degrees of freedom
+	log: returns log of the density
 	"""
-	assert df>0, "df>0 expected"
+	assert _np.all(_np.asarray(df)>0), "df>0 expected"
 
-	return _pydll.c_stat_dt(py_object(x), c_int(df))
+	return _evaluate("dt", x, out, df, log=log)
 
 
-def pt(q:Iterable|Real, df:int)->list|Real:
+def pt(q:Iterable|Real, df:int, lower_tail:bool = True, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	df: degrees of freedom
+	lower_tail: if True P(X<=q), otherwise P(X>q)
+	log: probabilities are returned as log(p)
 	"""
-	assert df>0, "df>0 expected"
+	assert _np.all(_np.asarray(df)>0), "df>0 expected"
 
-	return _pydll.c_stat_pt(py_object(q), c_int(df))
+	return _evaluate("pt", q, out, df, lower_tail=lower_tail, log=log)
 
 
-def qt(p:Iterable|Real, df:int)->list|Real:
+def qt(p:Iterable|Real, df:int, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	df: degrees of freedom
 	"""
-	assert df>0, "df>0 expected"
+	assert _np.all(_np.asarray(df)>0), "df>0 expected"
 
-	return _pydll.c_stat_qt(py_object(p), c_int(df))
+	return _evaluate("qt", p, out, df)
 
 
-def rt(n:int, df)->list:
+def rt(n:int, df, rng=None, asarray:bool=False)->list|_np.ndarray:
 	"""
 	df: degrees of freedom
+
+	rng: int seed or numpy.random.Generator (see spawn_rng)
+	asarray: returns ndarray instead of list
 	"""
 	assert n>0 ,"n>0 expected"
 	assert df>0, "df1>0 expected"
 
-	return _np.random.standard_t(size=n, df=df).tolist()
+	return _draw("standard_t", n, rng, asarray, df=df)
 
 
 
 
 # ----- Uniform Distribution  -------
 
-def dunif(x:Iterable|Real, min=0.0, max=1.0)->list|Real:
+def dunif(x:Iterable|Real, min=0.0, max=1.0, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	min: minimum bound
 	max: maximum bound
+	log: returns log of the density
 	"""
-	assert max>min, "max>min expected"
+	assert _np.all(_np.asarray(max)>_np.asarray(min)), "max>min expected"
 
-	return _pydll.c_stat_dunif(py_object(x), c_double(min), c_double(max))
+	return _evaluate("dunif", x, out, min, max, log=log)
 
 
-def punif(q:Iterable|Real, min=0.0, max=1.0)->list|Real:
+def punif(q:Iterable|Real, min=0.0, max=1.0, lower_tail:bool = True, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	min: minimum bound
 	max: maximum bound
+	lower_tail: if True P(X<=q), otherwise P(X>q)
+	log: probabilities are returned as log(p)
 	"""
-	assert max>min, "max>min expected"
+	assert _np.all(_np.asarray(max)>_np.asarray(min)), "max>min expected"
 
-	return _pydll.c_stat_punif(py_object(q), c_double(min), c_double(max))
+	return _evaluate("punif", q, out, min, max, lower_tail=lower_tail, log=log)
 
 
-def qunif(p:Iterable|Real, min=0.0, max=1.0)->list|Real:
+def qunif(p:Iterable|Real, min=0.0, max=1.0, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	min: minimum bound
 	max: maximum bound
 	"""
-	assert max>min, "max>min expected"
+	assert _np.all(_np.asarray(max)>_np.asarray(min)), "max>min expected"
 
-	return _pydll.c_stat_qunif(py_object(p), c_double(min), c_double(max))
+	return _evaluate("qunif", p, out, min, max)
 
 
-def runif(n:int, min=0.0, max=1.0)->list:
+def runif(n:int, min=0.0, max=1.0, rng=None, asarray:bool=False)->list|_np.ndarray:
 	"""
 	min: minimum bound
 	max: maximum bound
+
+	rng: int seed or numpy.random.Generator (see spawn_rng)
+	asarray: returns ndarray instead of list
 	"""
 	assert max>min, "max>min expected"
 	assert n>0 ,"n>0 expected"
 
-	return _np.random.uniform(size=n, low=min, high=max).tolist()
+	return _draw("uniform", n, rng, asarray, low=min, high=max)
 
 
 
 # ----- Weibull Distribution  -------
 
-def dweibull(x:Iterable|Real, shape:Real, scale = 1.0)->list|Real:
+def dweibull(x:Iterable|Real, shape:Real, scale = 1.0, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	x: quantile	
 	shape: known as Weibull-slope
 	scale: characteristic life
+	log: returns log of the density
 	"""
-	assert shape>0, "shape>0 expected"
-	assert scale>0, "scale>0 expected"
+	assert _np.all(_np.asarray(shape)>0), "shape>0 expected"
+	assert _np.all(_np.asarray(scale)>0), "scale>0 expected"
 
-	return _pydll.c_stat_dweibull(py_object(x), c_double(shape), c_double(scale))
+	return _evaluate("dweibull", x, out, shape, scale, log=log)
 
 
-def pweibull(q:Iterable|Real, shape:Real, scale = 1.0)->list|Real:
+def pweibull(q:Iterable|Real, shape:Real, scale = 1.0, lower_tail:bool = True, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	q: quantile
 	shape: known as Weibull-slope
 	scale: characteristic life
+	lower_tail: if True P(X<=q), otherwise P(X>q)
+	log: probabilities are returned as log(p)
 	"""
-	assert shape>0, "shape>0 expected"
-	assert scale>0, "scale>0 expected"
+	assert _np.all(_np.asarray(shape)>0), "shape>0 expected"
+	assert _np.all(_np.asarray(scale)>0), "scale>0 expected"
 
-	return _pydll.c_stat_pweibull(py_object(q), c_double(shape), c_double(scale))
+	return _evaluate("pweibull", q, out, shape, scale, lower_tail=lower_tail, log=log)
 
 
-def qweibull(p:Iterable|Real, shape:Real, scale = 1.0)->list|Real:
+def qweibull(p:Iterable|Real, shape:Real, scale = 1.0, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
 	"""
 	p: probabilities
 	shape: known as Weibull-slope
 	scale: characteristic life
 	"""
-	assert shape>0, "shape>0 expected"
-	assert scale>0, "scale>0 expected"
+	assert _np.all(_np.asarray(shape)>0), "shape>0 expected"
+	assert _np.all(_np.asarray(scale)>0), "scale>0 expected"
 	
-	return _pydll.c_stat_qweibull(py_object(p), c_double(shape), c_double(scale))
+	return _evaluate("qweibull", p, out, shape, scale)
 
 
-def rweibull(n:int, shape:Real, scale=1.0)->list:
+def rweibull(n:int, shape:Real, scale=1.0, rng=None, asarray:bool=False)->list|_np.ndarray:
 	"""
 	Draw samples from weibull distribution
+
+	rng: int seed or numpy.random.Generator (see spawn_rng)
+	asarray: returns ndarray instead of list
 	"""
 	assert n>0 ,"n>0 expected"
 	assert shape>0, "shape>0 expected"
 	assert scale>0, "scale>0 expected"
 
-	return (scale*_np.random.weibull(size=n, a=shape, )).tolist()
+	retVal = scale*_generator(rng).weibull(size=n, a=shape)
+	return retVal if asarray else retVal.tolist()
 
 
 # ----- Wilcoxon Sign Rank Distribution  -------
 
-def dsignrank(x:Iterable|Real, n:int)->list|Real:
-	return _pydll.c_stat_dsignrank(py_object(x), c_int(n))
+def dsignrank(x:Iterable|Real, n:int, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
+	"""
+	n: number of observations
+	log: returns log of the density
+	"""
+	return _evaluate("dsignrank", x, out, n, log=log)
 
 
-def psignrank(q:Iterable|Real, n:int)->list|Real:
-	return _pydll.c_stat_psignrank(py_object(q), c_int(n))
+def psignrank(q:Iterable|Real, n:int, lower_tail:bool = True, log:bool = False, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
+	"""
+	n: number of observations
+	lower_tail: if True P(X<=q), otherwise P(X>q)
+	log: probabilities are returned as log(p)
+	"""
+	return _evaluate("psignrank", q, out, n, lower_tail=lower_tail, log=log)
 
 
-def qsignrank(p:Iterable|Real, n:int)->list|Real:
-	return _pydll.c_stat_qsignrank(py_object(p), c_int(n))
+def qsignrank(p:Iterable|Real, n:int, out:_np.ndarray|None = None)->list|Real|_np.ndarray:
+	return _evaluate("qsignrank", p, out, n)
 
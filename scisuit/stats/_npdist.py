@@ -0,0 +1,1526 @@
+"""
+Pure NumPy implementations of the d/p/q functions of probability distributions.
+
+Every function has the same name and parameter order as its counterpart in
+_distributions.py, accepts arrays (or numbers) for all of its arguments,
+broadcasts them against each other and returns an ndarray.
+
+Densities accept `log` and cumulative distribution functions accept
+`lower_tail` and `log`. Both tails are computed directly (not as 1-p)
+so that small upper tail probabilities keep their precision.
+
+Performance: continued fractions and Newton iterations run on whole arrays, with
+parameters shared by all elements kept as floats and converged elements removed from
+the working set. Each Newton step of a quantile takes the density from the prefactor
+of the incomplete beta/gamma function, which is computed for the cdf anyway.
+Single numbers are evaluated with Python floats, a scalar call costs tens of
+microseconds (quantiles about 0.2 ms). tests/stats/dist_benchmark.py compares the
+batch evaluation with the native backend.
+"""
+
+import math
+import threading
+from collections import OrderedDict
+
+import numpy as _np
+
+from .. import settings as _settings
+from . import _special as _sp
+from ._special import asarrays as _asarrays
+
+
+
+
+_EPS = _sp._EPS
+_INF = _np.inf
+_NAN = _np.nan
+
+
+
+class _TableCache:
+	"""
+	Bounded LRU cache of tables that only depend on the parameters of a distribution
+	(e.g. the null distribution of the signed rank statistic for a given n).
+
+	Shared by all threads, at most settings.DIST_CACHE_SIZE tables are kept.
+	Tables are read-only ndarrays (or tuples of them).
+	"""
+	def __init__(self):
+		self._data = OrderedDict()
+		self._lock = threading.Lock()
+		self.hits = 0
+		self.misses = 0
+
+	def get(self, key:tuple, build):
+		"""returns the table for key, build() is called on a miss"""
+		with self._lock:
+			if key in self._data:
+				self._data.move_to_end(key)
+				self.hits += 1
+				return self._data[key]
+			self.misses += 1
+
+		#build outside the lock so that other threads are not blocked
+		table = build()
+		for v in (table if isinstance(table, tuple) else (table, )):
+			v.setflags(write=False)
+
+		with self._lock:
+			self._data[key] = table
+			self._data.move_to_end(key)
+			while len(self._data) > max(_settings.DIST_CACHE_SIZE, 0):
+				self._data.popitem(last=False)
+
+		return table
+
+	def info(self)->tuple[int, int, int]:
+		"""hits, misses, number of cached tables"""
+		with self._lock:
+			return self.hits, self.misses, len(self._data)
+
+	def clear(self):
+		with self._lock:
+			self._data.clear()
+			self.hits = 0
+			self.misses = 0
+
+
+
+_CACHE = _TableCache()
+
+
+
+def _isint(x:_np.ndarray)->_np.ndarray:
+	"""x is (almost) an integer, same tolerance as R's R_nonint"""
+	return _np.abs(x - _np.round(x)) <= 1E-7*_np.maximum(1.0, _np.abs(x))
+
+
+
+def _tail(lower, upper, lower_tail:bool, log:bool)->_np.ndarray:
+	"""
+	Selects the requested tail, lower=P(X<=x) and upper=P(X>x).
+	In log scale log1p of the complement is used when the tail is close to 1.
+	"""
+	P, Q = (lower, upper) if lower_tail else (upper, lower)
+	if not log:
+		return P
+
+	with _np.errstate(divide="ignore", invalid="ignore"):
+		return _np.where(P < 0.5, _np.log(P), _np.log1p(-Q))
+
+
+
+def _tail_exp(lq, lower_tail:bool, log:bool)->_np.ndarray:
+	"""_tail when the upper tail is exp(lq), lq<=0"""
+	if not log:
+		return -_np.expm1(lq) if lower_tail else _np.exp(lq)
+	if not lower_tail:
+		return lq
+
+	#log(1-exp(lq)) without cancellation
+	with _np.errstate(divide="ignore", invalid="ignore"):
+		return _np.where(lq > -math.log(2), _np.log(-_np.expm1(lq)), _np.log1p(-_np.exp(lq)))
+
+
+
+def _dlog(d:_np.ndarray, log:bool)->_np.ndarray:
+	"""log of density d if requested"""
+	if not log:
+		return d
+	with _np.errstate(divide="ignore"):
+		return _np.log(d)
+
+
+
+def _dexp(ld:_np.ndarray, log:bool)->_np.ndarray:
+	"""density from its logarithm ld (computed on the log scale so that it does not underflow)"""
+	if log:
+		return ld
+	return _np.exp(ld)
+
+
+
+def _quantile(p:_np.ndarray, lo, hi, func, *params)->_np.ndarray:
+	"""
+	Evaluates func(p, *params) only where 0<p<1.
+	p=0 and p=1 map to lo and hi (lower and upper bound of the support),
+	p outside [0, 1] is nan.
+	"""
+	p, lo, hi, *params = _asarrays(p, lo, hi, *params)
+	retVal = _np.where(p == 0, lo, _np.where(p == 1, hi, _NAN))
+
+	m = (p > 0) & (p < 1)
+	if m.any():
+		retVal[m] = func(p[m], *[v[m] for v in params])
+
+	return retVal
+
+
+
+
+# ----- Beta Distribution  -------
+
+def dbeta(x, shape1, shape2, log = False):
+	x, a, b = _asarrays(x, shape1, shape2)
+
+	with _np.errstate(all="ignore"):
+		#(a+b-1) * C(a+b-2, a-1) * x^(a-1) * (1-x)^(b-1)
+		loader = _np.log(a + b - 1) + _sp.dbinom_raw(a - 1, a + b - 2, x, 1.0 - x, True)
+		direct = (a - 1)*_np.log(x) + (b - 1)*_np.log1p(-x) - _sp.lbeta(a, b)
+		retVal = _np.where((a <= 2) | (b <= 2), direct, loader)
+
+		at0 = _np.where(a > 1, -_INF, _np.where(a < 1, _INF, _np.log(b)))
+		at1 = _np.where(b > 1, -_INF, _np.where(b < 1, _INF, _np.log(a)))
+		retVal = _np.where(x == 0, at0, _np.where(x == 1, at1, retVal))
+
+	return _dexp(_np.where((x < 0) | (x > 1), -_INF, retVal), log)
+
+
+
+def pbeta(q, shape1, shape2, lower_tail = True, log = False):
+	q, a, b = _asarrays(q, shape1, shape2)
+	lower, upper = _sp.incbeta(a, b, _np.clip(q, 0.0, 1.0))
+	lower = _np.where(_np.isnan(q), _NAN, lower)
+	return _tail(lower, upper, lower_tail, log)
+
+
+
+def _qbeta(p, a, b, x0 = None)->tuple[_np.ndarray, _np.ndarray]:
+	"""
+	Returns x and 1-x where pbeta(x, a, b) = p for 0<p<1.
+	For p>0.5 the problem is solved for 1-x (upper tail) so that both are accurate.
+
+	x0: starting values (optional)
+	"""
+	p, a, b = _asarrays(p, a, b)
+	swap = p > 0.5
+
+	#solve I_z(A, B) = P for z
+	P = _np.where(swap, 1.0 - p, p)
+	A = _np.where(swap, b, a)
+	B = _np.where(swap, a, b)
+
+	def tail(z, A, B):
+		#the density is the prefactor of the incomplete beta function over z(1-z)
+		lower, _, pre = _sp.incbeta(A, B, z, prefactor = True)
+		return lower, pre/(z*(1.0 - z))
+
+	def tail1(z, A, B):
+		return _sp._incbeta1(A, B, z, 1.0 - z)[0]
+
+	def dens1(z, A, B):
+		lb = math.lgamma(A) + math.lgamma(B) - math.lgamma(A + B)
+		return math.exp((A - 1)*math.log(z) + (B - 1)*math.log1p(-z) - lb)
+
+	with _np.errstate(all="ignore"):
+		#Cran GW et al. (1977) Algorithm AS 109, Applied Statistics 26(1), 111-114
+		lb = _sp.lbeta(A, B)
+		r = _np.sqrt(-2*_np.log(P))
+		y = r - (2.30753 + 0.27061*r)/(1.0 + (0.99229 + 0.04481*r)*r)
+
+		r = (y*y - 3.0)/6.0
+		s, t = 1.0/(2*A - 1.0), 1.0/(2*B - 1.0)
+		h = 2.0/(s + t)
+		w = y*_np.sqrt(h + r)/h - (t - s)*(r + 5.0/6.0 - 2.0/(3.0*h))
+		large = A/(A + B*_np.exp(2*w))
+
+		r = 2*B
+		t = 1.0/(9*B)
+		t = r*(1.0 - t + y*_np.sqrt(t))**3
+		T = (4*A + r - 2.0)/t
+		small = _np.where(t <= 0, 1.0 - _np.exp((_np.log1p(-P) + _np.log(B) + lb)/B),
+					_np.where(T <= 1, _np.exp((_np.log(P*A) + lb)/A), 1.0 - 2.0/(T + 1.0)))
+
+		z0 = _np.where((A > 1) & (B > 1), large, small)
+		z0 = _np.where((z0 > 0) & (z0 < 1), z0, A/(A + B))
+
+	if x0 is not None:
+		z0 = _np.where(swap, 1.0 - x0, x0)
+
+	#separately, so that the parameters of each call are shared by all of its elements
+	z = _np.empty_like(P)
+	for IsSwap in (False, True):
+		m = swap == IsSwap
+		if m.any():
+			z[m] = _sp.invert(tail, None, P[m], z0[m], (A[m], B[m]), hi = 1.0, scalar = (tail1, dens1))
+
+	return _np.where(swap, 1.0 - z, z), _np.where(swap, z, 1.0 - z)
+
+
+
+def qbeta(p, shape1, shape2):
+	return _quantile(p, 0.0, 1.0, lambda p, a, b: _qbeta(p, a, b)[0], shape1, shape2)
+
+
+
+
+# ----- Binomial Distribution  -------
+
+def dbinom(x, size, prob, log = False):
+	x, n, p = _asarrays(x, size, prob)
+	retVal = _sp.dbinom_raw(_np.round(x), n, p, 1.0 - p, True)
+	return _dexp(_np.where(_isint(x), retVal, -_INF), log)
+
+
+
+def pbinom(q, size, prob, lower_tail = True, log = False):
+	q, n, p = _asarrays(q, size, prob)
+	x = _np.floor(q + 1E-7)
+
+	with _np.errstate(all="ignore"):
+		upper, lower = _sp.incbeta(x + 1, n - x, p, 1.0 - p)
+
+	lower = _np.where(x < 0, 0.0, _np.where(x >= n, 1.0, lower))
+	upper = _np.where(x < 0, 1.0, _np.where(x >= n, 0.0, upper))
+	return _tail(lower, upper, lower_tail, log)
+
+
+
+def qbinom(p, size, prob):
+	p, n, pr = _asarrays(p, size, prob)
+
+	def func(p, n, pr):
+		retVal = _lookup("binom", p, [n, pr], lambda n, pr: n + 1)
+		if retVal is not None:
+			return retVal
+		return _sp.discrete_quantile(pbinom, p, (n, pr), lo=0.0, hi=n)
+
+	return _quantile(p, 0.0, n, func, n, pr)
+
+
+
+
+# ----- Negative-Binomial Distribution  -------
+
+def dnbinom(x, size, prob, log = False):
+	x, n, p = _asarrays(x, size, prob)
+	xr = _np.round(x)
+
+	with _np.errstate(all="ignore"):
+		retVal = _np.log(n/(n + xr)) + _sp.dbinom_raw(n, xr + n, p, 1.0 - p, True)
+
+	return _dexp(_np.where(_isint(x) & (x >= 0), retVal, -_INF), log)
+
+
+
+def pnbinom(q, size, prob, lower_tail = True, log = False):
+	q, n, p = _asarrays(q, size, prob)
+	x = _np.floor(q + 1E-7)
+
+	with _np.errstate(all="ignore"):
+		lower, upper = _sp.incbeta(n, x + 1, p, 1.0 - p)
+
+	lower = _np.where(x < 0, 0.0, _np.where(_np.isposinf(x), 1.0, lower))
+	upper = _np.where(x < 0, 1.0, _np.where(_np.isposinf(x), 0.0, upper))
+	return _tail(lower, upper, lower_tail, log)
+
+
+
+def qnbinom(p, size, prob):
+	p, n, pr = _asarrays(p, size, prob)
+
+	def func(p, n, pr):
+		return _sp.discrete_quantile(pnbinom, p, (n, pr), lo=0.0, guess=n*(1 - pr)/pr)
+
+	return _quantile(p, 0.0, _INF, func, n, pr)
+
+
+
+
+# ----- Multinomial Distribution  -------
+
+def dmultinom(x, size, prob, log = False):
+	x = _np.asarray(x, dtype=_np.float64)
+	prob = _np.asarray(prob, dtype=_np.float64)
+	assert len(x) == len(prob), "x and prob must have same length"
+
+	prob = prob/prob.sum()
+
+	with _np.errstate(divide="ignore"):
+		lp = _np.where(x == 0, 0.0, x*_np.log(prob))
+
+	retVal = math.lgamma(size + 1) + float(_np.sum(lp - _sp.lgamma(x + 1)))
+	return retVal if log else math.exp(retVal)
+
+
+
+
+# ----- Chi-Square Distribution  -------
+
+def dchisq(x, df, log = False):
+	x, df = _asarrays(x, df)
+	return dgamma(x, df/2, 2.0, log)
+
+
+def pchisq(q, df, lower_tail = True, log = False):
+	q, df = _asarrays(q, df)
+	return pgamma(q, df/2, 2.0, lower_tail, log)
+
+
+def qchisq(p, df):
+	p, df = _asarrays(p, df)
+	return qgamma(p, df/2, 2.0)
+
+
+
+
+# ----- Exponential Distribution  -------
+
+def dexp(x, rate, log = False):
+	x, rate = _asarrays(x, rate)
+	if log:
+		return _np.where(x < 0, -_INF, _np.log(rate) - rate*x)
+	return _np.where(x < 0, 0.0, rate*_np.exp(-rate*x))
+
+
+def pexp(q, rate, lower_tail = True, log = False):
+	q, rate = _asarrays(q, rate)
+	return _tail_exp(-rate*_np.maximum(q, 0.0), lower_tail, log)
+
+
+def qexp(p, rate):
+	p, rate = _asarrays(p, rate)
+	return _quantile(p, 0.0, _INF, lambda p, r: -_np.log1p(-p)/r, rate)
+
+
+
+
+# ----- F Distribution  -------
+
+def df(x, df1, df2, log = False):
+	x, m, n = _asarrays(x, df1, df2)
+
+	with _np.errstate(all="ignore"):
+		f = 1.0/(n + x*m)
+		q = n*f
+		p = x*m*f
+
+		big = m >= 2
+		fac = _np.where(big, _np.log(m*q/2), _np.log(m*m*q/(2*(m + n))) - _np.log(p))
+		dens = _np.where(big,
+				_sp.dbinom_raw((m - 2)/2, (m + n - 2)/2, p, q, True),
+				_sp.dbinom_raw(m/2, (m + n)/2, p, q, True))
+		retVal = fac + dens
+
+	at0 = _np.where(m > 2, -_INF, _np.where(m == 2, 0.0, _INF))
+	retVal = _np.where(x == 0, at0, retVal)
+	return _dexp(_np.where(x < 0, -_INF, retVal), log)
+
+
+
+def pf(q, df1, df2, lower_tail = True, log = False):
+	q, m, n = _asarrays(q, df1, df2)
+
+	with _np.errstate(all="ignore"):
+		#choose the formulation where the beta argument is not close to 1
+		mq = m*q
+		x, y = n/(n + mq), mq/(n + mq)
+		big = n*q > m
+		lower, upper = _np.empty_like(x), _np.empty_like(x)
+		for IsBig in (True, False):
+			k = big == IsBig
+			if not k.any():
+				continue
+
+			if IsBig:
+				upper[k], lower[k] = _sp.incbeta(n[k]/2, m[k]/2, x[k], y[k])
+			else:
+				lower[k], upper[k] = _sp.incbeta(m[k]/2, n[k]/2, y[k], x[k])
+
+	lower = _np.where(q <= 0, 0.0, _np.where(_np.isposinf(q), 1.0, lower))
+	upper = _np.where(q <= 0, 1.0, _np.where(_np.isposinf(q), 0.0, upper))
+	return _tail(lower, upper, lower_tail, log)
+
+
+
+def qf(p, df1, df2):
+	def func(p, m, n):
+		x, y = _qbeta(p, m/2, n/2)
+		with _np.errstate(divide="ignore"):
+			return (n/m)*(x/y)
+
+	return _quantile(p, 0.0, _INF, func, df1, df2)
+
+
+
+
+# ----- Gamma Distribution  -------
+
+def dgamma(x, shape, scale, log = False):
+	x, a, s = _asarrays(x, shape, scale)
+
+	with _np.errstate(all="ignore"):
+		xs = x/s
+		retVal = _np.where(a < 1, _sp.dpois_raw(a, xs, True) + _np.log(a/x), _sp.dpois_raw(a - 1, xs, True) - _np.log(s))
+
+		at0 = _np.where(a < 1, _INF, _np.where(a > 1, -_INF, -_np.log(s)))
+		retVal = _np.where(x == 0, at0, retVal)
+
+	return _dexp(_np.where(x < 0, -_INF, retVal), log)
+
+
+
+def pgamma(q, shape, scale, lower_tail = True, log = False):
+	q, a, s = _asarrays(q, shape, scale)
+	lower, upper = _sp.incgamma(a, _np.maximum(q/s, 0.0))
+	return _tail(lower, upper, lower_tail, log)
+
+
+
+def _qgamma(p, a, x0 = None):
+	"""
+	quantile of the standard gamma distribution (scale=1) for 0<p<1
+	x0: starting values (optional)
+	"""
+	p, a = _asarrays(p, a)
+	upper = p > 0.5
+	P = _np.where(upper, 1.0 - p, p)
+
+	with _np.errstate(all="ignore"):
+		#Wilson-Hilferty, in terms of chi-square with 2a degrees of freedom
+		z = _sp.qnorm(p)
+		c = 1.0/(9*a)
+		wh = a*(1 - c + z*_np.sqrt(c))**3
+
+		#small p: P(a, x) ~ x^a / gamma(a+1)
+		small = _np.exp((_np.log(p) + _sp.lgamma(a + 1))/a)
+		if x0 is None:
+			x0 = _np.where((wh > 0) & (wh > small), wh, small)
+		x0 = _np.broadcast_to(x0, p.shape)
+
+	retVal = _np.empty_like(p)
+	for IsUpper in (False, True):
+		m = upper == IsUpper
+		if not m.any():
+			continue
+
+		#the density is the prefactor of the incomplete gamma function over x
+		k = int(IsUpper)
+		def tail(x, a):
+			PQ = _sp.incgamma(a, x, prefactor = True)
+			return PQ[k], PQ[2]/x
+
+		tail1 = lambda x, a: _sp._incgamma1(a, x)[k]
+		dens1 = lambda x, a: math.exp((a - 1)*math.log(x) - x - math.lgamma(a))
+		retVal[m] = _sp.invert(tail, None, P[m], x0[m], (a[m],), upper=IsUpper, scalar=(tail1, dens1))
+
+	return retVal
+
+
+
+def qgamma(p, shape, scale):
+	return _quantile(p, 0.0, _INF, lambda p, a, s: s*_qgamma(p, a), shape, scale)
+
+
+
+
+# ----- Geometric Distribution  -------
+
+def dgeom(x, prob, log = False):
+	x, p = _asarrays(x, prob)
+	xr = _np.round(x)
+
+	with _np.errstate(all="ignore"):
+		retVal = _np.log(p) + _np.where(xr == 0, 0.0, xr*_np.log1p(-p))
+
+	return _dexp(_np.where(_isint(x) & (x >= 0), retVal, -_INF), log)
+
+
+
+def pgeom(q, prob, lower_tail = True, log = False):
+	q, p = _asarrays(q, prob)
+	x = _np.floor(q + 1E-7)
+
+	with _np.errstate(all="ignore"):
+		lq = _np.where(p == 1, -_INF, (_np.maximum(x, -1) + 1)*_np.log1p(-p))
+
+	return _tail_exp(lq, lower_tail, log)
+
+
+
+def qgeom(p, prob):
+	def func(p, pr):
+		with _np.errstate(all="ignore"):
+			retVal = _np.ceil(_np.log1p(-p)/_np.log1p(-pr) - 1 - 1E-12)
+		return _np.where(pr == 1, 0.0, _np.maximum(retVal, 0.0))
+
+	return _quantile(p, 0.0, _INF, func, prob)
+
+
+
+
+# ----- Hypergeometric Distribution  -------
+
+def dhyper(x, m, n, k, log = False):
+	x, m, n, k = _asarrays(x, m, n, k)
+	xr = _np.round(x)
+
+	with _np.errstate(all="ignore"):
+		p = k/(m + n)
+		q = 1.0 - p
+		p1 = _sp.dbinom_raw(xr, m, p, q, True)
+		p2 = _sp.dbinom_raw(k - xr, n, p, q, True)
+		p3 = _sp.dbinom_raw(k, m + n, p, q, True)
+		retVal = p1 + p2 - p3
+
+	valid = _isint(x) & (xr >= 0) & (xr <= k) & (xr <= m) & (k - xr <= n)
+	return _dexp(_np.where(valid, retVal, -_INF), log)
+
+
+
+def _pdhyper(x, NR, NB, n):
+	"""
+	phyper(x, NR, NB, n)/dhyper(x, NR, NB, n), where x is on the lower side of the distribution
+
+	Reference:
+	- Morten Welinder (2004), R's pdhyper
+	"""
+	x, NR, NB, n = [v.ravel() for v in _asarrays(x, NR, NB, n)]
+
+	def step(x, term, Sum, NR, NB, n):
+		active = (x > 0) & (term >= _EPS*Sum)
+		with _np.errstate(all="ignore"):
+			t = term*x*(NB - n + x)/(n + 1 - x)/(NR + 1 - x)
+		term = _np.where(active, t, term)
+		Sum = _np.where(active, Sum + term, Sum)
+		x = _np.where(active, x - 1, x)
+		return [x, term, Sum, NR, NB, n], ~active
+
+	ones = _np.ones_like(x)
+	Sum, = _sp._iterate(step, [x, ones, _np.zeros_like(x), NR, NB, n], maxiter=10**7, outputs=(2, ))
+	return 1.0 + Sum
+
+
+
+def phyper(q, m, n, k, lower_tail = True, log = False):
+	q, NR, NB, k = _asarrays(q, m, n, k)
+	shape = q.shape
+	x = _np.floor(q + 1E-7)
+
+	#work on the side where the probabilities are small
+	swap = x*(NR + NB) > k*NR
+	x = _np.where(swap, k - x - 1, x)
+	NR, NB = _np.where(swap, NB, NR), _np.where(swap, NR, NB)
+
+	retVal = _np.where(x < 0, 0.0, 1.0)
+	inner = (x >= 0) & (x < NR) & (x < k)
+	if inner.any():
+		xi, r, b, ki = x[inner], NR[inner], NB[inner], k[inner]
+		retVal[inner] = dhyper(xi, r, b, ki)*_pdhyper(xi, r, b, ki)
+
+	#retVal is the tail on the small side: upper tail where swapped
+	retVal = _np.clip(retVal, 0.0, 1.0)
+	lower = _np.where(swap, 0.5 - retVal + 0.5, retVal).reshape(shape)
+	upper = _np.where(swap, retVal, 0.5 - retVal + 0.5).reshape(shape)
+	return _tail(lower, upper, lower_tail, log)
+
+
+
+def qhyper(p, m, n, k):
+	p, m, n, k = _asarrays(p, m, n, k)
+	lo = _np.maximum(0.0, k - n)
+	hi = _np.minimum(k, m)
+
+	def func(p, m, n, k, lo, hi):
+		retVal = _lookup("hyper", p, [m, n, k], lambda m, n, k: min(k, m) - max(0, k - n) + 1)
+		if retVal is not None:
+			return retVal
+		return _sp.discrete_quantile(phyper, p, (m, n, k), lo=lo, hi=hi)
+
+	return _quantile(p, lo, hi, func, m, n, k, lo, hi)
+
+
+
+
+# ----- Normal Distribution  -------
+
+def dnorm(x, mean, sd, log = False):
+	x, mu, sd = _asarrays(x, mean, sd)
+	z = (x - mu)/sd
+	if log:
+		return -(_sp._LN_SQRT_2PI + 0.5*z*z + _np.log(sd))
+	return _sp._1_SQRT_2PI*_np.exp(-0.5*z*z)/sd
+
+
+def pnorm(q, mean, sd, lower_tail = True, log = False):
+	q, mu, sd = _asarrays(q, mean, sd)
+	lower, upper = _sp.pnorm_both((q - mu)/sd, log)
+	return lower if lower_tail else upper
+
+
+def qnorm(p, mean, sd):
+	p, mu, sd = _asarrays(p, mean, sd)
+	return mu + sd*_sp.qnorm(p)
+
+
+
+
+# ----- Log Normal Distribution  -------
+
+def dlnorm(x, meanlog, sdlog, log = False):
+	x, mu, sd = _asarrays(x, meanlog, sdlog)
+	with _np.errstate(divide="ignore", invalid="ignore"):
+		if log:
+			return _np.where(x <= 0, -_INF, dnorm(_np.log(x), mu, sd, True) - _np.log(x))
+		retVal = dnorm(_np.log(x), mu, sd)/x
+	return _np.where(x <= 0, 0.0, retVal)
+
+
+def plnorm(q, meanlog, sdlog, lower_tail = True, log = False):
+	q, mu, sd = _asarrays(q, meanlog, sdlog)
+	with _np.errstate(divide="ignore", invalid="ignore"):
+		#log(0) = -inf gives the correct tails
+		return pnorm(_np.log(_np.maximum(q, 0.0)), mu, sd, lower_tail, log)
+
+
+def qlnorm(p, meanlog, sdlog):
+	p, mu, sd = _asarrays(p, meanlog, sdlog)
+	return _np.exp(qnorm(p, mu, sd))
+
+
+
+
+# ----- Pareto Distribution  -------
+
+def dpareto(x, location, shape, log = False):
+	x, loc, a = _asarrays(x, location, shape)
+	with _np.errstate(all="ignore"):
+		if log:
+			return _np.where(x < loc, -_INF, _np.log(a/x) + a*_np.log(loc/x))
+		retVal = a/x*_np.exp(a*_np.log(loc/x))
+	return _np.where(x < loc, 0.0, retVal)
+
+
+def ppareto(q, location, shape, lower_tail = True, log = False):
+	q, loc, a = _asarrays(q, location, shape)
+	with _np.errstate(all="ignore"):
+		lq = a*_np.log(loc/_np.maximum(q, loc))
+	return _tail_exp(lq, lower_tail, log)
+
+
+def qpareto(p, location, shape):
+	p, loc, a = _asarrays(p, location, shape)
+	return _quantile(p, loc, _INF, lambda p, loc, a: loc*_np.exp(-_np.log1p(-p)/a), loc, a)
+
+
+
+
+# ----- Poisson Distribution  -------
+
+def dpois(x, mu, log = False):
+	x, mu = _asarrays(x, mu)
+	retVal = _sp.dpois_raw(_np.round(x), mu, True)
+	return _dexp(_np.where(_isint(x) & (x >= 0), retVal, -_INF), log)
+
+
+def ppois(q, mu, lower_tail = True, log = False):
+	q, mu = _asarrays(q, mu)
+	x = _np.floor(q + 1E-7)
+	upper, lower = _sp.incgamma(_np.maximum(x, 0) + 1, mu)
+
+	lower = _np.where(mu == 0, 1.0, lower)
+	upper = _np.where(mu == 0, 0.0, upper)
+	lower = _np.where(x < 0, 0.0, _np.where(_np.isposinf(x), 1.0, lower))
+	upper = _np.where(x < 0, 1.0, _np.where(_np.isposinf(x), 0.0, upper))
+	return _tail(lower, upper, lower_tail, log)
+
+
+def qpois(p, mu):
+	p, mu = _asarrays(p, mu)
+
+	def func(p, mu):
+		return _sp.discrete_quantile(ppois, p, (mu,), lo=0.0, guess=mu)
+
+	retVal = _quantile(p, 0.0, _INF, func, mu)
+	return _np.where((mu == 0) & (p >= 0) & (p <= 1), 0.0, retVal)
+
+
+
+
+# ----- t Distribution  -------
+
+def dt(x, df, log = False):
+	x, n = _asarrays(x, df)
+
+	with _np.errstate(all="ignore"):
+		t = -_sp.bd0(n/2, (n + 1)/2) + _sp.stirlerr((n + 1)/2) - _sp.stirlerr(n/2)
+		x2n = x*x/n
+
+		#x^2/n is large: avoid overflow in x*x
+		ax = _np.abs(x)
+		lx2n_huge = _np.log(ax) - _np.log(n)/2
+
+		lx2n = _np.where(x2n > 1/_EPS, lx2n_huge, _np.log1p(x2n)/2)
+		u = _np.where(x2n > 0.2, n*lx2n, -_sp.bd0(n/2, (n + x*x)/2) + x*x/2)
+
+		if log:
+			return _np.where(_np.isinf(x), -_INF, t - u - lx2n - _sp._LN_SQRT_2PI)
+		retVal = _np.exp(t - u - lx2n)*_sp._1_SQRT_2PI
+
+	return _np.where(_np.isinf(x), 0.0, retVal)
+
+
+
+def _pt_twosided(t, n, log = False, density = False):
+	"""
+	P(|T|>|t|), log: natural logarithm of it
+	density: also return the density at t (not on log scale)
+	"""
+	t, n = _asarrays(t, n)
+
+	with _np.errstate(all="ignore"):
+		x2 = t*t
+		nx = 1 + (t/n)*t
+
+		#I(n/(n+t^2); n/2, 1/2), evaluated on whichever argument is accurate
+		#its prefactor is |t| times the density
+		small = n > x2
+		val = _np.empty_like(x2)
+		pre = _np.empty_like(x2)
+		for IsSmall in (True, False):
+			m = small == IsSmall
+			if not m.any():
+				continue
+
+			nm, x2m = n[m], x2[m]
+			if IsSmall:
+				res = _sp.incbeta(0.5, nm/2, x2m/(nm + x2m), nm/(nm + x2m), prefactor = density)
+				val[m] = res[1]
+			else:
+				res = _sp.incbeta(nm/2, 0.5, 1/nx[m], x2m/(nm + x2m), prefactor = density)
+				val[m] = res[0]
+			if density:
+				pre[m] = res[2]
+
+		if log:
+			_np.log(val, out=val)
+
+		#nx is huge
+		huge = nx > 1E100
+		if huge.any():
+			th, nh = t[huge], n[huge]
+			lval = -0.5*nh*(2*_np.log(_np.abs(th)) - _np.log(nh)) - _sp.lbeta(0.5*nh, 0.5) - _np.log(0.5*nh)
+			val[huge] = lval if log else _np.exp(lval)
+			pre[huge] = _np.abs(th)*dt(th, nh)
+
+		val = _np.where(_np.isinf(t), -_INF if log else 0.0, val)
+
+	if not density:
+		return val
+
+	with _np.errstate(all="ignore"):
+		f = _np.where(_np.isinf(t), 0.0, pre/_np.abs(t))
+	zero = t == 0
+	if zero.any():
+		f[zero] = dt(t[zero], n[zero])
+	return val, f
+
+
+
+def _pt_twosided1(t:float, n:float)->float:
+	"""_pt_twosided for a single element"""
+	x2 = t*t
+	nx = 1 + (t/n)*t
+	if nx > 1E100:
+		lb = math.lgamma(0.5*n) + math.lgamma(0.5) - math.lgamma(0.5*n + 0.5)
+		return math.exp(-0.5*n*(2*math.log(abs(t)) - math.log(n)) - lb - math.log(0.5*n))
+
+	if n > x2:
+		return _sp._incbeta1(0.5, n/2, x2/(n + x2), n/(n + x2))[1]
+	return _sp._incbeta1(n/2, 0.5, 1/nx, x2/(n + x2))[0]
+
+
+
+def pt(q, df, lower_tail = True, log = False):
+	q, n = _asarrays(q, df)
+	val = _pt_twosided(q, n)/2
+	lower = _np.where(q <= 0, val, 0.5 - val + 0.5)
+	upper = _np.where(q <= 0, 0.5 - val + 0.5, val)
+
+	#very large df: normal approximation with correction
+	big = n > 1E10
+	if big.any():
+		v = 1.0/(4*n[big])
+		qb = q[big]
+		lower[big], upper[big] = _sp.pnorm_both(qb*(1 - v)/_np.sqrt(1 + qb*qb*2*v))
+
+	lower = _np.where(_np.isnan(q), _NAN, lower)
+	upper = _np.where(_np.isnan(q), _NAN, upper)
+	retVal = _tail(lower, upper, lower_tail, log)
+
+	#the small tail underflows: use the log of the two-sided probability
+	if log:
+		small = (retVal == -_INF) & ~big & _np.isfinite(q) & ((q <= 0) == lower_tail)
+		if small.any():
+			retVal[small] = _pt_twosided(q[small], n[small], True) - math.log(2)
+
+	return retVal
+
+
+
+def _qt(p, n, t0 = None):
+	"""
+	quantile of t distribution for 0<p<1
+	t0: starting values for |t| (optional)
+	"""
+	p, n = _asarrays(p, n)
+	P = _np.minimum(p, 1.0 - p) #one-sided tail probability
+
+	if t0 is None:
+		with _np.errstate(all="ignore"):
+			#Cornish-Fisher expansion as starting value
+			z = -_sp.qnorm(P)
+			t0 = z + (z**3 + z)/(4*n) + (5*z**5 + 16*z**3 + 3*z)/(96*n*n)
+
+	def tail(t, n):
+		val, f = _pt_twosided(t, n, density = True)
+		return val/2, f
+
+	def tail1(t, n):
+		return _pt_twosided1(t, n)/2
+
+	def dens1(t, n):
+		lc = math.lgamma((n + 1)/2) - math.lgamma(n/2) - 0.5*math.log(n*math.pi)
+		return math.exp(lc - (n + 1)/2*math.log1p(t*t/n))
+
+	t = _sp.invert(tail, None, P, t0, (n,), upper=True, scalar=(tail1, dens1))
+
+	with _np.errstate(all="ignore"):
+		#exact for df=1 and df=2
+		t = _np.where(n == 1, 1.0/_np.tan(_np.pi*P), t)
+		t = _np.where(n == 2, (1 - 2*P)/_np.sqrt(2*P*(1 - P)), t)
+		t = _np.where(P == 0.5, 0.0, t)
+
+	return _np.where(p < 0.5, -t, t)
+
+
+
+def qt(p, df):
+	return _quantile(p, -_INF, _INF, _qt, df)
+
+
+
+
+# ----- Uniform Distribution  -------
+
+def dunif(x, min, max, log = False):
+	x, a, b = _asarrays(x, min, max)
+	return _dlog(_np.where((x >= a) & (x <= b), 1.0/(b - a), 0.0), log)
+
+
+def punif(q, min, max, lower_tail = True, log = False):
+	q, a, b = _asarrays(q, min, max)
+	lower = _np.clip((q - a)/(b - a), 0.0, 1.0)
+	upper = _np.clip((b - q)/(b - a), 0.0, 1.0)
+	return _tail(lower, upper, lower_tail, log)
+
+
+def qunif(p, min, max):
+	p, a, b = _asarrays(p, min, max)
+	retVal = a + p*(b - a)
+	return _np.where((p < 0) | (p > 1), _NAN, retVal)
+
+
+
+
+# ----- Weibull Distribution  -------
+
+def dweibull(x, shape, scale, log = False):
+	x, k, s = _asarrays(x, shape, scale)
+	with _np.errstate(all="ignore"):
+		z = x/s
+		zk = z**(k - 1)
+		if log:
+			return _np.where(x < 0, -_INF, _np.log(k/s) + (k - 1)*_np.log(z) - zk*z)
+		retVal = k/s*zk*_np.exp(-zk*z)
+	return _np.where(x < 0, 0.0, retVal)
+
+
+def pweibull(q, shape, scale, lower_tail = True, log = False):
+	q, k, s = _asarrays(q, shape, scale)
+	with _np.errstate(all="ignore"):
+		h = (_np.maximum(q, 0.0)/s)**k
+	return _tail_exp(-h, lower_tail, log)
+
+
+def qweibull(p, shape, scale):
+	p, k, s = _asarrays(p, shape, scale)
+	return _quantile(p, 0.0, _INF, lambda p, k, s: s*(-_np.log1p(-p))**(1/k), k, s)
+
+
+
+
+# ----- Wilcoxon Sign Rank Distribution  -------
+
+def _signrank_table(n:int)->tuple[_np.ndarray, _np.ndarray]:
+	"""
+	Probability mass function of the signed rank statistic for n, P(V=0), ..., P(V=n(n+1)/2),
+	and its cumulative sum (cached)
+	"""
+	return _CACHE.get(("signrank", n), lambda: _signrank_build(n))
+
+
+
+def _signrank_build(n:int)->tuple[_np.ndarray, _np.ndarray]:
+	N = n*(n + 1)//2
+	w = _np.zeros(N + 1)
+	w[0] = 1.0
+
+	#adding rank i to the set shifts the distribution by i
+	for i in range(1, n + 1):
+		hi = i*(i + 1)//2
+		w[i:hi + 1] = (w[i:hi + 1] + w[:hi + 1 - i])/2
+		w[:i] /= 2
+
+	return w, _np.cumsum(w)
+
+
+
+def _bygroup(func, x:_np.ndarray, n:_np.ndarray)->_np.ndarray:
+	"""Calls func(x[mask], int(n)) for each unique n"""
+	retVal = _np.full(x.shape, _NAN)
+	for v in _np.unique(n[_np.isfinite(n)]):
+		m = n == v
+		retVal[m] = func(x[m], int(v))
+	return retVal
+
+
+
+def dsignrank(x, n, log = False):
+	x, n = _asarrays(x, n)
+
+	def func(x, n):
+		w = _signrank_table(n)[0]
+		xr = _np.round(x)
+		valid = _isint(x) & (xr >= 0) & (xr < len(w))
+		return _np.where(valid, w[_np.where(valid, xr, 0).astype(_np.int64)], 0.0)
+
+	return _dlog(_bygroup(func, x, n), log)
+
+
+
+def psignrank(q, n, lower_tail = True, log = False):
+	q, n = _asarrays(q, n)
+
+	def func(q, n):
+		w, lower = _signrank_table(n)
+		N = len(w) - 1
+		upper = lower[::-1] #P(V>=x), the distribution is symmetric
+
+		x = _np.floor(q + 1E-7)
+		xi = _np.clip(x, 0, N).astype(_np.int64)
+
+		#sum the smaller tail
+		up = upper[_np.minimum(xi + 1, N)]
+		lo = _np.where(x <= N/2, lower[xi], 1.0 - up)
+		up = _np.where(x <= N/2, 1.0 - lower[xi], up)
+		lo = _np.where(x < 0, 0.0, _np.where(x >= N, 1.0, lo))
+		up = _np.where(x < 0, 1.0, _np.where(x >= N, 0.0, up))
+		return _tail(lo, up, lower_tail, log)
+
+	return _bygroup(func, q, n)
+
+
+
+def qsignrank(p, n):
+	p, n = _asarrays(p, n)
+
+	def func(p, n):
+		w, cdf = _signrank_table(n)
+		retVal = _np.searchsorted(cdf, p - 10*_EPS, side="left").astype(_np.float64)
+		retVal = _np.minimum(retVal, len(w) - 1)
+		return _np.where((p < 0) | (p > 1), _NAN, retVal)
+
+	return _bygroup(func, p, n)
+
+
+
+
+#---- Kolmogorov-Smirnov Dist --------
+
+def _mtw_build(m:int)->tuple[_np.ndarray, _np.ndarray]:
+	"""lower triangular pattern and factorial denominators of the m x m matrix of _mtw"""
+	i = _np.arange(m)
+	diff = i[:, None] - i[None, :] + 1
+	fact = _np.array([math.factorial(v) if v > 0 else 1 for v in diff.ravel()], dtype=_np.float64).reshape(m, m)
+	return _np.where(diff >= 0, 1.0, 0.0), fact
+
+
+
+def _mtw(d:_np.ndarray, n:int)->_np.ndarray:
+	"""
+	P(D_n < d) via the matrix method, d must satisfy 1/n < d < 1
+	The matrices are grouped by their size and powered in batches.
+
+	Reference:
+	- Marsaglia G, Tsang WW, Wang J (2003). Evaluating Kolmogorov's Distribution.
+	  Journal of Statistical Software 8(18)
+	"""
+	retVal = _np.empty(d.shape)
+	K = _np.floor(n*d).astype(_np.int64) + 1
+	lfact = math.lgamma(n + 1) - n*math.log(n)
+
+	for k in _np.unique(K):
+		sel = K == k
+		k = int(k)
+		m = 2*k - 1
+		h = k - n*d[sel]
+
+		i = _np.arange(m)
+		base, fact = _CACHE.get(("smirnov", m), lambda: _mtw_build(m))
+
+		H = _np.repeat(base[None, :, :], len(h), axis=0)
+		hp = h[:, None]**(i + 1)
+		H[:, :, 0] -= hp
+		H[:, m - 1, :] -= hp[:, ::-1]
+		H[:, m - 1, 0] += _np.where(2*h - 1 > 0, _np.maximum(2*h - 1, 0)**m, 0.0)
+		H /= fact
+
+		#H^n by repeated squaring, matrices are rescaled and log of the scale is tracked
+		Res = _np.repeat(_np.eye(m)[None, :, :], len(h), axis=0)
+		lscale = _np.zeros(len(h))
+		B, bscale = H, _np.zeros(len(h))
+		e = n
+		while e > 0:
+			if e & 1:
+				Res = Res @ B
+				lscale += bscale
+				sc = _np.abs(Res).max(axis=(1, 2))
+				sc = _np.where(sc > 0, sc, 1.0)
+				Res /= sc[:, None, None]
+				lscale += _np.log(sc)
+			e >>= 1
+			if e > 0:
+				B = B @ B
+				bscale = 2*bscale
+				sc = _np.abs(B).max(axis=(1, 2))
+				sc = _np.where(sc > 0, sc, 1.0)
+				B /= sc[:, None, None]
+				bscale += _np.log(sc)
+
+		v = Res[:, k - 1, k - 1]
+		with _np.errstate(divide="ignore"):
+			retVal[sel] = _np.where(v > 0, _np.exp(_np.log(v) + lscale + lfact), 0.0)
+
+	return _np.minimum(retVal, 1.0)
+
+
+
+def _pelz_good(d:_np.ndarray, n:int)->_np.ndarray:
+	"""
+	P(D_n <= d) via the asymptotic expansion of Pelz and Good (1976)
+
+	Reference:
+	- Simard R, L'Ecuyer P (2011). Computing the Two-Sided Kolmogorov-Smirnov Distribution.
+	  Journal of Statistical Software 39(11)
+	"""
+	z = math.sqrt(n)*d
+	z2, z3, z4, z6 = z**2, z**3, z**4, z**6
+	pi2, pi4, pi6 = math.pi**2, math.pi**4, math.pi**6
+	SQRT2PI = math.sqrt(2*math.pi)
+
+	q = _np.exp(-pi2/8/z2)
+	k1a, k1b = -z2, pi2/4
+	k2a, k2b, k2c = 6*z6 + 2*z4, (2*z4 - 5*z2)*pi2/4, pi4*(1 - 2*z2)/16
+	k3a, k3b = -30*z6 - 90*z**8, pi2*(135*z4 - 96*z6)/4
+	k3c, k3d = pi4*(-60*z2 + 212*z4)/16, pi6*(5 - 30*z2)/64
+
+	#sums over odd integers, sum c_m q^(m^2), by Horner's scheme
+	K = _np.zeros((4, ) + z.shape)
+	maxk = int(math.ceil(16*z.max()/math.pi))
+	for k in range(maxk, 0, -1):
+		m = 2*k - 1
+		m2, m4, m6 = m**2, m**4, m**6
+		K *= q**(8*k)
+		K[0] += 1.0
+		K[1] += k1a + k1b*m2
+		K[2] += k2a + k2b*m2 + k2c*m4
+		K[3] += k3a + k3b*m2 + k3c*m4 + k3d*m6
+
+	K *= q*SQRT2PI
+	K /= _np.stack([z, 6*z4, 72*z**7, 6480*z**10])
+
+	#sums over all integers
+	q = _np.exp(-pi2/2/z2)
+	ks = _np.arange(1, maxk + 1, dtype=_np.float64)[:, None]
+	ks2 = ks**2
+	qp = q**ks2
+	K[2] += _np.sum(ks2*qp, axis=0)*pi2*SQRT2PI/(-36*z3)
+
+	s3z, kpi = math.sqrt(3)*z, math.pi*ks
+	K[3] += _np.sum((s3z + kpi)*(s3z - kpi)*ks2*qp, axis=0)*pi2*SQRT2PI/(216*z6)
+
+	K /= (n**(_np.arange(4)/2))[:, None]
+	return _np.clip(K.sum(axis=0), 0.0, 1.0)
+
+
+
+def _smirnov_upper(d:_np.ndarray, n:int)->_np.ndarray:
+	"""
+	P(D_n >= d) as twice the one-sided tail P(D+_n >= d), exact for d>=0.5 and otherwise
+	larger by P(D+_n >= d, D-_n >= d), which is negligible when the tail is small.
+
+	Reference:
+	- Birnbaum ZW, Tingey FH (1951). One-sided confidence contours for probability 
+	  distribution functions. The Annals of Mathematical Statistics 22(4), 592-596
+	"""
+	retVal = _np.empty(d.shape)
+	J = _np.floor(n*(1 - d)).astype(_np.int64)
+
+	#sum over j=0..J of C(n,j) (1-d-j/n)^(n-j) (d+j/n)^(j-1), in blocks of elements
+	block = max(1, 2**20//(int(J.max()) + 1))
+	for i in range(0, len(d), block):
+		db, Jb = d[i:i + block, None], J[i:i + block, None]
+		j = _np.arange(int(Jb.max()) + 1, dtype=_np.float64)[None, :]
+		with _np.errstate(all="ignore"):
+			lt = (_sp.lgamma(n + 1.0) - _sp.lgamma(j + 1.0) - _sp.lgamma(n - j + 1.0)
+				+ (n - j)*_np.log(_np.maximum(1 - db - j/n, 0.0)) + (j - 1)*_np.log(db + j/n))
+			lt = _np.where(j <= Jb, lt, -_INF)
+			mx = lt.max(axis=1, keepdims=True)
+			retVal[i:i + block] = 2*db[:, 0]*_np.exp(mx[:, 0] + _np.log(_np.sum(_np.exp(lt - mx), axis=1)))
+
+	return _np.minimum(retVal, 1.0)
+
+
+
+def _psmirnov(d:_np.ndarray, n:int)->tuple[_np.ndarray, _np.ndarray]:
+	"""P(D_n <= d) and P(D_n > d) for 1D d, both tails are computed directly"""
+	P = _np.full(d.shape, _NAN)
+	Q = _np.full(d.shape, _NAN)
+
+	with _np.errstate(all="ignore"):
+		m = d <= 1/(2*n)
+		P[m], Q[m] = 0.0, 1.0
+
+		m = (d > 1/(2*n)) & (d <= 1/n)
+		P[m] = _np.exp(math.lgamma(n + 1) + n*_np.log(2*d[m] - 1/n))
+		Q[m] = 1.0 - P[m]
+
+		m = d >= 1.0
+		P[m], Q[m] = 1.0, 0.0
+
+		#upper tail is less than 2*exp(-2*n*d^2), P rounds to 1
+		m = _np.isnan(P) & (n*d*d >= 18)
+		P[m] = 1.0
+
+	rest = _np.isnan(P) & ~_np.isnan(d)
+	IsMTW = rest & ((n <= 140) | (n*d**1.5 < 1.4))
+	if IsMTW.any():
+		P[IsMTW] = _mtw(d[IsMTW], n)
+
+	IsPG = rest & ~IsMTW
+	if IsPG.any():
+		P[IsPG] = _pelz_good(d[IsPG], n)
+
+	#the complement is accurate unless the upper tail is small
+	small = _np.isnan(Q) & ~_np.isnan(d) & (P > 1 - 1E-3)
+	Q = _np.where(small | ~_np.isnan(Q), Q, 0.5 - P + 0.5)
+	if small.any():
+		Q[small] = _smirnov_upper(d[small], n)
+
+	return P, Q
+
+
+
+def psmirnov(q, n, lower_tail = True, log = False):
+	q, n = _asarrays(q, n)
+	shape = q.shape
+	q, n = q.ravel(), n.ravel()
+
+	lower, upper = _np.full(q.shape, _NAN), _np.full(q.shape, _NAN)
+	for v in _np.unique(n[_np.isfinite(n)]):
+		m = n == v
+		lower[m], upper[m] = _psmirnov(q[m], int(v))
+
+	return _tail(lower, upper, lower_tail, log).reshape(shape)
+
+
+
+
+def psmirnov2(d, m:int, n:int)->_np.ndarray:
+	"""
+	Exact upper tail P(D_mn >= d) of the two-sample statistic for sample sizes m and n.
+
+	A uniformly random lattice path from (0,0) to (m,n) is followed one anti-diagonal
+	at a time; probability reaching a point with |i/m - j/n| >= d is absorbed there and 
+	weighted by the probability, dhyper(i, m, n, i+j), that the path passes that point. 
+	All values of d are handled in one pass and the tail is summed directly (not 1 - P).
+	"""
+	d = _np.atleast_1d(_np.asarray(d, dtype=_np.float64))
+	if m > n:
+		m, n = n, m
+
+	#i*n - j*m is an integer, so is the threshold for attainable d (multiples of 1/lcm)
+	T = _np.ceil(d*m*n - 1E-7)[:, None]
+
+	i = _np.arange(m + 1, dtype=_np.float64)
+	w = _np.zeros((len(d), m + 1))
+	w[:, 0] = 1.0
+	retVal = _np.where(T[:, 0] <= 0, 1.0, 0.0)
+	w[T[:, 0] <= 0] = 0.0
+
+	for k in range(1, m + n + 1):
+		#w[i] is the probability of reaching (i, k-i) without crossing the boundary
+		w[:, 1:] = w[:, :-1]*(i[1:]/k) + w[:, 1:]*((k - i[1:])/k)
+		if k > n:
+			w[:, :k - n] = 0.0
+
+		outside = _np.abs(i*n - (k - i)*m)[None, :] >= T
+		outside[:, :max(k - n, 0)] = False
+		outside[:, min(k, m) + 1:] = False
+		if outside.any():
+			h = dhyper(i, m, n, k)
+			retVal += _np.where(outside, w, 0.0) @ h
+			w[outside] = 0.0
+
+	return _np.clip(retVal, 0.0, 1.0)
+
+
+
+#---- Discrete PMF/CDF tables --------
+
+_TABLE_BLOCK = 64 #exact densities are recomputed every _TABLE_BLOCK points
+_TABLE_MAXQ = 100000 #largest support used by qbinom/qhyper lookups
+
+
+
+def _outward(xs:_np.ndarray, dens, ratio)->_np.ndarray:
+	"""
+	pmf at consecutive points xs moving away from the mode,
+	ratio(x) is pmf(next point)/pmf(x) (<=1, so the products can not overflow)
+	"""
+	L = len(xs)
+	if L == 0:
+		return _np.empty(0)
+
+	B = _TABLE_BLOCK
+	nb = -(-L//B)
+	R = _np.ones(nb*B)
+	with _np.errstate(all="ignore"):
+		R[1:L] = ratio(xs[:-1])
+	R = R.reshape(nb, B)
+	R[:, 0] = dens(xs[::B])
+
+	return _np.cumprod(R, axis=1).ravel()[:L]
+
+
+
+def _upper_support(sf, start:float, tol:float)->float:
+	"""smallest integer x>=start with sf(x)<=tol"""
+	hi = max(float(start), 1.0)
+	while sf(hi) > tol:
+		hi *= 2
+	lo = float(start)
+	while lo < hi:
+		mid = math.floor((lo + hi)/2)
+		if sf(mid) <= tol:
+			hi = mid
+		else:
+			lo = mid + 1
+	return hi
+
+
+
+def _table_build(name:str, params:tuple, tol:float)->tuple:
+	if name == "binom":
+		n, p = params
+		q = 1.0 - p
+		lo, hi = 0.0, n
+		mode = min(math.floor((n + 1)*p), n)
+		dens = lambda x: dbinom(x, n, p)
+		up = lambda x: (n - x)/(x + 1)*(p/q)
+		down = lambda x: x/(n - x + 1)*(q/p)
+		if p == 0.0 or q == 0.0: #all mass at the mode
+			up = down = _np.zeros_like
+		sf = None
+
+	elif name == "hyper":
+		m, n, k = params
+		lo, hi = max(0.0, k - n), min(k, m)
+		mode = min(max(math.floor((k + 1)*(m + 1)/(m + n + 2)), lo), hi)
+		dens = lambda x: dhyper(x, m, n, k)
+		up = lambda x: (m - x)*(k - x)/((x + 1)*(n - k + x + 1))
+		down = lambda x: x*(n - k + x)/((m - x + 1)*(k - x + 1))
+		sf = None
+
+	elif name == "nbinom":
+		n, p = params
+		lo = 0.0
+		mode = math.floor((n - 1)*(1 - p)/p) if n > 1 else 0.0
+		dens = lambda x: dnbinom(x, n, p)
+		up = lambda x: (x + n)/(x + 1)*(1.0 - p)
+		down = lambda x: x/((x + n - 1)*(1.0 - p))
+		sf = lambda x: float(pnbinom(x, n, p, lower_tail=False))
+		hi = _upper_support(sf, mode, tol)
+
+	elif name == "pois":
+		mu, = params
+		lo = 0.0
+		mode = math.floor(mu)
+		dens = lambda x: dpois(x, mu)
+		up = lambda x: mu/(x + 1)
+		down = lambda x: x/mu
+		sf = lambda x: float(ppois(x, mu, lower_tail=False))
+		hi = _upper_support(sf, mode, tol)
+
+	else:
+		raise ValueError("dist must be 'binom', 'hyper', 'nbinom' or 'pois'")
+
+	x = _np.arange(lo, hi + 1)
+	pmf = _np.concatenate([
+		_outward(_np.arange(mode - 1, lo - 1, -1), dens, down)[::-1],
+		_outward(_np.arange(mode, hi + 1), dens, up)])
+
+	#probability beyond the truncated support
+	tail = sf(hi) if sf is not None else 0.0
+
+	lower = _np.cumsum(pmf)
+	upper = _np.empty_like(pmf) #P(X>x)
+	upper[:-1] = _np.cumsum(pmf[:0:-1])[::-1] + tail
+	upper[-1] = tail
+
+	#the smaller tail is the accurate one
+	cdf = _np.where(lower <= 0.5, lower, 1.0 - upper)
+	upper = _np.where(lower <= 0.5, 1.0 - lower, upper)
+
+	return x, pmf, _np.minimum(cdf, 1.0), _np.maximum(upper, 0.0)
+
+
+
+def pmf_table(name:str, params:tuple, tol:float = 1E-16)->tuple:
+	"""
+	x, pmf, cdf and upper tail P(X>x) over the support of a discrete distribution (cached).
+
+	The pmf is obtained from the ratio of consecutive probabilities, moving outward
+	from the mode, and is anchored at an exact density every _TABLE_BLOCK points.
+	The infinite supports of pois and nbinom end where P(X>x) <= tol.
+	"""
+	params = tuple(float(v) for v in params)
+	return _CACHE.get(("table", name, tol) + params, lambda: _table_build(name, params, tol))
+
+
+
+def _table_quantile(name:str, p:_np.ndarray, params:tuple)->_np.ndarray:
+	"""quantiles by binary search on the cached cdf (same fuzz as discrete_quantile)"""
+	x, _, cdf, _ = pmf_table(name, params)
+	i = _np.searchsorted(cdf, p*(1 - 64*_EPS), side="left")
+	return x[_np.minimum(i, len(x) - 1)]
+
+
+
+def _lookup(name:str, p:_np.ndarray, params:list, support)->_np.ndarray|None:
+	"""
+	Uses the table of `name` if parameters are scalars (or constant) and the support is
+	not larger than _TABLE_MAXQ, otherwise returns None
+	"""
+	if any(_np.ptp(v) != 0 for v in params if v.size > 0):
+		return None
+
+	params = tuple(float(v.flat[0]) for v in params)
+	if support(*params) > _TABLE_MAXQ:
+		return None
+
+	return _table_quantile(name, p, params)
+
+
+
+
+#---- Interpolated quantiles --------
+
+_QGRID_TOL = 1E-10
+_QGRID_PMIN = 1E-8
+
+#distribution: (density, transform, derivative of the transform, inverse of the transform)
+_QGRID = {
+	"qt": (dt, _np.arcsinh, lambda x: 1.0/_np.hypot(1.0, x), _np.sinh),
+	"qf": (df, _np.log, lambda x: 1.0/x, _np.exp),
+	"qchisq": (dchisq, _np.log, lambda x: 1.0/x, _np.exp)}
+
+
+
+def _logit(p:_np.ndarray)->_np.ndarray:
+	with _np.errstate(divide="ignore"):
+		return _np.log(p) - _np.log1p(-p)
+
+
+
+def _hermite(u:_np.ndarray, y:_np.ndarray, dy:_np.ndarray, v:_np.ndarray)->_np.ndarray:
+	"""cubic Hermite interpolation of nodes (u, y, dy/du) at v, u is sorted"""
+	i = _np.clip(_np.searchsorted(u, v, side="right") - 1, 0, len(u) - 2)
+	h = u[i + 1] - u[i]
+	t = (v - u[i])/h
+	t2, t3 = t*t, t*t*t
+	return (2*t3 - 3*t2 + 1)*y[i] + (t3 - 2*t2 + t)*h*dy[i] + (-2*t3 + 3*t2)*y[i + 1] + (t3 - t2)*h*dy[i + 1]
+
+
+
+def _qgrid_build(name:str, params:tuple)->tuple:
+	"""
+	Tabulates y=T(Q(p)) and dy/du at u=logit(p) for PMIN<=p<=1-PMIN,
+	where Q is the exact quantile function and T is the transform in _QGRID.
+
+	The grid is halved until cubic Hermite interpolation at every interval midpoint
+	is within |x - Q(p)| <= TOL*max(1, |Q(p)|). Returns () if that fails.
+	"""
+	dens, T, dT, inverse = _QGRID[name]
+	exact = globals()[name]
+
+	def tabulate(u):
+		#nodes are placed at representable probabilities
+		p = 1.0/(1.0 + _np.exp(-u))
+		x = exact(p, *params)
+		with _np.errstate(all="ignore"):
+			dy = dT(x)*p*(1.0 - p)/dens(x, *params)
+		return _logit(p), x, T(x), dy
+
+	umax = -_logit(_QGRID_PMIN)
+	u, x, y, dy = tabulate(_np.linspace(-umax, umax, 129))
+
+	while len(u) <= 8193:
+		um, xm, ym, dym = tabulate((u[:-1] + u[1:])/2)
+		if not (_np.all(_np.isfinite(y)) and _np.all(_np.isfinite(dy))):
+			break
+
+		xi = inverse(_hermite(u, y, dy, um))
+		err = _np.abs(xi - xm)/_np.maximum(1.0, _np.abs(xm))
+		if _np.all(err <= _QGRID_TOL):
+			return u, y, dy
+
+		#midpoints become nodes
+		n = len(u)
+		U, Y, DY = _np.empty(2*n - 1), _np.empty(2*n - 1), _np.empty(2*n - 1)
+		U[0::2], U[1::2] = u, um
+		Y[0::2], Y[1::2] = y, ym
+		DY[0::2], DY[1::2] = dy, dym
+		u, y, dy = U, Y, DY
+
+	return ()
+
+
+
+def qgrid(name:str):
+	"""
+	Returns a function with the signature of the quantile function `name` ("qt", "qf" or "qchisq")
+	that interpolates a cached grid of exact quantiles for PMIN<=p<=1-PMIN, where
+	|x - Q(p)| <= TOL*max(1, |Q(p)|), and uses the exact quantile function elsewhere.
+	Parameters must be scalars (one grid per set of parameters).
+	"""
+	exact = globals()[name]
+	inverse = _QGRID[name][3]
+
+	def func(p, *params):
+		params = tuple(float(v) for v in params)
+		table = _CACHE.get(("qgrid", name) + params, lambda: _qgrid_build(name, params))
+		p = _np.asarray(p, dtype=_np.float64)
+		if not table:
+			return exact(p, *params)
+
+		m = (p >= _QGRID_PMIN) & (p <= 1.0 - _QGRID_PMIN)
+		retVal = _np.empty(p.shape)
+		if not m.all():
+			retVal[~m] = exact(p[~m], *params)
+
+		retVal[m] = inverse(_hermite(*table, _logit(p[m])))
+		return retVal
+
+	return func
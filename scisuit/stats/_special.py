@@ -0,0 +1,1014 @@
+import math
+from statistics import NormalDist
+
+import numpy as _np
+
+
+
+
+_EPS = float(_np.finfo(_np.float64).eps)
+_DBL_MIN = float(_np.finfo(_np.float64).tiny)
+_FPMIN = 1.0E-300
+
+_LN_2PI = 1.837877066409345483560659472811
+_LN_SQRT_2PI = 0.918938533204672741780329736406
+_1_SQRT_2PI = 0.398942280401432677939946059934
+_SQRT_32 = 5.656854249492380195206754896838
+
+_MAXITER = 100000
+
+_NORMAL = NormalDist()
+
+
+
+
+def asarrays(*args)->list[_np.ndarray]:
+	"""Converts args to float64 arrays and broadcasts them against each other"""
+	return _np.broadcast_arrays(*[_np.asarray(v, dtype=_np.float64) for v in args])
+
+
+
+def _iterate(step, state:list[_np.ndarray], maxiter = _MAXITER, outputs:tuple[int, ...]|None = None)->list[_np.ndarray]:
+	"""
+	Runs an element-wise iteration until every element converges.
+
+	step: function taking arrays in state, returns (new state, converged mask)
+	state: list of 1D arrays of equal length, or floats shared by all elements
+		(i.e. an iteration counter or constant parameters)
+	outputs: positions of the state arrays returned (all by default)
+
+	Elements are recorded when they converge and are removed from the working set
+	once a quarter of it has converged, so that slowly converging elements do not
+	cost time for the others while the working set is not copied at every step.
+	"""
+	outputs = range(len(state)) if outputs is None else outputs
+	n = len(state[outputs[0]])
+	result = [_np.empty(n) for _ in outputs]
+	idx = _np.arange(n)
+	finished = _np.zeros(n, dtype=bool)
+
+	for _ in range(maxiter):
+		if len(idx) == 0:
+			break
+
+		state, done = step(*state)
+		done &= ~finished
+		if done.any():
+			for r, o in zip(result, outputs):
+				r[idx[done]] = state[o][done]
+			finished |= done
+
+			if 4*_np.count_nonzero(finished) >= len(idx):
+				keep = ~finished
+				idx = idx[keep]
+				state = [s[keep] if isinstance(s, _np.ndarray) else s for s in state]
+				finished = finished[keep]
+
+	keep = ~finished
+	for r, o in zip(result, outputs):
+		r[idx[keep]] = state[o][keep]
+
+	return result
+
+
+
+
+# ---------------------- Gamma function related ------------------------
+
+_LANCZOS = (
+	57.1562356658629235, -59.5979603554754912, 14.1360979747417471,
+	-0.491913816097620199, 0.339946499848118887E-4, 0.465236289270485756E-4,
+	-0.983744753048795646E-4, 0.158088703224912494E-3, -0.210264441724104883E-3,
+	0.217439618115212643E-3, -0.164318106536763890E-3, 0.844182239838527433E-4,
+	-0.261908384015814087E-4, 0.368991826595316234E-5)
+
+
+def _lgamma1(v:float)->float:
+	try:
+		return math.lgamma(v)
+	except OverflowError:
+		return math.inf
+
+
+def lgamma(x)->_np.ndarray:
+	"""
+	log(gamma(x)) for x>0
+
+	Lanczos approximation with g=607/128,
+	Press WH et al. (2007) Numerical Recipes, 3rd Ed., Section 6.1
+	"""
+	x = _np.asarray(x, dtype=_np.float64)
+	if x.size > 0 and x.min() == x.max():
+		#a single value (i.e. a scalar or broadcast parameters)
+		v = float(x.flat[0])
+		return _np.full(x.shape, _lgamma1(v) if v > 0 else (_np.inf if v == 0 else _np.nan))
+
+	y = x.copy()
+	ser = _np.full_like(x, 0.999999999999997092)
+	for c in _LANCZOS:
+		y += 1.0
+		ser += c/y
+
+	with _np.errstate(divide="ignore", invalid="ignore"):
+		tmp = x + 5.24218750000000000
+		tmp = (x + 0.5)*_np.log(tmp) - tmp
+		return tmp + _np.log(2.5066282746310005*ser/x)
+
+
+
+def lbeta(a, b)->_np.ndarray:
+	"""log(beta(a, b)) for a, b > 0"""
+	a, b = asarrays(a, b)
+	return lgamma(a) + lgamma(b) - lgamma(a + b)
+
+
+
+#log(n!) - log(sqrt(2*pi*n)*(n/e)^n) for n = 0, 0.5, 1.0, ..., 15.0
+_SFERR_HALVES = _np.array([
+	0.0, #n=0 is a placeholder
+	0.1534264097200273452913848, 0.0810614667953272582196702,
+	0.0548141210519176538961390, 0.0413406959554092940938221,
+	0.03316287351993628748511048, 0.02767792568499833914878929,
+	0.02374616365629749597132920, 0.02079067210376509311152277,
+	0.01848845053267318523077934, 0.01664469118982119216319487,
+	0.01513497322191737887351255, 0.01387612882307074799874573,
+	0.01281046524292022692424986, 0.01189670994589177009505572,
+	0.01110455975820691732662991, 0.010411265261972096497478567,
+	0.009799416126158803298389475, 0.009255462182712732917728637,
+	0.008768700134139385462952823, 0.008330563433362871256469318,
+	0.007934114564314020547248100, 0.007573675487951840794972024,
+	0.007244554301320383179543912, 0.006942840107209529865664152,
+	0.006665247032707682442354394, 0.006408994188004207068439631,
+	0.006171712263039457647532867, 0.005951370112758847735624416,
+	0.005746216513010115682023589, 0.005554733551962801371038690])
+
+
+def stirlerr(n)->_np.ndarray:
+	"""
+	Error term of Stirling's formula, log(n!) - log(sqrt(2*pi*n)*(n/e)^n)
+
+	Reference:
+	- Loader C (2000). Fast and Accurate Computation of Binomial Probabilities.
+	"""
+	n = _np.asarray(n, dtype=_np.float64)
+	if n.size > 1 and n.min() == n.max():
+		#broadcast parameters
+		return _np.full(n.shape, stirlerr(n.flat[0]))
+
+	S0, S1, S2, S3, S4 = 1/12, 1/360, 1/1260, 1/1680, 1/1188
+
+	with _np.errstate(divide="ignore", invalid="ignore"):
+		nn = n*n
+		retVal = _np.where(n > 500, (S0 - S1/nn)/n,
+				_np.where(n > 80, (S0 - (S1 - S2/nn)/nn)/n,
+				_np.where(n > 35, (S0 - (S1 - (S2 - S3/nn)/nn)/nn)/n,
+					(S0 - (S1 - (S2 - (S3 - S4/nn)/nn)/nn)/nn)/n)))
+
+		small = (n >= 0) & (n <= 15.0)
+		if small.any():
+			ns = n[small]
+			nn2 = ns + ns
+			IsHalf = nn2 == _np.floor(nn2)
+			tbl = _SFERR_HALVES[_np.where(IsHalf, nn2, 0).astype(_np.int64)]
+			direct = lgamma(ns + 1.0) - (ns + 0.5)*_np.log(ns) + ns - _LN_SQRT_2PI
+			retVal = _np.array(retVal, copy=True)
+			retVal[small] = _np.where(IsHalf, tbl, direct)
+
+	return retVal
+
+
+
+def bd0(x, np_)->_np.ndarray:
+	"""
+	Deviance term x*log(x/np) + np - x, evaluated without cancellation when x ~ np
+
+	Reference:
+	- Loader C (2000). Fast and Accurate Computation of Binomial Probabilities.
+	"""
+	x, M = asarrays(x, np_)
+
+	with _np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+		near = _np.abs(x - M) < 0.1*(x + M)
+
+		#masked copies are costly, they are skipped when all elements are near
+		AllNear = bool(near.all())
+		if not AllNear:
+			retVal = _np.where(x == 0, M, x*_np.log(x/M) + M - x)
+
+		if near.any():
+			xs, ms = (x, M) if AllNear else (x[near], M[near])
+			v = (xs - ms)/(xs + ms)
+			v2 = v*v
+
+			#s = (x-M)*v + 2*x*v*sum(v^(2j)/(2j+1)), j>=1, with v^2<0.01 at most 8 terms are needed.
+			#The number of terms is set from the largest v^2 and the sum is evaluated by Horner's rule.
+			vmax = float(v2.max())
+			K = 1 if vmax == 0 else min(max(int(math.log(_EPS)/math.log(vmax)) + 1, 1), 1000)
+			poly = _np.full_like(v2, 1.0/(2*K + 1))
+			for j in range(K - 1, 0, -1):
+				poly *= v2
+				poly += 1.0/(2*j + 1)
+			poly *= v2
+
+			series = (xs - ms)*v + 2*xs*v*poly
+			if AllNear:
+				return series
+
+			retVal = _np.array(retVal, copy=True)
+			retVal[near] = series
+
+	return retVal
+
+
+
+def dpois_raw(x, lam, log:bool = False)->_np.ndarray:
+	"""
+	lam^x * exp(-lam) / gamma(x+1) for real x>=0
+	log: natural logarithm of it (computed directly, does not underflow)
+
+	Reference:
+	- Loader C (2000). Fast and Accurate Computation of Binomial Probabilities.
+	"""
+	x, lam = asarrays(x, lam)
+
+	with _np.errstate(all="ignore"):
+		retVal = _np.array(-stirlerr(x) - bd0(x, lam) - 0.5*_np.log(2*_np.pi*x))
+
+		tiny = lam < x*_DBL_MIN
+		if tiny.any():
+			retVal[tiny] = -lam[tiny] + x[tiny]*_np.log(lam[tiny]) - lgamma(x[tiny] + 1)
+
+		retVal = _np.where(x <= lam*_DBL_MIN, -lam, retVal)
+		retVal = _np.where(lam == 0, _np.where(x == 0, 0.0, -_np.inf), retVal)
+		retVal = _np.where((x < 0) | _np.isinf(lam), -_np.inf, retVal)
+
+		return retVal if log else _np.exp(retVal)
+
+
+
+def dbinom_raw(x, n, p, q, log:bool = False)->_np.ndarray:
+	"""
+	Binomial probability C(n,x) p^x q^(n-x) for real x and n (q = 1-p given separately)
+	log: natural logarithm of it (computed directly, does not underflow)
+
+	Reference:
+	- Loader C (2000). Fast and Accurate Computation of Binomial Probabilities.
+	"""
+	x, n, p, q = asarrays(x, n, p, q)
+
+	with _np.errstate(all="ignore"):
+		lc = stirlerr(n) - stirlerr(x) - stirlerr(n - x) - bd0(x, n*p) - bd0(n - x, n*q)
+		lf = _LN_2PI + _np.log(x) + _np.log1p(-x/n)
+		retVal = _np.array(lc - 0.5*lf, copy=True, ndmin=1)
+
+		m = (x == 0).ravel()
+		if m.any():
+			nm, pm, qm = n.ravel()[m], p.ravel()[m], q.ravel()[m]
+			lc0 = _np.where(pm < 0.1, -bd0(nm, nm*qm) - nm*pm, nm*_np.log(qm))
+			retVal.ravel()[m] = _np.where(nm == 0, 0.0, lc0)
+
+		m = ((x == n) & (x != 0)).ravel()
+		if m.any():
+			nm, pm, qm = n.ravel()[m], p.ravel()[m], q.ravel()[m]
+			retVal.ravel()[m] = _np.where(qm < 0.1, -bd0(nm, nm*pm) - nm*qm, nm*_np.log(pm))
+
+		retVal = retVal.reshape(x.shape)
+
+		retVal = _np.where((x < 0) | (x > n), -_np.inf, retVal)
+		retVal = _np.where(p == 0, _np.where(x == 0, 0.0, -_np.inf), retVal)
+		retVal = _np.where(q == 0, _np.where(x == n, 0.0, -_np.inf), retVal)
+
+		return retVal if log else _np.exp(retVal)
+
+
+
+
+# ---------------------- Normal distribution ------------------------
+
+_CODY_A = (2.2352520354606839287, 161.02823106855587881, 1067.6894854603709582,
+		18154.981253343561249, 0.065682337918207449113)
+_CODY_B = (47.20258190468824187, 976.09855173777669322, 10260.932208618978205,
+		45507.789335026729956)
+_CODY_C = (0.39894151208813466764, 8.8831497943883759412, 93.506656132177855979,
+		597.27027639480026226, 2494.5375852903726711, 6848.1904505362823326,
+		11602.651437647350124, 9842.7148383839780218, 1.0765576773720192317e-8)
+_CODY_D = (22.266688044328115691, 235.38790178262499861, 1519.377599407554805,
+		6485.558298266760755, 18615.571640885098091, 34900.952721145977266,
+		38912.003286093271411, 19685.429676859990727)
+_CODY_P = (0.21589853405795699, 0.1274011611602473639, 0.022235277870649807,
+		0.001421619193227893466, 2.9112874951168792e-5, 0.02307344176494017303)
+_CODY_Q = (1.28426009614491121, 0.468238212480865118, 0.0659881378689285515,
+		0.00378239633202758244, 7.29751555083966205e-5)
+
+
+def pnorm_both(x, log:bool = False)->tuple[_np.ndarray, _np.ndarray]:
+	"""
+	Lower and upper tail probabilities of the standard normal distribution
+	log: logarithms of the probabilities (accurate far in the tails)
+
+	Reference:
+	- Cody WJ (1993). Algorithm 715: SPECFUN. ACM Transactions on Mathematical Software 19:22-32
+	"""
+	x = _np.asarray(x, dtype=_np.float64)
+	a, b, c, d, p, q = _CODY_A, _CODY_B, _CODY_C, _CODY_D, _CODY_P, _CODY_Q
+
+	cum = _np.empty_like(x)
+	ccum = _np.empty_like(x)
+	y = _np.abs(x)
+
+	with _np.errstate(all="ignore"):
+		#|x| <= qnorm(3/4)
+		m = y <= 0.67448975
+		if m.any():
+			xm = x[m]
+			xsq = xm*xm
+			xnum = a[4]*xsq
+			xden = xsq
+			for i in range(3):
+				xnum = (xnum + a[i])*xsq
+				xden = (xden + b[i])*xsq
+			temp = xm*(xnum + a[3])/(xden + b[3])
+			cum[m] = 0.5 + temp
+			ccum[m] = 0.5 - temp
+			if log:
+				cum[m], ccum[m] = _np.log(cum[m]), _np.log(ccum[m])
+
+		#qnorm(3/4) < |x| <= sqrt(32)
+		m = (y > 0.67448975) & (y <= _SQRT_32)
+		if m.any():
+			ym = y[m]
+			xnum = c[8]*ym
+			xden = ym
+			for i in range(7):
+				xnum = (xnum + c[i])*ym
+				xden = (xden + d[i])*ym
+			temp = (xnum + c[7])/(xden + d[7])
+
+			xsq = _np.trunc(ym*16)/16
+			dl = (ym - xsq)*(ym + xsq)
+			small = _np.exp(-xsq*xsq*0.5)*_np.exp(-dl*0.5)*temp
+			pos = x[m] > 0
+			cum[m] = _np.where(pos, 1.0 - small, small)
+			ccum[m] = _np.where(pos, small, 1.0 - small)
+			if log:
+				lsmall = -xsq*xsq*0.5 - dl*0.5 + _np.log(temp)
+				cum[m] = _np.where(pos, _np.log1p(-small), lsmall)
+				ccum[m] = _np.where(pos, lsmall, _np.log1p(-small))
+
+		#|x| > sqrt(32)
+		m = (y > _SQRT_32) | _np.isnan(y)
+		if m.any():
+			ym = y[m]
+			xsq = 1.0/(ym*ym)
+			xnum = p[5]*xsq
+			xden = xsq
+			for i in range(4):
+				xnum = (xnum + p[i])*xsq
+				xden = (xden + q[i])*xsq
+			temp = xsq*(xnum + p[4])/(xden + q[4])
+			temp = (_1_SQRT_2PI - temp)/ym
+
+			xsq = _np.trunc(ym*16)/16
+			dl = (ym - xsq)*(ym + xsq)
+			small = _np.exp(-xsq*xsq*0.5)*_np.exp(-dl*0.5)*temp
+			small = _np.where(_np.isinf(ym), 0.0, small)
+			pos = x[m] > 0
+			cum[m] = _np.where(pos, 1.0 - small, small)
+			ccum[m] = _np.where(pos, small, 1.0 - small)
+			if log:
+				lsmall = -xsq*xsq*0.5 - dl*0.5 + _np.log(temp)
+				lsmall = _np.where(_np.isinf(ym), -_np.inf, lsmall)
+				cum[m] = _np.where(pos, _np.log1p(-small), lsmall)
+				ccum[m] = _np.where(pos, lsmall, _np.log1p(-small))
+
+	return cum, ccum
+
+
+
+def qnorm(p)->_np.ndarray:
+	"""
+	Quantile function of the standard normal distribution (lower tail)
+
+	Reference:
+	- Wichura MJ (1988). Algorithm AS 241: The Percentage Points of the Normal Distribution.
+	  Applied Statistics 37:477-484
+	"""
+	p = _np.asarray(p, dtype=_np.float64)
+	if p.size == 1 and 0 < p.flat[0] < 1:
+		#same algorithm (AS 241) in the standard library
+		return _np.full(p.shape, _NORMAL.inv_cdf(float(p.flat[0])))
+
+	q = p - 0.5
+	retVal = _np.empty_like(p)
+
+	with _np.errstate(all="ignore"):
+		m = _np.abs(q) <= 0.425
+		if m.any():
+			qm = q[m]
+			r = 0.180625 - qm*qm
+			retVal[m] = qm*(((((((r*2509.0809287301226727 +
+				33430.575583588128105)*r + 67265.770927008700853)*r +
+				45921.953931549871457)*r + 13731.693765509461125)*r +
+				1971.5909503065514427)*r + 133.14166789178437745)*r +
+				3.387132872796366608) / (((((((r*5226.495278852545925 +
+				28729.085735721942674)*r + 39307.89580009271061)*r +
+				21213.794301586595867)*r + 5394.1960214247511077)*r +
+				687.1870074920579083)*r + 42.313330701600911252)*r + 1.0)
+
+		m = ~m
+		if m.any():
+			qm, pm = q[m], p[m]
+			r = _np.sqrt(-_np.log(_np.minimum(pm, 1.0 - pm)))
+
+			r1 = r - 1.6
+			v1 = (((((((r1*7.7454501427834140764e-4 +
+				0.0227238449892691845833)*r1 + 0.24178072517745061177)*r1 +
+				1.27045825245236838258)*r1 + 3.64784832476320460504)*r1 +
+				5.7694972214606914055)*r1 + 4.6303378461565452959)*r1 +
+				1.42343711074968357734) / (((((((r1*1.05075007164441684324e-9 +
+				5.475938084995344946e-4)*r1 + 0.0151986665636164571966)*r1 +
+				0.14810397642748007459)*r1 + 0.68976733498510000455)*r1 +
+				1.6763848301838038494)*r1 + 2.05319162663775882187)*r1 + 1.0)
+
+			r2 = r - 5.0
+			v2 = (((((((r2*2.01033439929228813265e-7 +
+				2.71155556874348757815e-5)*r2 + 0.0012426609473880784386)*r2 +
+				0.026532189526576123093)*r2 + 0.29656057182850489123)*r2 +
+				1.7848265399172913358)*r2 + 5.4637849111641143699)*r2 +
+				6.6579046435011037772) / (((((((r2*2.04426310338993978564e-15 +
+				1.4215117583164458887e-7)*r2 + 1.8463183175100546818e-5)*r2 +
+				7.868691311456132591e-4)*r2 + 0.0148753612908506148525)*r2 +
+				0.13692988092273580531)*r2 + 0.59983220655588793769)*r2 + 1.0)
+
+			val = _np.where(r <= 5.0, v1, v2)
+			retVal[m] = _np.where(qm < 0, -val, val)
+
+		retVal = _np.where(p == 0, -_np.inf, _np.where(p == 1, _np.inf, retVal))
+		retVal = _np.where((p < 0) | (p > 1), _np.nan, retVal)
+
+	return retVal
+
+
+
+
+# ---------------------- Incomplete gamma and beta functions ------------------------
+
+def _gamma_prefactor(a, x)->_np.ndarray:
+	"""x^a * exp(-x) / gamma(a)"""
+	small = a < 10
+	with _np.errstate(all="ignore"):
+		if small.all():
+			return _np.exp(a*_np.log(x) - x - lgamma(a))
+		if not small.any():
+			return a*dpois_raw(a, x)
+		direct = _np.exp(a*_np.log(x) - x - lgamma(a))
+		return _np.where(small, direct, a*dpois_raw(a, x))
+
+
+
+# Single elements (i.e. scalar calls) are iterated with Python floats, which is much
+# faster than applying the array operations to arrays of size 1.
+# (Lentz's guard against zero denominators is written inline, it runs at every step)
+
+def _stirlerr1(n:float)->float:
+	"""stirlerr for n>=0"""
+	if n <= 15.0:
+		nn = n + n
+		if nn == int(nn):
+			return float(_SFERR_HALVES[int(nn)])
+		return math.lgamma(n + 1.0) - (n + 0.5)*math.log(n) + n - _LN_SQRT_2PI
+
+	S0, S1, S2, S3, S4 = 1/12, 1/360, 1/1260, 1/1680, 1/1188
+	nn = n*n
+	if n > 500:
+		return (S0 - S1/nn)/n
+	if n > 80:
+		return (S0 - (S1 - S2/nn)/nn)/n
+	if n > 35:
+		return (S0 - (S1 - (S2 - S3/nn)/nn)/nn)/n
+	return (S0 - (S1 - (S2 - (S3 - S4/nn)/nn)/nn)/nn)/n
+
+
+def _bd01(x:float, M:float)->float:
+	"""bd0 for x>=0 and M>0"""
+	if x == 0:
+		return M
+
+	if abs(x - M) >= 0.1*(x + M):
+		return x*math.log(x/M) + M - x
+
+	v = (x - M)/(x + M)
+	s = (x - M)*v
+	ej = 2*x*v
+	v = v*v
+	for j in range(1, 1000):
+		ej *= v
+		s1 = s + ej/(2*j + 1)
+		if s1 == s:
+			break
+		s = s1
+	return s
+
+
+def _gamma_prefactor1(a:float, x:float)->float:
+	"""_gamma_prefactor for a>0 and 0<x<inf"""
+	if a < 10:
+		return math.exp(a*math.log(x) - x - math.lgamma(a))
+
+	#a*dpois_raw(a, x)
+	if x < a*_DBL_MIN:
+		return a*math.exp(-x + a*math.log(x) - math.lgamma(a + 1))
+	return a*math.exp(-_stirlerr1(a) - _bd01(a, x) - 0.5*math.log(2*math.pi*a))
+
+
+def _incgamma1(a:float, x:float)->tuple[float, float]:
+	"""incgamma for a single element"""
+	if not (a > 0 and x >= 0):
+		return math.nan, math.nan
+	if x == 0:
+		return 0.0, 1.0
+	if math.isinf(x):
+		return 1.0, 0.0
+
+	if x < a + 1:
+		lower = min(_gammaser1(a, x)*_gamma_prefactor1(a, x), 1.0)
+		return lower, 1.0 - lower
+
+	upper = min(_gammacf1(a, x)*_gamma_prefactor1(a, x), 1.0)
+	return 1.0 - upper, upper
+
+
+def _incbeta1(a:float, b:float, x:float, y:float)->tuple[float, float]:
+	"""incbeta for a single element (y = 1-x)"""
+	if not (a > 0 and b > 0 and x >= 0 and y >= 0):
+		return math.nan, math.nan
+	if x == 0:
+		return 0.0, 1.0
+	if y == 0:
+		return 1.0, 0.0
+
+	#x^a (1-x)^b / B(a, b), i.e. dbinom_raw(a, a+b, x, y)*a*b/(a+b)
+	n = a + b
+	lc = _stirlerr1(n) - _stirlerr1(a) - _stirlerr1(b) - _bd01(a, n*x) - _bd01(b, n*y)
+	pre = math.exp(lc - 0.5*(_LN_2PI + math.log(a) + math.log1p(-a/n)))*a*b/n
+
+	if x > (a + 1.0)/(n + 2.0):
+		tail = min(pre*_betacf1(b, a, y)/b, 1.0)
+		return 1.0 - tail, tail
+
+	tail = min(pre*_betacf1(a, b, x)/a, 1.0)
+	return tail, 1.0 - tail
+
+
+def _gammaser1(a:float, x:float)->float:
+	"""series of the lower incomplete gamma function, divided by the prefactor"""
+	ap, dl = a, 1.0/a
+	sm = dl
+	for _ in range(_MAXITER):
+		ap += 1.0
+		dl *= x/ap
+		sm += dl
+		if abs(dl) < abs(sm)*_EPS:
+			break
+	return sm
+
+
+def _gammacf1(a:float, x:float)->float:
+	"""continued fraction of the upper incomplete gamma function, divided by the prefactor"""
+	b = x + 1.0 - a
+	c, d = 1.0/_FPMIN, 1.0/b
+	h = d
+	for i in range(1, _MAXITER + 1):
+		an = -i*(i - a)
+		b += 2.0
+		d = an*d + b
+		d = 1.0/(_FPMIN if -_FPMIN < d < _FPMIN else d)
+		c = b + an/c
+		c = _FPMIN if -_FPMIN < c < _FPMIN else c
+		dl = d*c
+		h *= dl
+		if abs(dl - 1.0) <= _EPS:
+			break
+	return h
+
+
+def _betacf1(a:float, b:float, x:float)->float:
+	"""continued fraction for incomplete beta function"""
+	qab, qap, qam = a + b, a + 1.0, a - 1.0
+	c, d = 1.0, 1.0 - qab*x/qap
+	d = 1.0/(_FPMIN if -_FPMIN < d < _FPMIN else d)
+	h = d
+	for m in range(1, _MAXITER + 1):
+		m2 = 2*m
+		aa = m*(b - m)*x/((qam + m2)*(a + m2))
+		d = 1.0 + aa*d
+		d = 1.0/(_FPMIN if -_FPMIN < d < _FPMIN else d)
+		c = 1.0 + aa/c
+		c = _FPMIN if -_FPMIN < c < _FPMIN else c
+		h *= d*c
+
+		aa = -(a + m)*(qab + m)*x/((a + m2)*(qap + m2))
+		d = 1.0 + aa*d
+		d = 1.0/(_FPMIN if -_FPMIN < d < _FPMIN else d)
+		c = 1.0 + aa/c
+		c = _FPMIN if -_FPMIN < c < _FPMIN else c
+		dl = d*c
+		h *= dl
+		if abs(dl - 1.0) <= _EPS:
+			break
+	return h
+
+
+
+def _shared(v:_np.ndarray|float)->_np.ndarray|float:
+	"""v[0] if all elements of v are equal (i.e. broadcast parameters), otherwise v"""
+	if isinstance(v, float):
+		return v
+	return float(v[0]) if len(v) > 1 and v.min() == v.max() else v
+
+
+def _guard(v:_np.ndarray)->_np.ndarray:
+	"""Lentz's guard against zero denominators (in place)"""
+	tiny = _np.abs(v) < _FPMIN
+	if tiny.any():
+		v[tiny] = _FPMIN
+	return v
+
+
+def _reguard(h:_np.ndarray, cf1, *params)->_np.ndarray:
+	"""
+	The vectorized continued fractions skip Lentz's guard at every step, a zero
+	denominator leaves a non-finite h behind, which is recomputed with the guarded cf1
+	"""
+	for i in _np.flatnonzero(~_np.isfinite(h)):
+		h[i] = cf1(*(p if isinstance(p, float) else float(p[i]) for p in params))
+	return h
+
+
+
+def incgamma(a, x, prefactor = False)->tuple[_np.ndarray, ...]:
+	"""
+	Regularized lower and upper incomplete gamma functions, P(a, x) and Q(a, x)
+
+	prefactor: also return x^a*exp(-x)/gamma(a), i.e. x times the gamma density
+
+	Series expansion for x<a+1, otherwise continued fraction (modified Lentz's method).
+	The prefactor x^a*exp(-x)/gamma(a) is computed with Loader's saddle point expansion.
+
+	Reference:
+	- Press WH et al. (2007) Numerical Recipes, 3rd Ed., Section 6.2
+	"""
+	a, x = asarrays(a, x)
+	shape = a.shape
+	if a.size == 1 and not prefactor:
+		P, Q = _incgamma1(float(a.flat[0]), float(x.flat[0]))
+		return _np.full(shape, P), _np.full(shape, Q)
+
+	a, x = a.ravel(), x.ravel()
+
+	P = _np.full(a.shape, _np.nan)
+	Q = _np.full(a.shape, _np.nan)
+	pref = _np.full(a.shape, _np.nan)
+
+	valid = (a > 0) & (x >= 0)
+	P[valid & (x == 0)], Q[valid & (x == 0)] = 0.0, 1.0
+	P[valid & _np.isposinf(x)], Q[valid & _np.isposinf(x)] = 1.0, 0.0
+	pref[valid & ((x == 0) | _np.isposinf(x))] = 0.0
+
+	valid &= (x > 0) & _np.isfinite(x)
+
+	with _np.errstate(all="ignore"):
+		m = valid & (x < a + 1)
+		if m.any():
+			am, xm = a[m], x[m]
+			def step(ap, dl, sm, xx):
+				ap = ap + 1
+				dl *= xx/ap
+				sm += dl
+				return [ap, dl, sm, xx], _np.abs(dl) < _np.abs(sm)*_EPS
+
+			if len(am) == 1:
+				sm = _np.array([_gammaser1(float(am[0]), float(xm[0]))])
+			else:
+				ap = _shared(am)
+				dl = 1.0/ap + _np.zeros_like(xm)
+				sm, = _iterate(step, [ap, dl, dl.copy(), xm], outputs=(2, ))
+			pre = _gamma_prefactor(am, xm)
+			lower = _np.minimum(sm*pre, 1.0)
+			P[m], Q[m], pref[m] = lower, 1.0 - lower, pre
+
+		m = valid & (x >= a + 1)
+		if m.any():
+			am, xm = a[m], x[m]
+			b = xm + 1.0 - am
+			d = 1.0/b
+			def step(i, b, c, d, h, aa):
+				i = i + 1
+				an = -i*(i - aa)
+				b += 2.0
+				d = an*d + b
+				_np.divide(1.0, d, out=d)
+				c = an/c + b
+				dl = d*c
+				h *= dl
+				dl -= 1.0
+				return [i, b, c, d, h, aa], _np.abs(dl, out=dl) <= _EPS
+
+			if len(am) == 1:
+				h = _np.array([_gammacf1(float(am[0]), float(xm[0]))])
+			else:
+				h, = _iterate(step, [0.0, b, _np.full_like(am, 1/_FPMIN), d, d.copy(), _shared(am)], outputs=(4, ))
+				h = _reguard(h, _gammacf1, am, xm)
+			pre = _gamma_prefactor(am, xm)
+			upper = _np.minimum(h*pre, 1.0)
+			P[m], Q[m], pref[m] = 1.0 - upper, upper, pre
+
+	if prefactor:
+		return P.reshape(shape), Q.reshape(shape), pref.reshape(shape)
+	return P.reshape(shape), Q.reshape(shape)
+
+
+
+def _betacf(a, b, x)->_np.ndarray:
+	"""
+	Continued fraction for incomplete beta function (modified Lentz's method)
+
+	The iteration counter and parameters shared by all elements are kept as floats,
+	so that the coefficients of a step are computed once and not per element.
+	"""
+	if len(x) == 1:
+		return _np.array([_betacf1(*(float(_np.ravel(v)[0]) for v in (a, b, x)))])
+
+	a, b = _shared(a), _shared(b)
+
+	def step(m, c, d, h, a, b, x):
+		m = m + 1
+		m2 = 2*m
+		aa = (m*(b - m)/((a - 1.0 + m2)*(a + m2)))*x
+		d = aa*d + 1.0
+		_np.divide(1.0, d, out=d)
+		c = aa/c + 1.0
+		h *= d
+		h *= c
+
+		aa = (-(a + m)*(a + b + m)/((a + m2)*(a + 1.0 + m2)))*x
+		d = aa*d + 1.0
+		_np.divide(1.0, d, out=d)
+		c = aa/c + 1.0
+		dl = d*c
+		h *= dl
+		dl -= 1.0
+		return [m, c, d, h, a, b, x], _np.abs(dl, out=dl) <= _EPS
+
+	with _np.errstate(all="ignore"):
+		d = 1.0/_guard(1.0 - ((a + b)/(a + 1.0))*x)
+		h, = _iterate(step, [0.0, _np.ones_like(x), d, d.copy(), a, b, x], outputs=(3, ))
+
+	return _reguard(h, _betacf1, a, b, x)
+
+
+
+def incbeta(a, b, x, y = None, prefactor = False)->tuple[_np.ndarray, ...]:
+	"""
+	Regularized incomplete beta function I_x(a, b) and its complement 1 - I_x(a, b)
+
+	y: 1-x, can be provided when it is known more accurately than 1-x
+	prefactor: also return x^a (1-x)^b / B(a, b), i.e. x(1-x) times the beta density
+
+	The continued fraction is evaluated on the side where it converges rapidly
+	and the prefactor is computed with Loader's saddle point expansion.
+
+	Reference:
+	- Press WH et al. (2007) Numerical Recipes, 3rd Ed., Section 6.4
+	"""
+	if y is None:
+		a, b, x = asarrays(a, b, x)
+		y = 1.0 - x
+	else:
+		a, b, x, y = asarrays(a, b, x, y)
+
+	shape = a.shape
+	if a.size == 1 and not prefactor:
+		lower, upper = _incbeta1(float(a.flat[0]), float(b.flat[0]), float(x.flat[0]), float(y.flat[0]))
+		return _np.full(shape, lower), _np.full(shape, upper)
+
+	a, b, x, y = a.ravel(), b.ravel(), x.ravel(), y.ravel()
+
+	lower = _np.full(a.shape, _np.nan)
+	upper = _np.full(a.shape, _np.nan)
+	pref = _np.full(a.shape, _np.nan)
+
+	valid = (a > 0) & (b > 0) & (x >= 0) & (y >= 0)
+	lower[valid & (x == 0)], upper[valid & (x == 0)] = 0.0, 1.0
+	lower[valid & (y == 0)], upper[valid & (y == 0)] = 1.0, 0.0
+	pref[valid & ((x == 0) | (y == 0))] = 0.0
+	valid &= (x > 0) & (y > 0)
+
+	if valid.any():
+		#masked copies are skipped when all elements are valid, shared parameters are kept as floats
+		AllValid = bool(valid.all())
+		av, bv, xv, yv = (a, b, x, y) if AllValid else (a[valid], b[valid], x[valid], y[valid])
+		av, bv = _shared(av), _shared(bv)
+		take = lambda v, m: v if isinstance(v, float) else v[m]
+
+		#x^a (1-x)^b / B(a, b)
+		with _np.errstate(all="ignore"):
+			pre = dbinom_raw(av, av + bv, xv, yv)*(av*bv/(av + bv))
+
+		swap = xv > (av + 1.0)/(av + bv + 2.0)
+		cf = _np.empty_like(xv)
+		ns = ~swap
+		if ns.any():
+			cf[ns] = _betacf(take(av, ns), take(bv, ns), xv[ns])
+		if swap.any():
+			cf[swap] = _betacf(take(bv, swap), take(av, swap), yv[swap])
+
+		with _np.errstate(all="ignore"):
+			tail = _np.minimum(pre*cf/_np.where(swap, bv, av), 1.0)
+
+		if AllValid:
+			lower, upper, pref = _np.where(swap, 1.0 - tail, tail), _np.where(swap, tail, 1.0 - tail), pre
+		else:
+			lower[valid] = _np.where(swap, 1.0 - tail, tail)
+			upper[valid] = _np.where(swap, tail, 1.0 - tail)
+			pref[valid] = pre
+
+	if prefactor:
+		return lower.reshape(shape), upper.reshape(shape), pref.reshape(shape)
+	return lower.reshape(shape), upper.reshape(shape)
+
+
+
+
+# ---------------------- Numerical inversion ------------------------
+
+def invert(
+		tail,
+		dens,
+		target:_np.ndarray,
+		x0:_np.ndarray,
+		params:tuple = (),
+		upper = False,
+		hi = _np.inf,
+		maxiter = 200,
+		scalar:tuple|None = None)->_np.ndarray:
+	"""
+	Solves tail(x, *params) = target for x in (0, hi).
+
+	tail: lower (increasing) tail probability or, if upper is True, upper (decreasing) tail probability
+	dens: density function, dens(x, *params), or None if tail returns the tuple (tail, density)
+	target: probabilities in (0, 1)
+	x0: initial guesses
+	scalar: (tail, dens) taking and returning Python floats, used for a single element
+
+	Newton iterations are carried out on log(tail) vs log(x), so that power-law and
+	exponential tails converge in a few steps. Steps leaving the bracket are replaced
+	by (geometric) bisection.
+	"""
+	target, x0, *params = asarrays(target, x0, *params)
+	shape = target.shape
+	if target.size == 1 and scalar is not None:
+		x = _invert1(*scalar, float(target.flat[0]), float(x0.flat[0]),
+				[float(v.flat[0]) for v in params], upper, float(hi), maxiter)
+		return _np.full(shape, x)
+
+	target, x0 = target.ravel(), x0.ravel()
+	params = [_shared(p.ravel()) for p in params]
+
+	n = len(target)
+	lo = _np.zeros(n)
+	hi = _np.full(n, float(hi))
+	with _np.errstate(all="ignore"):
+		x = _np.where((x0 > 0) & (x0 < hi) & _np.isfinite(x0), x0, _np.where(_np.isinf(hi), 1.0, 0.5*hi))
+		logt = _np.log(target)
+
+	sign = -1.0 if upper else 1.0
+
+	def step(x, lo, hi, logt, *prm):
+		with _np.errstate(all="ignore"):
+			if dens is None:
+				T, f = tail(x, *prm)
+			else:
+				T, f = tail(x, *prm), dens(x, *prm)
+			g = _np.log(T) - logt
+
+			TooBig = sign*g > 0
+			hi = _np.where(TooBig, x, hi)
+			lo = _np.where(TooBig, lo, x)
+
+			slope = sign*f*x/T #d(log(T))/d(log(x))
+			xn = x*_np.exp(-g/slope)
+
+			#Newton converges quadratically, the error after this step is far below the step itself
+			conv = _np.abs(xn - x) <= 1E-11*x
+			bad = ~_np.isfinite(xn) | (xn <= lo) | (xn >= hi)
+			fix = bad & ~conv
+			if fix.any():
+				#unbounded brackets are expanded geometrically in the exponent as well
+				xf, lf, hf = x[fix], lo[fix], hi[fix]
+				xn[fix] = _np.where(_np.isinf(hf), _np.where(xf*xf < 1E300, _np.maximum(16.0*xf, xf*xf), 16.0*xf),
+							_np.where(lf == 0, _np.minimum(xf/16.0, xf*xf),
+							_np.where(hf > 4*lf, _np.sqrt(lf)*_np.sqrt(hf), 0.5*(lf + hf))))
+
+			done = (g == 0) | conv | (_np.isfinite(hi) & (hi - lo <= 4*_EPS*hi))
+			done |= ~_np.isfinite(g) & (hi - lo <= _DBL_MIN)
+			done |= (xn == 0) | _np.isinf(xn) #solution underflows or overflows
+		return [xn, lo, hi, logt, *prm], done
+
+	x, = _iterate(step, [x, lo, hi, logt, *params], maxiter=maxiter, outputs=(0, ))
+	return x.reshape(shape)
+
+
+
+def _invert1(tail, dens, target:float, x0:float, params:list, upper:bool, hi:float, maxiter:int)->float:
+	"""invert for a single element, same steps as the array version with Python floats"""
+	lo = 0.0
+	x = x0 if (0 < x0 < hi and math.isfinite(x0)) else (1.0 if math.isinf(hi) else 0.5*hi)
+	logt = math.log(target)
+	sign = -1.0 if upper else 1.0
+
+	for _ in range(maxiter):
+		T = tail(x, *params)
+		g = (math.log(T) if T > 0 else (-math.inf if T == 0 else math.nan)) - logt
+
+		if sign*g > 0:
+			hi = x
+		else:
+			lo = x
+
+		#math raises where NumPy gives inf/nan, the step is then replaced by bisection
+		try:
+			f = dens(x, *params)
+			xn = x*math.exp(-g*T/(sign*f*x))
+		except (ZeroDivisionError, OverflowError, ValueError):
+			xn = math.nan
+
+		if math.isinf(hi):
+			bisect = max(16.0*x, x*x) if x*x < 1E300 else 16.0*x
+		elif lo == 0:
+			bisect = min(x/16.0, x*x)
+		else:
+			bisect = math.sqrt(lo)*math.sqrt(hi) if hi > 4*lo else 0.5*(lo + hi)
+
+		conv = abs(xn - x) <= 1E-11*x
+		if not conv and (not math.isfinite(xn) or xn <= lo or xn >= hi):
+			xn = bisect
+
+		done = g == 0 or conv or (math.isfinite(hi) and hi - lo <= 4*_EPS*hi)
+		done = done or (not math.isfinite(g) and hi - lo <= _DBL_MIN)
+		done = done or xn == 0 or math.isinf(xn)
+		x = xn
+		if done:
+			break
+
+	return x
+
+
+
+def discrete_quantile(
+		cdf,
+		p:_np.ndarray,
+		params:tuple = (),
+		lo = 0.0,
+		hi = _np.inf,
+		guess = None)->_np.ndarray:
+	"""
+	Smallest integer x in [lo, hi] such that cdf(x, *params) >= p
+
+	hi can be infinite (the bracket is then expanded starting from guess).
+	"""
+	p, lo, hi, *params = asarrays(p, lo, hi, *params)
+	shape = p.shape
+	p, lo, hi = p.ravel(), lo.ravel().copy(), hi.ravel().copy()
+	params = [v.ravel() for v in params]
+
+	if guess is not None:
+		guess = _np.broadcast_to(_np.asarray(guess, dtype=_np.float64), shape).ravel()
+
+	#fuzz to avoid rounding problems, i.e. q(p(x)) != x
+	pf = p*(1 - 64*_EPS)
+
+	#expand the infinite brackets
+	inf = _np.isinf(hi)
+	if inf.any():
+		h = lo[inf] + 1.0
+		if guess is not None:
+			h = _np.maximum(h, _np.floor(guess[inf]))
+		prm = [v[inf] for v in params]
+		pi = pf[inf]
+		for _ in range(1100):
+			below = cdf(h, *prm) < pi
+			if not below.any():
+				break
+			h = _np.where(below, 2*h, h)
+		hi[inf] = h
+
+	def step(lo, hi, pf, *prm):
+		mid = _np.floor(0.5*(lo + hi))
+		ok = cdf(mid, *prm) >= pf
+		hi = _np.where(ok, mid, hi)
+		lo = _np.where(ok, lo, mid + 1)
+		return [lo, hi, pf, *prm], lo >= hi
+
+	lo, = _iterate(step, [lo, hi, pf, *params], maxiter=2000, outputs=(0, ))
+	return lo.reshape(shape)
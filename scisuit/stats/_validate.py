@@ -0,0 +1,52 @@
+from numbers import Real
+from typing import Iterable
+
+import numpy as _np
+
+
+
+
+def asarray(
+		x:Iterable,
+		name:str = "x",
+		minsize:int = 1,
+		ndim:int|None = 1,
+		finite:bool = True)->_np.ndarray:
+	"""
+	Converts x once to a C-contiguous float64 ndarray and validates it in vectorized form,
+	the returned array can be passed on as is (native functions copy float64 buffers directly).
+
+	name: used in error messages
+	minsize: minimum number of elements
+	ndim: required number of dimensions, None for any
+	finite: NaN and inf are not allowed
+	"""
+	assert isinstance(x, Iterable), name + " must be Iterable"
+
+	arr = _np.asarray(x)
+	if arr.ndim == 0 and arr.dtype == object:
+		#sets, generators and other iterables that are not sequences
+		arr = _np.asarray(list(x))
+
+	assert arr.dtype.kind in "biuf", name + " must contain only Real numbers"
+
+	arr = _np.ascontiguousarray(arr, dtype=_np.float64)
+	if ndim is not None:
+		assert arr.ndim == ndim, name + f" must be {ndim}D"
+
+	assert arr.size >= minsize, name + f" must have at least {minsize} elements"
+	if finite:
+		assert _np.isfinite(arr).all(), name + " must contain only finite numbers"
+
+	return arr
+
+
+
+def check_conflevel(conflevel:Real):
+	assert isinstance(conflevel, Real) and 0.0 < conflevel < 1.0, "conflevel must be in range (0, 1)"
+
+
+
+def check_alternative(alternative:str):
+	assert alternative in ["two.sided", "notequal", "less", "greater"], \
+		"alternative must be 'two.sided', 'less' or 'greater'"
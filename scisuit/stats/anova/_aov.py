@@ -3,6 +3,7 @@ from typing import Iterable
 
 from ctypes import py_object, c_double, c_char_p
 from ..._ctypeslib import pydll as _pydll
+from .._validate import asarray as _asarray
 
 
 
@@ -52,10 +53,9 @@ class aov_results:
 
 
 def aov(*args)->aov_results:
-	for v in args:
-		assert isinstance(v, Iterable), "Iterable objects expected."
+	Samples = tuple(_asarray(v, f"sample {i+1}") for i, v in enumerate(args))
 	
-	res:dict = _pydll.c_stat_test_anova_aov(args)
+	res:dict = _pydll.c_stat_test_anova_aov(Samples)
 
 	return aov_results(
 		Treat_DF= res["Treat_DF"],
@@ -4,6 +4,7 @@ from typing import Iterable
 
 from ctypes import py_object
 from ..._ctypeslib import pydll as _pydll
+from .._validate import asarray as _asarray
 
 _pydll.c_stat_test_anova_aov2.argtypes = [py_object, py_object, py_object]
 _pydll.c_stat_test_anova_aov2.restype=py_object
@@ -66,15 +67,13 @@ def aov2(y:Iterable, x1:Iterable, x2:Iterable)->aov2_results:
 	x1, x2: factors
 	"""
 
+	yy = _asarray(y, "y", minsize=3)
 	assert len(x1)>= 3, "x1 must have at least 3 elements"
 	assert len(x2) == len(x1), "x1 and x2 must have same size"
-	assert len(x1) == len(y), "x1 and y must have same size"
+	assert len(x1) == len(yy), "x1 and y must have same size"
 
-	for v in y:
-		assert isinstance(v, float|int), "y must contain only numbers"
 
-
-	dct:dict = _pydll.c_stat_test_anova_aov2(y, x1, x2)
+	dct:dict = _pydll.c_stat_test_anova_aov2(yy, x1, x2)
 
 	return aov2_results(
 		DFError = dct["DFError"], 
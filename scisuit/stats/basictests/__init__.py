@@ -1,17 +1,19 @@
-from ._test_f import test_f, test_f_Result
+from ._test_f import test_f, test_f_from_stats, test_f_Result
 
-from ._test_t import test_t, test_t1_result, test_t2_result, test_tpaired_result
-from ._test_z import test_z, test_z1_Result, test_z2_Result
+from ._test_t import test_t, test_t_from_stats, test_t1_result, test_t2_result, test_tpaired_result
+from ._test_z import test_z, test_z_from_stats, test_z1_Result, test_z2_Result
+from ._accumulator import accumulator
 
 
 from ._test_normality import \
 	anderson, ADTestRes, \
 	ks_1samp, Ks1SampletestResult, \
+	ks_2samp, Ks2SampletestResult, \
 	shapiro, ShapiroTestResult
 
-from ._test_cor import cor_test, cortest_Result
+from ._test_cor import cor_test, cortest_Result, cor_matrix, cor_matrix_Result
 
-from ._poisson1sample import test_poisson1sample, test_poisson1sample_Result
+from ._poisson1sample import test_poisson1sample, test_poisson1sample_from_stats, test_poisson1sample_Result
 
 
 
@@ -0,0 +1,190 @@
+from numbers import Real
+
+import numpy as _np
+
+from ._test_t import _t1_summary, _t2_summary, test_t1_result, test_t2_result
+from ._test_z import _z1_summary, _z2_summary, test_z1_Result, test_z2_Result
+from ._test_f import _f_summary, test_f_Result
+from .._validate import asarray as _asarray, check_conflevel as _check_conflevel, check_alternative as _check_alternative
+
+
+
+
+class accumulator:
+
+	"""
+	Running count, mean and variance of data arriving in chunks,
+	so that t, z and F tests can be performed without holding the data in memory.
+
+	Moments of each chunk are combined with the running ones by Chan's
+	parallel form of Welford's algorithm, accumulators filled in different
+	processes can be merged the same way.
+
+	axis: if None all elements of a chunk are accumulated,
+	otherwise moments are kept for each slice along axis (i.e. axis=0 for columns)
+
+	## Example:
+	>> acc = accumulator() \n
+	>> for chunk in chunks: acc.update(chunk) \n
+	>> acc.test_t(mu=10)
+	"""
+
+	def __init__(self, axis:int|None = None):
+		assert axis is None or isinstance(axis, int), "axis must be int or None"
+
+		self._m_Axis = axis
+		self._m_N = 0
+		self._m_Mean = 0.0
+		self._m_M2 = 0.0 #sum of squared deviations from the mean
+
+
+	@property
+	def n(self)->int:
+		return self._m_N
+
+	@property
+	def mean(self)->float|_np.ndarray:
+		return self._m_Mean
+
+	@property
+	def var(self)->float|_np.ndarray:
+		"""sample variance"""
+		assert self._m_N >= 2, "at least 2 observations expected"
+		return self._m_M2 / (self._m_N - 1)
+
+	@property
+	def stdev(self)->float|_np.ndarray:
+		"""sample standard deviation"""
+		return _np.sqrt(self.var)
+
+
+	def update(self, x)->'accumulator':
+		"""adds the observations in x"""
+		xx = _asarray(x, minsize=0, ndim=None)
+		if self._m_Axis is None:
+			xx = xx.ravel()
+
+		Axis = 0 if self._m_Axis is None else self._m_Axis
+		n = xx.shape[Axis]
+		if n == 0:
+			return self
+
+		mean = _np.mean(xx, axis=Axis)
+		M2 = _np.sum(_np.square(xx - _np.expand_dims(mean, Axis)), axis=Axis)
+		self.__combine(n, mean, M2)
+
+		return self
+
+
+	def merge(self, other:'accumulator')->'accumulator':
+		"""adds the observations accumulated by other"""
+		assert isinstance(other, accumulator), "other must be accumulator"
+		assert other._m_Axis == self._m_Axis, "accumulators must have same axis"
+
+		if other._m_N > 0:
+			self.__combine(other._m_N, other._m_Mean, other._m_M2)
+		return self
+
+
+	def __combine(self, n:int, mean, M2):
+		if self._m_N == 0:
+			self._m_N, self._m_Mean, self._m_M2 = n, mean, M2
+			return
+
+		assert _np.shape(mean) == _np.shape(self._m_Mean), "chunks must have same shape (except along axis)"
+
+		N = self._m_N + n
+		delta = mean - self._m_Mean
+		self._m_Mean = self._m_Mean + delta * (n / N)
+		self._m_M2 = self._m_M2 + M2 + delta**2 * (self._m_N * n / N)
+		self._m_N = N
+
+
+	def __check(self, name:str):
+		assert self._m_N >= 3, name + " must have at least 3 observations"
+
+
+	def test_t(
+			self,
+			y:'accumulator|None' = None,
+			varequal=True,
+			alternative="two.sided",
+			mu:Real=0.0,
+			conflevel:Real=0.95)->test_t1_result|test_t2_result:
+		"""
+		1-sample t-test or, if y is given, 2-sample t-test
+
+		y: accumulator of the second sample
+		varequal: assuming equal variances
+		alternative: 'two.sided', 'less' or 'greater'
+		mu: Assumed difference between samples or assumed mean
+		conflevel: Confidence level, [0,1]
+		"""
+		_check_conflevel(conflevel)
+		_check_alternative(alternative)
+		self.__check("x")
+
+		if y is None:
+			return _t1_summary(self.n, self.mean, self.stdev, mu, alternative, conflevel)
+
+		assert isinstance(y, accumulator), "y must be accumulator"
+		y.__check("y")
+		return _t2_summary(
+			self.n, y.n, self.mean, y.mean, self.stdev, y.stdev,
+			mu, varequal, alternative, conflevel)
+
+
+	def test_z(
+			self,
+			sd1:Real,
+			mu:Real = 0.0,
+			y:'accumulator|None' = None,
+			sd2: Real = None,
+			alternative="two.sided",
+			conflevel=0.95)->test_z1_Result|test_z2_Result:
+		"""
+		1-sample z-test or, if y is given, 2-sample z-test
+
+		sd1, sd2: Standard deviations of populations
+		mu: Assumed difference between means of populations
+		y: accumulator of the second sample
+		alternative: "two.sided", "less", "greater"
+		conflevel: Confidence level, (0,1)
+		"""
+		_check_conflevel(conflevel)
+		_check_alternative(alternative)
+		assert _np.all(_np.asarray(sd1)>0), "sd1>0 expected"
+		self.__check("x")
+
+		if y is None:
+			return _z1_summary(self.n, self.mean, self.stdev, sd1, mu, alternative, conflevel)
+
+		assert isinstance(y, accumulator), "y must be accumulator"
+		assert sd2 is not None and _np.all(_np.asarray(sd2)>0), "sd2>0 expected"
+		y.__check("y")
+		return _z2_summary(
+			self.n, y.n, self.mean, y.mean, self.stdev, y.stdev,
+			sd1, sd2, mu, alternative, conflevel)
+
+
+	def test_f(
+			self,
+			y:'accumulator',
+			ratio:float = 1.0,
+			alternative:str = "two.sided",
+			conflevel:float = 0.95)->test_f_Result:
+		"""
+		F test for the ratio of variances
+
+		y: accumulator of the second sample
+		ratio: Assumed ratio of variances of the samples
+		alternative: "two.sided", "less", "greater"
+		conflevel: Confidence level, [0,1]
+		"""
+		_check_conflevel(conflevel)
+		_check_alternative(alternative)
+		assert isinstance(y, accumulator), "y must be accumulator"
+		self.__check("x")
+		y.__check("y")
+
+		return _f_summary(self.n, y.n, self.var, y.var, ratio, alternative, conflevel)
@@ -3,7 +3,12 @@ from dataclasses import dataclass
 from typing import Iterable
 
 from ctypes import py_object, c_double, c_char_p, c_bool
+
+import numpy as _np
+
 from ..._ctypeslib import pydll as _pydll
+from .._distributions import pnorm, qnorm, ppois, qchisq
+from .._validate import asarray as _asarray, check_conflevel as _check_conflevel
 
 _pydll.c_stat_essential_poisson1sample.argtypes = [
 							py_object, #sample
@@ -41,7 +46,7 @@ class test_poisson1sample_Result:
 		if self._alternative == "two.sided":
 			s += f"CI = ({self.ci[0]}, {self.ci[1]})"
 		else:
-			s += f"CI = {max(self.ci[0],self.ci[1])}" #either one is 0.0
+			s += f"CI = {_np.maximum(self.ci[0], self.ci[1])}" #either one is 0.0
 
 		if self._hypotest:
 			s += "\n"
@@ -53,6 +58,14 @@ class test_poisson1sample_Result:
 
 
 
+def _tocounts(x:Iterable, name:str)->list[int]:
+	"""validated non-negative integer counts, as list of int which the native side expects"""
+	arr = _asarray(x, name)
+	assert _np.all((arr >= 0) & (arr == _np.floor(arr))), name + " must contain only non-negative integers"
+	return arr.astype(_np.int64).tolist()
+
+
+
 def test_poisson1sample(
 		sample: Iterable[int] | None = None,
 		frequency: Iterable[int] | None = None,
@@ -86,8 +99,8 @@ def test_poisson1sample(
 	alternative: "two.sided", "less" or "greater"
 	"""
 
-	SamplesKnown = sample != None
-	SummarizedData = samplesize != None and totaloccur != None
+	SamplesKnown = sample is not None
+	SummarizedData = samplesize is not None and totaloccur is not None
 
 	assert SamplesKnown or SummarizedData, "Either sample (and optionally frequency) or summarized data must be provided"
 
@@ -95,12 +108,14 @@ def test_poisson1sample(
 		assert SummarizedData == False, "if sample is not None, then samplesize and totaloccur must be None"
 	
 	if SummarizedData:
-		assert sample == None and frequency == None, "if samplesize is not None, then sample and frequency must be None"
+		assert sample is None and frequency is None, "if samplesize is not None, then sample and frequency must be None"
 
 
-	assert isinstance(conflevel, float) and (conflevel>0.0 or conflevel<1.0), "conflevel must be in range (0, 1)"
-	assert isinstance(sample, Iterable | None), "sample must be Iterable|None"
-	assert isinstance(frequency, Iterable | None), "frequency be Iterable|None"
+	_check_conflevel(conflevel)
+	if sample is not None:
+		sample = _tocounts(sample, "sample")
+	if frequency is not None:
+		frequency = _tocounts(frequency, "frequency")
 	assert isinstance(samplesize, int|None), "samplesize must be int|None"
 	assert isinstance(totaloccur, int|None), "totaloccur must be int|None"
 
@@ -138,3 +153,99 @@ def test_poisson1sample(
 			N=dct["N"],
 			TotalOccurences=dct["TotalOccurences"])
 
+
+
+
+
+def test_poisson1sample_from_stats(
+		samplesize: int | Iterable[int],
+		totaloccur: int | Iterable[int],
+		length:numbers.Real = 1,
+		hypotest = False,
+		hyporate:numbers.Real = 0.0,
+		conflevel:float = 0.95,
+		method = "normal",
+		alternative = "two.sided")->test_poisson1sample_Result:
+	"""
+	One sample Poisson rate test from summarized data, computed without the native library. 
+	samplesize and totaloccur can be arrays to perform a batch of tests, 
+	fields of the result are then ndarrays.
+
+	samplesize: Size of the sample  
+	totaloccur: Number of total occurences  
+	length: Length of observation (time, area, etc.)  
+	hypotest: Should perform hypothesis test
+	hyporate: Hypothesis rate  
+	conflevel: Confidence level, [0,1]  
+	method: "normal" or "exact"  
+	alternative: "two.sided", "less" or "greater"
+	"""
+	_check_conflevel(conflevel)
+	assert _np.all(_np.asarray(samplesize)>0), "samplesize>0 expected"
+	assert _np.all(_np.asarray(totaloccur)>=0), "totaloccur>=0 expected"
+	assert isinstance(length, numbers.Real) and length>0, "length must be Real and >0"
+	assert isinstance(hypotest, bool), "hypotest must be bool"
+	if hypotest:
+		assert isinstance(hyporate, numbers.Real) and hyporate>0, "hyporate must be Real and >0"
+	assert method in ["normal", "exact"], "method must be 'normal' or 'exact'"
+	assert alternative in ["two.sided", "less", "greater"], "alternative must be 'two.sided', 'less' or 'greater'"
+
+	N = _np.asarray(samplesize, dtype=_np.float64)
+	Total = _np.asarray(totaloccur, dtype=_np.float64)
+	Exposure = N*length
+	mean = Total/Exposure
+
+	alpha = 1 - conflevel
+	if alternative == "two.sided":
+		alpha /= 2
+	
+	if method == "normal":
+		Half = -qnorm(alpha, 0.0, 1.0)*_np.sqrt(mean/Exposure)
+		Lower, Upper = mean - Half, mean + Half
+	else:
+		#chi-square form of the exact (Garwood) interval, lower bound is 0 if no occurences
+		with _np.errstate(all="ignore"):
+			Lower = _np.where(Total > 0, _np.asarray(qchisq(alpha, _np.maximum(2*Total, 1)))/(2*Exposure), 0.0)
+		Upper = _np.asarray(qchisq(1 - alpha, 2*Total + 2))/(2*Exposure)
+
+	if alternative == "less":
+		Lower = _np.zeros_like(Upper)
+	elif alternative == "greater":
+		Upper = _np.zeros_like(Lower)
+
+	pvalue, zvalue = None, None
+	if hypotest:
+		Expected = hyporate*Exposure
+
+		if method == "normal":
+			zvalue = (Total - Expected)/_np.sqrt(Expected)
+			if alternative == "two.sided":
+				pvalue = 2.0*pnorm(-_np.abs(zvalue), 0.0, 1.0)
+			elif alternative == "greater":
+				pvalue = pnorm(zvalue, 0.0, 1.0, lower_tail=False)
+			else:
+				pvalue = pnorm(zvalue, 0.0, 1.0)
+		else:
+			#P(X<=T) and P(X>=T) for X ~ Poisson(Expected)
+			Less = _np.asarray(ppois(Total, Expected))
+			Greater = _np.asarray(ppois(Total - 1, Expected, lower_tail=False))
+			if alternative == "two.sided":
+				pvalue = _np.minimum(2.0*_np.minimum(Less, Greater), 1.0)
+			elif alternative == "greater":
+				pvalue = Greater
+			else:
+				pvalue = Less
+
+	def _value(v):
+		return v if v is None or _np.ndim(v) > 0 else float(v)
+
+	return test_poisson1sample_Result(
+			_alternative = alternative,
+			_method = method,
+			_hypotest = hypotest,
+			pvalue=_value(pvalue),
+			zvalue=_value(zvalue),
+			ci = (_value(Lower), _value(Upper)),
+			mean=_value(mean),
+			N=samplesize if _np.ndim(samplesize) == 0 else N.astype(int),
+			TotalOccurences=totaloccur if _np.ndim(totaloccur) == 0 else Total.astype(int))
\ No newline at end of file
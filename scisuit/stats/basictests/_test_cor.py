@@ -2,8 +2,11 @@ import numbers
 from dataclasses import dataclass
 from typing import Iterable
 
+import numpy as _np
+from .._distributions import pbeta, pnorm, qnorm
 from ctypes import py_object, c_double, c_char_p
 from ..._ctypeslib import pydll as _pydll
+from .._validate import asarray as _asarray, check_conflevel as _check_conflevel
 
 _pydll.c_stat_essential_correlation.argtypes = [py_object, py_object, c_double, c_char_p]
 _pydll.c_stat_essential_correlation.restype = py_object
@@ -16,10 +19,13 @@ _pydll.c_stat_essential_correlation.restype = py_object
 class cortest_Result:
 	coeff: float
 	ci:tuple[float, float]
+	pvalue:float|None = None #two-sided, H0: no association
 
 	def __str__(self):
 		s = f"Correlation coefficient = {self.coeff} \n"
 		s += f"CI = ({self.ci[0]}, {self.ci[1]})"
+		if self.pvalue is not None:
+			s += f" \np-value = {self.pvalue}"
 		return s
 
 def cor_test(
@@ -28,22 +34,252 @@ def cor_test(
 		conflevel=0.95,
 		method="pearson")->cortest_Result:
 	"""
-	returns coefficient and confidence interval.  
+	returns coefficient, confidence interval and p-value.  
 
 	x, y: x and y data  
 	conflevel: Confidence level, [0,1]  
-	method: correlation method, "pearson" or "spearman"
+	method: correlation method, "pearson", "spearman" or "kendall" (tau-b)
+
+	For Kendall's tau the p-value is exact for n<=50 without ties (normal approximation otherwise)
+	and the interval uses Fisher's z with variance 0.437/(n-4).
 	"""
 
-	assert conflevel>0.0 or conflevel<1.0, "conflevel must be in range (0, 1)"
-	assert isinstance(x, Iterable), "x must be Iterable"
-	assert isinstance(y, Iterable), "ymust be Iterable"
+	_check_conflevel(conflevel)
+	xx, yy = _asarray(x, "x", minsize=3), _asarray(y, "y", minsize=3)
+	assert len(xx) == len(yy), "x and y must have same size"
 	assert isinstance(method, str), "method must be str"
 
-	assert method in ["pearson", "spearman"], "method must be 'pearson' or 'spearman'"
+	assert method in ["pearson", "spearman", "kendall"], "method must be 'pearson', 'spearman' or 'kendall'"
+
+	n = len(xx)
+	if method == "kendall":
+		tau, pvalue = _kendall(xx[None, :], yy[None, :])
+		lower, upper = _fisher_ci(tau, _np.sqrt(0.437/(n - 4)) if n > 4 else _np.nan, conflevel)
+		return cortest_Result(coeff=float(tau[0]), ci=(float(lower[0]), float(upper[0])), pvalue=float(pvalue[0]))
+
+	retObj =  _pydll.c_stat_essential_correlation(xx, yy, c_double(conflevel), c_char_p(method.encode()))
+
+	r = min(abs(retObj[0]), 1.0)
+	return cortest_Result(coeff=retObj[0], ci=(retObj[1], retObj[2]), pvalue=float(pbeta((1.0 - r)*(1.0 + r), (n - 2)/2, 0.5)))
+
+
+
+def _fisher_ci(coeff, se, conflevel:float)->tuple[_np.ndarray, _np.ndarray]:
+	"""confidence interval of correlation coefficients by Fisher's z-transformation"""
+	quantile = -qnorm((1.0 - conflevel)/2.0)
+	with _np.errstate(divide="ignore"):
+		z = _np.arctanh(_np.asarray(coeff))
+	return _np.tanh(z - quantile*se), _np.tanh(z + quantile*se)
+
+
+
+
+
+def _colranks(X:_np.ndarray)->_np.ndarray:
+	"""midranks (starting from 1) of each column, all columns are ranked at once"""
+	n, p = X.shape
+	order = _np.argsort(X, axis=0, kind="stable")
+	sv = _np.take_along_axis(X, order, axis=0)
+
+	pos = _np.broadcast_to(_np.arange(n)[:, None], (n, p))
+	first = _np.ones((n, p), dtype=bool)
+	first[1:] = sv[1:] != sv[:-1]
+	last = _np.ones((n, p), dtype=bool)
+	last[:-1] = first[1:]
+
+	#position of the first and last element of the tied group each element belongs to
+	start = _np.maximum.accumulate(_np.where(first, pos, 0), axis=0)
+	end = _np.minimum.accumulate(_np.where(last, pos, n - 1)[::-1], axis=0)[::-1]
+
+	ranks = _np.empty((n, p))
+	_np.put_along_axis(ranks, order, (start + end)/2 + 1, axis=0)
+	return ranks
+
+
+
+def _inversions(V:_np.ndarray, vmax:int)->_np.ndarray:
+	"""
+	number of pairs i<j with V[i]>V[j] in each row of the integer array V (values in [0, vmax)),
+	bottom-up merge sort where the merges of all blocks of all rows are done at once
+	"""
+	B, n = V.shape
+	N = 1 << max(n - 1, 1).bit_length()
+	arr = _np.full((B, N), vmax, dtype=_np.int64) #padding at the end adds no inversions
+	arr[:, :n] = V
+
+	count = _np.zeros(B, dtype=_np.int64)
+	w = 1
+	while w < N:
+		pairs = arr.reshape(-1, 2, w)
+		#offsetting each pair of blocks makes the concatenated left blocks globally sorted
+		offset = _np.arange(len(pairs), dtype=_np.int64)[:, None]*(vmax + 1)
+		left = (pairs[:, 0, :] + offset).ravel()
+		right = pairs[:, 1, :] + offset
+
+		#left elements not greater than each right element
+		notgreater = _np.searchsorted(left, right.ravel(), side="right").reshape(right.shape) - offset//(vmax + 1)*w
+		count += (w - notgreater).reshape(B, -1).sum(axis=1)
+
+		arr = _np.sort(pairs.reshape(-1, 2*w), axis=1).reshape(B, N)
+		w *= 2
+
+	return count
+
+
+
+def _tiesums(sv:_np.ndarray, sv2:_np.ndarray|None = None)->tuple[_np.ndarray, _np.ndarray, _np.ndarray]:
+	"""
+	for each row of sorted values, sums of t(t-1)/2, t(t-1)(t-2) and t(t-1)(2t+5)
+	over the sizes t of tied groups (tied in both sv and sv2 if sv2 is given)
+	"""
+	B, n = sv.shape
+	first = _np.ones((B, n), dtype=bool)
+	first[:, 1:] = sv[:, 1:] != sv[:, :-1]
+	if sv2 is not None:
+		first[:, 1:] |= sv2[:, 1:] != sv2[:, :-1]
+	starts = _np.flatnonzero(first)
+	t = _np.diff(_np.append(starts, B*n)).astype(_np.float64)
+	row = starts//n
+
+	def rowsum(v):
+		return _np.bincount(row, weights=v, minlength=B)
+
+	return rowsum(t*(t - 1)/2), rowsum(t*(t - 1)*(t - 2)), rowsum(t*(t - 1)*(2*t + 5))
+
+
+
+def _kendall_exact(n:int)->_np.ndarray:
+	"""probabilities of 0, 1, ..., n(n-1)/2 discordant pairs when there is no association and no ties"""
+	prob = _np.ones(1)
+	for i in range(2, n + 1):
+		prob = _np.convolve(prob, _np.full(i, 1.0/i))
+	return prob
+
+
+
+def _kendall(X:_np.ndarray, Y:_np.ndarray)->tuple[_np.ndarray, _np.ndarray]:
+	"""
+	Kendall's tau-b and two-sided p-value for each row pair of X and Y (B x n),
+	discordant pairs are counted in O(n log n) (Knight, 1966)
+	"""
+	B, n = X.shape
+	order = _np.lexsort((Y, X), axis=1)
+	xs, ys = _np.take_along_axis(X, order, axis=1), _np.take_along_axis(Y, order, axis=1)
+
+	xtie, x0, x1 = _tiesums(xs)
+	ytie, y0, y1 = _tiesums(_np.sort(Y, axis=1))
+
+	xytie = _tiesums(xs, ys)[0]
+
+	#y as integer ranks in the order of x, tied values get equal ranks
+	ranks = (2*_colranks(ys.T).T - 2).astype(_np.int64)
+	discordant = _inversions(ranks, 2*n).astype(_np.float64)
+
+	n0 = n*(n - 1)/2
+	S = n0 - xtie - ytie + xytie - 2*discordant #concordant - discordant
+	with _np.errstate(divide="ignore", invalid="ignore"):
+		tau = S/_np.sqrt((n0 - xtie)*(n0 - ytie))
+	tau = _np.clip(tau, -1.0, 1.0)
+
+	m = n*(n - 1)
+	var = (m*(2*n + 5) - x1 - y1)/18 + 2*xtie*ytie/m + x0*y0/(9*m*(n - 2))
+	with _np.errstate(divide="ignore", invalid="ignore"):
+		pvalue = 2*_np.asarray(pnorm(-_np.abs(S)/_np.sqrt(var)))
+
+	exact = (xtie == 0) & (ytie == 0)
+	if n <= 50 and exact.any():
+		prob = _np.cumsum(_kendall_exact(n))
+		#distribution of discordant pairs is symmetric
+		d = _np.minimum(discordant, n0 - discordant)[exact].astype(_np.int64)
+		pvalue[exact] = _np.minimum(2*prob[d], 1.0)
+
+	return tau, _np.minimum(pvalue, 1.0)
+
+
+
+
+@dataclass
+class cor_matrix_Result:
+	coeff:_np.ndarray
+	pvalue:_np.ndarray
+	lower:_np.ndarray #lower bounds of confidence intervals
+	upper:_np.ndarray
+	n:int
+	method:str
+
+	def __str__(self):
+		s = f"Correlation matrix ({self.method}), n = {self.n} \n"
+		s += f"Coefficients: \n{self.coeff} \n"
+		s += f"p-values: \n{self.pvalue} \n"
+		s += f"CI lower: \n{self.lower} \n"
+		s += f"CI upper: \n{self.upper}"
+		return s
+
+
+
+def cor_matrix(
+		X:Iterable,
+		conflevel=0.95,
+		method="pearson",
+		tilesize:int = 512)->cor_matrix_Result:
+	"""
+	Pairwise correlations of the columns of X with two-sided p-values
+	and confidence intervals (Fisher z-transformation).
+
+	X: 2D data, observations in rows and variables in columns
+	conflevel: Confidence level, [0,1]
+	method: "pearson", "spearman" or "kendall" (tau-b, see cor_test)
+	tilesize: number of columns multiplied at once
+	"""
+	_check_conflevel(conflevel)
+	assert method in ["pearson", "spearman", "kendall"], "method must be 'pearson', 'spearman' or 'kendall'"
+	assert isinstance(tilesize, int) and tilesize > 0, "tilesize>0 expected"
+
+	XX = _asarray(X, "X", ndim=2)
+	n, p = XX.shape
+	assert n >= 4, "X must have at least 4 rows"
+
+	iu = _np.triu_indices(p, 1)
+	coeff, pvalue = _np.eye(p), _np.zeros((p, p))
+
+	if method == "kendall":
+		#column pairs are processed in batches of about 4M elements
+		XT = _np.ascontiguousarray(XX.T)
+		batch = max(1, (1 << 22)//n)
+		for k in range(0, len(iu[0]), batch):
+			i, j = iu[0][k:k + batch], iu[1][k:k + batch]
+			tau, pv = _kendall(XT[i], XT[j])
+			coeff[i, j], pvalue[i, j] = tau, pv
+
+		coeff += _np.triu(coeff, 1).T
+		pvalue += pvalue.T
+		lower, upper = _fisher_ci(coeff, _np.sqrt(0.437/(n - 4)) if n > 4 else _np.nan, conflevel)
+		return cor_matrix_Result(coeff=coeff, pvalue=pvalue, lower=lower, upper=upper, n=n, method=method)
+
+	if method == "spearman":
+		XX = _colranks(XX)
+
+	#centered columns scaled to unit length, so that coefficients are Z'Z
+	Z = XX - XX.mean(axis=0)
+	norms = _np.sqrt(_np.einsum("ij,ij->j", Z, Z))
+	assert _np.all(norms > 0), "columns of X must not be constant"
+	Z /= norms
+
+	for i in range(0, p, tilesize):
+		Zi = Z[:, i:i + tilesize]
+		for j in range(i, p, tilesize):
+			block = Zi.T @ Z[:, j:j + tilesize]
+			coeff[i:i + tilesize, j:j + tilesize] = block
+			coeff[j:j + tilesize, i:i + tilesize] = block.T
 
-	retObj =  _pydll.c_stat_essential_correlation(x, y, c_double(conflevel), c_char_p(method.encode()))
+	_np.clip(coeff, -1.0, 1.0, out=coeff)
+	_np.fill_diagonal(coeff, 1.0)
 
-	return cortest_Result(coeff=retObj[0], ci=(retObj[1], retObj[2]))
+	#two-sided p-value of t = r*sqrt((n-2)/(1-r^2)) is I(1-r^2; (n-2)/2, 1/2), evaluated once per pair
+	r = coeff[iu]
+	pvalue[iu] = pbeta((1.0 - r)*(1.0 + r), (n - 2)/2, 0.5)
+	pvalue += pvalue.T
 
+	lower, upper = _fisher_ci(coeff, 1.0/_np.sqrt(n - 3), conflevel)
 
+	return cor_matrix_Result(coeff=coeff, pvalue=pvalue, lower=lower, upper=upper, n=n, method=method)
\ No newline at end of file
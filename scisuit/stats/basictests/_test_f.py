@@ -4,6 +4,8 @@ from typing import Iterable
 
 import numpy as _np
 from .._distributions import pf, qf
+from ._test_t import _scalar
+from .._validate import asarray as _asarray, check_conflevel as _check_conflevel, check_alternative as _check_alternative
 
 
 
@@ -50,20 +52,14 @@ def test_f(
 	alternative: "two.sided", "less", "greater"
 	ratio: Assumed ratio of variances of the samples
 	conflevel: Confidence level, [0,1] 
-	"""
-	assert conflevel>=0.0 or conflevel <= 1.0, "conflevel must be in range (0, 1)"
-	assert isinstance(x, list) or type(x)==_np.ndarray, "x must be list/ndarray"
-	assert isinstance(y, list) or type(y)==_np.ndarray, "y must be list/ndarray"
 
-	xx, yy = x, y
-	if isinstance(x, list):
-		xx = _np.asarray(x, dtype=_np.float64)
+	A single test takes well below a millisecond also with the NumPy backend
+	(see tests/stats/dist_benchmark.py).
+	"""
+	_check_conflevel(conflevel)
+	_check_alternative(alternative)
 
-	if isinstance(y, list):
-		yy = _np.asarray(y, dtype=_np.float64)
-	
-	assert _np.issubdtype(xx.dtype, _np.number), "x must contain only numbers"
-	assert _np.issubdtype(yy.dtype, _np.number), "y must contain only numbers"
+	xx, yy = _asarray(x, "x", minsize=2), _asarray(y, "y", minsize=2)
 
 	alpha = 1 - conflevel
 	df1, df2 = len(xx) - 1, len(yy) -1 #degrees of freedoms
@@ -75,17 +71,15 @@ def test_f(
 
 	pvalue = 0.0
 	if alternative == "two.sided" or alternative == "notequal":
-		#F distribution is non - symmetric
-		a = pf(Fvalue, df1, df2)
-		b = 1 - pf(Fvalue, df1, df2)
+		#F distribution is non - symmetric, smaller tails at F and 1/F
+		def smalltail(x):
+			p = pf(x, df1, df2)
+			return p if p < 0.5 else pf(x, df1, df2, lower_tail=False)
 
-		c = pf(1 / Fvalue, df1, df2)
-		d = 1 - pf(1 / Fvalue, df1, df2)
-
-		pvalue = min(a, b) + min(c, d)
+		pvalue = smalltail(Fvalue) + smalltail(1 / Fvalue)
 
 	elif alternative == "greater":
-		pvalue = (1 - pf(Fvalue, df1, df2)) #area on the right
+		pvalue = pf(Fvalue, df1, df2, lower_tail=False) #area on the right
 
 	elif alternative == "less":
 		pvalue = pf(Fvalue, df1, df2) #area on the left
@@ -120,3 +114,78 @@ def test_f(
 			CI_lower = float(CI_lower),
 			CI_upper = float(CI_upper),
 			alternative=alternative)
+
+
+
+
+def _f_summary(n1, n2, var1, var2, ratio = 1.0, alternative = "two.sided", conflevel = 0.95)->test_f_Result:
+	"""F test from sample sizes and variances (scalars or arrays)"""
+	alpha = 1 - conflevel
+	df1, df2 = n1 - 1, n2 - 1
+	varRatio = _np.divide(var1, var2)
+	Fvalue = varRatio / ratio
+
+	if alternative == "two.sided" or alternative == "notequal":
+		def smalltail(x):
+			p = _np.asarray(pf(x, df1, df2))
+			return _np.where(p < 0.5, p, pf(x, df1, df2, lower_tail=False))
+
+		pvalue = smalltail(Fvalue) + smalltail(1 / Fvalue)
+		CI1 = varRatio * qf(alpha / 2.0, df1, df2)
+		CI2 = varRatio * qf(1 - alpha / 2.0, df1, df2)
+		CI_lower, CI_upper = _np.minimum(CI1, CI2), _np.maximum(CI1, CI2)
+
+	elif alternative == "greater":
+		pvalue = pf(Fvalue, df1, df2, lower_tail=False)
+		CI_lower = varRatio * qf(alpha, df1, df2)
+		CI_upper = _np.full_like(CI_lower, math.inf)
+
+	elif alternative == "less":
+		pvalue = pf(Fvalue, df1, df2)
+		CI_upper = varRatio * qf(1 - alpha, df1, df2)
+		CI_lower = _np.full_like(CI_upper, -math.inf)
+
+	else:
+		raise ValueError("Values for 'alternative': \"two.sided\" or \"notequal\", \"greater\", \"less\"")
+
+	return test_f_Result(
+			pvalue=_scalar(pvalue),
+			Fvalue=_scalar(Fvalue), 
+			df1=df1,
+			df2=df2,
+			var1 = _scalar(var1),
+			var2 = _scalar(var2),
+			CI_lower = _scalar(CI_lower),
+			CI_upper = _scalar(CI_upper),
+			alternative=alternative)
+
+
+
+def test_f_from_stats(
+		n1:int|Iterable, 
+		sd1:float|Iterable, 
+		n2:int|Iterable, 
+		sd2:float|Iterable, 
+		ratio:float = 1.0, 
+		alternative:str = "two.sided", 
+		conflevel:float = 0.95)->test_f_Result:
+	"""
+	Performs F test from summary statistics. Arguments can be arrays 
+	to perform a batch of tests, fields of the result are then ndarrays.
+
+	n1, n2: sample sizes
+	sd1, sd2: sample standard deviations
+	alternative: "two.sided", "less", "greater"
+	ratio: Assumed ratio of variances of the samples
+	conflevel: Confidence level, [0,1] 
+
+	A single test takes well below a millisecond also with the NumPy backend
+	(see tests/stats/dist_benchmark.py).
+	"""
+	_check_conflevel(conflevel)
+	_check_alternative(alternative)
+	assert _np.all(_np.asarray(n1)>=2) and _np.all(_np.asarray(n2)>=2), "n1>=2 and n2>=2 expected"
+	assert _np.all(_np.asarray(sd1)>0) and _np.all(_np.asarray(sd2)>0), "sd1>0 and sd2>0 expected"
+
+	n1, sd1, n2, sd2 = [_np.asarray(v) if isinstance(v, Iterable) else v for v in (n1, sd1, n2, sd2)]
+	return _f_summary(n1, n2, _np.square(sd1), _np.square(sd2), ratio, alternative, conflevel)
\ No newline at end of file
@@ -8,6 +8,8 @@ import numpy as _np
 from ctypes import py_object
 from ..._ctypeslib import pydll as _pydll
 from .._distributions import pnorm, psmirnov
+from .._npdist import psmirnov2 as _psmirnov2
+from .._validate import asarray as _asarray
 
 
 
@@ -41,12 +43,9 @@ def anderson(x:Iterable)->ADTestRes:
 	"""
 	Performs Anderson-Darling test
 	"""
-	assert isinstance(x, Iterable), "x must be an Iterable object"
+	xx = _asarray(x)
 	
-	_xx = [v for v in x if isinstance(v, numbers.Real)]
-	assert len(x) == len(_xx), "x must contain only Real numbers"
-	
-	pval, A2 = _pydll.c_stat_normality_ad(x)
+	pval, A2 = _pydll.c_stat_normality_ad(xx)
 	return ADTestRes(pvalue=pval, A2=A2)
 
 
@@ -63,50 +62,157 @@ class Ks1SampletestResult:
 
 	def __str__(self):
 		s = "Kolmogorov-Smirnov test \n"
-		s += f"p-value: {round(self.pvalue, 3)} \n"
-		s += f"Test statistic: {round(self.D, 4)} and its sign {self.D_sign} \n"
+		s += f"p-value: {_np.round(self.pvalue, 3)} \n"
+		s += f"Test statistic: {_np.round(self.D, 4)} and its sign {self.D_sign} \n"
 		s += f"Max distance at: {self.D_loc}"
 		return s
 	
 
 
+def _samples(x, name:str, axis:int|None)->_np.ndarray:
+	"""validated sample, with the observations moved to the first axis in batched mode"""
+	if axis is None:
+		return _asarray(x, name)
+	
+	return _np.moveaxis(_asarray(x, name, ndim=None), axis, 0)
+
+
+
+def _pick(v:_np.ndarray, index:_np.ndarray)->_np.ndarray:
+	"""v[index[...], ...] along the first axis"""
+	return _np.take_along_axis(v, index[None, ...], axis=0)[0]
+
+
+
 def ks_1samp(
 		x:Iterable, 
 		cdf:FunctionType=pnorm, 
-		args:tuple=())->Ks1SampletestResult:
+		args:tuple=(),
+		axis:int|None = None)->Ks1SampletestResult:
 	"""
 	Performs two.sided Kolmogorov-Smirnov test
 
+	axis: if given, x is an array and a test is performed for each slice along axis
+	(i.e. axis=0 tests every column), fields of the result are then ndarrays
+
 	Reference:
 	- Simard R & L'Ecuyer P (2011) "Computing the Two-Sided Kolmogorov-Smirnov Distribution". 
 	  J of Statistical Software, 39:11.
 	"""
-	assert isinstance(x, Iterable), "x must be Iterable"
 	assert isinstance(cdf, FunctionType), "cdf must be a function"
 
-	_xx = [v for v in x if isinstance(v, numbers.Real)]
-	assert len(x) == len(_xx), "x must contain only Real numbers"
-
+	x = _np.sort(_samples(x, "x", axis), axis=0)
 	n = len(x)
-	x = _np.sort(x)
-	cdfvals = cdf(x, *args)
+	cdfvals = _np.asarray(cdf(x, *args))
+	k = _np.arange(1.0, n + 1).reshape((n, ) + (1, )*(x.ndim - 1))
 	
-	dplus = (_np.arange(1.0, n + 1) / n - cdfvals)
-	_plus = dplus.argmax()
+	dplus = (k / n - cdfvals)
+	_plus = dplus.argmax(axis=0)
 
-	dminus = (cdfvals - _np.arange(0.0, n)/n)
-	_minus = dminus.argmax()
+	dminus = (cdfvals - (k - 1)/n)
+	_minus = dminus.argmax(axis=0)
 
-	Dminus, dminus_loc = float(dminus[_minus]), float(x[_minus])
-	Dplus, dplus_loc = float(dplus[_plus]), float(x[_plus])
+	Dminus, dminus_loc = _pick(dminus, _minus), _pick(x, _minus)
+	Dplus, dplus_loc = _pick(dplus, _plus), _pick(x, _plus)
 	
-	Dvalue = max(Dplus, Dminus)
+	Dvalue = _np.maximum(Dplus, Dminus)
+	pvalue = psmirnov(Dvalue, n, lower_tail=False)
+
+	if axis is None:
+		return Ks1SampletestResult(
+					pvalue = pvalue,
+					D = float(Dvalue), 
+					D_sign = 1 if Dplus>Dminus else -1,
+					D_loc = float(dplus_loc if Dplus>Dminus else dminus_loc))
 
 	return Ks1SampletestResult(
-					pvalue = 1-psmirnov(Dvalue, n),
+					pvalue = pvalue,
 					D = Dvalue, 
-					D_sign = 1 if Dplus>Dminus else -1,
-					D_loc = dplus_loc if Dplus>Dminus else dminus_loc)
+					D_sign = _np.where(Dplus>Dminus, 1, -1),
+					D_loc = _np.where(Dplus>Dminus, dplus_loc, dminus_loc))
+
+
+
+
+@dataclass
+class Ks2SampletestResult:
+	pvalue:float
+	D:float #test statistics
+	D_loc:float #location of max distance (D)
+	D_sign:int #1 if ecdf of x is above that of y at D_loc
+	method:str
+
+	def __str__(self):
+		s = "Two-sample Kolmogorov-Smirnov test (" + self.method + ") \n"
+		s += f"p-value: {_np.round(self.pvalue, 3)} \n"
+		s += f"Test statistic: {_np.round(self.D, 4)} and its sign {self.D_sign} \n"
+		s += f"Max distance at: {self.D_loc}"
+		return s
+
+
+
+def ks_2samp(
+		x:Iterable, 
+		y:Iterable, 
+		method:str = "auto",
+		axis:int|None = None)->Ks2SampletestResult:
+	"""
+	Performs two.sided two-sample Kolmogorov-Smirnov test
+
+	x, y: samples
+	method: "exact", "asymp" or "auto" (exact if len(x)*len(y) <= 10000)
+	axis: if given, x and y are arrays and a test is performed for each slice along axis
+	(i.e. axis=0 compares every column of x with the same column of y), 
+	fields of the result are then ndarrays
+
+	The statistic is found by merging the sorted samples, exact p-values are from 
+	lattice path counting and asymptotic ones from the Kolmogorov distribution 
+	with the effective sample size m*n/(m+n).
+	"""
+	assert method in ["auto", "exact", "asymp"], "method must be 'auto', 'exact' or 'asymp'"
+
+	xx, yy = _samples(x, "x", axis), _samples(y, "y", axis)
+	assert xx.shape[1:] == yy.shape[1:], "x and y must have same shape (except along axis)"
+
+	m, n = len(xx), len(yy)
+	
+	#stable sort of two sorted runs is a single merge
+	data = _np.concatenate([_np.sort(xx, axis=0), _np.sort(yy, axis=0)], axis=0)
+	order = _np.argsort(data, axis=0, kind="stable")
+	z = _np.take_along_axis(data, order, axis=0)
+
+	#n*m*(F_x - F_y) in integers, evaluated only after the last of tied values
+	diff = _np.cumsum(_np.where(order < m, n, -m), axis=0)
+	last = _np.ones(z.shape, dtype=bool)
+	last[:-1] = z[1:] != z[:-1]
+
+	dplus = _np.where(last, diff, 0)
+	dminus = _np.where(last, -diff, 0)
+	_plus, _minus = dplus.argmax(axis=0), dminus.argmax(axis=0)
+	Dplus, Dminus = _pick(dplus, _plus), _pick(dminus, _minus)
+	
+	Dvalue = _np.maximum(Dplus, Dminus)/(m*n)
+	D_sign = _np.where(Dplus >= Dminus, 1, -1)
+	D_loc = _np.where(Dplus >= Dminus, _pick(z, _plus), _pick(z, _minus))
+
+	if method == "auto":
+		method = "exact" if m*n <= 10000 else "asymp"
+
+	if method == "exact":
+		uD, inv = _np.unique(Dvalue, return_inverse=True)
+		pvalue = _psmirnov2(uD, m, n)[inv.ravel()].reshape(_np.shape(Dvalue))
+	else:
+		pvalue = _np.asarray(psmirnov(Dvalue, max(round(m*n/(m + n)), 1), lower_tail=False))
+
+	if axis is None:
+		return Ks2SampletestResult(
+					pvalue = float(pvalue), 
+					D = float(Dvalue), 
+					D_loc = float(D_loc), 
+					D_sign = int(D_sign), 
+					method = method)
+	
+	return Ks2SampletestResult(pvalue = pvalue, D = Dvalue, D_loc = D_loc, D_sign = D_sign, method = method)
 
 
 
@@ -141,14 +247,9 @@ def shapiro(x:Iterable)->ShapiroTestResult:
 	- Shapiro SS & Wilk MB (1965). An Analysis of Variance Test for Normality
 	  Biometrika Vol. 52, No. 3/4, pp. 591-611
 	"""
-	assert isinstance(x, Iterable), "x must be an Iterable object."
-
-	N = len(x)
-	if N < 3:
+	xx = _asarray(x, minsize=0)
+	if len(xx) < 3:
 		raise ValueError("x must be at least length 3.")
 	
-	_xx = [v for v in x if isinstance(v, numbers.Real)]
-	assert N == len(_xx), "x must contain only Real numbers."
-	
-	result = _pydll.c_stat_normality_shapirowilk(x)
+	result = _pydll.c_stat_normality_shapirowilk(xx)
 	return ShapiroTestResult(W=result[0], pvalue=result[1], msg=result[2])
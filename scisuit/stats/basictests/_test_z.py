@@ -5,6 +5,8 @@ from typing import Iterable
 
 import numpy as _np
 from .._distributions import pnorm, qnorm
+from ._test_t import _scalar
+from .._validate import asarray as _asarray, check_conflevel as _check_conflevel, check_alternative as _check_alternative
 
 
 
@@ -48,16 +50,11 @@ def test_z1(
 	alternative: "two.sided", "less", "greater"
 	conflevel: Confidence level, (0,1)
 	"""
-	assert conflevel>0.0 or conflevel<1.0, "conflevel must be in range (0, 1)"
+	_check_conflevel(conflevel)
+	_check_alternative(alternative)
 	assert sd >= 0, "sd must be >0"
-	assert isinstance(x, Iterable), "x must be Iterable"
 
-	XX = x
-	if isinstance(x, list):
-		XX = _np.asarray(x, dtype=_np.float64)
-
-	assert len(XX)>= 3, "container must have at least 3 elements"
-	assert _np.issubdtype(XX.dtype, _np.number), "x must contain only numbers"
+	XX = _asarray(x, minsize=3)
 
 	dim = len(XX)
 	xaver = float(_np.mean(XX))
@@ -70,16 +67,11 @@ def test_z1(
 	pvalue = 0.0
 
 	if alternative == "two.sided" or alternative == "notequal":
-		if zvalue <= 0:
-			#area on the left of zcrit + area on the right of positive
-			pvalue = pnorm(zvalue, 0.0, 1.0) + (1.0 - pnorm(abs(zvalue), 0.0, 1.0))
-
-		elif zvalue > 0:
-			#area on the right of positive zcriticial + area on the left of negative zcriticial
-			pvalue = (1.0 - pnorm(zvalue, 0.0, 1.0)) + pnorm(-zvalue, 0.0, 1.0)
+		#area on the left of -|z| + area on the right of |z|
+		pvalue = 2.0*pnorm(-abs(zvalue), 0.0, 1.0)
 
 	elif alternative == "greater":
-		pvalue = (1.0 - pnorm(zvalue, 0.0, 1.0)) #area on the right
+		pvalue = pnorm(zvalue, 0.0, 1.0, lower_tail=False) #area on the right
 
 	elif alternative == "less":
 		pvalue = pnorm(zvalue, 0.0, 1.0) #area on the left
@@ -160,24 +152,12 @@ def test_z2(
 	alternative: "two.sided", "less", "greater"
 	conflevel: Confidence level, (0,1)
 	"""
-	assert conflevel>0.0 or conflevel<1.0, "conflevel must be in range (0, 1)"
+	_check_conflevel(conflevel)
+	_check_alternative(alternative)
 	assert sd1 > 0 and sd2>0, "sd1 and sd2 must be >0"
-	assert isinstance(x, Iterable), "x must be Iterable"
-	assert isinstance(y, Iterable), "y must be Iterable"
 	assert isinstance(mu, Real), "mu1 must be Real"
 
-	xx = x
-	if isinstance(x, list):
-		xx = _np.asarray(x, dtype=_np.float64)
-	
-	yy = y
-	if isinstance(y, list):
-		yy = _np.asarray(y, dtype=_np.float64)
-
-	assert len(xx)>= 3, "x must have at least 3 elements"
-	assert len(yy)>= 3, "y must have at least 3 elements"
-	assert _np.issubdtype(xx.dtype, _np.number), "x must contain only numbers"
-	assert _np.issubdtype(yy.dtype, _np.number), "y must contain only numbers"
+	xx, yy = _asarray(x, "x", minsize=3), _asarray(y, "y", minsize=3)
 
 	n1, n2 = len(xx), len(yy)
 	xaver, yaver = float(_np.mean(xx)), float(_np.mean(yy))
@@ -190,16 +170,11 @@ def test_z2(
 	pvalue = 0.0
 
 	if alternative == "two.sided" or alternative == "notequal":
-		if zvalue <= 0:
-			#area on the left of zcrit + area on the right of positive
-			pvalue = pnorm(zvalue, 0.0, 1.0) + (1.0 - pnorm(abs(zvalue), 0.0, 1.0))
-
-		elif zvalue > 0:
-			#area on the right of positive zcriticial + area on the left of negative zcriticial
-			pvalue = (1.0 - pnorm(zvalue, 0.0, 1.0)) + pnorm(-zvalue, 0.0, 1.0)
+		#area on the left of -|z| + area on the right of |z|
+		pvalue = 2.0*pnorm(-abs(zvalue), 0.0, 1.0)
 
 	elif alternative == "greater":
-		pvalue = (1.0 - pnorm(zvalue, 0.0, 1.0)) #area on the right
+		pvalue = pnorm(zvalue, 0.0, 1.0, lower_tail=False) #area on the right
 
 	elif alternative == "less":
 		pvalue = pnorm(zvalue, 0.0, 1.0) #area on the left
@@ -236,6 +211,74 @@ def test_z2(
 
 
 
+#-------------------------------------------------------------------------
+#-------------------  Tests from summary statistics  -----------------------
+
+
+def _zdist(estimate, stderr, mu, alternative:str, conflevel:float)->tuple:
+	"""vectorized z-value, p-value and confidence interval"""
+	zvalue = (estimate - mu) / stderr
+	alpha = 1 - conflevel
+
+	if alternative == "two.sided" or alternative == "notequal":
+		pvalue = 2.0*pnorm(-_np.abs(zvalue), 0.0, 1.0)
+		quantile = qnorm(alpha / 2.0, 0.0, 1.0)
+		CI_lower, CI_upper = estimate + quantile * stderr, estimate - quantile * stderr
+
+	elif alternative == "greater":
+		pvalue = pnorm(zvalue, 0.0, 1.0, lower_tail=False)
+		CI_lower = estimate + qnorm(alpha, 0.0, 1.0) * stderr
+		CI_upper = _np.full_like(CI_lower, math.inf)
+
+	elif alternative == "less":
+		pvalue = pnorm(zvalue, 0.0, 1.0)
+		CI_upper = estimate - qnorm(alpha, 0.0, 1.0) * stderr
+		CI_lower = _np.full_like(CI_upper, -math.inf)
+
+	else:
+		raise ValueError("'alternative': \"two.sided\" or \"notequal\", \"greater\", \"less\"")
+
+	return zvalue, pvalue, CI_lower, CI_upper
+
+
+
+def _z1_summary(n, mean, stdev, sd, mu, alternative="two.sided", conflevel=0.95)->test_z1_Result:
+	"""one-sample z-test from sample size, mean and standard deviation (scalars or arrays)"""
+	stderr = sd / _np.sqrt(n)
+	zvalue, pvalue, CI_lower, CI_upper = _zdist(mean, stderr, mu, alternative, conflevel)
+
+	return test_z1_Result(pvalue=_scalar(pvalue),
+			SE = _scalar(stderr), 
+			stdev = _scalar(stdev), 
+			N = n, 
+			mean = _scalar(mean), 
+			zvalue = _scalar(zvalue),
+			CI_lower = _scalar(CI_lower),
+			CI_upper = _scalar(CI_upper),
+			alternative= alternative)
+
+
+
+def _z2_summary(n1, n2, mean1, mean2, stdev1, stdev2, sd1, sd2, mu, alternative="two.sided", conflevel=0.95)->test_z2_Result:
+	"""two-sample z-test from sample sizes, means and standard deviations (scalars or arrays)"""
+	stderr = _np.sqrt(_np.square(sd1)/n1 + _np.square(sd2)/n2)
+	zvalue, pvalue, CI_lower, CI_upper = _zdist(mean1 - mean2, stderr, mu, alternative, conflevel)
+
+	return test_z2_Result(pvalue=_scalar(pvalue),
+			SE=_scalar(stderr), 
+			stdev1=_scalar(stdev1),
+			stdev2=_scalar(stdev2),
+			n1=n1, 
+			n2=n2,
+			mean1=_scalar(mean1), 
+			mean2=_scalar(mean2),
+			zvalue = _scalar(zvalue),
+			CI_lower = _scalar(CI_lower),
+			CI_upper = _scalar(CI_upper),
+			alternative= alternative)
+
+
+
 #-------------------------------------------------------------------------
 #---------------------------------------------------------------------------
 
@@ -243,7 +286,7 @@ def test_z2(
 def test_z(
 	x:Iterable, 
 	sd1:Real, 
-	mu:Real, 
+	mu:Real = 0.0, 
 	y:Iterable = None,
 	sd2: Real = None,
 	alternative="two.sided", 
@@ -256,7 +299,49 @@ def test_z(
 	conflevel: Confidence level, (0,1)   
 	"""
 
-	if y != None:
+	if y is not None:
 		return test_z2(x=x, y=y, sd1=sd1, sd2=sd2, mu=mu, alternative=alternative, conflevel=conflevel)
 	
-	return test_z1(x=x, sd=sd1, mu=mu, alternative=alternative, conflevel=conflevel)
\ No newline at end of file
+	return test_z1(x=x, sd=sd1, mu=mu, alternative=alternative, conflevel=conflevel)
+
+
+
+def test_z_from_stats(
+	n1:int|Iterable, 
+	mean1:Real|Iterable, 
+	sd1:Real|Iterable, 
+	mu:Real = 0.0, 
+	n2:int|Iterable|None = None,
+	mean2:Real|Iterable|None = None,
+	sd2:Real|Iterable|None = None,
+	alternative="two.sided", 
+	conflevel=0.95)->test_z1_Result | test_z2_Result:
+	"""
+	1-sample z-test or, if n2, mean2 and sd2 are given, 2-sample z-test 
+	from summary statistics. Arguments can be arrays to perform a batch of tests,
+	fields of the result are then ndarrays. 
+	(sample standard deviations are not known, stdev fields are NaN)
+
+	n1, n2: sample sizes   
+	mean1, mean2: sample means   
+	sd1, sd2: Standard deviations of populations   
+	mu: Assumed difference between means of populations   
+	alternative: "two.sided", "less", "greater"   
+	conflevel: Confidence level, (0,1)   
+	"""
+	_check_conflevel(conflevel)
+	_check_alternative(alternative)
+	assert _np.all(_np.asarray(n1)>=1), "n1>=1 expected"
+	assert _np.all(_np.asarray(sd1)>0), "sd1>0 expected"
+
+	n1, mean1, sd1 = [_np.asarray(v) if isinstance(v, Iterable) else v for v in (n1, mean1, sd1)]
+
+	if n2 is None and mean2 is None and sd2 is None:
+		return _z1_summary(n1, mean1, math.nan, sd1, mu, alternative, conflevel)
+
+	assert n2 is not None and mean2 is not None and sd2 is not None, "n2, mean2 and sd2 expected"
+	assert _np.all(_np.asarray(n2)>=1), "n2>=1 expected"
+	assert _np.all(_np.asarray(sd2)>0), "sd2>0 expected"
+
+	n2, mean2, sd2 = [_np.asarray(v) if isinstance(v, Iterable) else v for v in (n2, mean2, sd2)]
+	return _z2_summary(n1, n2, mean1, mean2, math.nan, math.nan, sd1, sd2, mu, alternative, conflevel)
\ No newline at end of file
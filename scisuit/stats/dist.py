@@ -0,0 +1,669 @@
+"""
+Frozen distributions.
+
+Parameters are validated once, when the object is created, and the constants
+(log-normalizers, quantile brackets) are computed once and reused by every call.
+
+```
+from scisuit.stats import dist
+G = dist.gamma(shape=2.5, scale=3)
+G.pdf([1, 2, 3])
+G.ppf(0.95)
+```
+"""
+
+import math
+from abc import ABC, abstractmethod
+from numbers import Real
+from typing import Iterable
+
+import numpy as _np
+
+from . import _npdist
+from . import _special as _sp
+from ._distributions import _generator
+
+
+
+
+#probabilities where quantiles are tabulated to serve as starting values (1E-10 ... 1-1E-10)
+_LOGIT_GRID = _np.linspace(-23.0, 23.0, 93)
+_P_GRID = 1.0/(1.0 + _np.exp(-_LOGIT_GRID))
+
+
+
+def _logit(p:_np.ndarray)->_np.ndarray:
+	with _np.errstate(divide="ignore"):
+		return _np.log(p) - _np.log1p(-p)
+
+
+
+def _xlogy(x, y):
+	"""x*log(y), 0 when x=0"""
+	with _np.errstate(divide="ignore", invalid="ignore"):
+		return _np.where(x == 0, 0.0, x*_np.log(y))
+
+
+
+
+class _frozen(ABC):
+	"""Base class of frozen distributions"""
+
+	def __init__(self):
+		self._grid = None
+
+	def _call(self, x, func)->Real|_np.ndarray:
+		X = _np.asarray(x, dtype=_np.float64)
+		with _np.errstate(all="ignore"):
+			retVal = func(X)
+		return float(retVal) if retVal.ndim == 0 else retVal
+
+	@abstractmethod
+	def _logpdf(self, x:_np.ndarray)->_np.ndarray:
+		"""log of density (mass) at x, -inf outside the support"""
+
+	@abstractmethod
+	def _cdf(self, q:_np.ndarray)->_np.ndarray:
+		"""P(X<=q)"""
+
+	@abstractmethod
+	def _ppf(self, p:_np.ndarray)->_np.ndarray:
+		"""quantile function, nan outside [0, 1]"""
+
+	@abstractmethod
+	def _rvs(self, n:int, gen:_np.random.Generator)->_np.ndarray:
+		"""n random variates drawn with gen"""
+
+
+	def logpdf(self, x:Iterable|Real)->Real|_np.ndarray:
+		"""log of probability density (mass) function"""
+		return self._call(x, self._logpdf)
+
+	def pdf(self, x:Iterable|Real)->Real|_np.ndarray:
+		"""probability density (mass) function"""
+		return self._call(x, lambda X: _np.exp(self._logpdf(X)))
+
+	def cdf(self, q:Iterable|Real)->Real|_np.ndarray:
+		"""cumulative distribution function, P(X<=q)"""
+		return self._call(q, self._cdf)
+
+	def ppf(self, p:Iterable|Real)->Real|_np.ndarray:
+		"""quantile function, inverse of cdf"""
+		return self._call(p, self._ppf)
+
+	def rvs(self, n:int, rng=None)->_np.ndarray:
+		"""
+		draws n random variates
+		rng: int seed or numpy.random.Generator
+		"""
+		assert n>0, "n>0 expected"
+		return self._rvs(n, _generator(rng))
+
+	def __repr__(self):
+		args = ", ".join(f"{k}={v}" for k, v in self._params().items())
+		return f"{type(self).__name__}({args})"
+
+	def _params(self)->dict:
+		return {}
+
+
+
+class _continuous(_frozen):
+	"""
+	Continuous distributions without closed form quantile function.
+
+	Quantiles at a fixed grid of probabilities are computed once (on first call to ppf)
+	and interpolated to get starting values for the root finder.
+	"""
+	def _transform(self, x:_np.ndarray)->_np.ndarray:
+		"""maps the support to the real line for interpolation"""
+		with _np.errstate(divide="ignore"):
+			return _np.log(x)
+
+	def _inverse(self, u:_np.ndarray)->_np.ndarray:
+		return _np.exp(u)
+
+	@abstractmethod
+	def _solve(self, p:_np.ndarray, x0:_np.ndarray|None)->_np.ndarray:
+		"""solves cdf(x)=p for 0<p<1 starting from x0"""
+
+	def _bracket(self, p:_np.ndarray)->_np.ndarray:
+		if self._grid is None:
+			self._grid = self._transform(self._solve(_P_GRID, None))
+		return self._inverse(_np.interp(_logit(p), _LOGIT_GRID, self._grid))
+
+	def _ppf(self, p:_np.ndarray)->_np.ndarray:
+		def func(p):
+			return self._solve(p, self._bracket(p))
+		return _npdist._quantile(p, self._lo, self._hi, func)
+
+
+
+
+# ----- Continuous Distributions  -------
+
+class beta(_continuous):
+	def __init__(self, shape1:Real, shape2:Real):
+		"""
+		shape1, shape2: similar to alpha and beta
+		"""
+		assert shape1>0, "shape1>0 expected"
+		assert shape2>0, "shape2>0 expected"
+		super().__init__()
+		self.shape1, self.shape2 = float(shape1), float(shape2)
+		self._lo, self._hi = 0.0, 1.0
+		self._lognorm = -float(_sp.lbeta(self.shape1, self.shape2))
+
+	def _params(self):
+		return {"shape1":self.shape1, "shape2":self.shape2}
+
+	def _logpdf(self, x):
+		a, b = self.shape1, self.shape2
+		retVal = self._lognorm + _xlogy(a - 1, x) + _xlogy(b - 1, 1.0 - x)
+		return _np.where((x < 0) | (x > 1), -_np.inf, retVal)
+
+	def _cdf(self, q):
+		return _npdist.pbeta(q, self.shape1, self.shape2)
+
+	def _transform(self, x):
+		return _logit(x)
+
+	def _inverse(self, u):
+		return 1.0/(1.0 + _np.exp(-u))
+
+	def _solve(self, p, x0):
+		return _npdist._qbeta(p, self.shape1, self.shape2, x0)[0]
+
+	def _rvs(self, n, gen):
+		return gen.beta(size=n, a=self.shape1, b=self.shape2)
+
+
+
+class gamma(_continuous):
+	def __init__(self, shape:Real, scale = 1.0):
+		"""
+		shape: waiting time for the rth event to occur
+		scale: average waiting time for the next event recurrence
+		"""
+		assert shape>0, "shape>0 expected"
+		assert scale>0, "scale>0 expected"
+		super().__init__()
+		self.shape, self.scale = float(shape), float(scale)
+		self._lo, self._hi = 0.0, _np.inf
+		self._lognorm = -math.lgamma(self.shape) - self.shape*math.log(self.scale)
+
+	def _params(self):
+		return {"shape":self.shape, "scale":self.scale}
+
+	def _logpdf(self, x):
+		retVal = self._lognorm + _xlogy(self.shape - 1, x) - x/self.scale
+		return _np.where(x < 0, -_np.inf, retVal)
+
+	def _cdf(self, q):
+		return _npdist.pgamma(q, self.shape, self.scale)
+
+	def _solve(self, p, x0):
+		s = self.scale
+		return s*_npdist._qgamma(p, self.shape, None if x0 is None else x0/s)
+
+	def _rvs(self, n, gen):
+		return gen.gamma(size=n, shape=self.shape, scale=self.scale)
+
+
+
+class chisq(gamma):
+	def __init__(self, df:Real):
+		"""
+		df: degrees of freedom
+		"""
+		assert df>0, "df>0 expected"
+		super().__init__(df/2, 2.0)
+		self.df = float(df)
+
+	def _params(self):
+		return {"df":self.df}
+
+
+
+class f(_frozen):
+	def __init__(self, df1:Real, df2:Real):
+		"""
+		df1: degrees of freedom, numerator
+		df2: degrees of freedom, denominator
+		"""
+		assert df1>0, "df1>0 expected"
+		assert df2>0, "df2>0 expected"
+		super().__init__()
+		self.df1, self.df2 = float(df1), float(df2)
+		self._lo, self._hi = 0.0, _np.inf
+
+		m, n = self.df1, self.df2
+		self._lognorm = m/2*math.log(m/n) - float(_sp.lbeta(m/2, n/2))
+
+		#F = (n/m) * X/(1-X) where X ~ beta(m/2, n/2)
+		self._beta = beta(m/2, n/2)
+
+	def _params(self):
+		return {"df1":self.df1, "df2":self.df2}
+
+	def _logpdf(self, x):
+		m, n = self.df1, self.df2
+		retVal = self._lognorm + _xlogy(m/2 - 1, x) - (m + n)/2*_np.log1p(m*x/n)
+		return _np.where(x < 0, -_np.inf, retVal)
+
+	def _cdf(self, q):
+		return _npdist.pf(q, self.df1, self.df2)
+
+	def _ppf(self, p):
+		m, n = self.df1, self.df2
+		def func(p):
+			B = self._beta
+			x, y = _npdist._qbeta(p, B.shape1, B.shape2, B._bracket(p))
+			return (n/m)*(x/y)
+		return _npdist._quantile(p, self._lo, self._hi, func)
+
+	def _rvs(self, n, gen):
+		return gen.f(size=n, dfnum=self.df1, dfden=self.df2)
+
+
+
+class t(_continuous):
+	def __init__(self, df:Real):
+		"""
+		df: degrees of freedom
+		"""
+		assert df>0, "df>0 expected"
+		super().__init__()
+		self.df = float(df)
+		self._lo, self._hi = -_np.inf, _np.inf
+
+		n = self.df
+		self._lognorm = math.lgamma((n + 1)/2) - math.lgamma(n/2) - 0.5*math.log(n*math.pi)
+
+	def _params(self):
+		return {"df":self.df}
+
+	def _logpdf(self, x):
+		n = self.df
+		return self._lognorm - (n + 1)/2*_np.log1p(x*x/n)
+
+	def _cdf(self, q):
+		return _npdist.pt(q, self.df)
+
+	def _transform(self, x):
+		#linear around 0, logarithmic in the tails
+		return _np.arcsinh(x)
+
+	def _inverse(self, u):
+		return _np.sinh(u)
+
+	def _solve(self, p, x0):
+		return _npdist._qt(p, self.df, None if x0 is None else _np.abs(x0))
+
+	def _rvs(self, n, gen):
+		return gen.standard_t(size=n, df=self.df)
+
+
+
+
+# ----- Continuous Distributions with closed form quantile  -------
+
+class exp(_frozen):
+	def __init__(self, rate = 1.0):
+		"""
+		rate: 1/mean, where mean is the waiting time for the next event recurrence
+		"""
+		assert rate>0, "rate>0 expected"
+		super().__init__()
+		self.rate = float(rate)
+		self._lograte = math.log(self.rate)
+
+	def _params(self):
+		return {"rate":self.rate}
+
+	def _logpdf(self, x):
+		return _np.where(x < 0, -_np.inf, self._lograte - self.rate*x)
+
+	def _cdf(self, q):
+		return _npdist.pexp(q, self.rate)
+
+	def _ppf(self, p):
+		return _npdist.qexp(p, self.rate)
+
+	def _rvs(self, n, gen):
+		return gen.exponential(size=n, scale=1/self.rate)
+
+
+
+class lnorm(_frozen):
+	def __init__(self, meanlog = 0.0, sdlog = 1.0):
+		"""
+		meanlog: mean value of the distribution (log scale)
+		sdlog: standard deviation of the distribution (log scale)
+		"""
+		assert sdlog>0, "sdlog>0 expected"
+		super().__init__()
+		self.meanlog, self.sdlog = float(meanlog), float(sdlog)
+		self._lognorm = -math.log(self.sdlog) - _sp._LN_SQRT_2PI
+
+	def _params(self):
+		return {"meanlog":self.meanlog, "sdlog":self.sdlog}
+
+	def _logpdf(self, x):
+		lx = _np.log(x)
+		z = (lx - self.meanlog)/self.sdlog
+		return _np.where(x <= 0, -_np.inf, self._lognorm - lx - 0.5*z*z)
+
+	def _cdf(self, q):
+		return _npdist.plnorm(q, self.meanlog, self.sdlog)
+
+	def _ppf(self, p):
+		return _npdist.qlnorm(p, self.meanlog, self.sdlog)
+
+	def _rvs(self, n, gen):
+		return gen.lognormal(size=n, mean=self.meanlog, sigma=self.sdlog)
+
+
+
+class norm(_frozen):
+	def __init__(self, mean = 0.0, sd = 1.0):
+		"""
+		mean: mean value of the distribution
+		sd: standard deviation of the distribution
+		"""
+		assert sd>0, "sd>0 expected"
+		super().__init__()
+		self.mean, self.sd = float(mean), float(sd)
+		self._lognorm = -math.log(self.sd) - _sp._LN_SQRT_2PI
+
+	def _params(self):
+		return {"mean":self.mean, "sd":self.sd}
+
+	def _logpdf(self, x):
+		z = (x - self.mean)/self.sd
+		return self._lognorm - 0.5*z*z
+
+	def _cdf(self, q):
+		return _npdist.pnorm(q, self.mean, self.sd)
+
+	def _ppf(self, p):
+		return _npdist.qnorm(p, self.mean, self.sd)
+
+	def _rvs(self, n, gen):
+		return gen.normal(size=n, loc=self.mean, scale=self.sd)
+
+
+
+class pareto(_frozen):
+	def __init__(self, location:Real, shape = 1.0):
+		"""
+		location: location parameter
+		shape: shape parameter
+		"""
+		assert location>0 and shape>0, "'location' and 'shape' must be positive"
+		super().__init__()
+		self.location, self.shape = float(location), float(shape)
+		self._lognorm = math.log(self.shape) + self.shape*math.log(self.location)
+
+	def _params(self):
+		return {"location":self.location, "shape":self.shape}
+
+	def _logpdf(self, x):
+		retVal = self._lognorm - (self.shape + 1)*_np.log(x)
+		return _np.where(x < self.location, -_np.inf, retVal)
+
+	def _cdf(self, q):
+		return _npdist.ppareto(q, self.location, self.shape)
+
+	def _ppf(self, p):
+		return _npdist.qpareto(p, self.location, self.shape)
+
+	def _rvs(self, n, gen):
+		#inverse transform, numpy's pareto is Lomax
+		return self.location*(1.0 - gen.uniform(size=n))**(-1/self.shape)
+
+
+
+class unif(_frozen):
+	def __init__(self, min = 0.0, max = 1.0):
+		"""
+		min: minimum bound
+		max: maximum bound
+		"""
+		assert max>min, "max>min expected"
+		super().__init__()
+		self.min, self.max = float(min), float(max)
+		self._lognorm = -math.log(self.max - self.min)
+
+	def _params(self):
+		return {"min":self.min, "max":self.max}
+
+	def _logpdf(self, x):
+		return _np.where((x < self.min) | (x > self.max), -_np.inf, self._lognorm + 0*x)
+
+	def _cdf(self, q):
+		return _npdist.punif(q, self.min, self.max)
+
+	def _ppf(self, p):
+		return _npdist.qunif(p, self.min, self.max)
+
+	def _rvs(self, n, gen):
+		return gen.uniform(size=n, low=self.min, high=self.max)
+
+
+
+class weibull(_frozen):
+	def __init__(self, shape:Real, scale = 1.0):
+		"""
+		shape: known as Weibull-slope
+		scale: characteristic life
+		"""
+		assert shape>0, "shape>0 expected"
+		assert scale>0, "scale>0 expected"
+		super().__init__()
+		self.shape, self.scale = float(shape), float(scale)
+		self._lognorm = math.log(self.shape) - self.shape*math.log(self.scale)
+
+	def _params(self):
+		return {"shape":self.shape, "scale":self.scale}
+
+	def _logpdf(self, x):
+		k = self.shape
+		retVal = self._lognorm + _xlogy(k - 1, x) - (x/self.scale)**k
+		return _np.where(x < 0, -_np.inf, retVal)
+
+	def _cdf(self, q):
+		return _npdist.pweibull(q, self.shape, self.scale)
+
+	def _ppf(self, p):
+		return _npdist.qweibull(p, self.shape, self.scale)
+
+	def _rvs(self, n, gen):
+		return self.scale*gen.weibull(size=n, a=self.shape)
+
+
+
+
+# ----- Discrete Distributions  -------
+
+class _discrete(_frozen):
+	"""
+	Discrete distributions on integers in [_lo, _hi].
+
+	For unbounded support, an upper bracket covering all but 1E-10 of the probability
+	mass is computed on first call to ppf and reused.
+	"""
+	def _ppf(self, p):
+		if self._grid is None:
+			hi = self._hi
+			if _np.isinf(hi):
+				hi = float(_sp.discrete_quantile(self._cdf, _np.array(1 - 1E-10), lo=self._lo, guess=self._mean()))
+			self._grid = (hi, float(self._cdf(_np.array(hi))))
+
+		hi, phi = self._grid
+		def func(p):
+			upper = _np.where(p*(1 - 64*_sp._EPS) <= phi, hi, self._hi)
+			return _sp.discrete_quantile(self._cdf, p, lo=self._lo, hi=upper, guess=hi)
+
+		return _npdist._quantile(p, self._lo, self._hi, func)
+
+	def _mean(self)->float:
+		return self._lo
+
+	@abstractmethod
+	def _logpmf(self, x:_np.ndarray)->_np.ndarray:
+		"""log of probability mass at integers x in the support"""
+
+	def _logpdf(self, x):
+		xr = _np.round(x)
+		valid = _npdist._isint(x) & (xr >= self._lo) & (xr <= self._hi)
+		return _np.where(valid, self._logpmf(_np.where(valid, xr, self._lo)), -_np.inf)
+
+
+
+class binom(_discrete):
+	def __init__(self, size:int, prob:Real):
+		"""
+		size: number of trials
+		prob: probability of success in each trial
+		"""
+		assert size>0, "size>0 expected"
+		assert prob>=0 and prob<=1, "prob in [0, 1] expected"
+		super().__init__()
+		self.size, self.prob = int(size), float(prob)
+		self._lo, self._hi = 0.0, float(size)
+		self._lfact = math.lgamma(self.size + 1)
+
+	def _params(self):
+		return {"size":self.size, "prob":self.prob}
+
+	def _logpmf(self, x):
+		n, p = self.size, self.prob
+		return self._lfact - _sp.lgamma(x + 1) - _sp.lgamma(n - x + 1) + _xlogy(x, p) + _xlogy(n - x, 1.0 - p)
+
+	def _cdf(self, q):
+		return _npdist.pbinom(q, self.size, self.prob)
+
+	def _rvs(self, n, gen):
+		return gen.binomial(size=n, n=self.size, p=self.prob)
+
+
+
+class geom(_discrete):
+	def __init__(self, prob:Real):
+		"""
+		prob: probability of success in each trial.
+		"""
+		assert prob>0 and prob<=1, "prob in (0, 1] expected"
+		super().__init__()
+		self.prob = float(prob)
+		self._lo, self._hi = 0.0, _np.inf
+		self._logp, self._logq = math.log(self.prob), math.log1p(-self.prob) if self.prob < 1 else -_np.inf
+
+	def _params(self):
+		return {"prob":self.prob}
+
+	def _logpmf(self, x):
+		return self._logp + _np.where(x == 0, 0.0, x*self._logq)
+
+	def _cdf(self, q):
+		return _npdist.pgeom(q, self.prob)
+
+	def _ppf(self, p):
+		return _npdist.qgeom(p, self.prob)
+
+	def _rvs(self, n, gen):
+		#numpy counts the trials, not the failures
+		return gen.geometric(size=n, p=self.prob) - 1
+
+
+
+class hyper(_discrete):
+	def __init__(self, m:int, n:int, k:int):
+		"""
+		m: number of good samples in the urn
+		n: number of bad samples in the urn
+		k: samples drawn from the urn
+		"""
+		assert m>=0 and n>=0, "m>=0 and n>=0 expected"
+		assert k>=0 and k<=m+n, "0<=k<=m+n expected"
+		super().__init__()
+		self.m, self.n, self.k = int(m), int(n), int(k)
+		self._lo, self._hi = float(max(0, k - n)), float(min(k, m))
+
+		lg = math.lgamma
+		self._lfact = lg(m + 1) + lg(n + 1) - (lg(m + n + 1) - lg(k + 1) - lg(m + n - k + 1))
+
+	def _params(self):
+		return {"m":self.m, "n":self.n, "k":self.k}
+
+	def _logpmf(self, x):
+		m, n, k = self.m, self.n, self.k
+		lg = _sp.lgamma
+		return self._lfact - lg(x + 1) - lg(m - x + 1) - lg(k - x + 1) - lg(n - k + x + 1)
+
+	def _cdf(self, q):
+		return _npdist.phyper(q, self.m, self.n, self.k)
+
+	def _rvs(self, n, gen):
+		return gen.hypergeometric(size=n, ngood=self.m, nbad=self.n, nsample=self.k)
+
+
+
+class nbinom(_discrete):
+	def __init__(self, size:Real, prob:Real):
+		"""
+		size: target for number of successful trials
+		prob: probability of success in each trial
+		"""
+		assert size>0, "size>0 expected"
+		assert prob>0 and prob<=1, "prob in (0, 1] expected"
+		super().__init__()
+		self.size, self.prob = float(size), float(prob)
+		self._lo, self._hi = 0.0, _np.inf
+		self._lognorm = self.size*math.log(self.prob) - math.lgamma(self.size)
+		self._logq = math.log1p(-self.prob) if self.prob < 1 else -_np.inf
+
+	def _params(self):
+		return {"size":self.size, "prob":self.prob}
+
+	def _mean(self):
+		return self.size*(1 - self.prob)/self.prob
+
+	def _logpmf(self, x):
+		r = self.size
+		return self._lognorm + _sp.lgamma(x + r) - _sp.lgamma(x + 1) + _np.where(x == 0, 0.0, x*self._logq)
+
+	def _cdf(self, q):
+		return _npdist.pnbinom(q, self.size, self.prob)
+
+	def _rvs(self, n, gen):
+		return gen.negative_binomial(size=n, n=self.size, p=self.prob)
+
+
+
+class pois(_discrete):
+	def __init__(self, mu:Real):
+		"""
+		mu: mean
+		"""
+		assert mu>0, "mu>0 expected"
+		super().__init__()
+		self.mu = float(mu)
+		self._lo, self._hi = 0.0, _np.inf
+		self._logmu = math.log(self.mu)
+
+	def _params(self):
+		return {"mu":self.mu}
+
+	def _mean(self):
+		return self.mu
+
+	def _logpmf(self, x):
+		return x*self._logmu - self.mu - _sp.lgamma(x + 1)
+
+	def _cdf(self, q):
+		return _npdist.ppois(q, self.mu)
+
+	def _rvs(self, n, gen):
+		return gen.poisson(size=n, lam=self.mu)
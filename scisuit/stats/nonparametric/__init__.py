@@ -6,3 +6,5 @@ from ._kruskalwallis import test_kruskal, test_kruskal_Result
 
 from ._friedman import test_friedman, test_friedman_Result
 
+from ._permutation import test_permutation, test_permutation_Result
+
@@ -4,6 +4,7 @@ from typing import Iterable
 
 from ctypes import py_object, c_double, c_char_p, c_bool
 from ..._ctypeslib import pydll as _pydll
+from .._validate import asarray as _asarray
 
 _pydll.c_stat_nonparam_friedman.argtypes = [py_object, py_object, py_object]
 _pydll.c_stat_nonparam_friedman.restype = py_object
@@ -59,11 +60,12 @@ def test_friedman(
 	groups	: groups to which each response belongs
 	"""
 
-	assert isinstance(responses, Iterable), "responses must be Iterable"
-	assert isinstance(factors, Iterable), "groups must be Iterable"
+	Responses = _asarray(responses, "responses")
+	assert isinstance(factors, Iterable), "factors must be Iterable"
 	assert isinstance(groups, Iterable), "groups must be Iterable"
+	assert len(Responses) == len(factors) == len(groups), "responses, factors and groups must have same size"
 
-	dct =  _pydll.c_stat_nonparam_friedman(responses,factors, groups)
+	dct =  _pydll.c_stat_nonparam_friedman(Responses, factors, groups)
 	
 	return test_friedman_Result(
 		pvalue=dct["pvalue"],
@@ -4,6 +4,7 @@ from typing import Iterable
 
 from ctypes import py_object, c_double, c_char_p, c_bool
 from ..._ctypeslib import pydll as _pydll
+from .._validate import asarray as _asarray
 
 _pydll.c_stat_nonparam_kruskalwallis.argtypes = [py_object, py_object]
 _pydll.c_stat_nonparam_kruskalwallis.restype = py_object
@@ -49,10 +50,11 @@ def test_kruskal(
 	groups	: groups to which each response belongs
 	"""
 
-	assert isinstance(responses, Iterable), "responses must be Iterable"
+	Responses = _asarray(responses, "responses")
 	assert isinstance(groups, Iterable), "groups must be Iterable"
+	assert len(Responses) == len(groups), "responses and groups must have same size"
 
-	dct =  _pydll.c_stat_nonparam_kruskalwallis(responses, groups)
+	dct =  _pydll.c_stat_nonparam_kruskalwallis(Responses, groups)
 	
 	return test_kruskal_Result(
 		pvalue=dct["pvalue"],
@@ -4,6 +4,7 @@ from typing import Iterable
 
 from ctypes import py_object, c_double, c_char_p, c_bool
 from ..._ctypeslib import pydll as _pydll
+from .._validate import asarray as _asarray, check_conflevel as _check_conflevel
 
 _pydll.c_stat_nonparam_mannwhitney.argtypes = [py_object, py_object, c_double, c_bool, c_double, c_char_p]
 _pydll.c_stat_nonparam_mannwhitney.restype = py_object
@@ -50,9 +51,8 @@ def test_mannwhitney(
 	conflevel:	Confidence level, [0,1]  
 	"""
 
-	assert conflevel>0.0 or conflevel<1.0, "conflevel must be in range (0, 1)"
-	assert isinstance(x, Iterable), "x must be Iterable"
-	assert isinstance(y, Iterable), "x must be Iterable"
+	_check_conflevel(conflevel)
+	xx, yy = _asarray(x, "x"), _asarray(y, "y")
 	assert isinstance(md, numbers.Real), "md must be real number"
 	assert isinstance(confint, bool), "confint must be bool"
 	assert isinstance(alternative, str), "alternative must be str"
@@ -60,8 +60,8 @@ def test_mannwhitney(
 	assert alternative in ["two.sided", "less", "greater"], "alternative must be two.sided, less or greater"
 
 	dct =  _pydll.c_stat_nonparam_mannwhitney(
-		x, 
-		y,
+		xx, 
+		yy,
 		c_double(md), 
 		c_bool(confint), 
 		c_double(conflevel), 
@@ -0,0 +1,229 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from numbers import Real
+from typing import Iterable
+
+import numpy as _np
+
+from .._distributions import qbeta, spawn_rng
+from .._validate import asarray as _asarray, check_alternative as _check_alternative
+
+
+
+
+def _midranks(v:_np.ndarray)->_np.ndarray:
+	"""ranks starting from 1, tied values get the average of their ranks"""
+	order = _np.argsort(v, kind="stable")
+	sv = v[order]
+
+	first = _np.ones(len(v), dtype=bool)
+	first[1:] = sv[1:] != sv[:-1]
+	starts = _np.flatnonzero(first)
+	counts = _np.diff(_np.append(starts, len(v)))
+
+	r = _np.empty(len(v))
+	r[order] = _np.repeat(starts + (counts + 1)/2, counts)
+	return r
+
+
+
+class _PermStat:
+	"""
+	Data of a permutation test, batch() returns the statistic for B random
+	relabelings (or sign flips) drawn as one block of indices.
+	Module level, so that it can be sent to worker processes.
+	"""
+	def __init__(self, name:str, samples:list[_np.ndarray], md:float):
+		self.name = name
+
+		if name == "wilcox":
+			d = samples[0] - md
+			d = d[d != 0]
+			assert len(d) > 0, "x must contain values other than md"
+			self.ranks = _midranks(_np.abs(d))
+			self.signs = d > 0
+			return
+
+		z = _np.concatenate(samples)
+		self.sizes = _np.array([len(s) for s in samples])
+		self.labels = _np.repeat(_np.arange(len(samples)), self.sizes)
+		N = len(z)
+
+		if name == "t":
+			#difference of means orders the permutations as the pooled t statistic does
+			self.values = z - _np.where(self.labels == 0, md, 0.0)
+
+		elif name == "mannwhitney":
+			self.values = _midranks(z - _np.where(self.labels == 0, md, 0.0))
+
+		elif name == "kruskal":
+			self.values = _midranks(z)
+			ties = _np.unique(z, return_counts=True)[1]
+			self.correction = 1.0 - _np.sum(ties**3 - ties)/(N**3 - N)
+
+
+	def observed(self)->float:
+		if self.name == "wilcox":
+			return float(_np.sum(self.ranks[self.signs]))
+		return float(self.__statistic(self.labels[None, :])[0])
+
+
+	def batch(self, gen:_np.random.Generator, B:int)->_np.ndarray:
+		if self.name == "wilcox":
+			flips = gen.integers(0, 2, size=(B, len(self.ranks)), dtype=_np.int8)
+			return flips @ self.ranks
+
+		labels = gen.permuted(_np.tile(self.labels, (B, 1)), axis=1)
+		return self.__statistic(labels)
+
+
+	def __statistic(self, labels:_np.ndarray)->_np.ndarray:
+		"""statistic for each row of group labels"""
+		B, N = labels.shape
+		k = len(self.sizes)
+
+		if self.name == "kruskal":
+			Rsum = _np.bincount(
+				(labels + k*_np.arange(B)[:, None]).ravel(),
+				weights=_np.tile(self.values, B),
+				minlength=B*k).reshape(B, k)
+			H = 12/(N*(N + 1))*_np.sum(Rsum**2/self.sizes, axis=1) - 3*(N + 1)
+			return H/self.correction
+
+		InX = labels == 0
+		SumX = InX @ self.values
+		if self.name == "mannwhitney":
+			return SumX
+
+		m, n = self.sizes
+		return SumX/m - (self.values.sum() - SumX)/n
+
+
+
+def _count(stat:_PermStat, observed:float, B:int, gen:_np.random.Generator):
+	"""
+	number of B permuted statistics >= observed and <= observed,
+	the generator is returned with its advanced state
+	"""
+	T = stat.batch(gen, B)
+	tol = 1E-12*max(abs(observed), 1.0)
+	return int(_np.count_nonzero(T >= observed - tol)), int(_np.count_nonzero(T <= observed + tol)), gen
+
+
+
+
+@dataclass
+class test_permutation_Result:
+	pvalue:float
+	statistic:float
+	nperm:int #number of permutations evaluated
+	stopped:bool #stopped early, the p-value is resolved relative to alpha
+	test:str
+	alternative:str
+
+	def __str__(self):
+		s = f"Permutation test ({self.test}) \n"
+		s += f"Statistic = {self.statistic} \n"
+		s += f"p-value = {self.pvalue} ({self.alternative}) \n"
+		s += f"Permutations = {self.nperm}" + (" (stopped early)" if self.stopped else "")
+		return s
+
+
+
+def test_permutation(
+		*samples:Iterable,
+		statistic:str = "t",
+		alternative:str = "two.sided",
+		md:Real = 0.0,
+		nperm:int = 10000,
+		alpha:float|None = 0.05,
+		blocksize:int = 1000,
+		rng = None,
+		workers:int = 1)->test_permutation_Result:
+	"""
+	Monte-Carlo permutation test, p = (1 + #extreme)/(1 + nperm), 
+	two.sided p-value is twice the smaller tail
+
+	samples: x (wilcox), x and y (t, mannwhitney) or 2 or more groups (kruskal)
+	statistic: "t" (difference of means), "mannwhitney" (rank sum of x),
+	"wilcox" (signed rank sum of x - md) or "kruskal" (H, upper tail only)
+	alternative: "two.sided", "less", "greater"
+	md: Hypothesized difference between x and y, or median of x
+	nperm: maximum number of permutations
+	alpha: stops once the 99.9% confidence interval of p excludes alpha, None to run all
+	blocksize: permutations evaluated at once (per worker)
+	rng: None (fresh entropy), int seed or numpy.random.Generator
+	workers: number of processes, each draws from its own stream spawned from rng
+	"""
+	Required = {"t":2, "mannwhitney":2, "wilcox":1}
+	assert statistic in ["t", "mannwhitney", "wilcox", "kruskal"], "statistic must be 't', 'mannwhitney', 'wilcox' or 'kruskal'"
+	if statistic == "kruskal":
+		assert len(samples) >= 2, "kruskal requires at least 2 samples"
+		alternative = "greater"
+	else:
+		assert len(samples) == Required[statistic], f"{statistic} requires {Required[statistic]} sample(s)"
+
+	_check_alternative(alternative)
+	assert isinstance(md, Real), "md must be Real"
+	assert isinstance(nperm, int) and nperm > 0, "nperm>0 expected"
+	assert isinstance(blocksize, int) and blocksize > 0, "blocksize>0 expected"
+	assert isinstance(workers, int) and workers > 0, "workers>0 expected"
+	assert alpha is None or 0 < alpha < 1, "alpha must be in range (0, 1)"
+
+	Samples = [_asarray(v, f"sample {i+1}") for i, v in enumerate(samples)]
+	stat = _PermStat(statistic, Samples, float(md))
+	observed = stat.observed()
+
+	if isinstance(rng, _np.random.Generator):
+		gens = rng.spawn(workers)
+	else:
+		gens = spawn_rng(workers, seed=rng)
+
+	def tail(upper:int, lower:int)->tuple[int, float]:
+		"""count in the tail and the tail probability it is compared with"""
+		if alternative == "greater":
+			return upper, 1.0
+		elif alternative == "less":
+			return lower, 1.0
+		return min(upper, lower), 2.0 #twice the smaller tail
+
+	pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+	upper, lower, done, stopped = 0, 0, 0, False
+	try:
+		while done < nperm and not stopped:
+			sizes = []
+			for _ in gens:
+				sizes.append(min(blocksize, nperm - done - sum(sizes)))
+			sizes = [v for v in sizes if v > 0]
+
+			if pool is None:
+				results = [_count(stat, observed, sizes[0], gens[0])]
+			else:
+				futures = [pool.submit(_count, stat, observed, B, g) for B, g in zip(sizes, gens)]
+				results = [f.result() for f in futures]
+
+			#generators come back with their advanced state
+			for i, (u, l, g) in enumerate(results):
+				upper += u
+				lower += l
+				gens[i] = g
+			done += sum(sizes)
+
+			if alpha is not None and done < nperm:
+				c, factor = tail(upper, lower)
+				lo = 0.0 if c == 0 else qbeta(0.0005, c, done - c + 1)
+				hi = 1.0 if c == done else qbeta(0.9995, c + 1, done - c)
+				stopped = factor*hi < alpha or factor*lo > alpha
+	finally:
+		if pool is not None:
+			pool.shutdown()
+
+	c, factor = tail(upper, lower)
+
+	return test_permutation_Result(
+		pvalue=min(factor*(c + 1)/(done + 1), 1.0),
+		statistic=observed,
+		nperm=done,
+		stopped=stopped,
+		test=statistic,
+		alternative=alternative)
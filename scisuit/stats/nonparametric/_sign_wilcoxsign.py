@@ -4,6 +4,7 @@ from typing import Iterable
 
 from ctypes import py_object, c_double, c_char_p, c_bool
 from ..._ctypeslib import pydll as _pydll
+from .._validate import asarray as _asarray, check_conflevel as _check_conflevel
 
 _pydll.c_stat_nonparam_signtest.argtypes = [py_object, c_double, c_bool, c_double, c_char_p]
 _pydll.c_stat_nonparam_signtest.restype = py_object
@@ -50,8 +51,8 @@ def test_sign(
 	conflevel:	Confidence level, [0,1]  
 	"""
 
-	assert conflevel>0.0 or conflevel<1.0, "conflevel must be in range (0, 1)"
-	assert isinstance(x, Iterable), "x must be Iterable"
+	_check_conflevel(conflevel)
+	xx = _asarray(x)
 	assert isinstance(md, numbers.Real), "md must be real number"
 	assert isinstance(confint, bool), "confint must be bool"
 	assert isinstance(alternative, str), "alternative must be str"
@@ -59,7 +60,7 @@ def test_sign(
 	assert alternative in ["two.sided", "less", "greater"], "alternative must be two.sided, less or greater"
 
 	dct =  _pydll.c_stat_nonparam_signtest(
-		x, 
+		xx, 
 		c_double(md), 
 		c_bool(confint), 
 		c_double(conflevel), 
@@ -112,8 +113,8 @@ def test_wilcox(
 	conflevel:	Confidence level, [0,1]  
 	"""
 
-	assert conflevel>0.0 or conflevel<1.0, "conflevel must be in range (0, 1)"
-	assert isinstance(x, Iterable), "x must be Iterable"
+	_check_conflevel(conflevel)
+	xx = _asarray(x)
 	assert isinstance(md, numbers.Real), "md must be real number"
 	assert isinstance(confint, bool), "confint must be bool"
 	assert isinstance(alternative, str), "alternative must be str"
@@ -121,7 +122,7 @@ def test_wilcox(
 	assert alternative in ["two.sided", "less", "greater"], "alternative must be two.sided, less or greater"
 
 	dct =  _pydll.c_stat_nonparam_wilcox_signedrank(
-		x, 
+		xx, 
 		c_double(md), 
 		c_bool(confint), 
 		c_double(conflevel), 
@@ -1,3 +1,5 @@
 from ._linearregress import linregress
 from ._linear_simple import SimpleLinRegressResult
-from ._linear_multiple import MultipleLinregress
\ No newline at end of file
+from ._linear_multiple import MultipleLinregress, MultiResponseLinRegressResult
+from ._linear_incremental import linregress_accumulator
+from ._linear_robust import RobustLinRegressResult, RobustSimpleLinRegressResult
\ No newline at end of file
@@ -0,0 +1,123 @@
+from typing import Iterable
+
+import numpy as np
+
+from ._linear_multiple import _Augmented, _ComputeSummary, MultipleLinRegressResult
+from ._linear_simple import AnovaResults, SimpleLinRegressResult
+from .._validate import asarray as _asarray
+
+
+
+
+class linregress_accumulator:
+
+	"""
+	Linear regression of data arriving in chunks of rows (memmaps, generators or
+	different processes) in bounded memory.
+
+	Only the triangular factor R of [1 | X | y] is kept, each chunk is reduced by a QR
+	factorization of R stacked on top of the chunk (TSQR), therefore accumulators
+	filled separately can be merged the same way.
+
+	intercept: True if there is intercept
+	alpha: significance level
+
+	## Example:
+	>> acc = linregress_accumulator() \n
+	>> for y, x in chunks: acc.update(y, x) \n
+	>> acc.result()
+	"""
+
+	def __init__(self, intercept=True, alpha=0.05):
+		self._m_Intercept = intercept
+		self._m_Alpha = alpha
+		self._m_N = 0
+		self._m_Simple = None #1D factor
+		self._m_R = None
+
+
+	@property
+	def n(self)->int:
+		return self._m_N
+
+
+	def update(self, yobs:Iterable, factor:Iterable | Iterable[Iterable])->'linregress_accumulator':
+		"""
+		adds the rows of a chunk
+
+		yobs: Dependent data
+		factor: independent data, same layout as linregress (each predictor is a row,
+		pass chunk.T for a chunk with predictors in columns)
+		"""
+		Observed = _asarray(yobs, "yobs", minsize=0)
+		Factor = _asarray(factor, "factor", minsize=0, ndim=None)
+		assert Factor.ndim in [1, 2], "factor must be either Iterable, Iterable[Iterable]"
+
+		Simple = Factor.ndim == 1
+		Factor = Factor[:, None] if Simple else np.transpose(Factor)
+		assert Factor.shape[0] == Observed.size, "Rows of matrix == size of observed variables expected."
+		if Observed.size == 0:
+			return self
+
+		self.__combine(_Augmented(Observed, Factor, self._m_Intercept), Observed.size, Simple)
+
+		return self
+
+
+	def merge(self, other:'linregress_accumulator')->'linregress_accumulator':
+		"""adds the rows accumulated by other"""
+		assert isinstance(other, linregress_accumulator), "other must be linregress_accumulator"
+		assert other._m_Intercept == self._m_Intercept, "accumulators must have same intercept setting"
+
+		if other._m_N > 0:
+			self.__combine(other._m_R, other._m_N, other._m_Simple)
+		return self
+
+
+	def __combine(self, A:np.ndarray, n:int, Simple:bool):
+		if self._m_R is not None:
+			assert A.shape[1] == self._m_R.shape[1] and Simple == self._m_Simple, "chunks must have same number of predictors"
+			A = np.vstack([self._m_R, A])
+
+		self._m_R = np.linalg.qr(A, mode="r")
+		self._m_N += n
+		self._m_Simple = Simple
+
+
+	def result(self)->SimpleLinRegressResult|MultipleLinRegressResult:
+		"""regression of all rows added so far, residuals and fits are not available (None)"""
+		assert self._m_R is not None, "no observations added"
+
+		m = self._m_R.shape[1]
+		assert self._m_N > m - 1, "More observations than coefficients expected."
+
+		R = np.zeros((m, m))
+		R[:len(self._m_R)] = self._m_R
+
+		coeffs, stderror, CoefStats, anova = _ComputeSummary(R, self._m_N, self._m_Intercept, self._m_Alpha)
+
+		if not self._m_Simple:
+			return MultipleLinRegressResult(
+							Coefficients=coeffs,
+							CoefficientStats=CoefStats,
+							stderr=stderror,
+							anova=anova,
+							intercept=self._m_Intercept,
+							Residuals=None,
+							Fits=None,
+							R=R[:-1, :-1],
+							alpha=self._m_Alpha)
+
+		#simple regression lists the slope first
+		if self._m_Intercept:
+			Coefficients, CoefStats = np.array([coeffs[1], coeffs[0]]), [CoefStats[1], CoefStats[0]]
+		else:
+			Coefficients = np.array([coeffs[0], 0.0])
+
+		return SimpleLinRegressResult(
+						Coefficients=Coefficients,
+						CoefficientStats=CoefStats,
+						anova=AnovaResults(**vars(anova)),
+						stderr=float(np.sqrt(anova.MS_Residual)),
+						Residuals=None,
+						Fits=None)
\ No newline at end of file
@@ -1,10 +1,10 @@
-import math
 from typing import Iterable as _Iterable
 
 from dataclasses import dataclass
 import numpy as np
 
 from .._distributions import pf, pt, qt
+from .._validate import asarray as _asarray
 
 
 
@@ -35,104 +35,183 @@ class CoeffStats:
 
 #-------------------------------------------------------------
 
-def _ComputeSummary(
-				yobs:np.ndarray, 
-				factor:np.ndarray, 
-				Coeffs, 
-				ModifiedMatrix, 
-				intercept=True, alpha=0.05)->tuple[float, list[CoeffStats],AnovaResults]:
-	nrows, ncols = factor.shape
-
-	MeanYObs = np.mean(yobs)
-	ypredicted = np.zeros(nrows)
-
-	SS_Total, SS_Residual = 0, 0
-	sum_y2=0.0
-	for i in range(nrows):
-		#row vector * col vector = number
-		ypredicted[i] = np.dot(ModifiedMatrix[i, :], Coeffs)
-		
-		SS_Total += (MeanYObs-yobs[i])**2
-		SS_Residual += (yobs[i]-ypredicted[i])**2
-		sum_y2 += yobs[i]**2
-	
-	NObservations = nrows
-	DF_Regression = ncols
-	DF_Residual = NObservations - (DF_Regression + 1)
+def _Augmented(yobs:np.ndarray, factor:np.ndarray, intercept=True)->np.ndarray:
+	"""
+	[1 | factor | yobs] built in a single allocation (column of ones only if intercept),
+	yobs can be 2D with a column for each response
+	"""
+	NRows, NCols = factor.shape
+	offset = 1 if intercept else 0
+	Y = yobs if yobs.ndim == 2 else yobs[:, None]
 
-	if not intercept:
-		DF_Residual = NObservations - DF_Regression
-		SS_Total = sum_y2
-	
+	A = np.empty((NRows, NCols + offset + Y.shape[1]))
+	if intercept:
+		A[:, 0] = 1.0
+	A[:, offset:offset + NCols] = factor
+	A[:, offset + NCols:] = Y
+
+	return A
+
+
+
+def _SummaryArrays(
+				Rxx:np.ndarray, 
+				QtY:np.ndarray,
+				SS_Residual:np.ndarray,
+				NObservations:int, 
+				intercept=True, alpha=0.05)->tuple:
+	"""
+	Everything is computed from the QR factorization X = QR of the design matrix 
+	(including the column of ones if intercept), for k responses Y:
 
+	Rxx: upper triangular factor of X (p x p)
+	QtY: Q'Y (p x k)
+	SS_Residual: residual sums of squares (k)
+
+	With an intercept, the first row of Q'Y is sqrt(n)*mean(Y), therefore SS_Total is the 
+	sum of squares of the remaining rows plus SS_Residual.
+
+	Returns coefficients, standard errors, t-values, p-values, CI bounds (p x k) and ANOVA tables (k)
+	"""
+	p, k = QtY.shape
+
+	Coeffs = np.linalg.solve(Rxx, QtY)
+	SS_Total = np.sum(QtY[1 if intercept else 0:]**2, axis=0) + SS_Residual
+
+	DF_Regression = p - 1 if intercept else p
+	DF_Residual = NObservations - p
+	
 	SS_Regression = SS_Total - SS_Residual
 	MS_Residual = SS_Residual / DF_Residual
 	MS_Regression = SS_Regression/DF_Regression
 	FValue = MS_Regression/MS_Residual
 
-	pvalue = 1 - pf(float(FValue), DF_Regression, DF_Residual)
-
-	anova = AnovaResults(
-		DF_Residual=DF_Residual, 
-		SS_Residual=SS_Residual,
-		MS_Residual=MS_Residual,
-		DF_Regression=1, 
-		SS_Regression=SS_Regression, 
-		MS_Regression=MS_Regression, 
-		SS_Total=SS_Total,
-		R2=SS_Regression/SS_Total,
-		Fvalue = FValue,
-		pvalue = pvalue)
+	Fpvalue = np.asarray(pf(FValue, DF_Regression, DF_Residual, lower_tail=False), dtype=np.float64).reshape(k)
+
+	anova = [AnovaResults(
+				DF_Residual=DF_Residual, 
+				SS_Residual=float(SS_Residual[j]),
+				MS_Residual=float(MS_Residual[j]),
+				DF_Regression=DF_Regression, 
+				SS_Regression=float(SS_Regression[j]), 
+				MS_Regression=float(MS_Regression[j]), 
+				SS_Total=float(SS_Total[j]),
+				R2=float(SS_Regression[j]/SS_Total[j]),
+				Fvalue = float(FValue[j]),
+				pvalue = float(Fpvalue[j])) for j in range(k)]
 	
 
-	SEMat = np.linalg.inv(np.dot(np.transpose(ModifiedMatrix),ModifiedMatrix))
-	stderror = np.sqrt(np.diag(SEMat))*math.sqrt(MS_Residual)
+	#diagonal of (X'X)^-1 = (R'R)^-1 is the squared row norms of R^-1
+	Rinv = np.linalg.solve(Rxx, np.eye(p))
+	stderror = np.sqrt(np.sum(Rinv**2, axis=1))[:, None]*np.sqrt(MS_Residual)[None, :]
+
+	Tvalues = Coeffs/stderror
+	pvalues = 2.0*np.asarray(pt(q=-np.abs(Tvalues), df=DF_Residual))
+	invTval = float(qt(alpha/2.0, DF_Residual))
+
+	val1 = Coeffs - stderror*invTval
+	val2 = Coeffs + stderror*invTval
+
+	return Coeffs, stderror, Tvalues, pvalues, np.minimum(val1, val2), np.maximum(val1, val2), anova
+
+
+
+def _ComputeSummary(
+				R:np.ndarray, 
+				NObservations:int, 
+				intercept=True, alpha=0.05)->tuple[np.ndarray, np.ndarray, list[CoeffStats], AnovaResults]:
+	"""
+	summary of a single response from the triangular factor R of [X | y], 
+	R[:p, p] is Q'y and R[p, p]^2 is the residual sum of squares (see _SummaryArrays)
+	"""
+	p = R.shape[1] - 1
+	SS_Residual = np.sum(R[p:, p:]**2, axis=0)
+	Coeffs, stderror, Tvalues, pvalues, CILow, CIHigh, anova = _SummaryArrays(R[:p, :p], R[:p, p:], SS_Residual, NObservations, intercept, alpha)
 
 	CoefStatistics=[]
 	for i in range(len(Coeffs)):
-		Tvalue = Coeffs[i]/stderror[i]
-		_pt = pt(q=float(Tvalue), df = nrows-1)
-		_pvalue = float(2*(1 - _pt) if Tvalue>=0 else 2*_pt)	
-		
-		invTval = qt(alpha/2.0, DF_Residual)
-		
-		val1 = Coeffs[i] - stderror[i]*invTval
-		val2 = Coeffs[i] + stderror[i]*invTval
-
 		CoefStatistics.append(CoeffStats(
-							value=float(Coeffs[i]), 
-							pvalue=float(_pvalue), 
-							tvalue=float(Tvalue), 
-							stderr=float(stderror[i]), 
-							CILow=min(val1,val2),
-							CIHigh=max(val1,val2)))
+							value=float(Coeffs[i, 0]), 
+							pvalue=float(pvalues[i, 0]), 
+							tvalue=float(Tvalues[i, 0]), 
+							stderr=float(stderror[i, 0]), 
+							CILow=float(CILow[i, 0]),
+							CIHigh=float(CIHigh[i, 0])))
 
-	return stderror, CoefStatistics, anova
+	return Coeffs[:, 0], stderror[:, 0], CoefStatistics, anova[0]
 
 
 
 
 #-------------------------------------------------------
 
-def _ComputeResiduals(yobs:np.ndarray, factor:np.ndarray, Coeffs, intercept:bool)->tuple[list, list]:
-	IsIntercept = intercept
+def _ComputeResiduals(yobs:np.ndarray, X:np.ndarray, Coeffs)->tuple[list, list]:
+	"""X: design matrix (including the column of ones if intercept)"""
+	Fits = X @ Coeffs
+	Residuals = yobs - Fits
+	
+	return Residuals.tolist(), Fits.tolist()
 
-	Residuals, Fits = [], []
 
-	NRows, NCols = factor.shape
-	for i in range(NRows):
-		Intercept = float(Coeffs[0]) if IsIntercept else 0.0
-		fit = Intercept
-		for j in range(NCols):
-			Coeff = float(Coeffs[j+1]) if IsIntercept else float(Coeffs[j])
-			fit += factor[i, j]*Coeff	
-		
-		residual = yobs[i] - fit
-		
-		Residuals.append(float(residual))
-		Fits.append(float(fit))
-	
-	return Residuals, Fits
+
+#-------------------------------------------------------
+
+def _ForwardSolve(R:np.ndarray, X:np.ndarray)->np.ndarray:
+	"""
+	Solves R'z = x for each row x of X by forward substitution (R is upper triangular),
+	each step handles a column for all rows at once
+	"""
+	Z = np.empty_like(X)
+	for k in range(len(R)):
+		Z[:, k] = (X[:, k] - Z[:, :k] @ R[:k, k])/R[k, k]
+	return Z
+
+
+
+def _Predict(
+		R:np.ndarray, 
+		Coeffs:np.ndarray, 
+		MS_Residual, 
+		DF_Residual:int,
+		intercept:bool,
+		Xnew, 
+		interval:str|None, 
+		alpha:float,
+		chunksize:int = 65536):
+	"""
+	Fits at new points, with confidence/prediction intervals if requested.
+
+	The variance of a fit at x is MS_Residual*x'(X'X)^-1 x = MS_Residual*|R'^-1 x|^2,
+	computed by solving with the triangular factor R for chunks of rows.
+	"""
+	assert interval in [None, "confidence", "prediction"], "interval must be None, 'confidence' or 'prediction'"
+
+	p = len(R)
+	NPred = p - (1 if intercept else 0)
+	Factor = _asarray(Xnew, "Xnew", ndim=None)
+	assert Factor.ndim in [1, 2], "Xnew must be either Iterable, Iterable[Iterable]"
+	Factor = Factor[:, None] if Factor.ndim == 1 else np.transpose(Factor)
+	assert Factor.shape[1] == NPred, f"Xnew must have {NPred} predictor(s)"
+
+	X = _Augmented(np.empty((len(Factor), 0)), Factor, intercept)
+	Fits = X @ Coeffs
+	if interval is None:
+		return Fits
+
+	#squared norms of R'^-1 x for each row x
+	h = np.empty(len(X))
+	for i in range(0, len(X), chunksize):
+		Z = _ForwardSolve(R, X[i:i + chunksize])
+		h[i:i + chunksize] = np.einsum("ij,ij->i", Z, Z)
+
+	if interval == "prediction":
+		h += 1.0
+
+	quantile = -float(qt(alpha/2.0, DF_Residual))
+	halfwidth = quantile*np.sqrt(np.multiply.outer(h, MS_Residual))
+	halfwidth = halfwidth.reshape(Fits.shape)
+
+	return Fits, Fits - halfwidth, Fits + halfwidth
 
 
 
@@ -148,7 +227,22 @@ class MultipleLinRegressResult:
 	Residuals:list[float]|None
 	Fits:list[float]|None
 	intercept:bool
+	R:np.ndarray|None = None #triangular factor of the design matrix
+	alpha:float = 0.05
 	
+
+	def predict(self, Xnew, interval:str|None = None):
+		"""
+		Xnew: values of predictors, same layout as factor in linregress
+		interval: None, "confidence" (mean response) or "prediction" (new observation) at 1-alpha level
+
+		returns fits, or fits with lower and upper bounds of intervals
+		"""
+		assert self.R is not None, "factorization is not available"
+		return _Predict(
+				self.R, self.Coefficients, self.anova.MS_Residual, self.anova.DF_Residual, 
+				self.intercept, Xnew, interval, self.alpha)
+
 		
 	def __str__(self):
 		anova = self.anova
@@ -186,23 +280,18 @@ def MultipleLinregress(
 		assert isinstance(yobs, np.ndarray), "yobs must be of type numpy 1D array"
 		assert isinstance(factor, np.ndarray), "factor must be of type numpy 2D array"
 
-		NRows = factor.shape[0]
+		NRows, NCols = factor.shape
 		assert NRows == yobs.size, "Rows of matrix == size of observed variables expected."
+		assert NRows > NCols + (1 if intercept else 0), "More observations than coefficients expected."
 
-		modifiedMatrix = np.copy(factor)
+		A = _Augmented(yobs, factor, intercept)
+		R = np.linalg.qr(A, mode="r")
 
-		if intercept:
-			NRows = factor.shape[0]
-			ones = np.ones(NRows)
-			modifiedMatrix = np.insert(modifiedMatrix, 0, values=ones, axis=1)
-
-		coeffs = np.linalg.lstsq(modifiedMatrix, b=yobs, rcond=None)[0]
-
-		stderror, CoefficientStats, anova = _ComputeSummary(yobs, factor, coeffs, modifiedMatrix, intercept, alpha)
+		coeffs, stderror, CoefficientStats, anova = _ComputeSummary(R, NRows, intercept, alpha)
 
 		Residuals, Fits = None, None
 		if residuals:
-			Residuals, Fits = _ComputeResiduals(yobs, factor, coeffs, intercept)
+			Residuals, Fits = _ComputeResiduals(yobs, A[:, :-1], coeffs)
 
 		return MultipleLinRegressResult(
 							Coefficients=coeffs,
@@ -211,6 +300,96 @@ def MultipleLinregress(
 							anova=anova,
 							intercept=intercept,
 							Residuals=Residuals,
-							Fits=Fits)
+							Fits=Fits,
+							R=R[:-1, :-1],
+							alpha=alpha)
+
+
+
+#--------------------------------------------------------------
+
+@dataclass
+class MultiResponseLinRegressResult:
+	"""arrays have a column for each response, rows of coefficient arrays are predictors (intercept first)"""
+	Coefficients:np.ndarray
+	stderr:np.ndarray
+	tvalue:np.ndarray
+	pvalue:np.ndarray
+	CILow:np.ndarray
+	CIHigh:np.ndarray
+	anova:list[AnovaResults]
+	Residuals:np.ndarray|None
+	Fits:np.ndarray|None
+	intercept:bool
+	R:np.ndarray|None = None #triangular factor of the design matrix
+	alpha:float = 0.05
+
+
+	def predict(self, Xnew, interval:str|None = None):
+		"""
+		Xnew: values of predictors, same layout as factor in linregress
+		interval: None, "confidence" (mean response) or "prediction" (new observation) at 1-alpha level
+
+		returns fits (a column for each response), or fits with lower and upper bounds of intervals
+		"""
+		assert self.R is not None, "factorization is not available"
+		MS_Residual = np.array([a.MS_Residual for a in self.anova])
+		return _Predict(
+				self.R, self.Coefficients, MS_Residual, self.anova[0].DF_Residual, 
+				self.intercept, Xnew, interval, self.alpha)
+
+
+	def __str__(self):
+		s = "   Multiple Response Linear Regression  \n"
+		s += "{:<10} {:>15} {:>15} {:>15}\n".format("Response", "F", "p-value", "R2")
+
+		for j, anova in enumerate(self.anova):
+			s += "{:<10} {:>15.2f} {:>15.3e} {:>15.3f} \n".format(f"Y{j+1}", anova.Fvalue, anova.pvalue, anova.R2)
+
+		return s
 
 
+
+def MultiResponseLinregress(
+		yobs:np.ndarray, 
+		factor:np.ndarray, 
+		intercept=True, 
+		alpha=0.05,
+		residuals=True) -> MultiResponseLinRegressResult:
+		"""the design matrix is factorized once and all responses (columns of yobs) are solved by matrix products"""
+		assert isinstance(yobs, np.ndarray) and yobs.ndim == 2, "yobs must be of type numpy 2D array"
+		assert isinstance(factor, np.ndarray), "factor must be of type numpy 2D array"
+
+		NRows, NCols = factor.shape
+		assert NRows == yobs.shape[0], "Rows of matrix == rows of observed variables expected."
+		assert NRows > NCols + (1 if intercept else 0), "More observations than coefficients expected."
+
+		X = _Augmented(np.empty((NRows, 0)), factor, intercept)
+		Q, Rxx = np.linalg.qr(X)
+
+		#all responses at once
+		QtY = Q.T @ yobs
+		Residuals = yobs - Q @ QtY
+		SS_Residual = np.einsum("ij,ij->j", Residuals, Residuals)
+
+		coeffs, stderror, tvalues, pvalues, CILow, CIHigh, anova = _SummaryArrays(Rxx, QtY, SS_Residual, NRows, intercept, alpha)
+
+		Fits = None
+		if residuals:
+			Fits = yobs - Residuals
+		else:
+			Residuals = None
+
+		return MultiResponseLinRegressResult(
+							Coefficients=coeffs,
+							stderr=stderror,
+							tvalue=tvalues,
+							pvalue=pvalues,
+							CILow=CILow,
+							CIHigh=CIHigh,
+							anova=anova,
+							Residuals=Residuals,
+							Fits=Fits,
+							intercept=intercept,
+							R=Rxx,
+							alpha=alpha)
\ No newline at end of file
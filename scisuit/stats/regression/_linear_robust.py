@@ -0,0 +1,154 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from ._linear_multiple import _Augmented, _ComputeSummary, MultipleLinRegressResult
+from ._linear_simple import AnovaResults, SimpleLinRegressResult
+
+
+
+
+def _huber(u:np.ndarray, c:float = 1.345)->np.ndarray:
+	return np.minimum(1.0, c/np.maximum(np.abs(u), 1E-300))
+
+
+def _bisquare(u:np.ndarray, c:float = 4.685)->np.ndarray:
+	return np.where(np.abs(u) < c, (1.0 - (u/c)**2)**2, 0.0)
+
+
+_PSI = {"huber":_huber, "bisquare":_bisquare}
+
+
+
+def _WeightedFit(A:np.ndarray, sw:np.ndarray, buffer:np.ndarray, NObservations:int, intercept:bool, alpha:float):
+	"""
+	least squares with rows of [X | y] scaled by square roots of weights,
+	buffer is the preallocated array the scaled rows are written to
+	"""
+	np.multiply(A, sw[:, None], out=buffer)
+	R = np.linalg.qr(buffer, mode="r")
+	return R, _ComputeSummary(R, NObservations, intercept, alpha)
+
+
+
+@dataclass
+class RobustLinRegressResult(MultipleLinRegressResult):
+	weights:np.ndarray|None = None #final weights (robust weights times the given weights)
+	scale:float|None = None #robust scale of residuals (MAD/0.6745), None for weighted least squares
+	iterations:int = 0
+	converged:bool = True
+
+
+
+@dataclass
+class RobustSimpleLinRegressResult(SimpleLinRegressResult):
+	"""RobustLinRegressResult of a single factor in the layout of simple regression (slope first)"""
+	weights:np.ndarray|None = None
+	scale:float|None = None
+	iterations:int = 0
+	converged:bool = True
+
+
+
+def _AsSimple(result:RobustLinRegressResult)->RobustSimpleLinRegressResult:
+	coeffs, CoefStats, anova = result.Coefficients, result.CoefficientStats, result.anova
+
+	#simple regression lists the slope first
+	if result.intercept:
+		Coefficients, CoefStats = np.array([coeffs[1], coeffs[0]]), [CoefStats[1], CoefStats[0]]
+	else:
+		Coefficients = np.array([coeffs[0], 0.0])
+
+	return RobustSimpleLinRegressResult(
+					Coefficients=Coefficients,
+					CoefficientStats=CoefStats,
+					anova=AnovaResults(**vars(anova)),
+					stderr=float(np.sqrt(anova.MS_Residual)),
+					Residuals=result.Residuals,
+					Fits=result.Fits,
+					weights=result.weights,
+					scale=result.scale,
+					iterations=result.iterations,
+					converged=result.converged)
+
+
+
+def RobustLinregress(
+		yobs:np.ndarray,
+		factor:np.ndarray,
+		weights:np.ndarray|None = None,
+		robust:str|None = None,
+		intercept=True,
+		alpha=0.05,
+		residuals=True,
+		maxiter:int = 50,
+		tol:float = 1E-8) -> RobustLinRegressResult:
+	"""
+	Weighted least squares and, if robust is given, M-estimation by iteratively
+	reweighted least squares. Standard errors are those of the final weighted fit.
+
+	weights: non-negative weights of observations (i.e. inverse variances)
+	robust: None, "huber" or "bisquare" (Tukey)
+	maxiter: maximum number of iterations
+	tol: stops when the largest change of coefficients is below tol (relative)
+	"""
+	assert robust in [None, "huber", "bisquare"], "robust must be None, 'huber' or 'bisquare'"
+	assert isinstance(maxiter, int) and maxiter > 0, "maxiter>0 expected"
+
+	NRows, NCols = factor.shape
+	assert NRows == yobs.size, "Rows of matrix == size of observed variables expected."
+
+	W = np.ones(NRows) if weights is None else weights
+	assert W.shape == (NRows, ), "weights must have same size as yobs"
+	assert np.all(W >= 0) and np.any(W > 0), "weights must be non-negative and not all zero"
+
+	NObservations = int(np.count_nonzero(W))
+	assert NObservations > NCols + (1 if intercept else 0), "More observations than coefficients expected."
+
+	#allocated once and reused by all iterations
+	A = _Augmented(yobs, factor, intercept)
+	X = A[:, :-1]
+	buffer = np.empty_like(A)
+
+	Weights = W.copy()
+	R, (coeffs, stderror, CoefStats, anova) = _WeightedFit(A, np.sqrt(Weights), buffer, NObservations, intercept, alpha)
+
+	scale, iterations, converged = None, 0, True
+	if robust is not None:
+		psi = _PSI[robust]
+		converged = False
+		for iterations in range(1, maxiter + 1):
+			resid = yobs - X @ coeffs
+			scale = float(np.median(np.abs(resid[W > 0])))/0.6745
+			if scale == 0.0:
+				converged = True
+				break
+
+			Weights = W*psi(resid/scale)
+			previous = coeffs
+			R, (coeffs, stderror, CoefStats, anova) = _WeightedFit(A, np.sqrt(Weights), buffer, NObservations, intercept, alpha)
+
+			if np.max(np.abs(coeffs - previous)) <= tol*(np.max(np.abs(previous)) + tol):
+				converged = True
+				break
+
+	Residuals, Fits = None, None
+	if residuals:
+		Fits = X @ coeffs
+		Residuals = (yobs - Fits).tolist()
+		Fits = Fits.tolist()
+
+	return RobustLinRegressResult(
+					Coefficients=coeffs,
+					CoefficientStats=CoefStats,
+					stderr=stderror,
+					anova=anova,
+					intercept=intercept,
+					Residuals=Residuals,
+					Fits=Fits,
+					R=R[:-1, :-1],
+					alpha=alpha,
+					weights=Weights,
+					scale=scale,
+					iterations=iterations,
+					converged=converged)
\ No newline at end of file
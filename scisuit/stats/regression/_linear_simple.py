@@ -50,16 +50,8 @@ def _ComputeCoeffStat(
 		t_beta:float, 
 		alpha:float, 
 		df:int)->CoeffStats:
-	pvalue = 0.0
-
-	#area on the left of tcrit + area on the right of positive
-	if t_beta<=0:
-		pvalue = pt(q=t_beta, df=df) + (1-pt(q=abs(t_beta), df=df))
-	
-	#area on the right of positive tcritical + area on the left of negative tcritical
-	else:
-		pvalue = (1-pt(q=t_beta, df=df)) + pt(q=-t_beta, df=df) 
-	
+	#area on the left of -|t| + area on the right of |t|
+	pvalue = 2.0*pt(q=-abs(t_beta), df=df)
 
 	invTval = float(qt(alpha/2.0, df))
 
@@ -133,7 +125,7 @@ def _ComputeSummary(yobs, factor, coeffs, intercept=True, alpha=0.05)->tuple[flo
 		SS_Total=SS_Total,
 		R2=SS_Regression/SS_Total,
 		Fvalue = float(MS_Regression/MS_Residual),
-		pvalue = 1 - pf(float(MS_Regression/MS_Residual), 1, df))
+		pvalue = pf(float(MS_Regression/MS_Residual), 1, df, lower_tail=False))
 
 
 
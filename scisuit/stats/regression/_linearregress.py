@@ -1,7 +1,8 @@
 import numpy as np
 from typing import Iterable 
 from ._linear_simple import SimpleLinRegress, SimpleLinRegressResult
-from ._linear_multiple import MultipleLinregress, MultipleLinRegressResult
+from ._linear_multiple import MultipleLinregress, MultipleLinRegressResult, MultiResponseLinregress, MultiResponseLinRegressResult
+from ._linear_robust import RobustLinregress, RobustLinRegressResult, RobustSimpleLinRegressResult, _AsSimple
 
 
 
@@ -11,15 +12,25 @@ def linregress(
 		factor:Iterable | Iterable[Iterable], 
 		intercept=True, 
 		alpha=0.05,
-		residuals = True)->SimpleLinRegressResult|MultipleLinRegressResult:
+		residuals = True,
+		weights:Iterable|None = None,
+		robust:str|None = None,
+		maxiter:int = 50,
+		tol:float = 1E-8)->SimpleLinRegressResult|MultipleLinRegressResult|MultiResponseLinRegressResult|RobustLinRegressResult|RobustSimpleLinRegressResult:
 	"""
 	Performs simple/multiple linear regression
 
-	yobs: Dependent data  
+	yobs: Dependent data, 2D (n x k) to regress k responses on the same factor  
 	factor: independent data   
 	intercept: True if there is intercept   
 	alpha: significance level   
-	residuals: Compute residuals and fits (otherwise None is returned)
+	residuals: Compute residuals and fits (otherwise None is returned)  
+	weights: weights of observations for weighted least squares  
+	robust: None, "huber" or "bisquare", M-estimation by iteratively reweighted least squares  
+	maxiter, tol: maximum number of iterations and relative tolerance of coefficients (robust)
+
+	With weights or robust, the result is a RobustLinRegressResult (a MultipleLinRegressResult),
+	for a 1D factor a RobustSimpleLinRegressResult (a SimpleLinRegressResult, slope first)
 	"""
 	Observed = np.asarray(yobs, dtype=np.float64)
 	Factor = np.asarray(factor, dtype=np.float64)
@@ -27,6 +38,19 @@ def linregress(
 	IsMatrix = len(Factor.shape) == 2
 	IsVector = len(Factor.shape) == 1
 
+	if weights is not None or robust is not None:
+		assert Observed.ndim == 1, "weights and robust require 1D yobs"
+		Design = np.transpose(Factor) if IsMatrix else Factor[:, None]
+		W = None if weights is None else np.asarray(weights, dtype=np.float64)
+		result = RobustLinregress(
+				yobs=Observed, factor=Design, weights=W, robust=robust, intercept=intercept, 
+				alpha=alpha, residuals=residuals, maxiter=maxiter, tol=tol)
+		return result if IsMatrix else _AsSimple(result)
+
+	if Observed.ndim == 2:
+		Design = np.transpose(Factor) if IsMatrix else Factor[:, None]
+		return MultiResponseLinregress(yobs=Observed, factor=Design, intercept=intercept, alpha=alpha, residuals=residuals)
+
 	if(IsMatrix):
 		return MultipleLinregress(yobs=Observed, factor=np.transpose(Factor), intercept=intercept, alpha=alpha, residuals=residuals)
 	
@@ -108,7 +108,7 @@ def _chisq_assoc(data:list[list[int]])->chisq_assoc_Result:
 		contrib=ContribChiSq,
 		chisq=(float(Chisq_Pearson), float(Chisq_Likelihood)),
 		df=df,
-		pvalue=(1.0-pchisq(q=Chisq_Pearson, df=df), 1.0-pchisq(q=Chisq_Likelihood, df=df))
+		pvalue=(pchisq(q=Chisq_Pearson, df=df, lower_tail=False), pchisq(q=Chisq_Likelihood, df=df, lower_tail=False))
 	)
 
 
@@ -148,7 +148,7 @@ def test_chisq(
 		ContribChiSq.append(contribChisq)
 
 	df = len(data) - 1
-	pvalue = 1.0 - pchisq(q=Chisq, df=df)
+	pvalue = pchisq(q=Chisq, df=df, lower_tail=False)
 
 	return chisquare_GoodnessFit_Result(
 		expected=ExpectedCount,
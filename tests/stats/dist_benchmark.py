@@ -0,0 +1,49 @@
+import numpy as np
+from timeit import repeat
+
+import scisuit.settings as settings
+import scisuit.stats as st
+from scisuit._ctypeslib import HAS_NATIVE
+
+
+N = 1_000_000
+rng = np.random.default_rng(1)
+x = 2*rng.standard_normal(N)
+u = rng.uniform(size=N)
+
+calls = {
+	"pt": (lambda: st.pt(1.3, 7), lambda: st.pt(x, 7)),
+	"qt": (lambda: st.qt(0.3, 7), lambda: st.qt(u, 7)),
+	"pbeta": (lambda: st.pbeta(0.3, 2.5, 3.5), lambda: st.pbeta(u, 2.5, 3.5)),
+	"qbeta": (lambda: st.qbeta(0.3, 2.5, 3.5), lambda: st.qbeta(u, 2.5, 3.5)),
+	"pgamma": (lambda: st.pgamma(1.3, 2.5), lambda: st.pgamma(x*x, 2.5)),
+	"qgamma": (lambda: st.qgamma(0.3, 2.5), lambda: st.qgamma(u, 2.5)),
+	"pf": (lambda: st.pf(1.3, 5, 9), lambda: st.pf(3*u, 5, 9)),
+	"qf": (lambda: st.qf(0.3, 5, 9), lambda: st.qf(u, 5, 9)),
+	"test_t_from_stats": (lambda: st.test_t_from_stats(n1=10, mean1=5.0, sd1=1.0, mu=4.5),
+			lambda: st.test_t_from_stats(n1=10, mean1=x, sd1=1.0, mu=0.0)),
+	"test_f_from_stats": (lambda: st.test_f_from_stats(n1=10, sd1=1.0, n2=12, sd2=2.0),
+			lambda: st.test_f_from_stats(n1=10, sd1=1 + u, n2=12, sd2=1.5))}
+
+
+def performance(backend:str)->dict[str, float]:
+	"""prints the timings and returns the ones of the batch evaluations"""
+	settings.DIST_BACKEND = backend
+	print(f"\n{backend} backend: scalar call (ms), {N} elements (s)")
+	retVal = {}
+	for name, (scalar, vector) in calls.items():
+		retVal[name] = min(repeat(vector, number=1, repeat=3))
+		print(f"{name}: {min(repeat(scalar, number=100, repeat=3))*10:.3f}, {retVal[name]:.2f}")
+	return retVal
+
+
+np_times = performance("numpy")
+if HAS_NATIVE:
+	native_times = performance("native")
+
+	#batch evaluation with the NumPy backend must be at least as fast as the native per-element loop
+	for name in calls:
+		assert np_times[name] <= native_times[name], f"{name}: numpy {np_times[name]:.2f} s, native {native_times[name]:.2f} s"
+	print("\nNumPy backend is at least as fast as the native backend")
+else:
+	print("\nnative library is not available, NumPy backend is not compared")
\ No newline at end of file
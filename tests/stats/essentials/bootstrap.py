@@ -0,0 +1,37 @@
+import numpy as np
+from scisuit.stats import bootstrap
+
+
+def slope(x, y, axis=-1):
+	xm = x - x.mean(axis=axis, keepdims=True)
+	ym = y - y.mean(axis=axis, keepdims=True)
+	return np.sum(xm*ym, axis=axis)/np.sum(xm**2, axis=axis)
+
+
+rng = np.random.default_rng(10)
+x = rng.lognormal(size=50)
+y = 2*x + rng.normal(size=50)
+
+
+#vectorized statistic, resamples are evaluated in blocks
+print(bootstrap(np.median, x, rng=1))
+print()
+print(bootstrap(slope, (x, y), paired=True, method="percentile", rng=1))
+
+
+#two independent samples, reference bounds are scipy's BCa interval for the same bootstrap distribution
+def sdratio(a, b, axis=-1):
+	return np.std(a, axis=axis, ddof=1)/np.std(b, axis=axis, ddof=1)
+
+a = [2.1, 3.4, 1.9, 5.6, 2.8, 4.4, 3.1, 7.2, 2.5, 3.9, 1.4, 6.1]
+b = [3.3, 2.9, 4.1, 3.6, 3.8, 2.7, 4.4, 3.1, 3.5, 4.0, 2.6, 3.7, 3.2, 4.8, 3.0]
+result = bootstrap(sdratio, (a, b), nboot=5000, rng=1)
+assert abs(result.lower - 1.5805397164858266) < 1E-10 and abs(result.upper - 4.581449795163166) < 1E-10
+print()
+print(result)
+
+
+#non-vectorized statistic spread across 2 processes
+if __name__ == "__main__":
+	print()
+	print(bootstrap(np.std, x, vectorized=False, nboot=2000, rng=1, workers=2))
\ No newline at end of file
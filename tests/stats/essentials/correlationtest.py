@@ -4,4 +4,18 @@ C1 = [500, 760, 320, 1000]
 C2 = {67, 43, 20, 45}
 	
 res = cor_test(C1, C2, 0.95, "spearman")
-print(res)
\ No newline at end of file
+print(res)
+
+
+#correlation screen, each column is a variable
+import numpy as np
+from scisuit.stats import cor_matrix, cor_test
+
+rng = np.random.default_rng(1)
+X = rng.normal(size=(100, 5))
+X[:, 1] += X[:, 0]
+
+print(cor_matrix(X, method="pearson"))
+print()
+print(cor_test(X[:, 0], X[:, 1], method="kendall"))
+print(cor_matrix(X, method="kendall").pvalue)
\ No newline at end of file
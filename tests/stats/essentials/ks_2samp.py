@@ -0,0 +1,18 @@
+import numpy as np
+from scisuit.stats import ks_1samp, ks_2samp
+
+
+x = [0.61, 0.29, 0.06, 0.59, -1.73, -0.74, 0.51, -0.56, 0.39, 1.64, 0.05, -0.06, 0.64, -0.82, 0.37]
+y = [-0.32, -0.43, -0.39, -0.61, 0.08, 0.13, -1.30, 0.48, 1.63, -0.24, 0.11, 0.89, 0.33, -0.67, -1.38, 1.47]
+
+print(ks_2samp(x, y))
+
+
+#drift monitoring, each column is a feature
+rng = np.random.default_rng(42)
+reference = rng.normal(size=(500, 6))
+current = rng.normal(loc=[0, 0, 0.3, 0, 0, 0.5], size=(400, 6))
+
+result = ks_2samp(reference, current, axis=0)
+print("\nDrift p-values:", result.pvalue)
+print("Normality p-values:", ks_1samp(current, axis=0).pvalue)
\ No newline at end of file
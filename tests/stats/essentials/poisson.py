@@ -51,6 +51,18 @@ def customercomplaints():
 				alternative="greater")
 
 
+def particleEmit_batch():
+	from scisuit.stats import test_poisson1sample_from_stats
+
+	#each element is a separate test
+	return test_poisson1sample_from_stats(
+						samplesize=[2608, 2608, 1000], 
+						totaloccur=[10092, 10500, 3800], 
+						hypotest=True, 
+						hyporate=4.0, 
+						method="exact")
+
+
 print(particleEmit())
 
 print("\n------------\n")
@@ -59,4 +71,8 @@ print(particleEmit_summarizeddata())
 
 print("\n------------\n")
 
-print(customercomplaints())
\ No newline at end of file
+print(customercomplaints())
+
+print("\n------------\n")
+
+print(particleEmit_batch())
\ No newline at end of file
@@ -30,5 +30,31 @@ def ttest_paired():
 	print(tbl)
 
 
+def ttest_columns():
+	#each column is a metric, rows are observations
+	rng = np.random.default_rng(42)
+	A = rng.normal(loc=10, scale=2, size=(50, 4))
+	B = rng.normal(loc=[10, 11, 10, 12], scale=2, size=(40, 4))
 
-ttest_2sample()
\ No newline at end of file
+	result = test_t(x=A, y=B, varequal=False, axis=0)
+	print(result.pvalue)
+	print(result.CI_lower, result.CI_upper)
+
+
+def ttest_chunks():
+	from scisuit.stats import accumulator
+
+	#data arrives in chunks, e.g. read from a large file
+	rng = np.random.default_rng(42)
+	x, y = accumulator(), accumulator()
+	for _ in range(10):
+		x.update(rng.normal(loc=10, scale=2, size=1000))
+		y.update(rng.normal(loc=10.1, scale=2, size=1000))
+
+	print(x.test_t(y=y, varequal=False))
+
+
+
+ttest_2sample()
+ttest_columns()
+ttest_chunks()
\ No newline at end of file
@@ -16,3 +16,17 @@ print(tbl)
 
 
 
+
+
+
+#accumulators take the same arguments as test_z
+from scisuit.stats import accumulator
+
+acc = accumulator().update(x[:20]).update(x[20:])
+streamed = acc.test_z(mu=132.4, sd1=6)
+assert abs(streamed.pvalue - tbl.pvalue) < 1E-12, "accumulator must match test_z"
+
+y = [v - 3 for v in x[::2]]
+two = test_z(x=x, y=y, sd1=6, sd2=5)
+assert abs(acc.test_z(y=accumulator().update(y), sd1=6, sd2=5).pvalue - two.pvalue) < 1E-12
+print(two)
\ No newline at end of file
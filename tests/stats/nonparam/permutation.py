@@ -0,0 +1,16 @@
+from scisuit.stats import test_permutation
+
+
+x = [1, 2, 2, 3, 3, 3, 4, 5]
+y = [2, 3, 4, 4, 5, 5, 6, 6, 7]
+
+print(test_permutation(x, y, statistic="mannwhitney", rng=1))
+print()
+print(test_permutation(x, y, statistic="t", alternative="less", alpha=None, nperm=100000, rng=1))
+
+
+#groups for Kruskal-Wallis, 2 processes each drawing from its own stream
+if __name__ == "__main__":
+	g1, g2, g3 = [1, 2, 2, 3], [2, 3, 3, 4, 4], [4, 5, 5, 6]
+	print()
+	print(test_permutation(g1, g2, g3, statistic="kruskal", alpha=None, nperm=100000, rng=3, workers=2))
\ No newline at end of file
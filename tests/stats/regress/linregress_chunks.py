@@ -0,0 +1,18 @@
+import numpy as np
+from scisuit.stats import linregress_accumulator
+
+
+rng = np.random.default_rng(3)
+X = rng.normal(size=(100_000, 3))
+y = X @ [1.5, -2.0, 0.5] + 4 + rng.normal(size=len(X))
+
+
+#two accumulators filled separately (i.e. in different processes) and merged
+first, second = linregress_accumulator(), linregress_accumulator()
+for i in range(0, 50_000, 10_000):
+	first.update(y[i:i+10_000], X[i:i+10_000].T)
+
+for i in range(50_000, len(X), 10_000):
+	second.update(y[i:i+10_000], X[i:i+10_000].T)
+
+print(first.merge(second).result())
\ No newline at end of file
@@ -7,4 +7,17 @@ viscosity = [2256, 2340, 2426, 2293, 2330, 2368, 2250, 2409, 2364, 2379, 2440, 2
 
 #note the order of input to factor
 result = linregress(yobs=viscosity, factor=[temperature, feedrate])
-print(result)
\ No newline at end of file
+print(result)
+
+#intervals at new points, same layout as factor
+fit, lower, upper = result.predict([[85, 95], [10, 11]], interval="prediction")
+print("Predictions:", fit, lower, upper)
+
+
+#several responses regressed on the same factor, yobs has a column for each response
+import numpy as np
+density = [1.02, 1.05, 1.09, 1.03, 1.04, 1.08, 1.02, 1.07, 1.06, 1.05, 1.08, 1.06, 1.08, 1.04, 1.04, 1.05]
+
+result = linregress(yobs=np.column_stack([viscosity, density]), factor=[temperature, feedrate])
+print(result)
+print(result.Coefficients)
\ No newline at end of file
@@ -0,0 +1,18 @@
+import numpy as np
+from scisuit.stats import linregress
+
+
+rng = np.random.default_rng(7)
+temperature = rng.uniform(20, 80, size=60)
+yieldpct = 40 + 0.5*temperature + rng.normal(size=60)
+yieldpct[[5, 17, 33]] += 25 #faulty readings
+
+
+#heteroscedastic data: weights are inverse variances
+weights = 1/(0.1 + 0.02*temperature)**2
+print(linregress(yobs=yieldpct, factor=temperature, weights=weights))
+
+for method in ["huber", "bisquare"]:
+	result = linregress(yobs=yieldpct, factor=temperature, robust=method)
+	print(result)
+	print(f"iterations={result.iterations}, weights of outliers={result.weights[[5, 17, 33]]}")
\ No newline at end of file
@@ -0,0 +1,28 @@
+import numpy as np
+from scisuit.stats import rolling_linregress
+
+
+#calibration drift: slope of the sensor response changes over time
+rng = np.random.default_rng(5)
+reference = rng.uniform(0, 100, size=2000)
+slope = np.linspace(1.0, 1.2, len(reference))
+reading = 2.0 + slope*reference + rng.normal(size=len(reference))
+
+result = rolling_linregress(yobs=reading, factor=reference, period=200)
+print(result)
+print("Slopes every 300 windows:", result.Coefficients[::300, 1])
+
+expanding = rolling_linregress(yobs=reading, factor=reference)
+print("Expanding window R2:", expanding.R2[-1])
+
+#the reference is held constant for a while: windows inside that stretch are singular
+held = reference.copy()
+held[500:700] = 50.0
+degenerate = rolling_linregress(yobs=reading, factor=held, period=100)
+singular = np.isnan(degenerate.Coefficients[:, 1])
+assert np.array_equal(degenerate.index[singular], np.arange(599, 700)), "windows inside the constant stretch must be nan"
+for t in degenerate.index[~singular][::50]:
+	X = np.column_stack([np.ones(100), held[t - 99:t + 1]])
+	direct = np.linalg.lstsq(X, reading[t - 99:t + 1], rcond=None)[0]
+	assert np.allclose(degenerate.Coefficients[t - 99], direct, rtol=1E-8), "other windows must match least squares"
+print("Singular windows:", singular.sum())
\ No newline at end of file
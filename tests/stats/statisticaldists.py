@@ -157,7 +157,91 @@ def gamma_weibull_shape():
 
 
 
+def ndarray_io():
+	print("\n ndarray input/output")
+	x = np.linspace(-3, 3, num=7)
+	print(st.pnorm(q=x))
 
+	#results are written into a preallocated array
+	out = np.empty_like(x)
+	st.dnorm(x=x, out=out)
+	print(out)
+
+
+
+def frozen():
+	print("\n Frozen distributions")
+	G = st.dist.gamma(shape=3, scale=4)
+	print(G)
+	print(G.pdf(4), st.dgamma(x=4, shape=3, scale=4))
+	print(G.ppf([0.05, 0.5, 0.95]))
+
+	T = st.dist.t(df=10)
+	print(T.cdf([-2, 0, 2]))
+	print(T.rvs(5))
+
+
+
+def broadcasting():
+	print("\n Broadcasting parameters")
+	#each t value is evaluated with its own degrees of freedom
+	print(st.pt(q=np.array([2.1, -1.3, 3.0]), df=np.array([5, 10, 30])))
+
+	#2x3 grid of quantiles
+	print(st.qnorm(p=0.975, mean=[0, 1, 2], sd=[[1], [2]]))
+
+
+
+def seeded():
+	print("\n Seeded random variates")
+	#same seed, same numbers
+	print(st.rnorm(n=3, rng=42), st.rnorm(n=3, rng=42))
+
+	#independent streams, e.g. one for each worker of a process pool
+	for gen in st.spawn_rng(n=3, seed=2024):
+		print(st.rexp(n=2, rate=0.5, rng=gen, asarray=True))
+
+
+
+def tails():
+	print("\n Upper tail and log-scale probabilities")
+	#1 - pchisq(...) would give 0.0
+	print(st.pchisq(q=500, df=3, lower_tail=False))
+	print(st.pnorm(q=-50, log=True))
+	print(st.dt(x=[0, 5], df=4, log=True))
+
+
+
+def tablecache():
+	print("\n Cached signed rank tables")
+	st.distcache_clear()
+	for _ in range(3):
+		st.psignrank(q=[10, 20, 30], n=15)
+	print(st.distcache_info())
+
+
+
+def quantilegrid():
+	from scisuit import settings
+	print("\n Interpolated quantiles")
+	settings.DIST_QUANTILE_GRID = True
+	#critical values for a table of confidence levels, grid for df=12 is built once
+	print(st.qt(p=[0.9, 0.95, 0.975, 0.99, 0.995], df=12))
+	settings.DIST_QUANTILE_GRID = False
+	print(st.qt(p=[0.9, 0.95, 0.975, 0.99, 0.995], df=12))
+
+
+
+
+def pmftable():
+	print("\n Discrete probability tables")
+	T = st.table("binom", size=20, prob=0.3)
+	print(T)
+	print(T.pmf[:5], T.cdf[:5])
+
+	#qbinom does a binary search on the cached table
+	print(st.qbinom(p=np.linspace(0.05, 0.95, 5), size=20, prob=0.3))
+	print(st.table("pois", mu=4.5))
 
 
 
@@ -169,4 +253,12 @@ GeometricDist()
 HyperGeometricDist()
 NegativeBinomialDist()
 multinomdist()
-weibull()
\ No newline at end of file
+weibull()
+ndarray_io()
+frozen()
+broadcasting()
+seeded()
+tails()
+tablecache()
+quantilegrid()
+pmftable()
\ No newline at end of file